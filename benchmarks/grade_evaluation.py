@@ -0,0 +1,137 @@
+"""
+Compare the per-user and the vectorized (grade matrix) evaluation of grade-based eligibility criteria.
+
+Run it from the repository root::
+
+    python benchmarks/grade_evaluation.py [NUMBER_OF_LEARNERS ...]
+
+By default, it evaluates synthetic courses with 10k, 100k, and 500k learners. For each size, it reports:
+
+- the duration of a reference per-user loop, which evaluates the grades one learner at a time,
+- the duration of the vectorized evaluation (building the grade matrix and evaluating it),
+- the duration of the vectorized evaluation including the per-user progress dicts returned by the processors,
+- the memory needed to hold the grades as a dict of dicts and as a grade matrix.
+"""
+
+# ruff: noqa: T201
+
+from __future__ import annotations
+
+import os
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import django
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'test_settings')
+django.setup()
+
+# noinspection PyProtectedMember
+from learning_credentials.processors import (  # noqa: E402
+    _build_grade_matrix,
+    _evaluate_grade_matrix,
+    _iter_grade_matrix_progress,
+)
+
+CATEGORY_WEIGHTS = {'homework': 0.15, 'lab': 0.15, 'midterm exam': 0.3, 'final exam': 0.4}
+REQUIRED_GRADES = {'homework': 40.0, 'final exam': 65.0, 'total': 70.0}
+DEFAULT_SIZES = (10_000, 100_000, 500_000)
+MiB = 2**20
+
+
+def generate_grades(learners: int) -> list[tuple[int, dict[str, float]]]:
+    """Generate random grades. Some learners have not attempted all categories."""
+    rng = random.Random(learners)  # noqa: S311
+    return [
+        (uid, {category: rng.uniform(0, 100) for category in CATEGORY_WEIGHTS if rng.random() > 0.05})  # noqa: PLR2004
+        for uid in range(learners)
+    ]
+
+
+def is_eligible(user_grades: dict[str, float]) -> bool:
+    """Evaluate the grades of a single learner, the way the processors did before the grade matrix was introduced."""
+    # Learners without a grade in a required category did not attempt it.
+    if not all(category in user_grades for category in REQUIRED_GRADES if category != 'total'):
+        return False
+
+    total_score = 0.0
+    for category, score in user_grades.items():
+        if score < REQUIRED_GRADES.get(category, 0):
+            return False
+        total_score += score * CATEGORY_WEIGHTS[category]
+    return total_score >= REQUIRED_GRADES.get('total', 0)
+
+
+def per_user_loop(grades: list[tuple[int, dict[str, float]]]) -> list[bool]:
+    """Evaluate the grades one learner at a time."""
+    return [is_eligible(user_grades) for _uid, user_grades in grades]
+
+
+def build_matrix(grades: list[tuple[int, dict[str, float]]]) -> tuple[list[int], list[str], np.ndarray]:
+    """Build the grade matrix of all learners."""
+    return _build_grade_matrix(iter(grades), len(grades))
+
+
+def matrix_evaluation(grades: list[tuple[int, dict[str, float]]]) -> list[bool]:
+    """Evaluate the grades of all learners with a grade matrix."""
+    _user_ids, categories, matrix = build_matrix(grades)
+    _totals, eligible = _evaluate_grade_matrix(categories, matrix, REQUIRED_GRADES, CATEGORY_WEIGHTS)
+    return eligible.tolist()
+
+
+def matrix_progress(grades: list[tuple[int, dict[str, float]]]) -> list[bool]:
+    """Evaluate the grades of all learners with a grade matrix and build their progress dicts."""
+    return [
+        progress['is_eligible']
+        for _uid, progress in _iter_grade_matrix_progress(grades, REQUIRED_GRADES, CATEGORY_WEIGHTS)
+    ]
+
+
+def timed(func: Callable, grades: list[tuple[int, dict[str, float]]]) -> tuple[float, list[bool]]:
+    """Return the duration (in seconds) and the results of the function."""
+    start = time.perf_counter()
+    results = func(grades)
+    return time.perf_counter() - start, results
+
+
+def allocated(func: Callable) -> float:
+    """Return the memory (in MiB) allocated by the function and still held by its result."""
+    tracemalloc.start()
+    result = func()
+    current, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current / MiB
+
+
+def main(sizes: list[int]):
+    """Run the benchmark for each course size."""
+    columns = ('learners', 'loop [s]', 'matrix [s]', 'matrix+dicts [s]', 'dicts [MiB]', 'matrix [MiB]')
+    print(' | '.join(f'{column:>16}' for column in columns))
+    for learners in sizes:
+        grades = generate_grades(learners)
+        loop_time, loop_results = timed(per_user_loop, grades)
+        matrix_time, matrix_results = timed(matrix_evaluation, grades)
+        progress_time, progress_results = timed(matrix_progress, grades)
+        if not loop_results == matrix_results == progress_results:
+            msg = f"The evaluation results differ for {learners} learners."
+            raise AssertionError(msg)
+
+        dicts_memory = allocated(lambda learners=learners: dict(generate_grades(learners)))
+        matrix_memory = allocated(lambda grades=grades: build_matrix(grades))
+        row = (learners, loop_time, matrix_time, progress_time, dicts_memory, matrix_memory)
+        print(' | '.join(f'{value:>16.3f}' if isinstance(value, float) else f'{value:>16}' for value in row))
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or list(DEFAULT_SIZES))
@@ -2,8 +2,7 @@
 
 from __future__ import annotations
 
-import importlib
-import inspect
+import uuid
 from typing import TYPE_CHECKING
 
 import django
@@ -20,12 +19,13 @@ from opaque_keys import InvalidKeyError
 from opaque_keys.edx.keys import CourseKey
 
 from .models import (
+    ArchivedCredential,
     Credential,
     CredentialAsset,
     CredentialConfiguration,
     CredentialType,
 )
-from .tasks import generate_credentials_for_config_task
+from .registry import GENERATORS_GROUP, PROCESSORS_GROUP, get_available_functions, get_function_metadata
 
 if TYPE_CHECKING:
     from collections.abc import Generator
@@ -42,20 +42,14 @@ class DocstringOptionsMixin:
         """
         Get the docstring of the function and return the "Options:" section.
 
+        The docstring is read from the source code of the function, so its module is not imported.
+
         :param func: The function to get the docstring for.
         :returns: The "Options:" section of the docstring.
         """
-        try:
-            docstring = (
-                'Custom options:'
-                + inspect.getdoc(
-                    getattr(
-                        importlib.import_module(func.rsplit('.', 1)[0]),
-                        func.rsplit('.', 1)[1],
-                    ),
-                ).split("Options:")[1]
-            )
-        except IndexError:
+        if options := get_function_metadata(func).options:
+            docstring = 'Custom options:' + options
+        else:
             docstring = (
                 'Custom options are not documented for this function. If you selected a different function, '
                 'you need to save your changes to see an updated docstring.'
@@ -71,36 +65,23 @@ class CredentialTypeAdminForm(forms.ModelForm, DocstringOptionsMixin):
     generation_func = forms.ChoiceField(choices=[])
 
     @staticmethod
-    def _available_functions(module: str, prefix: str) -> Generator[tuple[str, str], None, None]:
+    def _available_functions(group: str) -> Generator[tuple[str, str], None, None]:
         """
-        Import a module and return all functions in it that start with a specific prefix.
+        Return all functions available in a group, without importing them.
 
-        :param module: The name of the module to import.
-        :param prefix: The prefix of the function names to return.
+        :param group: The group of the functions (processors or generators).
 
-        :return: A tuple containing the functions that start with the prefix in the module.
+        :return: Tuples containing the paths and the display names of the functions.
         """
-        # TODO: Implement plugin support for the functions.
-        _module = importlib.import_module(module)
-        return (
-            (f'{obj.__module__}.{name}', f'{obj.__module__}.{name}')
-            for name, obj in inspect.getmembers(_module, inspect.isfunction)
-            if name.startswith(prefix)
-        )
+        return ((metadata.path, f'{metadata.name} ({metadata.path})') for metadata in get_available_functions(group))
 
     def __init__(self, *args, **kwargs):
         """Initializes the choices for the retrieval and generation function selection fields."""
         super().__init__(*args, **kwargs)
-        self.fields['retrieval_func'].choices = self._available_functions(
-            'learning_credentials.processors',
-            'retrieve_',
-        )
+        self.fields['retrieval_func'].choices = self._available_functions(PROCESSORS_GROUP)
         if self.instance.retrieval_func:
             self.fields['retrieval_func'].help_text = self._get_docstring_custom_options(self.instance.retrieval_func)
-        self.fields['generation_func'].choices = self._available_functions(
-            'learning_credentials.generators',
-            'generate_',
-        )
+        self.fields['generation_func'].choices = self._available_functions(GENERATORS_GROUP)
         if self.instance.generation_func:
             self.fields['generation_func'].help_text = self._get_docstring_custom_options(self.instance.generation_func)
 
@@ -175,7 +156,16 @@ class CredentialConfigurationAdmin(DjangoObjectActions, ReverseModelAdmin):
             {'fields': ['enabled', 'interval', 'crontab', 'clocked', 'start_time', 'expires', 'one_off']},
         ),
     ]
-    list_display = ('learning_context_key', 'credential_type', 'enabled', 'interval')
+    list_display = (
+        'learning_context_key',
+        'credential_type',
+        'enabled',
+        'interval',
+        'issued_credentials',
+        'failed_credentials',
+        'invalidated_credentials',
+    )
+    list_select_related = ('credential_type', 'periodic_task__interval', 'stats')
     search_fields = ('learning_context_key', 'credential_type__name')
     list_filter = ('learning_context_key', 'credential_type', 'periodic_task__enabled')
 
@@ -207,6 +197,28 @@ class CredentialConfigurationAdmin(DjangoObjectActions, ReverseModelAdmin):
         """Return the interval of the credentialedential generation task."""
         return obj.periodic_task.interval
 
+    @staticmethod
+    def _get_credential_count(obj: CredentialConfiguration, status: str) -> int:
+        """Return the number of credentials of the configuration with the given status."""
+        if (stats := getattr(obj, 'stats', None)) is None:
+            return 0
+        return getattr(stats, stats.get_counter_field(status))
+
+    @admin.display(description='Issued')
+    def issued_credentials(self, obj: CredentialConfiguration) -> int:
+        """Return the number of issued credentials."""
+        return self._get_credential_count(obj, Credential.Status.AVAILABLE)
+
+    @admin.display(description='Failed')
+    def failed_credentials(self, obj: CredentialConfiguration) -> int:
+        """Return the number of credentials that failed to generate."""
+        return self._get_credential_count(obj, Credential.Status.ERROR)
+
+    @admin.display(description='Invalidated')
+    def invalidated_credentials(self, obj: CredentialConfiguration) -> int:
+        """Return the number of invalidated credentials, including the archived ones."""
+        return self._get_credential_count(obj, Credential.Status.INVALIDATED)
+
     def get_readonly_fields(self, _request: HttpRequest, obj: CredentialConfiguration = None) -> tuple:
         """Make the learning_context_key field read-only."""
         if obj:  # editing an existing object
@@ -222,7 +234,11 @@ class CredentialConfigurationAdmin(DjangoObjectActions, ReverseModelAdmin):
             _request: The request object.
             obj: The CredentialConfiguration instance.
         """
-        generate_credentials_for_config_task.delay(obj.id)
+        # The tasks are imported here, so the Celery app is not created when the admin is loaded.
+        from .tasks import generate_credentials_for_config_task  # noqa: PLC0415
+
+        # Manual generation starts a new run, so it does not reuse the progress data of the scheduled run.
+        generate_credentials_for_config_task.delay(obj.id, uuid.uuid4().hex)
 
     change_actions = ('generate_credentials',)
 
@@ -310,3 +326,35 @@ class CredentialAdmin(DjangoObjectActions, admin.ModelAdmin):  # noqa: D101
         if django.VERSION[0] > 4 and isinstance(db_field, URLField):  # pragma: no cover
             kwargs["assume_scheme"] = "https"
         return super().formfield_for_dbfield(db_field, request, **kwargs)
+
+
+@admin.register(ArchivedCredential)
+class ArchivedCredentialAdmin(admin.ModelAdmin):  # noqa: D101
+    list_display = (
+        'user',
+        'user_full_name',
+        'configuration',
+        'invalidated_at',
+        'archived_at',
+    )
+    search_fields = (
+        "configuration__learning_context_key",
+        "user_full_name",
+        "user__username",
+        "user__email",
+        "uuid",
+        "verify_uuid",
+    )
+    list_filter = ("configuration__learning_context_key", "configuration__credential_type")
+
+    def has_add_permission(self, _request: HttpRequest) -> bool:
+        """Hide the "Add" button in the admin interface."""
+        return False
+
+    def has_change_permission(self, _request: HttpRequest, _obj: ArchivedCredential | None = None) -> bool:
+        """Make the archived credentials read-only."""
+        return False
+
+    def has_delete_permission(self, _request: HttpRequest, _obj: ArchivedCredential | None = None) -> bool:
+        """Hide the "Delete" button in the admin interface."""
+        return False
@@ -2,6 +2,8 @@
 
 from typing import TYPE_CHECKING
 
+from django.conf import settings
+from django.core.cache import cache
 from django.db.models import Q
 from learning_paths.models import LearningPath
 from opaque_keys import InvalidKeyError
@@ -9,7 +11,7 @@ from opaque_keys.edx.keys import LearningContextKey
 from rest_framework.exceptions import NotFound, ParseError
 from rest_framework.permissions import BasePermission
 
-from learning_credentials.compat import get_course_enrollments
+from learning_credentials.compat import is_enrolled_in_course
 
 if TYPE_CHECKING:
     from django.contrib.auth.models import User
@@ -37,7 +39,14 @@ class IsAdminOrSelf(BasePermission):
 
 
 class CanAccessLearningContext(BasePermission):
-    """Permission to allow access to learning context if the user is enrolled."""
+    """
+    Permission to allow access to learning context if the user is enrolled.
+
+    The access decisions are stored on the request, so each learning context is checked at most once per request.
+    Granted access is also stored in the Django cache for ``LEARNING_CREDENTIALS_ACCESS_CACHE_TIMEOUT`` seconds, so the
+    subsequent requests of the user do not query the database. Denied access is not cached, so learners can access a
+    learning context right after they enroll.
+    """
 
     def has_permission(self, request: "Request", view: "APIView") -> bool:
         """Check if the user can access the learning context."""
@@ -51,24 +60,47 @@ class CanAccessLearningContext(BasePermission):
         if request.user.is_staff:
             return True
 
-        if learning_context_key.is_course:
-            if self._can_access_course(learning_context_key, request.user):
-                return True
-
-            msg = "Course not found or user does not have access."
-            raise NotFound(msg)
-
-        # For learning paths, check enrollment or if it's not invite-only.
-        if self._can_access_learning_path(learning_context_key, request.user):
+        if self._can_access(learning_context_key, request):
             return True
 
-        msg = "Learning path not found or user does not have access."
+        if learning_context_key.is_course:
+            msg = "Course not found or user does not have access."
+        else:
+            msg = "Learning path not found or user does not have access."
         raise NotFound(msg)
 
+    @staticmethod
+    def _get_access_cache_key(learning_context_key: "LearningContextKey", user: "User") -> str:
+        """Get the key of the access decision of a user in the Django cache."""
+        return f'learning_credentials.learning_context_access.{user.id}.{learning_context_key}'
+
+    def _can_access(self, learning_context_key: "LearningContextKey", request: "Request") -> bool:
+        """Check if the user of the request can access a learning context, using the cached decisions if possible."""
+        decisions = getattr(request, '_learning_context_access', None)
+        if decisions is None:
+            decisions = request._learning_context_access = {}  # noqa: SLF001
+        if learning_context_key in decisions:
+            return decisions[learning_context_key]
+
+        cache_key = self._get_access_cache_key(learning_context_key, request.user)
+        if not (can_access := bool(cache.get(cache_key))):
+            if learning_context_key.is_course:
+                can_access = self._can_access_course(learning_context_key, request.user)
+            else:
+                # For learning paths, check enrollment or if it's not invite-only.
+                can_access = self._can_access_learning_path(learning_context_key, request.user)
+
+            timeout = getattr(settings, 'LEARNING_CREDENTIALS_ACCESS_CACHE_TIMEOUT', 60)
+            if can_access and timeout:
+                cache.set(cache_key, can_access, timeout)
+
+        decisions[learning_context_key] = can_access
+        return can_access
+
     def _can_access_course(self, course_key: "CourseKey", user: "User") -> bool:
         """Check if user can access a course."""
         # Check if user is enrolled in the course.
-        if get_course_enrollments(course_key, user.id):  # ty: ignore[unresolved-attribute]
+        if is_enrolled_in_course(course_key, user.id):  # ty: ignore[unresolved-attribute]
             return True
 
         # Check if the course is a part of a learning path the user can access.
@@ -80,10 +112,9 @@ class CanAccessLearningContext(BasePermission):
 
     def _can_access_course_via_learning_path(self, course_key: "CourseKey", user: "User") -> bool:
         """Check if user can access a course through learning path membership."""
-        accessible_paths = (
-            LearningPath.objects.filter(steps__course_key=course_key)
-            .filter(self._get_accessible_learning_paths_filter(user))
-            .distinct()
+        # `exists()` stops at the first matching row, so the joins do not need to be deduplicated with `distinct()`.
+        accessible_paths = LearningPath.objects.filter(steps__course_key=course_key).filter(
+            self._get_accessible_learning_paths_filter(user)
         )
 
         return accessible_paths.exists()
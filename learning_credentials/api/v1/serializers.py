@@ -1,10 +1,14 @@
 """API serializers for learning credentials."""
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+from django.conf import settings
 from rest_framework import serializers
 
-from learning_credentials.models import Credential
+from learning_credentials.models import Credential, CredentialConfigurationStats
+
+if TYPE_CHECKING:
+    from uuid import UUID
 
 
 class CredentialSerializer(serializers.ModelSerializer):
@@ -17,6 +21,40 @@ class CredentialSerializer(serializers.ModelSerializer):
         fields = ('user_full_name', 'created', 'learning_context_name', 'status', 'invalidation_reason')
 
 
+class BulkVerificationRequestSerializer(serializers.Serializer):
+    """Serializer for the verification UUIDs of the credentials verified at once."""
+
+    verify_uuids = serializers.ListField(child=serializers.UUIDField(), allow_empty=False)
+
+    def validate_verify_uuids(self, value: list["UUID"]) -> list["UUID"]:
+        """Limit the number of credentials verified in a single request."""
+        max_uuids = getattr(settings, 'LEARNING_CREDENTIALS_BULK_VERIFICATION_MAX_UUIDS', 100)
+        if len(value) > max_uuids:
+            msg = f'At most {max_uuids} credentials can be verified at once.'
+            raise serializers.ValidationError(msg)
+        return value
+
+
+class BulkEligibilityRequestSerializer(serializers.Serializer):
+    """Serializer for the learners whose credential eligibility is checked at once."""
+
+    usernames = serializers.ListField(child=serializers.CharField(), required=False, default=list)
+    user_ids = serializers.ListField(child=serializers.IntegerField(), required=False, default=list)
+
+    def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:
+        """Require at least one learner, and limit the number of learners checked in a single request."""
+        count = len(attrs['usernames']) + len(attrs['user_ids'])
+        if not count:
+            msg = 'At least one username or user ID is required.'
+            raise serializers.ValidationError(msg)
+
+        max_users = getattr(settings, 'LEARNING_CREDENTIALS_BULK_ELIGIBILITY_MAX_USERS', 100)
+        if count > max_users:
+            msg = f'The eligibility of at most {max_users} learners can be checked at once.'
+            raise serializers.ValidationError(msg)
+        return attrs
+
+
 class CredentialEligibilitySerializer(serializers.Serializer):
     """Serializer for credential eligibility information with dynamic fields."""
 
@@ -35,6 +73,8 @@ class CredentialEligibilitySerializer(serializers.Serializer):
 
     steps = serializers.DictField(required=False)
 
+    progress_computed_at = serializers.DateTimeField(required=False, allow_null=True)
+
     def to_representation(self, instance: dict) -> dict[str, Any]:
         """Remove null/empty fields from representation."""
         data = super().to_representation(instance)
@@ -46,3 +86,47 @@ class CredentialEligibilityResponseSerializer(serializers.Serializer):
 
     context_key = serializers.CharField()
     credentials = CredentialEligibilitySerializer(many=True)
+
+
+class UserCredentialEligibilitySerializer(serializers.Serializer):
+    """Serializer for the credential eligibility of a learner checked by the bulk eligibility endpoint."""
+
+    user_id = serializers.IntegerField()
+    username = serializers.CharField()
+    credentials = CredentialEligibilitySerializer(many=True)
+
+
+class BulkCredentialEligibilityResponseSerializer(serializers.Serializer):
+    """Serializer for the credential eligibility of multiple learners, keyed by the requested usernames and IDs."""
+
+    context_key = serializers.CharField()
+    users_by_username = serializers.DictField(child=UserCredentialEligibilitySerializer(allow_null=True))
+    users_by_id = serializers.DictField(child=UserCredentialEligibilitySerializer(allow_null=True))
+
+
+class CredentialStatsSerializer(serializers.ModelSerializer):
+    """Serializer for the credential counters of a credential configuration."""
+
+    credential_type_id = serializers.IntegerField(source='configuration.credential_type_id')
+    name = serializers.CharField(source='configuration.credential_type.name')
+
+    class Meta:
+        """Serializer metadata."""
+
+        model = CredentialConfigurationStats
+        fields = (
+            'credential_type_id',
+            'name',
+            'generating_count',
+            'available_count',
+            'error_count',
+            'invalidated_count',
+            'reconciled_at',
+        )
+
+
+class CredentialStatsResponseSerializer(serializers.Serializer):
+    """Serializer for the credential counters of a learning context."""
+
+    context_key = serializers.CharField()
+    credentials = CredentialStatsSerializer(many=True)
@@ -0,0 +1,55 @@
+"""Django REST framework throttles."""
+
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from rest_framework.throttling import SimpleRateThrottle
+
+if TYPE_CHECKING:
+    from rest_framework.request import Request
+    from rest_framework.views import APIView
+
+
+class _SettingRateThrottle(SimpleRateThrottle):
+    """
+    Limit the rate of the requests of each user (or IP address for anonymous requests).
+
+    The rate is read from the ``rate_setting`` setting (e.g., ``"100/hour"``), so it does not need to be added to the
+    throttle rates of the platform. Set it to None to disable the throttling.
+    """
+
+    rate_setting: str
+    default_rate: str | None
+
+    def get_rate(self) -> str | None:
+        """Get the rate from the settings."""
+        return getattr(settings, self.rate_setting, self.default_rate)
+
+    def get_cache_key(self, request: "Request", view: "APIView") -> str:  # noqa: ARG002
+        """Get the cache key of the user or the IP address."""
+        ident = request.user.pk if request.user.is_authenticated else self.get_ident(request)
+        return self.cache_format % {'scope': self.scope, 'ident': ident}
+
+
+class BulkVerificationRateThrottle(_SettingRateThrottle):
+    """Limit the rate of the bulk verification requests (``LEARNING_CREDENTIALS_BULK_VERIFICATION_THROTTLE_RATE``)."""
+
+    scope = 'learning_credentials_bulk_verification'
+    rate_setting = 'LEARNING_CREDENTIALS_BULK_VERIFICATION_THROTTLE_RATE'
+    default_rate = '100/hour'
+
+
+class FreshEligibilityRateThrottle(_SettingRateThrottle):
+    """Limit the rate of the live eligibility checks (``LEARNING_CREDENTIALS_FRESH_ELIGIBILITY_THROTTLE_RATE``)."""
+
+    scope = 'learning_credentials_fresh_eligibility'
+    rate_setting = 'LEARNING_CREDENTIALS_FRESH_ELIGIBILITY_THROTTLE_RATE'
+    default_rate = '10/minute'
+
+
+class BulkEligibilityRateThrottle(_SettingRateThrottle):
+    """Limit the rate of the bulk eligibility checks (``LEARNING_CREDENTIALS_BULK_ELIGIBILITY_THROTTLE_RATE``)."""
+
+    scope = 'learning_credentials_bulk_eligibility'
+    rate_setting = 'LEARNING_CREDENTIALS_BULK_ELIGIBILITY_THROTTLE_RATE'
+    default_rate = '10/hour'
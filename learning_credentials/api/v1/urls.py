@@ -2,7 +2,15 @@
 
 from django.urls import path
 
-from .views import CredentialConfigurationCheckView, CredentialEligibilityView, CredentialMetadataView
+from .views import (
+    CredentialBulkEligibilityView,
+    CredentialBulkMetadataView,
+    CredentialConfigurationCheckView,
+    CredentialEligibilityView,
+    CredentialMetadataView,
+    CredentialProgressReportView,
+    CredentialStatsView,
+)
 
 urlpatterns = [
     path(
@@ -10,10 +18,20 @@ urlpatterns = [
         CredentialConfigurationCheckView.as_view(),
         name='credential_configuration_check',
     ),
+    path('metadata/', CredentialBulkMetadataView.as_view(), name='credential-metadata-bulk'),
     path('metadata/<uuid:uuid>/', CredentialMetadataView.as_view(), name='credential-metadata'),
     path(
         'eligibility/<str:learning_context_key>/',
         CredentialEligibilityView.as_view(),
         name='credential-eligibility',
     ),
+    path(
+        'eligibility/<str:learning_context_key>/bulk/',
+        CredentialBulkEligibilityView.as_view(),
+        name='credential-eligibility-bulk',
+    ),
+    path('stats/<str:learning_context_key>/', CredentialStatsView.as_view(), name='credential-stats'),
+    path(
+        'report/<str:learning_context_key>/', CredentialProgressReportView.as_view(), name='credential-progress-report'
+    ),
 ]
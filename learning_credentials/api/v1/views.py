@@ -1,25 +1,147 @@
 """API views for Learning Credentials."""
 
-from typing import TYPE_CHECKING
+import hashlib
+import json
+from typing import TYPE_CHECKING, Any
 
 import edx_api_doc_tools as apidocs
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models import Q
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
 from edx_api_doc_tools import ParameterLocation
 from rest_framework import status
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from learning_credentials.models import Credential, CredentialConfiguration
+from learning_credentials.concurrency import run_concurrently
+from learning_credentials.models import (
+    ArchivedCredential,
+    Credential,
+    CredentialConfiguration,
+    CredentialConfigurationStats,
+    LearnerProgressSnapshot,
+)
+from learning_credentials.progress_cache import request_progress_cache_scope
+from learning_credentials.reports import REPORT_CONTENT_TYPES, iter_progress_report
 
 from .permissions import CanAccessLearningContext, IsAdminOrSelf
-from .serializers import CredentialEligibilityResponseSerializer, CredentialSerializer
+from .serializers import (
+    BulkCredentialEligibilityResponseSerializer,
+    BulkEligibilityRequestSerializer,
+    BulkVerificationRequestSerializer,
+    CredentialEligibilityResponseSerializer,
+    CredentialSerializer,
+    CredentialStatsResponseSerializer,
+)
+from .throttles import BulkEligibilityRateThrottle, BulkVerificationRateThrottle, FreshEligibilityRateThrottle
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
+    from datetime import datetime
+    from uuid import UUID
+
     from django.contrib.auth.models import User
     from rest_framework.request import Request
 
+    from learning_credentials.models import BaseCredential
+
+
+def _get_eligibility_max_workers() -> int:
+    """
+    Get the maximum number of credential configurations evaluated concurrently by the eligibility endpoints.
+
+    The threads are shared by all requests of the process, and each of them keeps its own database connection, so the
+    process opens at most this many database connections in addition to the ones of its request threads.
+    """
+    return getattr(settings, 'LEARNING_CREDENTIALS_ELIGIBILITY_MAX_WORKERS', 4)
+
+
+def _serialize_metadata(credential: "BaseCredential") -> dict[str, Any]:
+    """
+    Serialize the metadata of a credential with the values of its validators for conditional requests.
+
+    :param credential: The credential (current or archived).
+    :returns: The serialized metadata, its ETag, and the timestamp of the last modification of the credential.
+    """
+    data = dict(CredentialSerializer(credential).data)
+    content = json.dumps(data, sort_keys=True, default=str).encode()
+    return {
+        'data': data,
+        'etag': quote_etag(hashlib.sha256(content).hexdigest()),
+        'last_modified': int(credential.modified.timestamp()),
+    }
+
+
+def _get_many_metadata(uuids: "Collection[UUID]") -> dict["UUID", dict[str, Any]]:
+    """
+    Get the metadata of credentials, using the Django cache.
+
+    The credentials missing from the cache are retrieved with a single query to each credential table. Invalidated
+    credentials can be moved to the archive, so they are looked up there if they are not found. The retrieved metadata
+    is cached for ``LEARNING_CREDENTIALS_METADATA_CACHE_TIMEOUT``, and unknown UUIDs are cached for
+    ``LEARNING_CREDENTIALS_METADATA_NEGATIVE_CACHE_TIMEOUT``, so enumeration attempts do not reach the database.
+
+    :param uuids: The verification UUIDs of the credentials.
+    :returns: The serialized metadata of each credential (see `_serialize_metadata`), or an empty dict for the
+        credentials that do not exist.
+    """
+    cache_keys = {Credential.get_metadata_cache_key(uuid): uuid for uuid in uuids}
+    metadata = {cache_keys[cache_key]: value for cache_key, value in cache.get_many(cache_keys).items()}
+
+    missing_uuids = [uuid for uuid in uuids if uuid not in metadata]
+    retrieved_metadata = {}
+    for model in (Credential, ArchivedCredential):
+        if missing_uuids:
+            for credential in model.objects.filter(verify_uuid__in=missing_uuids):
+                retrieved_metadata[credential.verify_uuid] = _serialize_metadata(credential)
+            missing_uuids = [uuid for uuid in missing_uuids if uuid not in retrieved_metadata]
+
+    if retrieved_metadata:
+        cache.set_many(
+            {Credential.get_metadata_cache_key(uuid): value for uuid, value in retrieved_metadata.items()},
+            getattr(settings, 'LEARNING_CREDENTIALS_METADATA_CACHE_TIMEOUT', 3600),
+        )
+    if missing_uuids:
+        cache.set_many(
+            {Credential.get_metadata_cache_key(uuid): {} for uuid in missing_uuids},
+            getattr(settings, 'LEARNING_CREDENTIALS_METADATA_NEGATIVE_CACHE_TIMEOUT', 60),
+        )
+
+    return {**metadata, **retrieved_metadata, **{uuid: {} for uuid in missing_uuids}}
+
+
+def _build_eligibility_data(
+    config: CredentialConfiguration,
+    progress_data: dict[str, Any],
+    existing_credential: Credential | None,
+    computed_at: "datetime",
+) -> dict[str, Any]:
+    """
+    Get the eligibility data of a learner for a credential configuration.
+
+    :param config: The credential configuration.
+    :param progress_data: The progress returned by the retrieval function of the configuration.
+    :param existing_credential: The credential of the learner for this configuration, if it exists.
+    :param computed_at: The time when the progress was retrieved.
+    :returns: The data in the format of ``CredentialEligibilitySerializer``.
+    """
+    return {
+        'credential_type_id': config.credential_type.pk,
+        'name': config.credential_type.name,
+        'is_generation_enabled': config.periodic_task.enabled,
+        **progress_data,
+        'existing_credential': existing_credential.uuid if existing_credential else None,
+        'existing_credential_url': existing_credential.download_url if existing_credential else None,
+        'progress_computed_at': computed_at,
+    }
+
 
 class CredentialConfigurationCheckView(APIView):
     """API view to check if any credentials are configured for a specific learning context."""
@@ -100,13 +222,17 @@ class CredentialMetadataView(APIView):
         ],
         responses={
             200: "Successfully retrieved the credential metadata.",
+            304: "The credential metadata did not change since the version cached by the client.",
             404: "Credential not found or not valid.",
         },
     )
-    def get(self, _request: "Request", uuid: str) -> Response:
+    def get(self, request: "Request", uuid: str) -> Response:
         """
         Retrieve credential metadata by its UUID.
 
+        The responses are cached, and they include the ``ETag``, ``Last-Modified``, and ``Cache-Control`` headers, so
+        they can be cached by CDNs and revalidated with conditional requests (which return ``304 Not Modified``).
+
         **Example Request**
 
         ``GET /api/learning_credentials/v1/metadata/123e4567-e89b-12d3-a456-426614174000/``
@@ -114,6 +240,7 @@ class CredentialMetadataView(APIView):
         **Response Values**
 
         - **200 OK**: Successfully retrieved the credential metadata.
+        - **304 Not Modified**: The ``If-None-Match`` or ``If-Modified-Since`` header matches the current version.
         - **404 Not Found**: Credential not found or not valid.
 
         **Example Response**
@@ -137,13 +264,87 @@ class CredentialMetadataView(APIView):
                 "invalidation_reason": "Reissued due to name change."
             }
         """
-        try:
-            credential = Credential.objects.get(verify_uuid=uuid)
-        except Credential.DoesNotExist:
-            return Response({'error': 'Credential not found.'}, status=status.HTTP_404_NOT_FOUND)
+        negative_cache_timeout = getattr(settings, 'LEARNING_CREDENTIALS_METADATA_NEGATIVE_CACHE_TIMEOUT', 60)
+        metadata = _get_many_metadata([uuid])[uuid]
+
+        if not metadata:
+            response = Response({'error': 'Credential not found.'}, status=status.HTTP_404_NOT_FOUND)
+            patch_cache_control(response, public=True, max_age=negative_cache_timeout)
+            return response
+
+        response = get_conditional_response(
+            request, etag=metadata['etag'], last_modified=metadata['last_modified']
+        ) or Response(metadata['data'], status=status.HTTP_200_OK)
+        response['ETag'] = metadata['etag']
+        response['Last-Modified'] = http_date(metadata['last_modified'])
+        patch_cache_control(
+            response, public=True, max_age=getattr(settings, 'LEARNING_CREDENTIALS_METADATA_MAX_AGE', 300)
+        )
+        return response
+
+
+class CredentialBulkMetadataView(APIView):
+    """API view to retrieve the metadata of multiple credentials at once."""
+
+    throttle_classes = (BulkVerificationRateThrottle,)
+
+    @apidocs.schema(
+        body=BulkVerificationRequestSerializer,
+        responses={
+            200: "Successfully retrieved the credential metadata.",
+            400: "Invalid list of UUIDs.",
+            429: "Too many requests.",
+        },
+    )
+    def post(self, request: "Request") -> Response:
+        """
+        Retrieve the metadata of multiple credentials by their verification UUIDs.
+
+        It returns the same fields as the metadata endpoint of a single credential, keyed by the verification UUID. The
+        value is ``null`` for the credentials that do not exist. At most
+        ``LEARNING_CREDENTIALS_BULK_VERIFICATION_MAX_UUIDS`` UUIDs can be verified in a single request, and the requests
+        are throttled by ``LEARNING_CREDENTIALS_BULK_VERIFICATION_THROTTLE_RATE``.
+
+        **Example Request**
 
-        serializer = CredentialSerializer(credential)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        ``POST /api/learning_credentials/v1/metadata/``
+
+        .. code-block:: json
+
+            {
+                "verify_uuids": ["123e4567-e89b-12d3-a456-426614174000", "00000000-0000-0000-0000-000000000000"]
+            }
+
+        **Response Values**
+
+        - **200 OK**: Successfully retrieved the credential metadata.
+        - **400 Bad Request**: The list of UUIDs is missing, empty, too long, or contains invalid UUIDs.
+        - **429 Too Many Requests**: The client exceeded the rate limit.
+
+        **Example Response**
+
+        .. code-block:: json
+
+            {
+                "credentials": {
+                    "123e4567-e89b-12d3-a456-426614174000": {
+                        "user_full_name": "John Doe",
+                        "created": "2023-01-01",
+                        "learning_context_name": "Demo Course",
+                        "status": "available",
+                        "invalidation_reason": ""
+                    },
+                    "00000000-0000-0000-0000-000000000000": null
+                }
+            }
+        """
+        request_serializer = BulkVerificationRequestSerializer(data=request.data)
+        request_serializer.is_valid(raise_exception=True)
+        uuids = dict.fromkeys(request_serializer.validated_data['verify_uuids'])
+
+        metadata = _get_many_metadata(uuids)
+        credentials = {str(uuid): metadata[uuid].get('data') for uuid in uuids}
+        return Response({'credentials': credentials}, status=status.HTTP_200_OK)
 
 
 class CredentialEligibilityView(APIView):
@@ -153,25 +354,43 @@ class CredentialEligibilityView(APIView):
     **GET**: Returns detailed eligibility info for all configured credentials in a learning context.
 
     Staff users can operate on behalf of other users via the ``username`` parameter.
+
+    The configurations are evaluated concurrently by up to ``LEARNING_CREDENTIALS_ELIGIBILITY_MAX_WORKERS`` threads.
+    They share a progress cache for the duration of the request, so the progress of the user in each course (e.g., the
+    grades) is retrieved at most once, even if multiple configurations (or learning path steps) use the same course.
+
+    If ``LEARNING_CREDENTIALS_PROGRESS_SNAPSHOTS`` is enabled, the progress is read from the stored snapshots, and it
+    is only retrieved for the configurations without a snapshot newer than
+    ``LEARNING_CREDENTIALS_PROGRESS_SNAPSHOT_MAX_AGE``, or for all of them if ``fresh=true`` is passed.
     """
 
     permission_classes = (IsAuthenticated, IsAdminOrSelf, CanAccessLearningContext)
 
+    def get_throttles(self) -> list:
+        """Throttle the requests that retrieve the progress even if it is stored in the snapshots."""
+        if self._is_fresh_request():
+            return [FreshEligibilityRateThrottle()]
+        return super().get_throttles()
+
+    def _is_fresh_request(self) -> bool:
+        """Check whether the progress is retrieved for all configurations instead of being read from the snapshots."""
+        return self.request.query_params.get('fresh', '').lower() in ('true', '1')
+
     def _get_eligibility_data(
-        self, user: "User", config: CredentialConfiguration, credentials_by_config_id: dict[int, Credential]
+        self,
+        user: "User",
+        config: CredentialConfiguration,
+        credentials_by_config_id: dict[int, Credential],
+        snapshots_by_config_id: dict[int, LearnerProgressSnapshot],
     ) -> dict:
-        """Calculate eligibility data for a credential configuration."""
-        progress_data = config.get_user_eligibility_details(user_id=user.id)
-        existing_credential = credentials_by_config_id.get(config.id)
-
-        return {
-            'credential_type_id': config.credential_type.pk,
-            'name': config.credential_type.name,
-            'is_generation_enabled': config.periodic_task.enabled,
-            **progress_data,
-            'existing_credential': existing_credential.uuid if existing_credential else None,
-            'existing_credential_url': existing_credential.download_url if existing_credential else None,
-        }
+        """Calculate eligibility data for a credential configuration, or read it from its progress snapshot."""
+        if snapshot := snapshots_by_config_id.get(config.id):
+            progress_data = {**snapshot.progress, 'is_eligible': snapshot.is_eligible}
+            computed_at = snapshot.computed_at
+        else:
+            computed_at = timezone.now()
+            progress_data = config.get_user_eligibility_details(user_id=user.id)
+        return _build_eligibility_data(config, progress_data, credentials_by_config_id.get(config.id), computed_at)
 
     @apidocs.schema(
         parameters=[
@@ -199,12 +418,18 @@ class CredentialEligibilityView(APIView):
                     "Staff users may specify any username; non-staff users are limited to their own."
                 ),
             ),
+            apidocs.string_parameter(
+                "fresh",
+                ParameterLocation.QUERY,
+                description="Set to true to retrieve the current progress instead of reading the stored snapshots.",
+            ),
         ],
         responses={
             200: CredentialEligibilityResponseSerializer,
             400: "Invalid context key format.",
             403: "User is not authenticated.",
             404: "Learning context not found or user does not have access.",
+            429: "Too many requests with fresh=true.",
         },
     )
     def get(self, request: "Request", learning_context_key: str) -> Response:
@@ -223,6 +448,10 @@ class CredentialEligibilityView(APIView):
         - ``username`` (staff only): View eligibility for a specific user.
         - ``retrieval_func``: Filter by credential type retrieval function
           (e.g. ``learning_credentials.processors.retrieve_subsection_grades``).
+        - ``fresh``: Set to ``true`` to retrieve the current progress instead of reading the stored snapshots.
+          These requests are throttled.
+
+        The ``progress_computed_at`` field of each credential shows when its progress was retrieved.
 
         **Example Request**
 
@@ -241,7 +470,8 @@ class CredentialEligibilityView(APIView):
                   "is_eligible": true,
                   "existing_credential": null,
                   "current_grades": {"final exam": 86, "total": 82},
-                  "required_grades": {"final exam": 65, "total": 80}
+                  "required_grades": {"final exam": 65, "total": 80},
+                  "progress_computed_at": "2026-01-01T12:00:00Z"
                 }
               ]
             }
@@ -263,9 +493,27 @@ class CredentialEligibilityView(APIView):
         )
         credentials_by_config_id = {credential.configuration_id: credential for credential in credentials}
 
-        eligibility_data = [
-            self._get_eligibility_data(user, config, credentials_by_config_id) for config in configurations
-        ]
+        snapshots_by_config_id = {}
+        if LearnerProgressSnapshot.is_enabled() and not self._is_fresh_request():
+            snapshots = LearnerProgressSnapshot.get_current_snapshots().filter(
+                user_id=user.id, configuration__in=configurations
+            )
+            snapshots_by_config_id = {snapshot.configuration_id: snapshot for snapshot in snapshots}
+
+        configurations = list(configurations)
+        max_workers = _get_eligibility_max_workers()
+        with request_progress_cache_scope():
+            eligibility_by_config_id = {
+                config.id: data
+                for config, data in run_concurrently(
+                    lambda config: self._get_eligibility_data(
+                        user, config, credentials_by_config_id, snapshots_by_config_id
+                    ),
+                    configurations,
+                    max_workers,
+                )
+            }
+        eligibility_data = [eligibility_by_config_id[config.id] for config in configurations]
 
         response_data = {
             'context_key': learning_context_key,
@@ -275,3 +523,297 @@ class CredentialEligibilityView(APIView):
         serializer = CredentialEligibilityResponseSerializer(data=response_data)
         serializer.is_valid(raise_exception=True)
         return Response(serializer.data)
+
+
+class CredentialBulkEligibilityView(APIView):
+    """
+    API view to check the credential eligibility of multiple learners (e.g., a cohort) at once.
+
+    The retrieval function of each credential configuration is called once for all requested learners, and the built-in
+    retrieval functions only retrieve the enrollments and grades of these learners.
+    """
+
+    permission_classes = (IsAuthenticated, IsAdminUser, CanAccessLearningContext)
+    throttle_classes = (BulkEligibilityRateThrottle,)
+
+    @apidocs.schema(
+        parameters=[
+            apidocs.string_parameter(
+                "learning_context_key",
+                ParameterLocation.PATH,
+                description=(
+                    "Learning context identifier. Can be a course key (course-v1:OpenedX+DemoX+DemoCourse) "
+                    "or learning path key (path-v1:OpenedX+DemoX+DemoPath+Demo)"
+                ),
+            ),
+            apidocs.string_parameter(
+                "retrieval_func",
+                ParameterLocation.QUERY,
+                description=(
+                    "Filter by credential type retrieval function "
+                    "(e.g. learning_credentials.processors.retrieve_subsection_grades)."
+                ),
+            ),
+        ],
+        body=BulkEligibilityRequestSerializer,
+        responses={
+            200: BulkCredentialEligibilityResponseSerializer,
+            400: "Invalid context key format or list of learners.",
+            403: "User is not authenticated or is not a staff user.",
+            429: "Too many requests.",
+        },
+    )
+    def post(self, request: "Request", learning_context_key: str) -> Response:
+        """
+        Get the credential eligibility of multiple learners in a learning context.
+
+        The learners are identified by their usernames and/or user IDs. At most
+        ``LEARNING_CREDENTIALS_BULK_ELIGIBILITY_MAX_USERS`` learners can be checked in a single request. The results
+        are keyed by the requested usernames in ``users_by_username`` and by the requested user IDs in
+        ``users_by_id``, and each of them contains the same credential fields as the eligibility endpoint. The value is
+        ``null`` for the learners that do not exist.
+
+        **Query Parameters**
+
+        - ``retrieval_func``: Filter by credential type retrieval function.
+
+        **Example Request**
+
+        ``POST /api/learning_credentials/v1/eligibility/course-v1:OpenedX+DemoX+DemoCourse/bulk/``
+
+        .. code-block:: json
+
+            {
+                "usernames": ["learner", "unknown"],
+                "user_ids": [4]
+            }
+
+        **Example Response**
+
+        .. code-block:: json
+
+            {
+              "context_key": "course-v1:OpenedX+DemoX+DemoCourse",
+              "users_by_username": {
+                "learner": {
+                  "user_id": 3,
+                  "username": "learner",
+                  "credentials": [
+                    {
+                      "credential_type_id": 1,
+                      "name": "Certificate of Achievement",
+                      "is_eligible": false,
+                      "current_grades": {"total": 62},
+                      "required_grades": {"total": 80},
+                      "progress_computed_at": "2026-01-01T12:00:00Z"
+                    }
+                  ]
+                },
+                "unknown": null
+              },
+              "users_by_id": {
+                "4": {"user_id": 4, "username": "another_learner", "credentials": []}
+              }
+            }
+        """
+        request_serializer = BulkEligibilityRequestSerializer(data=request.data)
+        request_serializer.is_valid(raise_exception=True)
+        usernames = dict.fromkeys(request_serializer.validated_data['usernames'])
+        user_ids = dict.fromkeys(request_serializer.validated_data['user_ids'])
+
+        users = get_user_model().objects.filter(Q(username__in=usernames) | Q(id__in=user_ids)).only('id', 'username')
+        users_by_id = {user.id: user for user in users}
+
+        configurations = CredentialConfiguration.objects.filter(
+            learning_context_key=learning_context_key
+        ).select_related('credential_type', 'periodic_task')
+        if retrieval_func := request.query_params.get('retrieval_func'):
+            configurations = configurations.filter(credential_type__retrieval_func=retrieval_func)
+
+        credentials = Credential.objects.filter(user_id__in=users_by_id, configuration__in=configurations).exclude(
+            status__in=[Credential.Status.ERROR, Credential.Status.INVALIDATED]
+        )
+        credentials_by_key = {
+            (credential.user_id, credential.configuration_id): credential for credential in credentials
+        }
+
+        configurations = list(configurations) if users_by_id else []
+        computed_at = timezone.now()
+        max_workers = _get_eligibility_max_workers()
+        with request_progress_cache_scope():
+            details_by_config_id = {
+                config.id: details
+                for config, details in run_concurrently(
+                    lambda config: config.get_users_eligibility_details(list(users_by_id)),
+                    configurations,
+                    max_workers,
+                )
+            }
+
+        eligibility_by_user_id = {
+            user.id: {
+                'user_id': user.id,
+                'username': user.username,
+                'credentials': [
+                    _build_eligibility_data(
+                        config,
+                        details_by_config_id[config.id][user.id],
+                        credentials_by_key.get((user.id, config.id)),
+                        computed_at,
+                    )
+                    for config in configurations
+                ],
+            }
+            for user in users_by_id.values()
+        }
+        user_ids_by_username = {user.username: user.id for user in users_by_id.values()}
+
+        serializer = BulkCredentialEligibilityResponseSerializer(
+            data={
+                'context_key': learning_context_key,
+                'users_by_username': {
+                    username: eligibility_by_user_id.get(user_ids_by_username.get(username)) for username in usernames
+                },
+                'users_by_id': {user_id: eligibility_by_user_id.get(user_id) for user_id in user_ids},
+            }
+        )
+        serializer.is_valid(raise_exception=True)
+        return Response(serializer.data)
+
+
+class CredentialStatsView(APIView):
+    """API view to retrieve the number of credentials of each credential configuration in a learning context."""
+
+    permission_classes = (IsAuthenticated, IsAdminUser, CanAccessLearningContext)
+
+    @apidocs.schema(
+        parameters=[
+            apidocs.string_parameter(
+                "learning_context_key",
+                ParameterLocation.PATH,
+                description=(
+                    "Learning context identifier. Can be a course key (course-v1:OpenedX+DemoX+DemoCourse) "
+                    "or learning path key (path-v1:OpenedX+DemoX+DemoPath+Demo)"
+                ),
+            ),
+        ],
+        responses={
+            200: CredentialStatsResponseSerializer,
+            400: "Invalid context key format.",
+            403: "User is not authenticated or is not a staff user.",
+        },
+    )
+    def get(self, _request: "Request", learning_context_key: str) -> Response:
+        """
+        Get the number of credentials of each credential configuration in a learning context.
+
+        The numbers are read from the counters of the configurations, so the credentials are not counted on each
+        request. Invalidated credentials include the archived ones.
+
+        **Example Request**
+
+        ``GET /api/learning_credentials/v1/stats/course-v1:OpenedX+DemoX+DemoCourse/``
+
+        **Example Response**
+
+        .. code-block:: json
+
+            {
+              "context_key": "course-v1:OpenedX+DemoX+DemoCourse",
+              "credentials": [
+                {
+                  "credential_type_id": 1,
+                  "name": "Certificate of Achievement",
+                  "generating_count": 0,
+                  "available_count": 120,
+                  "error_count": 2,
+                  "invalidated_count": 5,
+                  "reconciled_at": "2026-01-15T10:30:00Z"
+                }
+              ]
+            }
+        """
+        stats = CredentialConfigurationStats.objects.filter(
+            configuration__learning_context_key=learning_context_key
+        ).select_related('configuration__credential_type')
+
+        serializer = CredentialStatsResponseSerializer({'context_key': learning_context_key, 'credentials': stats})
+        return Response(serializer.data)
+
+
+class CredentialProgressReportView(APIView):
+    """API view to stream the progress of all learners of a learning context towards its credentials."""
+
+    permission_classes = (IsAuthenticated, IsAdminUser, CanAccessLearningContext)
+
+    @apidocs.schema(
+        parameters=[
+            apidocs.string_parameter(
+                "learning_context_key",
+                ParameterLocation.PATH,
+                description=(
+                    "Learning context identifier. Can be a course key (course-v1:OpenedX+DemoX+DemoCourse) "
+                    "or learning path key (path-v1:OpenedX+DemoX+DemoPath+Demo)"
+                ),
+            ),
+            apidocs.string_parameter(
+                "output_format",
+                ParameterLocation.QUERY,
+                description="Format of the report: ndjson (default) or csv.",
+            ),
+            apidocs.string_parameter(
+                "retrieval_func",
+                ParameterLocation.QUERY,
+                description=(
+                    "Filter by credential type retrieval function "
+                    "(e.g. learning_credentials.processors.retrieve_subsection_grades)."
+                ),
+            ),
+        ],
+        responses={
+            200: "The progress report.",
+            400: "Invalid context key format or unsupported report format.",
+            403: "User is not authenticated or is not a staff user.",
+        },
+    )
+    def get(self, request: "Request", learning_context_key: str) -> StreamingHttpResponse | Response:
+        """
+        Stream the progress of all learners of a learning context towards each of its credentials.
+
+        The retrieval function of each credential configuration is called once for the whole learning context, and the
+        progress of each learner is streamed as soon as it is retrieved. For learning paths and combined completion and
+        grade criteria, the progress of all learners is retrieved before the first one is streamed.
+
+        **Query Parameters**
+
+        - ``output_format``: ``ndjson`` (default) for one JSON object per line, or ``csv``.
+        - ``retrieval_func``: Filter by credential type retrieval function.
+
+        **Example Request**
+
+        ``GET /api/learning_credentials/v1/report/course-v1:OpenedX+DemoX+DemoCourse/?output_format=ndjson``
+
+        **Example Response**
+
+        .. code-block:: json
+
+            {"credential_type_id": 1, "credential_type": "Certificate of Achievement", "user_id": 3, "username": "learner", "is_eligible": false, "progress": {"current_grades": {"total": 0.62}, "required_grades": {"total": 0.8}}}
+        """  # noqa: E501
+        output_format = request.query_params.get('output_format', 'ndjson')
+        if output_format not in REPORT_CONTENT_TYPES:
+            return Response(
+                {'error': f'Unsupported report format: {output_format}.'}, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        configurations = CredentialConfiguration.objects.filter(
+            learning_context_key=learning_context_key
+        ).select_related('credential_type')
+        if retrieval_func := request.query_params.get('retrieval_func'):
+            configurations = configurations.filter(credential_type__retrieval_func=retrieval_func)
+
+        response = StreamingHttpResponse(
+            iter_progress_report(configurations, output_format), content_type=REPORT_CONTENT_TYPES[output_format]
+        )
+        filename = f'{learning_context_key}.{output_format}'.replace(':', '_')
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
@@ -5,7 +5,7 @@ from __future__ import annotations
 from typing import ClassVar
 
 from django.apps import AppConfig
-from edx_django_utils.plugins.constants import PluginSettings, PluginURLs
+from edx_django_utils.plugins.constants import PluginSettings, PluginSignals, PluginURLs
 
 
 class LearningCredentialsConfig(AppConfig):
@@ -22,6 +22,29 @@ class LearningCredentialsConfig(AppConfig):
                 PluginURLs.APP_NAME: name,
             }
         },
+        PluginSignals.CONFIG: {
+            'lms.djangoapp': {
+                PluginSignals.RELATIVE_PATH: 'signals',
+                PluginSignals.RECEIVERS: [
+                    {
+                        PluginSignals.RECEIVER_FUNC_NAME: 'invalidate_course_name',
+                        PluginSignals.SIGNAL_PATH: 'django.db.models.signals.post_save',
+                        PluginSignals.SENDER_PATH: (
+                            'openedx.core.djangoapps.content.course_overviews.models.CourseOverview'
+                        ),
+                    },
+                    {
+                        PluginSignals.RECEIVER_FUNC_NAME: 'invalidate_learning_path_name',
+                        PluginSignals.SIGNAL_PATH: 'django.db.models.signals.post_save',
+                        PluginSignals.SENDER_PATH: 'learning_paths.models.LearningPath',
+                    },
+                    {
+                        PluginSignals.RECEIVER_FUNC_NAME: 'update_progress_snapshots',
+                        PluginSignals.SIGNAL_PATH: 'openedx.core.djangoapps.signals.signals.COURSE_GRADE_CHANGED',
+                    },
+                ],
+            },
+        },
         PluginSettings.CONFIG: {
             'lms.djangoapp': {
                 'common': {PluginSettings.RELATIVE_PATH: 'settings.common'},
@@ -0,0 +1,230 @@
+"""
+Local disk cache of the files of credential assets.
+
+With remote storage backends (e.g., S3), reading a PDF template or a font is a network request. When the
+``LEARNING_CREDENTIALS_ASSET_CACHE_DIR`` setting is set, each version of an asset is downloaded once per host and
+stored in that directory. All processes of the host share the cached files, and they read them with ``mmap`` or by
+their path, so the operating system keeps a single copy of each file in memory.
+
+Files are written to a temporary file and atomically renamed, so other processes never read a partially written file.
+When the total size of the cached files exceeds ``LEARNING_CREDENTIALS_ASSET_CACHE_MAX_BYTES``, the least recently
+used files are removed.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import io
+import logging
+import mmap
+import os
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+
+if TYPE_CHECKING:
+    from django.core.files import File
+
+log = logging.getLogger(__name__)
+
+_TEMPORARY_FILE_SUFFIX = '.tmp'
+
+
+def _get_cache_dir() -> Path | None:
+    """Get the directory of the cache, or None if the cache is disabled."""
+    if not (cache_dir := getattr(settings, 'LEARNING_CREDENTIALS_ASSET_CACHE_DIR', None)):
+        return None
+    return Path(cache_dir)
+
+
+def _get_cache_path(cache_dir: Path, version: str) -> Path:
+    """Get the path of the cached file of an asset version."""
+    return cache_dir / hashlib.sha256(version.encode()).hexdigest()
+
+
+def _touch(path: Path):
+    """Mark a cached file as recently used. The modification time is used as the last access time by the eviction."""
+    with contextlib.suppress(FileNotFoundError):
+        os.utime(path)
+
+
+def _map_file(path: Path) -> bytes | mmap.mmap:
+    """
+    Map a cached file into memory and mark it as recently used.
+
+    :param path: The path of the cached file.
+    :returns: The content of the file.
+    :raises FileNotFoundError: If the file does not exist (e.g., it was evicted by another process).
+    """
+    with path.open('rb') as file:
+        # Empty files cannot be mapped.
+        content = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if os.fstat(file.fileno()).st_size else b''
+    _touch(path)
+    return content
+
+
+def _write_atomically(path: Path, content: bytes):
+    """
+    Write a file, so that other processes see either the complete file or no file at all.
+
+    :param path: The path of the file.
+    :param content: The content of the file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temporary_path = tempfile.mkstemp(dir=path.parent, suffix=_TEMPORARY_FILE_SUFFIX)
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            file.write(content)
+        Path(temporary_path).replace(path)
+    except BaseException:
+        Path(temporary_path).unlink(missing_ok=True)
+        raise
+
+
+def _evict(cache_dir: Path, max_bytes: int):
+    """
+    Remove the least recently used files until the total size of the cache does not exceed `max_bytes`.
+
+    Processes that have already mapped a removed file can still read it.
+
+    :param cache_dir: The directory of the cache.
+    :param max_bytes: The maximum total size of the cached files.
+    """
+    entries = []
+    for entry in os.scandir(cache_dir):
+        if entry.is_file() and not entry.name.endswith(_TEMPORARY_FILE_SUFFIX):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+    total_size = sum(size for _mtime, size, _path in entries)
+    for _mtime, size, path in sorted(entries):
+        if total_size <= max_bytes:
+            break
+        Path(path).unlink(missing_ok=True)
+        total_size -= size
+        log.debug('Evicted %s from the asset cache.', path)
+
+
+def _fetch(asset_file: File, cache_dir: Path, path: Path) -> tuple[bytes, bool]:
+    """
+    Download an asset and store it in the cache, unless it is larger than the cache.
+
+    :param asset_file: The file of the CredentialAsset.
+    :param cache_dir: The directory of the cache.
+    :param path: The path of the cached file.
+    :returns: The content of the asset and whether it was stored in the cache.
+    """
+    with asset_file.open('rb') as file:
+        content = file.read()
+
+    max_bytes = getattr(settings, 'LEARNING_CREDENTIALS_ASSET_CACHE_MAX_BYTES', 256 * 1024 * 1024)
+    if len(content) > max_bytes:
+        return content, False
+
+    _write_atomically(path, content)
+    _evict(cache_dir, max_bytes)
+    return content, True
+
+
+def load_asset(asset_file: File, version: str) -> bytes | mmap.mmap:
+    """
+    Get the content of an asset, reading it from the local disk cache if possible.
+
+    :param asset_file: The file of the CredentialAsset.
+    :param version: The version of the asset. The cached file is only used if it has the same version.
+    :returns: The content of the asset. It is a read-only memory map if the asset is stored in the cache.
+    """
+    if (cache_dir := _get_cache_dir()) is None:
+        with asset_file.open('rb') as file:
+            return file.read()
+
+    path = _get_cache_path(cache_dir, version)
+    try:
+        return _map_file(path)
+    except FileNotFoundError:
+        log.debug('Asset %s is not in the asset cache.', asset_file.name)
+
+    content, cached = _fetch(asset_file, cache_dir, path)
+    if not cached:
+        return content
+
+    try:
+        return _map_file(path)
+    except FileNotFoundError:
+        # Another process evicted the file in the meantime.
+        return content
+
+
+def get_asset_path(asset_file: File, version: str) -> Path | None:
+    """
+    Get the path of the cached file of an asset, storing the asset in the local disk cache if needed.
+
+    It is meant for libraries that read files by their path (e.g., fonts), so they do not need a copy of the content.
+    The file can be evicted by another process before it is read, so callers should fall back to `load_asset`.
+
+    :param asset_file: The file of the CredentialAsset.
+    :param version: The version of the asset. The cached file is only used if it has the same version.
+    :returns: The path of the cached file, or None if the cache is disabled or the asset is larger than the cache.
+    """
+    if (cache_dir := _get_cache_dir()) is None:
+        return None
+
+    path = _get_cache_path(cache_dir, version)
+    if path.exists():
+        _touch(path)
+        return path
+
+    log.debug('Asset %s is not in the asset cache.', asset_file.name)
+    _content, cached = _fetch(asset_file, cache_dir, path)
+    return path if cached else None
+
+
+class AssetReader(io.RawIOBase):
+    """
+    A read-only, seekable stream over the content of an asset.
+
+    Unlike `io.BytesIO`, it does not copy the content, so a memory-mapped asset stays shared with other processes.
+    Each reader has its own position, so multiple readers can read the same memory map concurrently.
+    """
+
+    def __init__(self, content: bytes | mmap.mmap):
+        """
+        Initialize the reader.
+
+        :param content: The content of the asset, as returned by `load_asset`.
+        """
+        super().__init__()
+        self._view = memoryview(content)
+        self._position = 0
+
+    def readable(self) -> bool:  # noqa: D102
+        return True
+
+    def seekable(self) -> bool:  # noqa: D102
+        return True
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:  # noqa: D102
+        chunk = self._view[self._position : self._position + len(buffer)]
+        buffer[: len(chunk)] = chunk
+        self._position += len(chunk)
+        return len(chunk)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:  # noqa: D102
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        if offset < 0:
+            msg = f"Negative seek position {offset}."
+            raise ValueError(msg)
+        self._position = offset
+        return offset
+
+    def tell(self) -> int:  # noqa: D102
+        return self._position
@@ -13,14 +13,19 @@ from contextlib import contextmanager
 from typing import TYPE_CHECKING
 
 import pytz
-from celery import Celery
 from django.conf import settings
-from learning_paths.models import LearningPath
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+
+from learning_credentials.progress_cache import ProgressCache, get_active_progress_cache
 
 if TYPE_CHECKING:
+    from collections.abc import Collection, Iterable, Iterator
     from datetime import datetime
 
+    from celery import Celery
     from django.contrib.auth.models import User
+    from django.db.models import QuerySet
     from learning_paths.keys import LearningPathKey
     from opaque_keys.edx.keys import CourseKey, LearningContextKey
 
@@ -28,6 +33,8 @@ if TYPE_CHECKING:
 def get_celery_app() -> Celery:
     """Get Celery app to reuse configuration and queues."""
     if getattr(settings, "TESTING", False):
+        from celery import Celery
+
         # We can ignore this in the testing environment.
         return Celery(task_always_eager=True)
 
@@ -62,33 +69,158 @@ def _get_course_name(course_id: CourseKey) -> str:
     return name
 
 
-def _get_learning_path_name(learning_path_key: LearningPathKey) -> str:
-    """Get the Learning Path name from the plugin."""
-    try:
-        return LearningPath.objects.get(key=learning_path_key).display_name
-    except LearningPath.DoesNotExist:
-        return str(learning_path_key)
+def _get_course_names(course_ids: list[CourseKey]) -> dict[CourseKey, str]:
+    """Get the names of multiple courses from Open edX."""
+    # noinspection PyUnresolvedReferences,PyPackageRequirements
+    from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
+
+    names = {}
+    for course_overview in CourseOverview.objects.filter(id__in=course_ids).only(
+        'id', 'cert_name_long', 'display_name'
+    ):
+        names[course_overview.id] = (
+            course_overview.cert_name_long or course_overview.display_name or str(course_overview.id)
+        )
+
+    # Course overviews that do not exist yet are created from the modulestore.
+    for course_id in course_ids:
+        if course_id not in names:
+            names[course_id] = _get_course_name(course_id)
+
+    return names
+
+
+def _get_learning_path_names(learning_path_keys: list[LearningPathKey]) -> dict[LearningPathKey, str]:
+    """Get the names of multiple Learning Paths from the plugin."""
+    from learning_paths.models import LearningPath
+
+    names = {key: str(key) for key in learning_path_keys}
+    names.update(LearningPath.objects.filter(key__in=learning_path_keys).values_list('key', 'display_name'))
+    return names
+
+
+def _get_learning_context_name_cache_key(learning_context_key: LearningContextKey) -> str:
+    """Get the key of the learning context name in the Django cache."""
+    return f'learning_credentials.learning_context_name.{learning_context_key}'
+
+
+def get_learning_context_names(learning_context_keys: Iterable[LearningContextKey]) -> dict[LearningContextKey, str]:
+    """
+    Get the names of multiple learning contexts (courses or Learning Paths) at once.
+
+    The names are cached for the rest of the current credential generation run. If the
+    ``LEARNING_CREDENTIALS_CONTEXT_NAME_CACHE_TIMEOUT`` setting is set, they are also stored in the Django cache for the
+    given number of seconds, so they can be shared between processes.
+
+    :param learning_context_keys: The keys of the learning contexts.
+    :returns: A dict mapping each learning context key to its name.
+    """
+    names: dict[LearningContextKey, str] = {}
+    missing_keys = []
+    run_cache = get_active_progress_cache()
+    for learning_context_key in dict.fromkeys(learning_context_keys):
+        if run_cache is not None and (name := run_cache.get((str(learning_context_key), 'name'))) is not None:
+            names[learning_context_key] = name
+        else:
+            missing_keys.append(learning_context_key)
+
+    timeout = getattr(settings, 'LEARNING_CREDENTIALS_CONTEXT_NAME_CACHE_TIMEOUT', None)
+    if missing_keys and timeout is not None:
+        cache_keys = {_get_learning_context_name_cache_key(key): key for key in missing_keys}
+        cached_names = {cache_keys[cache_key]: name for cache_key, name in cache.get_many(cache_keys).items()}
+        names.update(cached_names)
+        missing_keys = [key for key in missing_keys if key not in cached_names]
+
+    if missing_keys:
+        retrieved_names = {
+            **_get_course_names([key for key in missing_keys if key.is_course]),
+            **_get_learning_path_names([key for key in missing_keys if not key.is_course]),
+        }
+        names.update(retrieved_names)
+        if timeout is not None:
+            cache.set_many(
+                {_get_learning_context_name_cache_key(key): name for key, name in retrieved_names.items()}, timeout
+            )
+
+    if run_cache is not None:
+        for learning_context_key, name in names.items():
+            run_cache.set((str(learning_context_key), 'name'), name)
+
+    return names
 
 
 def get_learning_context_name(learning_context_key: LearningContextKey) -> str:
     """Get the learning context (course or Learning Path) name."""
-    if learning_context_key.is_course:
-        return _get_course_name(learning_context_key)
-    return _get_learning_path_name(learning_context_key)
+    return get_learning_context_names([learning_context_key])[learning_context_key]
+
+
+def invalidate_learning_context_name(learning_context_key: LearningContextKey):
+    """Remove the cached name of a learning context, e.g., after it is renamed."""
+    ProgressCache.invalidate((str(learning_context_key), 'name'))
+    cache.delete(_get_learning_context_name_cache_key(learning_context_key))
 
 
-def get_course_enrollments(course_id: CourseKey, user_id: int | None = None) -> list[User]:
-    """Get the course enrollments from Open edX."""
+def get_course_enrollments(
+    course_id: CourseKey,
+    user_id: int | None = None,
+    user_ids: Collection[int] | None = None,
+    usernames: Collection[str] | None = None,
+) -> list[User]:
+    """Get the course enrollments from Open edX, optionally restricted to a single user or a set of users."""
     # noinspection PyUnresolvedReferences,PyPackageRequirements
     from common.djangoapps.student.models import CourseEnrollment
 
     enrollments = CourseEnrollment.objects.filter(course_id=course_id, is_active=True).select_related('user')
     if user_id:
         enrollments = enrollments.filter(user__id=user_id)
+    if user_ids is not None:
+        enrollments = enrollments.filter(user__id__in=user_ids)
+    if usernames is not None:
+        enrollments = enrollments.filter(user__username__in=usernames)
 
     return [enrollment.user for enrollment in enrollments]
 
 
+def is_enrolled_in_course(course_id: CourseKey, user_id: int) -> bool:
+    """Check whether a user is actively enrolled in a course, using a single query."""
+    # noinspection PyUnresolvedReferences,PyPackageRequirements
+    from common.djangoapps.student.models import CourseEnrollment
+
+    return CourseEnrollment.objects.filter(course_id=course_id, user_id=user_id, is_active=True).exists()
+
+
+def get_users_with_profiles(user_ids: Iterable[int]) -> QuerySet[User]:
+    """Get the users with their Open edX profiles, using a single query."""
+    return get_user_model().objects.filter(id__in=user_ids).select_related('profile')
+
+
+def iter_course_enrollments(
+    course_id: CourseKey,
+    user_id: int | None = None,
+    chunk_size: int = 2000,
+    user_ids: Collection[int] | None = None,
+) -> Iterator[User]:
+    """
+    Iterate over the users enrolled in a course without loading all of them into memory at once.
+
+    :param course_id: The course ID.
+    :param user_id: Optional. If provided, only this user is returned (if enrolled).
+    :param chunk_size: The number of rows fetched from the database at a time.
+    :param user_ids: Optional. If provided, only these users are returned (if enrolled).
+    """
+    # noinspection PyUnresolvedReferences,PyPackageRequirements
+    from common.djangoapps.student.models import CourseEnrollment
+
+    enrollments = CourseEnrollment.objects.filter(course_id=course_id, is_active=True).select_related('user')
+    if user_id:
+        enrollments = enrollments.filter(user__id=user_id)
+    if user_ids is not None:
+        enrollments = enrollments.filter(user__id__in=user_ids)
+
+    for enrollment in enrollments.iterator(chunk_size=chunk_size):
+        yield enrollment.user
+
+
 @contextmanager
 def prefetch_course_grades(course_id: CourseKey, users: list[User]):
     """
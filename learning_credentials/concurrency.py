@@ -0,0 +1,98 @@
+"""Helpers for running independent work concurrently."""
+
+from __future__ import annotations
+
+import contextvars
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, TypeVar
+
+from django.db import close_old_connections
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+# Whether the current context runs in a worker thread of the shared pool.
+_in_worker_thread: contextvars.ContextVar[bool] = contextvars.ContextVar('in_worker_thread', default=False)
+
+_executors: dict[int, ThreadPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def _get_executor(max_workers: int) -> ThreadPoolExecutor:
+    """
+    Get the thread pool of the given size shared by all calls of ``run_concurrently`` in this process.
+
+    The threads of the pool are reused, so their database connections are not opened again for each call.
+
+    :param max_workers: The number of threads of the pool.
+    :returns: The shared thread pool.
+    """
+    with _executors_lock:
+        if max_workers not in _executors:
+            _executors[max_workers] = ThreadPoolExecutor(max_workers, thread_name_prefix='learning-credentials')
+        return _executors[max_workers]
+
+
+def _run_in_thread(context: contextvars.Context, func: Callable[[T], R], item: T) -> R:
+    """
+    Run the function in a worker thread with the caller's context variables.
+
+    Django opens a separate database connection for each thread and only closes it at the end of a request, so the
+    connections of the worker thread are closed once they exceed ``CONN_MAX_AGE`` or become unusable.
+    """
+    try:
+        return context.run(_call_in_worker_thread, func, item)
+    finally:
+        close_old_connections()
+
+
+def _call_in_worker_thread(func: Callable[[T], R], item: T) -> R:
+    """Call the function, marking the current context as running in a worker thread."""
+    _in_worker_thread.set(True)
+    return func(item)
+
+
+def run_concurrently(func: Callable[[T], R], items: Iterable[T], max_workers: int) -> Iterator[tuple[T, R]]:
+    """
+    Call the function for each item using a bounded thread pool, and yield the results as they finish.
+
+    If `max_workers` is lower than 2, there is only one item, or the caller already runs in a worker thread, the items
+    are processed sequentially in the calling thread. This way, nested calls do not wait for threads of the same pool.
+    Exceptions raised by the function are propagated to the caller.
+
+    :param func: The function to call with each item.
+    :param items: The items to process.
+    :param max_workers: The maximum number of items processed at once.
+    :returns: An iterator over ``(item, result)`` pairs, in the order of completion.
+    """
+    items = list(items)
+    if max_workers < 2 or len(items) < 2 or _in_worker_thread.get():
+        for item in items:
+            yield item, func(item)
+        return
+
+    executor = _get_executor(max_workers)
+    pending_items = iter(items)
+    futures: dict[Future[R], T] = {}
+
+    def submit_next() -> None:
+        for item in pending_items:
+            futures[executor.submit(_run_in_thread, contextvars.copy_context(), func, item)] = item
+            return
+
+    try:
+        for _ in range(max_workers):
+            submit_next()
+        while futures:
+            done, _pending = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                item = futures.pop(future)
+                submit_next()
+                yield item, future.result()
+    finally:
+        for future in futures:
+            future.cancel()
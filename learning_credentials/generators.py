@@ -11,33 +11,52 @@ from __future__ import annotations
 
 import copy
 import io
+import json
 import logging
 import re
 import secrets
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Any
 
 from django.conf import settings
 from django.core.files.base import ContentFile
 from django.core.files.storage import FileSystemStorage, default_storage
+from django.core.serializers.json import DjangoJSONEncoder
+from django.template.loader import render_to_string
 from pypdf import PdfReader, PdfWriter
 from pypdf.constants import UserAccessPermissions
 from reportlab.pdfbase.pdfmetrics import FontError, FontNotFoundError, registerFont
 from reportlab.pdfbase.ttfonts import TTFError, TTFont
 from reportlab.pdfgen.canvas import Canvas
 
+from .asset_cache import AssetReader, get_asset_path, load_asset
 from .compat import get_default_storage_url, get_localized_credential_date
 from .exceptions import AssetNotFoundError
-from .models import CredentialAsset
+from .models import Credential, CredentialAsset
 
 log = logging.getLogger(__name__)
 
+# The display names of the generators of this module. It is read from the source code by the registry (see
+# `learning_credentials.registry`), so it must stay a literal dict.
+CREDENTIAL_FUNCTIONS = {
+    'generate_pdf_credential': {'name': 'PDF credential'},
+}
+
+# Process-level caches of the assets used for rendering credentials, keyed by asset slug. They store the version of each
+# asset, so an asset is loaded again after it is re-uploaded. The templates are kept in the least recently used order,
+# and their total size is limited by the `LEARNING_CREDENTIALS_TEMPLATE_CACHE_MAX_BYTES` setting.
+_template_cache: OrderedDict[str, tuple[str, bytes | mmap.mmap]] = OrderedDict()
+_template_cache_bytes = 0
+_font_versions: dict[str, str] = {}
+
 if TYPE_CHECKING:
+    import mmap
+    from collections.abc import Iterable
     from uuid import UUID
 
+    from django.core.files import File
     from pypdf import PageObject
 
-    from learning_credentials.models import Credential
-
 
 def _get_defaults() -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
     """
@@ -81,6 +100,25 @@ def _get_defaults() -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
     return default_styling, default_text_elements
 
 
+def _load_font(font_name: str, font_file: File, version: str) -> TTFont:
+    """
+    Load a custom font, letting reportlab read it from the local asset cache by its path if the cache is enabled.
+
+    :param font_name: The name of the font.
+    :param font_file: The file of the font asset.
+    :param version: The version of the font asset.
+    :returns: The loaded font.
+    """
+    if (path := get_asset_path(font_file, version)) is not None:
+        try:
+            return TTFont(font_name, str(path))
+        except TTFError:
+            # Fall back to reading the content if another process evicted the file in the meantime.
+            if path.exists():
+                raise
+    return TTFont(font_name, io.BytesIO(load_asset(font_file, version)))
+
+
 def _register_font(pdf_canvas: Canvas, font_name: str) -> str:
     """
     Register a custom font if not already available.
@@ -97,7 +135,11 @@ def _register_font(pdf_canvas: Canvas, font_name: str) -> str:
         return font_name
 
     try:
-        registerFont(TTFont(font_name, CredentialAsset.get_asset_by_slug(font_name)))
+        font_file = CredentialAsset.get_asset_by_slug(font_name)
+        # reportlab keeps registered fonts for the lifetime of the process, so each version is only parsed once.
+        if _font_versions.get(font_name) != (version := _get_asset_version(font_file)):
+            registerFont(_load_font(font_name, font_file, version))
+            _font_versions[font_name] = version
     except AssetNotFoundError:
         log.warning("Font asset not found: %s", font_name)
     except (FontError, FontNotFoundError, TTFError):
@@ -108,6 +150,112 @@ def _register_font(pdf_canvas: Canvas, font_name: str) -> str:
     return 'Helvetica'
 
 
+def _get_asset_version(asset_file: File) -> str:
+    """
+    Get the version of an asset file, which changes every time the asset is re-uploaded.
+
+    Each version of an asset is stored in a separate file whose path contains the hash of its content, so the path
+    identifies the version.
+
+    :param asset_file: The file of a CredentialAsset.
+    :returns: The version of the asset.
+    """
+    return asset_file.name
+
+
+def _get_template_data(template_slug: str) -> bytes | mmap.mmap:
+    """
+    Get the content of a PDF template asset.
+
+    The content is cached in the process, so each version of a template is only loaded once. Only the latest version
+    of each template is kept, and the least recently used templates are evicted once their total size exceeds
+    ``LEARNING_CREDENTIALS_TEMPLATE_CACHE_MAX_BYTES``. The content is loaded through the local asset cache, so it is
+    also only downloaded once per host.
+
+    :param template_slug: The slug of the template asset.
+    :returns: The content of the template.
+    :raises AssetNotFoundError: If the template asset does not exist.
+    """
+    global _template_cache_bytes  # noqa: PLW0603
+
+    template_file = CredentialAsset.get_asset_by_slug(template_slug)
+    version = _get_asset_version(template_file)
+    if (cached := _template_cache.get(template_slug)) is not None and cached[0] == version:
+        _template_cache.move_to_end(template_slug)
+        return cached[1]
+
+    data = load_asset(template_file, version)
+    if cached is not None:
+        del _template_cache[template_slug]
+        _template_cache_bytes -= len(cached[1])
+
+    max_bytes = getattr(settings, 'LEARNING_CREDENTIALS_TEMPLATE_CACHE_MAX_BYTES', 64 * 1024 * 1024)
+    if len(data) > max_bytes:
+        log.info("Not caching template %s (%d bytes), as it exceeds the memory cap.", template_slug, len(data))
+        return data
+
+    _template_cache[template_slug] = (version, data)
+    _template_cache_bytes += len(data)
+    while _template_cache_bytes > max_bytes:
+        _, (_, evicted_data) = _template_cache.popitem(last=False)
+        _template_cache_bytes -= len(evicted_data)
+    return data
+
+
+def _get_asset_slugs(options: dict[str, Any]) -> tuple[set[str], set[str]]:
+    """
+    Get the slugs of the templates and fonts referenced by the options of a PDF credential.
+
+    :param options: The options documented in the ``generate_pdf_credential`` function.
+    :returns: A tuple of (template_slugs, font_slugs).
+    """
+    template_slugs = {options[key] for key in ('template', 'template_multiline') if options.get(key)}
+    font_slugs = {element['font'] for element in _build_text_elements(options).values() if element.get('font')}
+    return template_slugs, font_slugs
+
+
+def preload_assets(options_list: Iterable[dict[str, Any]], max_bytes: int) -> int:
+    """
+    Load the templates and register the fonts referenced by the options of PDF credentials in this process.
+
+    Templates are loaded before fonts. An asset is skipped if loading it would exceed `max_bytes`, so it is loaded when
+    a credential uses it for the first time instead.
+
+    :param options_list: The options documented in the ``generate_pdf_credential`` function.
+    :param max_bytes: The maximum total size of the loaded assets.
+    :returns: The total size of the loaded assets, in bytes.
+    """
+    template_slugs: set[str] = set()
+    font_slugs: set[str] = set()
+    for options in options_list:
+        templates, fonts = _get_asset_slugs(options)
+        template_slugs |= templates
+        font_slugs |= fonts
+
+    pdf_canvas = Canvas(io.BytesIO())
+    font_slugs -= set(pdf_canvas.getAvailableFonts())
+
+    loaded_bytes = 0
+    for slug in [*sorted(template_slugs), *sorted(font_slugs)]:
+        try:
+            size = CredentialAsset.get_asset_by_slug(slug).size
+        except AssetNotFoundError:
+            log.warning("Asset not found: %s", slug)
+            continue
+
+        if loaded_bytes + size > max_bytes:
+            log.info("Skipping the preloading of asset %s (%d bytes), as it exceeds the memory cap.", slug, size)
+            continue
+
+        if slug in template_slugs:
+            _get_template_data(slug)
+        else:
+            _register_font(pdf_canvas, slug)
+        loaded_bytes += size
+
+    return loaded_bytes
+
+
 def _hex_to_rgb(hex_color: str) -> tuple[float, float, float]:
     """
     Convert a hexadecimal color code to an RGB tuple with floating-point values.
@@ -349,15 +497,69 @@ def _save_credential(pdf_writer: PdfWriter, credential_uuid: UUID) -> str:
     if default_storage.exists(output_path):
         default_storage.delete(output_path)
     default_storage.save(output_path, credential_file)
-    if isinstance(default_storage, FileSystemStorage):
-        url = f"{get_default_storage_url()}{output_path}"
-    else:
-        url = default_storage.url(output_path)
+    return _get_file_url(output_path)
+
+
+def _get_file_url(path: str) -> str:
+    """
+    Get the public URL of a file saved in the output directory of the Django default storage.
 
+    :param path: The path of the file in the storage.
+    :returns: The URL of the file, using `LEARNING_CREDENTIALS_CUSTOM_DOMAIN` if it is set.
+    """
     if custom_domain := getattr(settings, 'LEARNING_CREDENTIALS_CUSTOM_DOMAIN', None):
-        url = f"{custom_domain}/{credential_uuid}.pdf"
+        return f"{custom_domain}/{path.rsplit('/', 1)[-1]}"
+
+    if isinstance(default_storage, FileSystemStorage):
+        return f"{get_default_storage_url()}{path}"
+    return default_storage.url(path)
 
-    return url
+
+def _save_verification_sidecars(credential: Credential, status: str) -> list[str]:
+    """
+    Save the verification documents of a credential next to its PDF file.
+
+    The documents contain the same metadata as the credential metadata (verification) endpoint, so the verification
+    can be served by the storage (or a CDN in front of it) instead of the LMS. They are saved for each format listed in
+    `LEARNING_CREDENTIALS_VERIFICATION_SIDECARS` ("json" and "html"), as ``<verify_uuid>.<format>`` files. Unlike the
+    PDF files, they are not moved when the credential is invalidated, but rewritten with the new status.
+
+    :param credential: The Credential instance.
+    :param status: The status of the credential after the current generation or invalidation.
+    :returns: The URLs of the saved documents.
+    """
+    formats = getattr(settings, 'LEARNING_CREDENTIALS_VERIFICATION_SIDECARS', ())
+    if not formats:
+        return []
+
+    # The REST framework is not needed to generate the PDF files, so it is only imported when the sidecars are enabled.
+    from .api.v1.serializers import CredentialSerializer  # noqa: PLC0415
+
+    metadata = {**CredentialSerializer(credential).data, 'status': status}
+    renderers = {
+        'json': lambda: json.dumps(metadata, cls=DjangoJSONEncoder),
+        'html': lambda: render_to_string(
+            'learning_credentials/verification.html',
+            {
+                'credential': metadata,
+                'issue_date': get_localized_credential_date(credential.created),
+                'is_valid': status == Credential.Status.AVAILABLE,
+            },
+        ),
+    }
+
+    output_dir = getattr(settings, 'LEARNING_CREDENTIALS_OUTPUT_DIR', 'learning_credentials')
+    urls = []
+    for sidecar_format in formats:
+        path = f'{output_dir}/{credential.verify_uuid}.{sidecar_format}'
+        # Delete the file if it already exists, so the storage does not save the new content under a different name.
+        if default_storage.exists(path):
+            default_storage.delete(path)
+        default_storage.save(path, ContentFile(renderers[sidecar_format]().encode()))
+        urls.append(_get_file_url(path))
+
+    log.info("Verification documents of credential %s saved to %s", credential.uuid, urls)
+    return urls
 
 
 def generate_pdf_credential(credential: Credential, options: dict[str, Any], *, invalidate: bool = False) -> str:
@@ -370,6 +572,9 @@ def generate_pdf_credential(credential: Credential, options: dict[str, Any], *,
         The PDF is moved to an archive location and made inaccessible.
     :returns: The URL of the saved credential, or empty string if invalidated.
 
+    If `LEARNING_CREDENTIALS_VERIFICATION_SIDECARS` is set, the verification documents of the credential are saved
+    (or rewritten, when it is invalidated) next to the PDF.
+
     Options:
 
       - template (required): The slug of the PDF template asset.
@@ -410,6 +615,7 @@ def generate_pdf_credential(credential: Credential, options: dict[str, Any], *,
     if invalidate:
         log.info("Invalidating credential %s for user %s", credential.uuid, credential.user.id)
         _invalidate_credential(credential.uuid)
+        _save_verification_sidecars(credential, Credential.Status.INVALIDATED)
         return ''
 
     log.info("Starting credential generation for user %s", credential.user.id)
@@ -432,27 +638,27 @@ def generate_pdf_credential(credential: Credential, options: dict[str, Any], *,
         raise ValueError(msg)
 
     # Get template from the CredentialAsset.
-    template_file = CredentialAsset.get_asset_by_slug(template_path)
+    template_data = _get_template_data(template_path)
 
     # Get the issue date.
     issue_date = get_localized_credential_date(credential.created)
 
-    # Load the PDF template.
-    with template_file.open('rb') as template_file:
-        template = PdfReader(template_file).pages[0]
+    # Load the PDF template. The page is modified below, so it is parsed again for each credential.
+    template = PdfReader(AssetReader(template_data)).pages[0]
 
-        pdf_writer = PdfWriter()
+    pdf_writer = PdfWriter()
 
-        # Create a new canvas, prepare the page and write the data.
-        pdf_canvas = _write_text_on_template(
-            template, username, context_name, issue_date, str(credential.verify_uuid), options
-        )
+    # Create a new canvas, prepare the page and write the data.
+    pdf_canvas = _write_text_on_template(
+        template, username, context_name, issue_date, str(credential.verify_uuid), options
+    )
 
-        overlay_pdf = PdfReader(io.BytesIO(pdf_canvas.getpdfdata()))
-        template.merge_page(overlay_pdf.pages[0])
-        pdf_writer.add_page(template)
+    overlay_pdf = PdfReader(io.BytesIO(pdf_canvas.getpdfdata()))
+    template.merge_page(overlay_pdf.pages[0])
+    pdf_writer.add_page(template)
 
-        url = _save_credential(pdf_writer, credential.uuid)
+    url = _save_credential(pdf_writer, credential.uuid)
+    _save_verification_sidecars(credential, Credential.Status.AVAILABLE)
 
-        log.info("Credential saved to %s", url)
+    log.info("Credential saved to %s", url)
     return url
@@ -0,0 +1 @@
+"""Learning Credentials management commands."""
@@ -0,0 +1,49 @@
+"""Management command to export the progress of all learners of a learning context towards its credentials."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.core.management.base import BaseCommand
+
+from learning_credentials.models import CredentialConfiguration
+from learning_credentials.reports import REPORT_CONTENT_TYPES, iter_progress_report
+
+if TYPE_CHECKING:
+    from argparse import ArgumentParser
+
+
+class Command(BaseCommand):
+    """
+    Export the progress of all learners of a learning context towards each of its credentials.
+
+    The retrieval function of each credential configuration is called once for the whole learning context, and the
+    report is written as the progress is retrieved.
+
+    Example::
+
+        ./manage.py lms credential_progress_report course-v1:OpenedX+DemoX+DemoCourse --output-format csv > report.csv
+    """
+
+    help = 'Export the progress of all learners of a learning context towards its credentials.'
+
+    def add_arguments(self, parser: ArgumentParser):
+        """Add the arguments of the command."""
+        parser.add_argument('learning_context_key', help='The key of the course or learning path.')
+        parser.add_argument(
+            '--output-format', choices=REPORT_CONTENT_TYPES, default='ndjson', help='The format of the report.'
+        )
+        parser.add_argument(
+            '--retrieval-func', help='Only report the configurations of credential types with this retrieval function.'
+        )
+
+    def handle(self, *_args, **options):
+        """Write the report to the standard output."""
+        configurations = CredentialConfiguration.objects.filter(
+            learning_context_key=options['learning_context_key']
+        ).select_related('credential_type')
+        if retrieval_func := options['retrieval_func']:
+            configurations = configurations.filter(credential_type__retrieval_func=retrieval_func)
+
+        for line in iter_progress_report(configurations, options['output_format']):
+            self.stdout.write(line, ending='')
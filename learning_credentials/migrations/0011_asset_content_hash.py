@@ -0,0 +1,32 @@
+# Generated by Django 4.2.30 on 2026-10-19 04:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("learning_credentials", "0010_credential_configuration_fk"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="credentialasset",
+            name="content_hash",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="SHA-256 hash of the current version of the asset file.",
+                max_length=64,
+            ),
+        ),
+        migrations.AddField(
+            model_name="credentialasset",
+            name="content_uploaded",
+            field=models.DateTimeField(
+                blank=True,
+                editable=False,
+                help_text="Date and time when the current version of the asset file was uploaded.",
+                null=True,
+            ),
+        ),
+    ]
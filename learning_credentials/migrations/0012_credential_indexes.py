@@ -0,0 +1,31 @@
+# Generated by Django 4.2.30 on 2026-10-19 04:54
+
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("learning_credentials", "0011_asset_content_hash"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="credential",
+            name="verify_uuid",
+            field=models.UUIDField(
+                default=uuid.uuid4,
+                editable=False,
+                help_text="UUID used for verifying the credential",
+                unique=True,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="credential",
+            index=models.Index(fields=["configuration", "status", "user"], name="lc_credential_config_status"),
+        ),
+        migrations.AddIndex(
+            model_name="credential",
+            index=models.Index(fields=["user", "configuration", "status"], name="lc_credential_user_config"),
+        ),
+    ]
@@ -0,0 +1,139 @@
+# Generated by Django 4.2.30 on 2026-10-19 04:58
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+import model_utils.fields
+import opaque_keys.edx.django.models
+import uuid
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("learning_credentials", "0012_credential_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchivedCredential",
+            fields=[
+                (
+                    "created",
+                    model_utils.fields.AutoCreatedField(
+                        default=django.utils.timezone.now, editable=False, verbose_name="created"
+                    ),
+                ),
+                (
+                    "modified",
+                    model_utils.fields.AutoLastModifiedField(
+                        default=django.utils.timezone.now, editable=False, verbose_name="modified"
+                    ),
+                ),
+                (
+                    "uuid",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        help_text="Auto-generated UUID of the credential",
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "verify_uuid",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        help_text="UUID used for verifying the credential",
+                        unique=True,
+                    ),
+                ),
+                (
+                    "user_full_name",
+                    models.CharField(
+                        editable=False,
+                        help_text="User receiving the credential. This field is used for validation purposes.",
+                        max_length=255,
+                    ),
+                ),
+                (
+                    "learning_context_key",
+                    opaque_keys.edx.django.models.LearningContextKeyField(
+                        help_text="ID of a learning context (e.g., a course or a Learning Path) for which the credential was issued",
+                        max_length=255,
+                    ),
+                ),
+                (
+                    "learning_context_name",
+                    models.CharField(
+                        editable=False,
+                        help_text="Name of the learning context for which the credential was issued. This field is used for validation purposes.",
+                        max_length=255,
+                    ),
+                ),
+                ("credential_type", models.CharField(help_text="Type of the credential", max_length=255)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("generating", "Generating"),
+                            ("available", "Available"),
+                            ("error", "Error"),
+                            ("invalidated", "Invalidated"),
+                        ],
+                        default="generating",
+                        help_text="Status of the credential generation task",
+                        max_length=32,
+                    ),
+                ),
+                (
+                    "download_url",
+                    models.URLField(blank=True, help_text="URL of the generated credential PDF (e.g., to S3)"),
+                ),
+                (
+                    "legacy_id",
+                    models.IntegerField(
+                        help_text="Legacy ID of the credential imported from another system", null=True
+                    ),
+                ),
+                ("generation_task_id", models.CharField(help_text="Task ID from the Celery queue", max_length=255)),
+                (
+                    "invalidated_at",
+                    models.DateTimeField(
+                        editable=False, help_text="Timestamp when the credential was invalidated", null=True
+                    ),
+                ),
+                (
+                    "invalidation_reason",
+                    models.CharField(blank=True, help_text="Reason for invalidating the credential", max_length=255),
+                ),
+                (
+                    "archived_at",
+                    models.DateTimeField(
+                        auto_now_add=True, help_text="Timestamp when the credential was moved to the archive"
+                    ),
+                ),
+                (
+                    "configuration",
+                    models.ForeignKey(
+                        help_text="Associated credential configuration",
+                        on_delete=django.db.models.deletion.PROTECT,
+                        to="learning_credentials.credentialconfiguration",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        help_text="User receiving the credential",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+    ]
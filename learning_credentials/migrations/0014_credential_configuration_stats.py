@@ -0,0 +1,76 @@
+# Generated by Django 4.2.30 on 2026-10-19 05:05
+
+from collections import Counter
+
+from django.db import migrations, models
+from django.utils import timezone
+import django.db.models.deletion
+
+
+def backfill_stats(apps, schema_editor):
+    """Count the credentials of each existing configuration in each status."""
+    CredentialConfiguration = apps.get_model("learning_credentials", "CredentialConfiguration")
+    CredentialConfigurationStats = apps.get_model("learning_credentials", "CredentialConfigurationStats")
+
+    counts = {
+        configuration_id: Counter() for configuration_id in CredentialConfiguration.objects.values_list("id", flat=True)
+    }
+    for model_name in ("Credential", "ArchivedCredential"):
+        model = apps.get_model("learning_credentials", model_name)
+        rows = model.objects.order_by().values_list("configuration_id", "status").annotate(models.Count("pk"))
+        for configuration_id, status, count in rows:
+            counts[configuration_id][status] += count
+
+    CredentialConfigurationStats.objects.bulk_create(
+        CredentialConfigurationStats(
+            configuration_id=configuration_id,
+            **{f"{status}_count": count for status, count in status_counts.items()},
+            reconciled_at=timezone.now(),
+        )
+        for configuration_id, status_counts in counts.items()
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("learning_credentials", "0013_archived_credential"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CredentialConfigurationStats",
+            fields=[
+                (
+                    "configuration",
+                    models.OneToOneField(
+                        help_text="Associated credential configuration.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="stats",
+                        serialize=False,
+                        to="learning_credentials.credentialconfiguration",
+                    ),
+                ),
+                (
+                    "generating_count",
+                    models.IntegerField(default=0, help_text="Number of credentials being generated."),
+                ),
+                ("available_count", models.IntegerField(default=0, help_text="Number of issued credentials.")),
+                (
+                    "error_count",
+                    models.IntegerField(default=0, help_text="Number of credentials that failed to generate."),
+                ),
+                ("invalidated_count", models.IntegerField(default=0, help_text="Number of invalidated credentials.")),
+                (
+                    "reconciled_at",
+                    models.DateTimeField(
+                        blank=True, help_text="Timestamp when the counters were last recalculated.", null=True
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name_plural": "credential configuration stats",
+            },
+        ),
+        migrations.RunPython(backfill_stats, reverse_code=migrations.RunPython.noop),
+    ]
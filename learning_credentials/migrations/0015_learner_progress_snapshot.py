@@ -0,0 +1,48 @@
+# Generated by Django 4.2.30 on 2026-10-19 05:29
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import jsonfield.fields
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("learning_credentials", "0014_credential_configuration_stats"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LearnerProgressSnapshot",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "progress",
+                    jsonfield.fields.JSONField(default=dict, help_text="Progress returned by the retrieval function."),
+                ),
+                (
+                    "is_eligible",
+                    models.BooleanField(default=False, help_text="Whether the learner is eligible for the credential."),
+                ),
+                ("computed_at", models.DateTimeField(help_text="Timestamp when the progress was retrieved.")),
+                (
+                    "configuration",
+                    models.ForeignKey(
+                        help_text="Associated credential configuration.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="progress_snapshots",
+                        to="learning_credentials.credentialconfiguration",
+                    ),
+                ),
+                ("user", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                "indexes": [models.Index(fields=["user", "configuration"], name="lc_snapshot_user_config")],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="learnerprogresssnapshot",
+            constraint=models.UniqueConstraint(fields=("configuration", "user"), name="lc_snapshot_config_user"),
+        ),
+    ]
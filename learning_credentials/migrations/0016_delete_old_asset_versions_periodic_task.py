@@ -0,0 +1,31 @@
+from django.db import migrations
+
+PERIODIC_TASK_NAME = "Delete old credential asset versions"
+
+
+def create_periodic_task(apps, schema_editor):
+    """Sweep the expired versions of the asset files once a day."""
+    IntervalSchedule = apps.get_model("django_celery_beat", "IntervalSchedule")
+    PeriodicTask = apps.get_model("django_celery_beat", "PeriodicTask")
+    schedule, _created = IntervalSchedule.objects.get_or_create(every=1, period="days")
+    PeriodicTask.objects.get_or_create(
+        name=PERIODIC_TASK_NAME,
+        defaults={"task": "learning_credentials.tasks.delete_old_asset_versions_task", "interval": schedule},
+    )
+
+
+def delete_periodic_task(apps, schema_editor):
+    """Remove the periodic task."""
+    PeriodicTask = apps.get_model("django_celery_beat", "PeriodicTask")
+    PeriodicTask.objects.filter(name=PERIODIC_TASK_NAME).delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("django_celery_beat", "0019_alter_periodictasks_options"),
+        ("learning_credentials", "0015_learner_progress_snapshot"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_periodic_task, reverse_code=delete_periodic_task),
+    ]
@@ -0,0 +1,31 @@
+from django.db import migrations
+
+PERIODIC_TASKS = {
+    "Archive invalidated credentials": "learning_credentials.tasks.archive_invalidated_credentials_task",
+    "Reconcile credential counters": "learning_credentials.tasks.reconcile_credential_stats_task",
+}
+
+
+def create_periodic_tasks(apps, schema_editor):
+    """Archive the invalidated credentials and recalculate the credential counters once a day."""
+    IntervalSchedule = apps.get_model("django_celery_beat", "IntervalSchedule")
+    PeriodicTask = apps.get_model("django_celery_beat", "PeriodicTask")
+    schedule, _created = IntervalSchedule.objects.get_or_create(every=1, period="days")
+    for name, task in PERIODIC_TASKS.items():
+        PeriodicTask.objects.get_or_create(name=name, defaults={"task": task, "interval": schedule})
+
+
+def delete_periodic_tasks(apps, schema_editor):
+    """Remove the periodic tasks."""
+    PeriodicTask = apps.get_model("django_celery_beat", "PeriodicTask")
+    PeriodicTask.objects.filter(name__in=PERIODIC_TASKS).delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("learning_credentials", "0016_delete_old_asset_versions_periodic_task"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_periodic_tasks, reverse_code=delete_periodic_tasks),
+    ]
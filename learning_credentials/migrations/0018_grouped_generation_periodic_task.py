@@ -0,0 +1,34 @@
+from django.db import migrations
+
+PERIODIC_TASK_NAME = "Generate credentials grouped by learning context"
+
+
+def create_periodic_task(apps, schema_editor):
+    """Create the disabled daily task generating the credentials of all learning contexts."""
+    IntervalSchedule = apps.get_model("django_celery_beat", "IntervalSchedule")
+    PeriodicTask = apps.get_model("django_celery_beat", "PeriodicTask")
+    schedule, _created = IntervalSchedule.objects.get_or_create(every=1, period="days")
+    PeriodicTask.objects.get_or_create(
+        name=PERIODIC_TASK_NAME,
+        defaults={
+            "task": "learning_credentials.tasks.generate_all_credentials_task",
+            "interval": schedule,
+            "enabled": False,
+        },
+    )
+
+
+def delete_periodic_task(apps, schema_editor):
+    """Remove the periodic task."""
+    PeriodicTask = apps.get_model("django_celery_beat", "PeriodicTask")
+    PeriodicTask.objects.filter(name=PERIODIC_TASK_NAME).delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("learning_credentials", "0017_archive_and_reconcile_periodic_tasks"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_periodic_task, reverse_code=delete_periodic_task),
+    ]
@@ -2,37 +2,46 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import uuid as uuid_lib
-from importlib import import_module
+from collections import Counter, defaultdict
+from datetime import timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Self
 
 import jsonfield
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import connections, models, router, transaction
+from django.db.models.functions import Coalesce
 from django.db.models.signals import post_delete
 from django.dispatch import receiver
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
-from django_celery_beat.models import IntervalSchedule, PeriodicTask
-from edx_ace import Message, Recipient, ace
 from model_utils.models import TimeStampedModel
 from opaque_keys.edx.django.models import LearningContextKeyField
 
-from learning_credentials.compat import get_learning_context_name
+from learning_credentials.compat import get_learning_context_name, get_users_with_profiles
 from learning_credentials.exceptions import AssetNotFoundError, CredentialGenerationError
+from learning_credentials.registry import forget_functions, resolve_function
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Collection, Iterable, Iterator
+
+    from django.contrib.auth.models import User
     from django.core.files import File
     from django.db.models import QuerySet
 
 
 log = logging.getLogger(__name__)
 
+# Merged custom options of each configuration, with the `modified` timestamps of the configuration and its type.
+_merged_options_cache: dict[int, tuple[tuple, dict[str, Any]]] = {}
+
 
 def _deep_merge(base: dict, override: dict) -> dict:
     """
@@ -53,6 +62,19 @@ def _deep_merge(base: dict, override: dict) -> dict:
     return result
 
 
+def _get_user_full_name(user: User) -> str:
+    """
+    Get the full name of a user.
+
+    Use the name from the profile if it is not empty. Otherwise, use the first and last name.
+    We check if the profile exists because it may not exist in some cases (e.g., when a User is created manually).
+
+    :param user: The user.
+    :return: The full name of the user.
+    """
+    return getattr(getattr(user, 'profile', None), 'name', f"{user.first_name} {user.last_name}")
+
+
 class CredentialType(TimeStampedModel):
     """
     Model to store global credential configurations for each type.
@@ -71,18 +93,38 @@ class CredentialType(TimeStampedModel):
         """Get a string representation of this model's instance."""
         return self.name
 
+    def save(self, *args, **kwargs):
+        """
+        Resolve the functions again on their next use, and drop the merged options of the configurations.
+
+        The progress snapshots of the configurations are deleted if the retrieval function or the options change, as
+        the stored progress was evaluated against the previous ones.
+        """
+        previous = None
+        if not self._state.adding:
+            previous = CredentialType.objects.filter(pk=self.pk).values('retrieval_func', 'custom_options').first()
+
+        super().save(*args, **kwargs)
+        forget_functions(self.retrieval_func, self.generation_func)
+        for config_id, (version, _options) in list(_merged_options_cache.items()):
+            if version[2] == self.pk:
+                _merged_options_cache.pop(config_id, None)
+
+        if previous is not None and previous != {
+            'retrieval_func': self.retrieval_func,
+            'custom_options': self.custom_options,
+        }:
+            LearnerProgressSnapshot.objects.filter(configuration__credential_type=self).delete()
+
     def clean(self):
         """Ensure that the `retrieval_func` and `generation_func` exist."""
         for func_field in ['retrieval_func', 'generation_func']:
             func_path = getattr(self, func_field)
             try:
-                # TODO: Move the function retrieval to a method to avoid code duplication.
-                module_path, func_name = func_path.rsplit('.', 1)
-                module = import_module(module_path)
-                getattr(module, func_name)  # Will raise AttributeError if the function does not exist.
+                resolve_function(func_path)
             except ValueError as exc:
                 raise ValidationError({func_field: "Function path must be in format 'module.function_name'."}) from exc
-            except (ImportError, AttributeError) as exc:
+            except (ImportError, AttributeError, TypeError) as exc:
                 raise ValidationError(
                     {func_field: f"The function {func_path} could not be found. Please provide a valid path."},
                 ) from exc
@@ -105,7 +147,7 @@ class CredentialConfiguration(TimeStampedModel):
         help_text=_('Associated credential type.'),
     )
     periodic_task = models.OneToOneField(
-        PeriodicTask,
+        'django_celery_beat.PeriodicTask',
         on_delete=models.CASCADE,
         help_text=_('Associated periodic task.'),
     )
@@ -125,13 +167,25 @@ class CredentialConfiguration(TimeStampedModel):
         return f'{self.credential_type.name} in {self.learning_context_key}'
 
     def save(self, *args, **kwargs):
-        """Create a new PeriodicTask every time a new CredentialConfiguration is created."""
+        """
+        Create a new PeriodicTask every time a new CredentialConfiguration is created.
+
+        The progress snapshots of the configuration are deleted if its options change.
+        """
+        from django_celery_beat.models import IntervalSchedule, PeriodicTask  # noqa: PLC0415
+
         from learning_credentials.tasks import generate_credentials_for_config_task as task  # noqa: PLC0415
 
         # Use __wrapped__ to get the original function, as the task is wrapped by the @app.task decorator.
         task_path = f"{task.__wrapped__.__module__}.{task.__wrapped__.__name__}"
 
-        if self._state.adding:
+        adding = self._state.adding
+        previous_options = None
+        if not adding:
+            previous_options = (
+                CredentialConfiguration.objects.filter(pk=self.pk).values_list('custom_options', flat=True).first()
+            )
+        if adding:
             schedule, _created = IntervalSchedule.objects.get_or_create(every=10, period=IntervalSchedule.DAYS)
             self.periodic_task = PeriodicTask.objects.create(
                 enabled=False,
@@ -141,6 +195,11 @@ class CredentialConfiguration(TimeStampedModel):
             )
 
         super().save(*args, **kwargs)
+        if adding:
+            CredentialConfigurationStats.objects.create(configuration=self)
+        elif previous_options is not None and previous_options != self.custom_options:
+            self.progress_snapshots.all().delete()
+        _merged_options_cache.pop(self.pk, None)
 
         # Update the task on each save to prevent it from getting out of sync (e.g., after changing a task definition).
         self.periodic_task.task = task_path
@@ -177,12 +236,40 @@ class CredentialConfiguration(TimeStampedModel):
         """
         users_ids_with_credentials = Credential.objects.filter(
             models.Q(configuration=self),
+            models.Q(user_id__in=user_ids),
             ~(models.Q(status=Credential.Status.ERROR)),
         ).values_list('user_id', flat=True)
 
         filtered_user_ids_set = set(user_ids) - set(users_ids_with_credentials)
         return list(filtered_user_ids_set)
 
+    def _get_retrieval_func(self) -> Callable:
+        """Get the retrieval function of the credential type."""
+        return resolve_function(self.credential_type.retrieval_func)
+
+    def _get_generation_func(self) -> Callable:
+        """Get the generation function of the credential type."""
+        return resolve_function(self.credential_type.generation_func)
+
+    def get_custom_options(self) -> dict[str, Any]:
+        """
+        Get the custom options of the credential type merged with the custom options of this configuration.
+
+        The merged options are cached until the configuration or its credential type is modified. The returned
+        dictionary is shared, so it must not be modified.
+
+        :return: The merged custom options.
+        """
+        credential_type = self.credential_type
+        version = (self.pk, self.modified, credential_type.pk, credential_type.modified)
+        if self.pk is not None and (cached := _merged_options_cache.get(self.pk)) and cached[0] == version:
+            return cached[1]
+
+        options = _deep_merge(credential_type.custom_options, self.custom_options)
+        if self.pk is not None:
+            _merged_options_cache[self.pk] = (version, options)
+        return options
+
     def _call_retrieval_func(self, user_id: int | None = None) -> dict[int, dict[str, Any]]:
         """
         Call the retrieval function and return detailed results.
@@ -190,13 +277,41 @@ class CredentialConfiguration(TimeStampedModel):
         :param user_id: Optional. If provided, only check eligibility for this user.
         :return: A dict mapping user IDs to their detailed progress information.
         """
-        func_path = self.credential_type.retrieval_func
-        module_path, func_name = func_path.rsplit('.', 1)
-        module = import_module(module_path)
-        func = getattr(module, func_name)
+        from learning_credentials.processors import collect_progress  # noqa: PLC0415
+
+        func = self._get_retrieval_func()
+        custom_options = self.get_custom_options()
+        return collect_progress(func(self.learning_context_key, custom_options, user_id=user_id))
+
+    def iter_retrieval_results(self, user_id: int | None = None) -> Iterator[tuple[int, dict[str, Any]]]:
+        """
+        Call the streaming variant of the retrieval function and yield the results as they are retrieved.
+
+        Retrieval functions without a streaming variant are adapted, so their results are yielded once they complete.
+
+        :param user_id: Optional. If provided, only check eligibility for this user.
+        :return: An iterator over ``(user_id, progress)`` pairs.
+        """
+        from learning_credentials.processors import get_streaming_variant, iter_progress  # noqa: PLC0415
 
-        custom_options = _deep_merge(self.credential_type.custom_options, self.custom_options)
-        return func(self.learning_context_key, custom_options, user_id=user_id)
+        func = get_streaming_variant(self._get_retrieval_func())
+        custom_options = self.get_custom_options()
+        yield from iter_progress(func(self.learning_context_key, custom_options, user_id=user_id))
+
+    def iter_eligible_user_ids(self, user_id: int | None = None) -> Iterator[int]:
+        """
+        Yield the IDs of eligible learners for the given learning context as they are retrieved.
+
+        :param user_id: Optional. If provided, only check eligibility for this user.
+        :return: An iterator over eligible user IDs.
+        """
+        results = self.iter_retrieval_results(user_id)
+        if LearnerProgressSnapshot.is_enabled():
+            results = LearnerProgressSnapshot.iter_and_save_results(self, results)
+
+        for uid, details in results:
+            if details.get('is_eligible', False):
+                yield uid
 
     def get_eligible_user_ids(self, user_id: int | None = None) -> list[int]:
         """
@@ -205,8 +320,7 @@ class CredentialConfiguration(TimeStampedModel):
         :param user_id: Optional. If provided, only check eligibility for this user.
         :return: A list of eligible user IDs.
         """
-        results = self._call_retrieval_func(user_id)
-        return [uid for uid, details in results.items() if details.get('is_eligible', False)]
+        return list(self.iter_eligible_user_ids(user_id))
 
     def get_user_eligibility_details(self, user_id: int) -> dict[str, Any]:
         """
@@ -216,7 +330,28 @@ class CredentialConfiguration(TimeStampedModel):
         :return: Dictionary containing eligibility details and progress information.
         """
         results = self._call_retrieval_func(user_id)
-        return results.get(user_id, {'is_eligible': False})
+        details = results.get(user_id, {'is_eligible': False})
+        if LearnerProgressSnapshot.is_enabled():
+            LearnerProgressSnapshot.save_results(self, [(user_id, details)])
+        return details
+
+    def get_users_eligibility_details(self, user_ids: Collection[int]) -> dict[int, dict[str, Any]]:
+        """
+        Get detailed eligibility information for multiple users with a single call of the retrieval function.
+
+        The built-in retrieval functions only retrieve the enrollments and grades of these users.
+
+        :param user_ids: The IDs of the users to check eligibility for.
+        :return: A dict mapping each user ID to its eligibility details and progress information.
+        """
+        from learning_credentials.processors import restrict_to_users  # noqa: PLC0415
+
+        with restrict_to_users(user_ids):
+            results = self._call_retrieval_func()
+        details = {user_id: results.get(user_id, {'is_eligible': False}) for user_id in user_ids}
+        if LearnerProgressSnapshot.is_enabled():
+            LearnerProgressSnapshot.save_results(self, details.items())
+        return details
 
     def generate_credential_for_user(self, user_id: int, celery_task_id: int = 0) -> Credential:
         """
@@ -234,11 +369,9 @@ class CredentialConfiguration(TimeStampedModel):
             The generated Credential object.
         """
         user = get_user_model().objects.get(id=user_id)
-        # Use the name from the profile if it is not empty. Otherwise, use the first and last name.
-        # We check if the profile exists because it may not exist in some cases (e.g., when a User is created manually).
-        user_full_name = getattr(getattr(user, 'profile', None), 'name', f"{user.first_name} {user.last_name}")
+        user_full_name = _get_user_full_name(user)
         learning_context_name = get_learning_context_name(self.learning_context_key)
-        custom_options = _deep_merge(self.credential_type.custom_options, self.custom_options)
+        custom_options = self.get_custom_options()
 
         credential, _ = Credential.objects.exclude(status=Credential.Status.INVALIDATED).update_or_create(
             user=user,
@@ -255,9 +388,7 @@ class CredentialConfiguration(TimeStampedModel):
         )
 
         try:
-            generation_module_name, generation_func_name = self.credential_type.generation_func.rsplit('.', 1)
-            generation_module = import_module(generation_module_name)
-            generation_func = getattr(generation_module, generation_func_name)
+            generation_func = self._get_generation_func()
 
             # Run the functions. We do not validate them here, as they are validated in the model's clean() method.
             credential.download_url = generation_func(credential, custom_options)
@@ -276,6 +407,98 @@ class CredentialConfiguration(TimeStampedModel):
 
         return credential
 
+    def generate_credentials_for_users(self, user_ids: list[int], celery_task_id: int | str = 0) -> list[Credential]:
+        """
+        Generate the credentials of multiple users at once.
+
+        This is the batch equivalent of `generate_credential_for_user`. The users and their profiles are retrieved in
+        a single query, the credentials are created or updated in bulk with the GENERATING status before the generation
+        starts, and their final statuses and URLs are saved in bulk once all of them are generated. Therefore, the
+        number of queries does not depend on the number of users.
+
+        :param user_ids: The IDs of the users to generate the credentials for.
+        :param celery_task_id: The ID of the Celery task that is running this function.
+        :return: The generated credentials, including the ones that failed.
+        :raises CredentialGenerationError: If the generation of any credential failed. The failed credentials are saved
+            with the ERROR status, and the remaining credentials are still generated.
+        """
+        batch_size = getattr(settings, 'LEARNING_CREDENTIALS_BULK_WRITE_BATCH_SIZE', 500)
+        users = get_users_with_profiles(user_ids)
+        learning_context_name = get_learning_context_name(self.learning_context_key)
+        custom_options = self.get_custom_options()
+
+        # TODO: Remove learning_context_key and credential_type after removing them from the Credential model.
+        credential_fields = {
+            'configuration': self,
+            'learning_context_key': self.learning_context_key,
+            'credential_type': self.credential_type.name,
+        }
+        existing_credentials = {
+            credential.user_id: credential
+            for credential in Credential.objects.exclude(status=Credential.Status.INVALIDATED).filter(
+                user_id__in=user_ids, **credential_fields
+            )
+        }
+
+        # There is no unique constraint for the active credential of a user, so the rows cannot be upserted.
+        credentials, new_credentials = [], []
+        now = timezone.now()
+        for user in users:
+            if (credential := existing_credentials.get(user.id)) is None:
+                credential = Credential(user=user, **credential_fields)
+                new_credentials.append(credential)
+            credential.user = user
+            credential.user_full_name = _get_user_full_name(user)
+            credential.learning_context_name = learning_context_name
+            credential.status = Credential.Status.GENERATING
+            credential.generation_task_id = celery_task_id
+            credential.modified = now
+            credentials.append(credential)
+
+        with transaction.atomic():
+            Credential.objects.bulk_update(
+                existing_credentials.values(),
+                ['user_full_name', 'learning_context_name', 'status', 'generation_task_id', 'modified'],
+                batch_size=batch_size,
+            )
+            Credential.objects.bulk_create(new_credentials, batch_size=batch_size)
+            CredentialConfigurationStats.record_status_changes(credentials)
+            Credential.invalidate_cached_metadata(credentials)
+
+        generation_func = self._get_generation_func()
+        failed_credentials = []
+        for credential in credentials:
+            try:
+                # We do not validate the function here, as it is validated in the model's clean() method.
+                credential.download_url = generation_func(credential, custom_options)
+                credential.status = Credential.Status.AVAILABLE
+            except Exception:
+                log.exception(
+                    'Failed to generate the %s for user %s with %s.', credential.uuid, credential.user_id, self
+                )
+                credential.status = Credential.Status.ERROR
+                failed_credentials.append(credential)
+            credential.modified = timezone.now()
+
+        with transaction.atomic():
+            Credential.objects.bulk_update(credentials, ['download_url', 'status', 'modified'], batch_size=batch_size)
+            CredentialConfigurationStats.record_status_changes(credentials)
+            Credential.invalidate_cached_metadata(credentials)
+
+        for credential in credentials:
+            # TODO: In the future, we want to check this before generating the credential.
+            user = credential.user
+            if credential.status == Credential.Status.AVAILABLE and user.is_active and user.has_usable_password():
+                credential.send_email()
+
+        if failed_credentials:
+            msg = f'Failed to generate {len(failed_credentials)} credentials with {self.id=}: ' + ', '.join(
+                str(credential.uuid) for credential in failed_credentials
+            )
+            raise CredentialGenerationError(msg)
+
+        return credentials
+
 
 # noinspection PyUnusedLocal
 @receiver(post_delete, sender=CredentialConfiguration)
@@ -285,19 +508,12 @@ def post_delete_periodic_task(sender, instance, *_args, **_kwargs):  # noqa: ANN
         instance.periodic_task.delete()
 
 
-class Credential(TimeStampedModel):
+class BaseCredential(TimeStampedModel):
     """
-    Model to represent each credential awarded to a user for a course.
-
-    This model contains information about the related course, the user who earned the credential,
-    the download URL for the credential PDF, and the associated credential generation task.
+    Fields shared by the current credentials and the archived ones.
 
     .. note:: Credentials are identified by UUIDs rather than integer keys to prevent enumeration attacks
        or privacy leaks.
-
-    .. pii: The User's name is stored in this model.
-    .. pii_types: id, name
-    .. pii_retirement: retained
     """
 
     class Status(models.TextChoices):
@@ -317,6 +533,7 @@ class Credential(TimeStampedModel):
     verify_uuid = models.UUIDField(
         default=uuid_lib.uuid4,
         editable=False,
+        unique=True,
         help_text=_('UUID used for verifying the credential'),
     )
     user = models.ForeignKey(
@@ -364,6 +581,9 @@ class Credential(TimeStampedModel):
         max_length=255, blank=True, help_text=_('Reason for invalidating the credential')
     )
 
+    class Meta:  # noqa: D106
+        abstract = True
+
     def __str__(self):
         """Get a string representation of this model's instance."""
         return (
@@ -371,25 +591,91 @@ class Credential(TimeStampedModel):
             f"in {self.configuration.learning_context_key}"
         )
 
+
+class Credential(BaseCredential):
+    """
+    Model to represent each credential awarded to a user for a course.
+
+    This model contains information about the related course, the user who earned the credential,
+    the download URL for the credential PDF, and the associated credential generation task.
+
+    Invalidated credentials are moved to the ArchivedCredential model by ``ArchivedCredential.archive``.
+
+    .. pii: The User's name is stored in this model.
+    .. pii_types: id, name
+    .. pii_retirement: retained
+    """
+
+    # The status stored in the database, used to update the counters of CredentialConfigurationStats.
+    _saved_status: str | None = None
+
+    class Meta:  # noqa: D106
+        indexes = (
+            # Finding the users who already have a credential of a configuration (during the generation).
+            models.Index(fields=('configuration', 'status', 'user'), name='lc_credential_config_status'),
+            # Finding the credentials of a user in a learning context (e.g., in the eligibility view).
+            models.Index(fields=('user', 'configuration', 'status'), name='lc_credential_user_config'),
+        )
+
+    @classmethod
+    def from_db(cls, db: str | None, field_names: list[str], values: list[Any]) -> Self:
+        """Remember the status loaded from the database."""
+        instance = super().from_db(db, field_names, values)
+        instance._saved_status = instance.__dict__.get('status')  # noqa: SLF001
+        return instance
+
     def save(self, *args, **kwargs):
         """If the invalidation reason is set, trigger the invalidation and update the timestamp."""
         if self.invalidation_reason and self.status != Credential.Status.INVALIDATED:
             self._invalidate()
         if self.status == Credential.Status.INVALIDATED and not self.invalidated_at:
             self.invalidated_at = timezone.now()
-        super().save(*args, **kwargs)
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            CredentialConfigurationStats.record_status_changes([self])
+            Credential.invalidate_cached_metadata([self])
+
+    @staticmethod
+    def get_metadata_cache_key(verify_uuid: uuid_lib.UUID | str) -> str:
+        """Get the key of the cached verification metadata of a credential in the Django cache."""
+        return f'learning_credentials.credential_metadata.{verify_uuid}'
+
+    @classmethod
+    def invalidate_cached_metadata(cls, credentials: Iterable[BaseCredential]):
+        """
+        Remove the cached verification metadata of credentials once the current transaction is committed.
+
+        The cache is not cleared before the commit, so concurrent requests cannot cache the previous version again.
+
+        :param credentials: The changed credentials.
+        """
+        cache_keys = [cls.get_metadata_cache_key(credential.verify_uuid) for credential in credentials]
+        transaction.on_commit(lambda: cache.delete_many(cache_keys))
+
+    def pop_status_change(self) -> tuple[str | None, str] | None:
+        """
+        Get the change of the status since the credential was loaded or last saved, and mark it as recorded.
+
+        :returns: The previous status (None for new credentials) and the current status, or None if the status did
+            not change.
+        """
+        if self._saved_status == self.status:
+            return None
+        previous_status, self._saved_status = self._saved_status, self.status
+        return previous_status, self.status
 
     def _invalidate(self):
         """Trigger the invalidation process for the credential."""
-        generation_module_name, generation_func_name = self.configuration.credential_type.generation_func.rsplit('.', 1)
-        generation_module = import_module(generation_module_name)
-        generation_func = getattr(generation_module, generation_func_name)
+        generation_func = resolve_function(self.configuration.credential_type.generation_func)
 
         self.download_url = generation_func(self, {}, invalidate=True)
         self.status = Credential.Status.INVALIDATED
 
     def send_email(self):
         """Send a credential link to the student."""
+        # edx-ace loads its channels and policies on import, so it is only imported when an email is sent.
+        from edx_ace import Message, Recipient, ace  # noqa: PLC0415
+
         msg = Message(
             name="certificate_generated",
             app_label="learning_credentials",
@@ -413,6 +699,265 @@ class Credential(TimeStampedModel):
         return self.configuration.generate_credential_for_user(self.user.id)
 
 
+class ArchivedCredential(BaseCredential):
+    """
+    Model to store the invalidated credentials that were moved out of the Credential model.
+
+    Each reissue leaves an invalidated credential behind. Moving these credentials to a separate table keeps the
+    Credential table (and its indexes) proportional to the number of valid credentials. Archived credentials are only
+    read to verify them by their ``verify_uuid``.
+
+    .. pii: The User's name is stored in this model.
+    .. pii_types: id, name
+    .. pii_retirement: retained
+    """
+
+    archived_at = models.DateTimeField(
+        auto_now_add=True, help_text=_('Timestamp when the credential was moved to the archive')
+    )
+
+    @classmethod
+    def archive(cls, credentials: QuerySet[Credential], batch_size: int = 1000) -> int:
+        """
+        Move invalidated credentials to the archive.
+
+        The credentials are moved in batches. Each batch is copied and deleted in a single transaction, so a
+        credential is always either in the Credential table or in the archive.
+
+        :param credentials: The credentials to consider. Only the invalidated ones are archived.
+        :param batch_size: The maximum number of credentials moved in a single transaction.
+        :returns: The number of archived credentials.
+        """
+        field_names = [field.attname for field in BaseCredential._meta.concrete_fields]  # noqa: SLF001
+        credentials = credentials.filter(status=Credential.Status.INVALIDATED).order_by('pk')
+
+        archived_count = 0
+        while True:
+            with transaction.atomic():
+                batch = list(credentials.select_for_update()[:batch_size])
+                if not batch:
+                    return archived_count
+
+                cls.objects.bulk_create(
+                    [cls(**{name: getattr(credential, name) for name in field_names}) for credential in batch],
+                    ignore_conflicts=True,
+                )
+                Credential.objects.filter(pk__in=[credential.pk for credential in batch]).delete()
+
+            archived_count += len(batch)
+
+
+class CredentialConfigurationStats(models.Model):
+    """
+    Model to store the number of credentials of a configuration in each status.
+
+    The counters are updated in the same transaction as the status of a credential, so they can be shown (e.g., in the
+    admin) without counting the credentials. Archived credentials are still counted as invalidated. The counters are
+    periodically recalculated by ``reconcile``, which fixes any drift (e.g., after credentials are deleted).
+
+    The counters are stored separately from CredentialConfiguration, so saving a configuration does not overwrite them.
+
+    .. no_pii:
+    """
+
+    configuration = models.OneToOneField(
+        CredentialConfiguration,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='stats',
+        help_text=_('Associated credential configuration.'),
+    )
+    generating_count = models.IntegerField(default=0, help_text=_('Number of credentials being generated.'))
+    available_count = models.IntegerField(default=0, help_text=_('Number of issued credentials.'))
+    error_count = models.IntegerField(default=0, help_text=_('Number of credentials that failed to generate.'))
+    invalidated_count = models.IntegerField(default=0, help_text=_('Number of invalidated credentials.'))
+    reconciled_at = models.DateTimeField(
+        null=True, blank=True, help_text=_('Timestamp when the counters were last recalculated.')
+    )
+
+    class Meta:  # noqa: D106
+        verbose_name_plural = 'credential configuration stats'
+
+    def __str__(self):
+        """Get a string representation of this model's instance."""
+        return f'Stats of {self.configuration_id}'
+
+    @staticmethod
+    def get_counter_field(status: str) -> str:
+        """Get the name of the counter of a credential status."""
+        return f'{status}_count'
+
+    @classmethod
+    def record_status_changes(cls, credentials: Iterable[Credential]):
+        """
+        Update the counters after the statuses of credentials were saved.
+
+        It must be called in the same transaction as the save, so the counters are always consistent with the
+        credentials.
+
+        :param credentials: The saved credentials. Only the credentials with changed statuses are counted.
+        """
+        deltas: dict[int, Counter[str]] = defaultdict(Counter)
+        for credential in credentials:
+            if (status_change := credential.pop_status_change()) is None:
+                continue
+            previous_status, status = status_change
+            if previous_status is not None:
+                deltas[credential.configuration_id][previous_status] -= 1
+            deltas[credential.configuration_id][status] += 1
+
+        for configuration_id, status_deltas in deltas.items():
+            updates = {
+                cls.get_counter_field(status): models.F(cls.get_counter_field(status)) + delta
+                for status, delta in status_deltas.items()
+                if delta
+            }
+            if updates and not cls.objects.filter(configuration_id=configuration_id).update(**updates):
+                cls.reconcile(configuration_id)
+
+    @classmethod
+    def reconcile(cls, configuration_id: int) -> Self:
+        """
+        Recalculate the counters of a configuration from its credentials.
+
+        The row of the counters is locked first, so the status changes committed during the recalculation are counted
+        either by the recalculation or by their own update, but never twice.
+
+        :param configuration_id: The ID of the CredentialConfiguration.
+        :returns: The recalculated stats.
+        """
+        with transaction.atomic():
+            stats, _created = cls.objects.select_for_update().get_or_create(configuration_id=configuration_id)
+            counts = Counter()
+            for model in (Credential, ArchivedCredential):
+                counts.update(
+                    dict(
+                        model.objects.filter(configuration_id=configuration_id)
+                        .order_by()
+                        .values_list('status')
+                        .annotate(models.Count('pk'))
+                    )
+                )
+
+            for status in Credential.Status:
+                setattr(stats, cls.get_counter_field(status), counts[status])
+            stats.reconciled_at = timezone.now()
+            stats.save()
+        return stats
+
+
+class LearnerProgressSnapshot(models.Model):
+    """
+    Model to store the most recent progress of a learner towards the credential of a configuration.
+
+    The snapshots hold the output of the retrieval function for each learner, so the credential eligibility endpoint
+    can return it without retrieving the grades and completions again. They are written by the periodic credential
+    generation and by the eligibility checks of single learners (e.g., when the grade of a learner changes) if
+    ``LEARNING_CREDENTIALS_PROGRESS_SNAPSHOTS`` is enabled.
+
+    .. no_pii:
+    """
+
+    configuration = models.ForeignKey(
+        CredentialConfiguration,
+        on_delete=models.CASCADE,
+        related_name='progress_snapshots',
+        help_text=_('Associated credential configuration.'),
+    )
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    progress = jsonfield.JSONField(default=dict, help_text=_('Progress returned by the retrieval function.'))
+    is_eligible = models.BooleanField(default=False, help_text=_('Whether the learner is eligible for the credential.'))
+    computed_at = models.DateTimeField(help_text=_('Timestamp when the progress was retrieved.'))
+
+    class Meta:  # noqa: D106
+        constraints = (models.UniqueConstraint(fields=('configuration', 'user'), name='lc_snapshot_config_user'),)
+        indexes = (
+            # Finding the snapshots of a user in a learning context (in the eligibility view).
+            models.Index(fields=('user', 'configuration'), name='lc_snapshot_user_config'),
+        )
+
+    def __str__(self):
+        """Get a string representation of this model's instance."""
+        return f'Progress of {self.user_id} in {self.configuration_id}'
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """Check whether the progress snapshots are written and used."""
+        return getattr(settings, 'LEARNING_CREDENTIALS_PROGRESS_SNAPSHOTS', False)
+
+    @classmethod
+    def get_current_snapshots(cls) -> QuerySet[Self]:
+        """
+        Get the snapshots that are recent enough to be returned instead of retrieving the progress again.
+
+        The maximum age of the snapshots is set with ``LEARNING_CREDENTIALS_PROGRESS_SNAPSHOT_MAX_AGE``.
+
+        :returns: The snapshots computed within the maximum age, or all snapshots if the age is not limited.
+        """
+        snapshots = cls.objects.all()
+        if (max_age := getattr(settings, 'LEARNING_CREDENTIALS_PROGRESS_SNAPSHOT_MAX_AGE', 86400)) is not None:
+            snapshots = snapshots.filter(computed_at__gte=timezone.now() - timedelta(seconds=max_age))
+        return snapshots
+
+    @classmethod
+    def save_results(
+        cls, configuration: CredentialConfiguration, results: Iterable[tuple[int, dict[str, Any]]]
+    ) -> list[Self]:
+        """
+        Create or update the snapshots of the retrieved progress of learners with a single query.
+
+        :param configuration: The CredentialConfiguration whose retrieval function returned the results.
+        :param results: The ``(user_id, progress)`` pairs returned by the retrieval function.
+        :returns: The saved snapshots.
+        """
+        computed_at = timezone.now()
+        snapshots = [
+            cls(
+                configuration=configuration,
+                user_id=user_id,
+                progress=progress,
+                is_eligible=progress.get('is_eligible', False),
+                computed_at=computed_at,
+            )
+            for user_id, progress in results
+        ]
+        # MySQL does not support conflict targets. Its `ON DUPLICATE KEY UPDATE` is triggered by the unique constraint.
+        conflict_target = {}
+        if connections[router.db_for_write(cls)].features.supports_update_conflicts_with_target:
+            conflict_target['unique_fields'] = ('configuration', 'user')
+        return cls.objects.bulk_create(
+            snapshots,
+            update_conflicts=True,
+            update_fields=('progress', 'is_eligible', 'computed_at'),
+            **conflict_target,
+        )
+
+    @classmethod
+    def iter_and_save_results(
+        cls, configuration: CredentialConfiguration, results: Iterable[tuple[int, dict[str, Any]]]
+    ) -> Iterator[tuple[int, dict[str, Any]]]:
+        """
+        Yield the results of a retrieval function, and save their snapshots in batches as they are consumed.
+
+        The batches have ``LEARNING_CREDENTIALS_BULK_WRITE_BATCH_SIZE`` results, so the memory usage does not depend on
+        the number of learners.
+
+        :param configuration: The CredentialConfiguration whose retrieval function returns the results.
+        :param results: The ``(user_id, progress)`` pairs returned by the retrieval function.
+        :returns: An iterator over the same pairs.
+        """
+        batch_size = getattr(settings, 'LEARNING_CREDENTIALS_BULK_WRITE_BATCH_SIZE', 500)
+        batch = []
+        for result in results:
+            batch.append(result)
+            yield result
+            if len(batch) >= batch_size:
+                cls.save_results(configuration, batch)
+                batch = []
+        if batch:
+            cls.save_results(configuration, batch)
+
+
 class CredentialAsset(TimeStampedModel):
     """
     A set of assets to be used in custom credential templates.
@@ -422,18 +967,20 @@ class CredentialAsset(TimeStampedModel):
     .. no_pii:
     """
 
+    ASSETS_DIR = 'learning_credentials_template_assets'
+
     def template_assets_path(self, filename: str) -> str:
         """
-        Delete the file if it already exists and returns the credential template asset file path.
+        Return the path of a new version of the asset file.
+
+        The path contains the hash of the file content, so each version is stored in a separate file that never
+        changes. Caches (including CDNs and the local asset cache) can keep these files forever. The previous versions
+        are deleted by ``delete_old_asset_versions_task`` after a grace period.
 
         :param filename: File to upload.
-        :return path: Path of asset file e.g. `credential_template_assets/1/filename`.
+        :return path: Path of asset file e.g. `learning_credentials_template_assets/1/<content_hash>/filename`.
         """
-        name = Path('learning_credentials_template_assets') / str(self.id) / filename
-        fullname = Path(settings.MEDIA_ROOT) / name
-        if fullname.exists():
-            fullname.unlink()
-        return str(name)
+        return str(Path(self.ASSETS_DIR) / str(self.id) / self.content_hash / filename)
 
     description = models.CharField(
         max_length=255,
@@ -452,6 +999,18 @@ class CredentialAsset(TimeStampedModel):
         null=False,
         help_text=_('Asset\'s unique slug. We can reference the asset in templates using this value.'),
     )
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        editable=False,
+        help_text=_('SHA-256 hash of the current version of the asset file.'),
+    )
+    content_uploaded = models.DateTimeField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text=_('Date and time when the current version of the asset file was uploaded.'),
+    )
 
     class Meta:  # noqa: D106
         get_latest_by = 'created'
@@ -460,7 +1019,27 @@ class CredentialAsset(TimeStampedModel):
         return f'{self.asset.url}'
 
     def save(self, *args, **kwargs):
-        """If the object is being created, save the asset first, then save the object."""
+        """
+        Save the object and store a new version of the asset file if it was changed.
+
+        If the uploaded file has the same content as the current version, the current file is kept. Otherwise, the
+        storage would save a duplicate under a renamed path (or overwrite the current file).
+
+        If the object is being created, save the object first to get its ID for the asset path, then save the asset.
+        """
+        if bool(self.asset) and not self.asset._committed:  # noqa: SLF001
+            content_hash = hashlib.sha256()
+            for chunk in self.asset.chunks():
+                content_hash.update(chunk)
+            current_name = None
+            if not self._state.adding and content_hash.hexdigest() == self.content_hash:
+                current_name = type(self).objects.filter(pk=self.pk).values_list('asset', flat=True).first()
+            if current_name and self.asset.storage.exists(current_name):
+                self.asset = current_name
+            else:
+                self.content_hash = content_hash.hexdigest()
+                self.content_uploaded = timezone.now()
+
         if self._state.adding:
             asset_image = self.asset
             self.asset = None
@@ -469,6 +1048,56 @@ class CredentialAsset(TimeStampedModel):
 
         super().save(*args, **kwargs)
 
+    @staticmethod
+    def _get_grace_period() -> timedelta:
+        """Get the period after which the previous versions of an asset file are deleted."""
+        return timedelta(seconds=getattr(settings, 'LEARNING_CREDENTIALS_ASSET_GRACE_PERIOD', 7 * 24 * 60 * 60))
+
+    def delete_old_versions(self) -> list[str]:
+        """
+        Delete the previous versions of the asset file once the grace period of the current version has passed.
+
+        The grace period lets the processes that still reference a previous version (e.g., a credential that is being
+        generated) finish using it. Legacy assets, uploaded before the upload time was stored, use the time of their
+        last modification instead. The current file is never deleted.
+
+        :returns: The paths of the deleted files.
+        """
+        if timezone.now() - (self.content_uploaded or self.modified) < self._get_grace_period():
+            return []
+
+        storage = self.asset.storage
+        directory = f'{self.ASSETS_DIR}/{self.id}'
+        try:
+            subdirectories, files = storage.listdir(directory)
+        except FileNotFoundError:
+            return []
+
+        # Files stored directly in the directory were uploaded before the paths contained the content hash.
+        paths = [f'{directory}/{name}' for name in files]
+        for subdirectory in subdirectories:
+            if subdirectory != self.content_hash:
+                _nested_subdirectories, version_files = storage.listdir(f'{directory}/{subdirectory}')
+                paths += [f'{directory}/{subdirectory}/{name}' for name in version_files]
+
+        deleted_paths = [path for path in paths if path != self.asset.name]
+        for path in deleted_paths:
+            storage.delete(path)
+            log.info("Deleted the previous version %s of asset %s.", path, self.asset_slug)
+        return deleted_paths
+
+    @classmethod
+    def delete_expired_versions(cls) -> list[str]:
+        """
+        Delete the previous versions of all assets whose current version was uploaded before the grace period.
+
+        :returns: The paths of the deleted files.
+        """
+        assets = cls.objects.annotate(
+            uploaded=Coalesce('content_uploaded', 'modified', output_field=models.DateTimeField())
+        ).filter(uploaded__lte=timezone.now() - cls._get_grace_period())
+        return [path for asset in assets.iterator() for path in asset.delete_old_versions()]
+
     @classmethod
     def get_asset_by_slug(cls, asset_slug: str) -> File:
         """
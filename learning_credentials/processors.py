@@ -7,37 +7,154 @@ per-user progress for the credential type, following the contract described belo
 All processors return ``dict[int, dict[str, Any]]`` — a mapping from user ID to detailed progress info for all
 relevant users, including those who are not eligible. Each user's dict always includes an ``is_eligible`` boolean.
 
+Processors can also follow the streaming variant of this contract: instead of a dict, they return an iterator of
+``(user_id, progress)`` pairs, so that the results can be consumed while the retrieval is still running. A streaming
+implementation can be attached to a dict-returning processor with the ``streaming_variant`` decorator. Use
+``iter_progress`` and ``collect_progress`` to consume the results of any processor, regardless of its variant.
+
+Within ``restrict_to_users``, the built-in processors only retrieve the enrollments (and therefore the grades and
+completions) of the given users. This way, the progress of a group of learners (e.g., a cohort) is retrieved with a
+single call of a processor. Other processors may ignore the restriction, so callers still filter the results.
+
+The display names and capabilities of the processors are declared in ``CREDENTIAL_FUNCTIONS`` (see
+``learning_credentials.registry``), which must be updated when a processor is added or its streaming variant changes.
+
 We will move this module to an external repository (a plugin).
 """
 
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any
-
-from completion_aggregator.api.v1.views import CompletionDetailView
+from collections.abc import Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from itertools import islice
+from math import isnan
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import numpy as np
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from learning_paths.models import LearningPath
-from rest_framework.request import Request
-from rest_framework.test import APIRequestFactory
 
 from learning_credentials.compat import (
     get_course_enrollments,
     get_course_grade,
     get_course_grading_policy,
+    iter_course_enrollments,
     prefetch_course_grades,
 )
+from learning_credentials.concurrency import run_concurrently
+from learning_credentials.progress_cache import get_active_progress_cache, get_cached_progress
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Collection, Hashable, Iterable, Iterator
 
     from django.contrib.auth.models import User
     from opaque_keys.edx.keys import CourseKey, LearningContextKey
     from rest_framework.views import APIView
 
+    ProgressResults = Mapping[int, dict[str, Any]] | Iterable[tuple[int, dict[str, Any]]]
+
 
 log = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
+# The capabilities of the processors of this module. It is read from the source code by the registry, so it must stay a
+# literal dict.
+CREDENTIAL_FUNCTIONS = {
+    'retrieve_subsection_grades': {'name': 'Subsection grades', 'streaming': True, 'batch': True},
+    'retrieve_completions': {'name': 'Completions', 'streaming': True, 'batch': True},
+    'retrieve_completions_and_grades': {'name': 'Completions and grades', 'streaming': True, 'batch': True},
+}
+
+# Streaming implementations registered for the dict-returning processors.
+_streaming_variants: dict[Callable, Callable] = {}
+
+# The users that the built-in processors are restricted to (see `restrict_to_users`).
+_restricted_user_ids: ContextVar[frozenset[int] | None] = ContextVar(
+    'learning_credentials_restricted_user_ids', default=None
+)
+
+
+def streaming_variant(stream_func: Callable[..., Iterator[tuple[int, dict[str, Any]]]]) -> Callable:
+    """
+    Register a streaming implementation of the decorated processor.
+
+    The streaming implementation accepts the same arguments as the processor, but yields ``(user_id, progress)`` pairs
+    instead of returning a dict.
+
+    :param stream_func: The streaming implementation of the processor.
+    :returns: The decorator.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        _streaming_variants[func] = stream_func
+        return func
+
+    return decorator
+
+
+def get_streaming_variant(func: Callable) -> Callable:
+    """
+    Get the streaming implementation of a processor.
+
+    :param func: The processor function.
+    :returns: The registered streaming implementation, or the processor itself if none is registered.
+    """
+    return _streaming_variants.get(func, func)
+
+
+@contextmanager
+def restrict_to_users(user_ids: Collection[int]) -> Iterator[None]:
+    """
+    Restrict the built-in processors to the given users while the context is active.
+
+    :param user_ids: The IDs of the users whose progress is retrieved.
+    """
+    token = _restricted_user_ids.set(frozenset(user_ids))
+    try:
+        yield
+    finally:
+        _restricted_user_ids.reset(token)
+
+
+def _get_progress_key(*parts: Hashable) -> tuple:
+    """
+    Build the progress cache key of the data retrieved for the users of the active restriction.
+
+    :param parts: The parts of the key that identify the data.
+    :returns: The key, which also contains the restricted user IDs if `restrict_to_users` is active.
+    """
+    restricted_user_ids = _restricted_user_ids.get()
+    return parts if restricted_user_ids is None else (*parts, restricted_user_ids)
+
+
+def iter_progress(results: ProgressResults) -> Iterator[tuple[int, dict[str, Any]]]:
+    """
+    Iterate over the results of a processor, regardless of the variant of the contract it follows.
+
+    :param results: A dict mapping user IDs to their progress, or an iterable of ``(user_id, progress)`` pairs.
+    :returns: An iterator over ``(user_id, progress)`` pairs.
+    """
+    if isinstance(results, Mapping):
+        yield from results.items()
+    else:
+        yield from results
+
+
+def collect_progress(results: ProgressResults) -> dict[int, dict[str, Any]]:
+    """
+    Collect the results of a processor into a dict, regardless of the variant of the contract it follows.
+
+    :param results: A dict mapping user IDs to their progress, or an iterable of ``(user_id, progress)`` pairs.
+    :returns: A dict mapping user IDs to their progress.
+    """
+    if isinstance(results, dict):
+        return results
+    return dict(iter_progress(results))
+
 
 def _process_learning_context(
     learning_context_key: LearningContextKey,
@@ -50,7 +167,8 @@ def _process_learning_context(
 
     For courses, runs the processor directly. For learning paths, runs the processor on each
     course in the path with step-specific options (if available), and returns detailed results
-    with per-step breakdown.
+    with per-step breakdown. The courses of a learning path are processed concurrently, using up to
+    ``LEARNING_CREDENTIALS_LEARNING_PATH_MAX_WORKERS`` threads.
 
     Args:
         learning_context_key: A course key or learning path key to process
@@ -66,21 +184,29 @@ def _process_learning_context(
         return course_processor(learning_context_key, options, user_id)
 
     learning_path = LearningPath.objects.get(key=learning_context_key)
+    course_keys = [step.course_key for step in learning_path.steps.all()]
 
-    step_results_by_course: dict[str, dict[int, dict[str, Any]]] = {}
+    def process_step(course_key: CourseKey) -> dict[int, dict[str, Any]]:
+        course_options = options.get("steps", {}).get(str(course_key), options)
+        return course_processor(course_key, course_options, user_id)
+
+    # Steps are independent, so they are processed concurrently. The results are stored in the order of the steps.
+    step_results_by_course: dict[str, dict[int, dict[str, Any]]] = {str(key): {} for key in course_keys}
     all_user_ids: set[int] = set()
 
     # TODO: Use a single Completion Aggregator request when retrieving step results for a single user.
-    for step in learning_path.steps.all():
-        course_options = options.get("steps", {}).get(str(step.course_key), options)
-        step_results = course_processor(step.course_key, course_options, user_id)
-
-        step_results_by_course[str(step.course_key)] = step_results
+    max_workers = getattr(settings, 'LEARNING_CREDENTIALS_LEARNING_PATH_MAX_WORKERS', 4)
+    for course_key, step_results in run_concurrently(process_step, course_keys, max_workers):
+        step_results_by_course[str(course_key)] = step_results
         all_user_ids.update(step_results.keys())
 
     # Filter out users who are not enrolled in the Learning Path.
-    all_user_ids &= set(
-        learning_path.enrolled_users.filter(learningpathenrollment__is_active=True).values_list('id', flat=True)
+    enrolled_users = learning_path.enrolled_users.filter(learningpathenrollment__is_active=True)
+    if (restricted_user_ids := _restricted_user_ids.get()) is not None:
+        enrolled_users = enrolled_users.filter(id__in=restricted_user_ids)
+    all_user_ids &= get_cached_progress(
+        _get_progress_key(str(learning_context_key), 'enrollments'),
+        lambda: set(enrolled_users.values_list('id', flat=True)),
     )
 
     final_results: dict[int, dict[str, Any]] = {}
@@ -120,6 +246,66 @@ def _get_category_weights(course_id: CourseKey) -> dict[str, float]:
     return category_weight_ratios
 
 
+def _chunked(items: Iterable[T], chunk_size: int) -> Iterator[list[T]]:
+    """
+    Split an iterable into lists of at most `chunk_size` elements.
+
+    :param items: The iterable to split.
+    :param chunk_size: The maximum size of each chunk.
+    :returns: An iterator over the chunks.
+    """
+    iterator = iter(items)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def _get_user_grades_by_format(user: User, course_id: CourseKey) -> dict[str, float]:
+    """
+    Get the grades of a single user, categorized by assignment types.
+
+    :param user: The user to get the grades for.
+    :param course_id: The course ID.
+    :returns: A dictionary with the grades of the user, categorized by assignment types.
+    """
+    user_grades = {}
+    course_grade = get_course_grade(user, course_id)
+    for assignment_type, subsections in course_grade.graded_subsections_by_format().items():
+        assignment_earned = 0
+        assignment_possible = 0
+        log.debug(subsections)
+        for subsection in subsections.values():
+            assignment_earned += subsection.graded_total.earned
+            assignment_possible += subsection.graded_total.possible
+        grade = (assignment_earned / assignment_possible) * 100 if assignment_possible > 0 else 0
+        user_grades[assignment_type.lower()] = grade
+    return user_grades
+
+
+def _iter_grades_by_format(
+    course_id: CourseKey, users: Iterable[User], chunk_size: int | None = None
+) -> Iterator[tuple[int, dict[str, float]]]:
+    """
+    Stream the grades for each user, categorized by assignment types.
+
+    Grades are prefetched for one chunk of users at a time, and the prefetched data is cleared before the next chunk
+    is processed. This way, the peak memory usage depends on the chunk size instead of the number of enrollments.
+
+    :param course_id: The course ID.
+    :param users: The users to get the grades for.
+    :param chunk_size: The number of users to prefetch the grades for at once.
+        Defaults to the ``LEARNING_CREDENTIALS_GRADES_CHUNK_SIZE`` setting.
+    :returns: An iterator over `(user_id, grades)` pairs.
+    """
+    if chunk_size is None:
+        chunk_size = getattr(settings, 'LEARNING_CREDENTIALS_GRADES_CHUNK_SIZE', 1000)
+
+    for chunk in _chunked(users, chunk_size):
+        log.debug('Getting the grades for a chunk of %d users.', len(chunk))
+        with prefetch_course_grades(course_id, chunk):
+            for user in chunk:
+                yield user.id, _get_user_grades_by_format(user, course_id)
+
+
 def _get_grades_by_format(course_id: CourseKey, users: list[User]) -> dict[int, dict[str, float]]:
     """
     Get the grades for each user, categorized by assignment types.
@@ -129,106 +315,186 @@ def _get_grades_by_format(course_id: CourseKey, users: list[User]) -> dict[int,
     :returns: A dictionary with the grades for each user, categorized by assignment types.
     """
     log.debug('Getting the grades for each user.')
-
-    grades = {}
-
-    with prefetch_course_grades(course_id, users):
-        for user in users:
-            grades[user.id] = {}
-            course_grade = get_course_grade(user, course_id)
-            for assignment_type, subsections in course_grade.graded_subsections_by_format().items():
-                assignment_earned = 0
-                assignment_possible = 0
-                log.debug(subsections)
-                for subsection in subsections.values():
-                    assignment_earned += subsection.graded_total.earned
-                    assignment_possible += subsection.graded_total.possible
-                grade = (assignment_earned / assignment_possible) * 100 if assignment_possible > 0 else 0
-                grades[user.id][assignment_type.lower()] = grade
-
+    grades = dict(_iter_grades_by_format(course_id, users))
     log.debug('Finished getting the grades for each user.')
     return grades
 
 
-def _are_grades_passing_criteria(
-    user_grades: dict[str, float],
+def _iter_course_grades(
+    course_id: CourseKey, user_id: int | None, chunk_size: int
+) -> Iterator[tuple[int, dict[str, float]]]:
+    """
+    Stream the grades of the enrolled users in a course, categorized by assignment types.
+
+    The grades do not depend on the credential options, so when a progress cache is active, they are shared by all
+    credential configurations that process this course during the run, unless they exceed the size of the cache.
+
+    :param course_id: The course ID.
+    :param user_id: Optional. If provided, only get the grades of this user.
+    :param chunk_size: The number of users to prefetch the grades for at once.
+    :returns: An iterator over `(user_id, grades)` pairs.
+    """
+    restricted_user_ids = _restricted_user_ids.get()
+
+    def iter_grades() -> Iterator[tuple[int, dict[str, float]]]:
+        users = iter_course_enrollments(course_id, user_id, user_ids=restricted_user_ids)
+        return _iter_grades_by_format(course_id, users, chunk_size)
+
+    if (cache := get_active_progress_cache()) is None:
+        return iter_grades()
+    return cache.iter_or_compute(_get_progress_key(str(course_id), 'grades', user_id), iter_grades)
+
+
+def _build_grade_matrix(
+    grades: Iterator[tuple[int, dict[str, float]]], max_rows: int
+) -> tuple[list[int], list[str], np.ndarray]:
+    """
+    Build a columnar representation of the grades of the next users of a stream.
+
+    The grades of each user are written to the matrix as soon as they are read, so they do not need to be kept in
+    memory next to it.
+
+    :param grades: An iterator over ``(user_id, grades)`` pairs, where the grades are divided by category.
+    :param max_rows: The maximum number of users to read from the iterator.
+    :returns: A tuple of (user IDs, categories, grade matrix). The matrix has one row per user and one column per
+        category. Categories in which a user has no grade are represented by NaN.
+    """
+    user_ids: list[int] = []
+    columns: dict[str, int] = {}
+    matrix = np.full((max_rows, 0), np.nan)
+    for row, (uid, user_grades) in enumerate(islice(grades, max_rows)):
+        user_ids.append(uid)
+        for category, grade in user_grades.items():
+            if category not in columns:
+                columns[category] = len(columns)
+                matrix = np.hstack((matrix, np.full((max_rows, 1), np.nan)))
+            matrix[row, columns[category]] = grade
+    return user_ids, list(columns), matrix[: len(user_ids)]
+
+
+def _evaluate_grade_matrix(
+    categories: list[str],
+    matrix: np.ndarray,
     required_grades: dict[str, float],
     category_weights: dict[str, float],
-) -> bool:
+) -> tuple[np.ndarray, np.ndarray]:
     """
-    Determine whether the user received passing grades in all required categories.
+    Calculate the weighted totals and the eligibility of all users in a grade matrix at once.
 
-    :param user_grades: The grades of the user, divided by category.
+    :param categories: The categories of the matrix columns.
+    :param matrix: The grade matrix built by ``_build_grade_matrix``.
     :param required_grades: The required grades for each category.
     :param category_weights: The weight of each category.
-    :returns: Whether the user received passing grades in all required categories.
-    :raises ValueError: If a category weight is not found.
+    :returns: A tuple of (weighted totals, eligibility) vectors, with one element per matrix row.
+    :raises ValueError: If a user has a grade in a category that is not found in the course grading policy.
     """
+    weights = np.array([category_weights.get(category, 0.0) for category in categories])
+    required = np.array([required_grades.get(category, 0) for category in categories])
+    known = np.array([category in category_weights for category in categories], dtype=bool)
+
+    present = ~np.isnan(matrix)
+    totals = np.where(present & known, matrix * weights, 0.0).sum(axis=1)
+
     # If user does not have a grade for a category (except for the "total" category), it means that they did not
     # attempt it. Therefore, they should not be eligible for the credential.
-    if not all(category in user_grades for category in required_grades if category != 'total'):
-        return False
-
-    total_score = 0
-    for category, score in user_grades.items():
-        if score < required_grades.get(category, 0):
-            return False
+    has_required = np.ones(len(matrix), dtype=bool)
+    for category in required_grades:
+        if category == 'total':
+            continue
+        if category not in categories:
+            has_required[:] = False
+            break
+        has_required &= present[:, categories.index(category)]
 
-        if category not in category_weights:
-            msg = "Category weight '%s' was not found in the course grading policy."
-            raise ValueError(msg, category)
-        total_score += score * category_weights[category]
+    # The grades of the other categories are only checked for users who attempted all required categories, so the
+    # result of each user depends only on their own grades.
+    unknown = has_required[:, np.newaxis] & present & ~known
+    if unknown.any():
+        msg = "Category weight '%s' was not found in the course grading policy."
+        raise ValueError(msg, categories[unknown.any(axis=0).argmax()])
 
-    return total_score >= required_grades.get('total', 0)
+    failing = present & (matrix < required)
+    eligible = has_required & ~failing.any(axis=1) & (totals >= required_grades.get('total', 0))
+    return totals, eligible
 
 
-def _calculate_grades_progress(
-    user_grades: dict[str, float],
+def _iter_grade_matrix_progress(
+    grades: Iterable[tuple[int, dict[str, float]]],
     required_grades: dict[str, float],
     category_weights: dict[str, float],
-) -> dict[str, Any]:
+    chunk_size: int | None = None,
+) -> Iterator[tuple[int, dict[str, Any]]]:
     """
-    Calculate detailed progress information for grade-based criteria.
+    Evaluate the grades of users with a grade matrix, one chunk at a time, and yield their detailed progress.
 
-    :param user_grades: The grades of the user, divided by category.
+    :param grades: The ``(user_id, grades)`` pairs, where the grades are divided by category.
     :param required_grades: The required grades for each category.
     :param category_weights: The weight of each category.
-    :returns: Dict with is_eligible, current_grades, and required_grades.
+    :param chunk_size: The number of users evaluated at once.
+        Defaults to the ``LEARNING_CREDENTIALS_GRADES_CHUNK_SIZE`` setting.
+    :returns: An iterator over ``(user_id, progress)`` pairs, where the progress contains ``is_eligible``,
+        ``current_grades``, and ``required_grades``.
+    :raises ValueError: If a user has a grade in a category that is not found in the course grading policy.
     """
-    total_score = 0
-    for category, score in user_grades.items():
-        if category in category_weights:
-            total_score += score * category_weights[category]
+    if chunk_size is None:
+        chunk_size = getattr(settings, 'LEARNING_CREDENTIALS_GRADES_CHUNK_SIZE', 1000)
 
-    user_grades_with_total = {**user_grades, 'total': total_score}
-    is_eligible = _are_grades_passing_criteria(user_grades, required_grades, category_weights)
+    grades = iter(grades)
+    while True:
+        user_ids, categories, matrix = _build_grade_matrix(grades, chunk_size)
+        if not user_ids:
+            return
+        totals, eligible = _evaluate_grade_matrix(categories, matrix, required_grades, category_weights)
+
+        for uid, row, total, is_eligible in zip(user_ids, matrix, totals.tolist(), eligible.tolist(), strict=True):
+            current_grades = {
+                category: grade for category, grade in zip(categories, row.tolist(), strict=True) if not isnan(grade)
+            }
+            progress = {
+                'is_eligible': is_eligible,
+                'current_grades': {**current_grades, 'total': total},
+                'required_grades': required_grades,
+            }
+            yield uid, progress
 
-    return {
-        'is_eligible': is_eligible,
-        'current_grades': user_grades_with_total,
-        'required_grades': required_grades,
-    }
+
+def _stream_course_subsection_grades(
+    course_id: CourseKey, options: dict[str, Any], user_id: int | None = None
+) -> Iterator[tuple[int, dict[str, Any]]]:
+    """Stream detailed grade progress for enrolled users in a course."""
+    required_grades: dict[str, float] = options['required_grades']
+    required_grades = {key.lower(): value * 100 for key, value in required_grades.items()}
+
+    weights = get_cached_progress((str(course_id), 'category_weights'), lambda: _get_category_weights(course_id))
+    chunk_size = getattr(settings, 'LEARNING_CREDENTIALS_GRADES_CHUNK_SIZE', 1000)
+
+    # Evaluate the grades of each prefetched chunk with a grade matrix instead of processing them one user at a time.
+    grades = _iter_course_grades(course_id, user_id, chunk_size)
+    yield from _iter_grade_matrix_progress(grades, required_grades, weights, chunk_size)
 
 
 def _retrieve_course_subsection_grades(
     course_id: CourseKey, options: dict[str, Any], user_id: int | None = None
 ) -> dict[int, dict[str, Any]]:
     """Retrieve detailed grade progress for enrolled users in a course."""
-    required_grades: dict[str, float] = options['required_grades']
-    required_grades = {key.lower(): value * 100 for key, value in required_grades.items()}
+    return dict(_stream_course_subsection_grades(course_id, options, user_id))
 
-    users = get_course_enrollments(course_id, user_id)
-    grades = _get_grades_by_format(course_id, users)
-    log.debug(grades)
-    weights = _get_category_weights(course_id)
 
-    results: dict[int, dict[str, Any]] = {}
-    for uid, user_grades in grades.items():
-        results[uid] = _calculate_grades_progress(user_grades, required_grades, weights)
+def stream_subsection_grades(
+    learning_context_key: LearningContextKey, options: dict[str, Any], user_id: int | None = None
+) -> Iterator[tuple[int, dict[str, Any]]]:
+    """
+    Stream detailed grade progress for users in a learning context.
 
-    return results
+    This is the streaming variant of ``retrieve_subsection_grades``. Learning paths are not streamed, as the
+    eligibility of each user depends on the results of all steps.
+    """
+    if learning_context_key.is_course:
+        return _stream_course_subsection_grades(learning_context_key, options, user_id)
+    return iter_progress(retrieve_subsection_grades(learning_context_key, options, user_id))
 
 
+@streaming_variant(stream_subsection_grades)
 def retrieve_subsection_grades(
     learning_context_key: LearningContextKey, options: dict[str, Any], user_id: int | None = None
 ) -> dict[int, dict[str, Any]]:
@@ -296,6 +562,12 @@ def _prepare_request_to_completion_aggregator(course_id: CourseKey, query_params
     :param url: The URL to use in the request.
     :returns: The view with the prepared request.
     """
+    # These imports load the REST framework test utilities and the API of the Completion Aggregator, so they are
+    # deferred until the completions are retrieved for the first time.
+    from completion_aggregator.api.v1.views import CompletionDetailView  # noqa: PLC0415
+    from rest_framework.request import Request  # noqa: PLC0415
+    from rest_framework.test import APIRequestFactory  # noqa: PLC0415
+
     log.debug('Preparing the request for retrieving the completion.')
 
     # The URL does not matter, as we do not retrieve any data from the path.
@@ -314,60 +586,105 @@ def _prepare_request_to_completion_aggregator(course_id: CourseKey, query_params
     return view
 
 
-def _retrieve_course_completions(
-    course_id: CourseKey, options: dict[str, Any], user_id: int | None = None
-) -> dict[int, dict[str, Any]]:
-    """Retrieve detailed completion progress for enrolled users in a course."""
+def _iter_completion_percents(course_id: CourseKey, user_id: int | None = None) -> Iterator[tuple[int, float]]:
+    """
+    Stream the completion percentage of enrolled users in a course, one API page at a time.
+
+    The usernames returned on each page are mapped to the IDs of the enrolled users with a single query, so only one
+    page of the results is kept in memory.
+    """
     # If it turns out to be too slow, we can:
     # 1. Modify the Completion Aggregator to emit a signal/event when a user achieves a certain completion threshold.
     # 2. Get this data from the `Aggregator` model. Filter by `aggregation name == 'course'`, `course_key`, `percent`.
-
-    required_completion = options.get('required_completion', 0.9)
-
-    # Map usernames to user IDs via enrolled users.
-    users = get_course_enrollments(course_id, user_id)
-    username_to_id = {user.username: user.id for user in users}
+    restricted_user_ids = _restricted_user_ids.get()
 
     url = f'/completion-aggregator/v1/course/{course_id}/'
     # The API supports up to 10k results per page, but we limit it to 1k to avoid performance issues.
     query_params = {'page_size': 1000, 'page': 1}
 
-    if user_id and user_id in username_to_id.values():
+    single_user = None
+    if user_id:
+        enrollments = get_course_enrollments(course_id, user_id, user_ids=restricted_user_ids)
+        if not enrollments:
+            return
         # If we are processing a single user, we can directly query their completion to get live data.
         # This is because the Completion Aggregator API calculates stale completions for single user queries.
-        query_params['username'] = users[0].username
+        single_user = enrollments[0]
+        query_params['username'] = single_user.username
 
     # TODO: Extract the logic of this view into an API. The current approach is very hacky.
     view = _prepare_request_to_completion_aggregator(course_id, query_params.copy(), url)
-    completions: dict[str, float] = {}
 
     while True:
         response = view.get(view.request, str(course_id))
         log.debug(response.data)
-        for res in response.data['results']:
-            try:
-                completions[res['username']] = res['completion']['percent']
-            except KeyError:
-                # If we request completion for a single user, the API does not return the username in the response.
-                completions[users[0].username] = res['completion']['percent']
+        results = response.data['results']
+        if single_user:
+            # If we request completion for a single user, the API does not return the username in the response.
+            username_to_id = {single_user.username: single_user.id}
+        else:
+            usernames = [res['username'] for res in results]
+            enrolled_users = get_course_enrollments(course_id, user_ids=restricted_user_ids, usernames=usernames)
+            username_to_id = {user.username: user.id for user in enrolled_users}
+
+        for res in results:
+            username = single_user.username if single_user else res['username']
+            if username in username_to_id:
+                yield username_to_id[username], res['completion']['percent']
         if not response.data['pagination']['next']:
             break
         query_params['page'] += 1
         view = _prepare_request_to_completion_aggregator(course_id, query_params.copy(), url)
 
-    results: dict[int, dict[str, Any]] = {}
-    for username, current_completion in completions.items():
-        if username in username_to_id:
-            uid = username_to_id[username]
-            results[uid] = {
-                'is_eligible': current_completion >= required_completion,
-                'current_completion': current_completion,
-                'required_completion': required_completion,
-            }
 
-    return results
+def _stream_course_completions(
+    course_id: CourseKey, options: dict[str, Any], user_id: int | None = None
+) -> Iterator[tuple[int, dict[str, Any]]]:
+    """Stream detailed completion progress for enrolled users in a course."""
+    required_completion = options.get('required_completion', 0.9)
+
+    # The completions do not depend on the credential options, so they are shared by all credential configurations
+    # that process this course during the run, unless they exceed the size of the cache.
+    cache = get_active_progress_cache()
+    if cache is None:
+        completions = _iter_completion_percents(course_id, user_id)
+    else:
+        completions = cache.iter_or_compute(
+            _get_progress_key(str(course_id), 'completions', user_id),
+            lambda: _iter_completion_percents(course_id, user_id),
+        )
+
+    for uid, current_completion in completions:
+        progress = {
+            'is_eligible': current_completion >= required_completion,
+            'current_completion': current_completion,
+            'required_completion': required_completion,
+        }
+        yield uid, progress
+
+
+def _retrieve_course_completions(
+    course_id: CourseKey, options: dict[str, Any], user_id: int | None = None
+) -> dict[int, dict[str, Any]]:
+    """Retrieve detailed completion progress for enrolled users in a course."""
+    return dict(_stream_course_completions(course_id, options, user_id))
+
+
+def stream_completions(
+    learning_context_key: LearningContextKey, options: dict[str, Any], user_id: int | None = None
+) -> Iterator[tuple[int, dict[str, Any]]]:
+    """
+    Stream detailed completion progress for users in a learning context.
+
+    This is the streaming variant of ``retrieve_completions``. Learning paths are not streamed, as the eligibility
+    of each user depends on the results of all steps.
+    """
+    if learning_context_key.is_course:
+        return _stream_course_completions(learning_context_key, options, user_id)
+    return iter_progress(retrieve_completions(learning_context_key, options, user_id))
 
 
+@streaming_variant(stream_completions)
 def retrieve_completions(
     learning_context_key: LearningContextKey, options: dict[str, Any], user_id: int | None = None
 ) -> dict[int, dict[str, Any]]:
@@ -401,6 +718,33 @@ def retrieve_completions(
     return _process_learning_context(learning_context_key, _retrieve_course_completions, options, user_id)
 
 
+def _combine_completion_and_grade_progress(
+    completion_progress: dict[str, Any], grade_progress: dict[str, Any]
+) -> dict[str, Any]:
+    """Combine the completion and grade progress of a user. Both criteria must be met to be eligible."""
+    return {
+        **completion_progress,
+        **grade_progress,
+        'is_eligible': completion_progress['is_eligible'] and grade_progress['is_eligible'],
+    }
+
+
+def stream_completions_and_grades(
+    learning_context_key: LearningContextKey, options: dict[str, Any], user_id: int | None = None
+) -> Iterator[tuple[int, dict[str, Any]]]:
+    """
+    Stream detailed progress for users that must meet both completion and grade criteria.
+
+    This is the streaming variant of ``retrieve_completions_and_grades``. The completion progress is retrieved first,
+    and the combined results are yielded while the grades are being retrieved.
+    """
+    completion_results = collect_progress(stream_completions(learning_context_key, options, user_id))
+    for uid, grade_progress in stream_subsection_grades(learning_context_key, options, user_id):
+        if uid in completion_results:
+            yield uid, _combine_completion_and_grade_progress(completion_results[uid], grade_progress)
+
+
+@streaming_variant(stream_completions_and_grades)
 def retrieve_completions_and_grades(
     learning_context_key: LearningContextKey, options: dict[str, Any], user_id: int | None = None
 ) -> dict[int, dict[str, Any]]:
@@ -458,14 +802,7 @@ def retrieve_completions_and_grades(
     grade_results = retrieve_subsection_grades(learning_context_key, options, user_id)
 
     # Merge results for users present in both.
-    combined: dict[int, dict[str, Any]] = {}
-    for uid in set(completion_results) & set(grade_results):
-        comp = completion_results[uid]
-        grade = grade_results[uid]
-        combined[uid] = {
-            **comp,
-            **grade,
-            'is_eligible': comp['is_eligible'] and grade['is_eligible'],
-        }
-
-    return combined
+    return {
+        uid: _combine_completion_and_grade_progress(completion_results[uid], grade_results[uid])
+        for uid in set(completion_results) & set(grade_results)
+    }
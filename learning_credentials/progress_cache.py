@@ -0,0 +1,510 @@
+"""
+Run-scoped cache of the raw learner progress data of learning contexts.
+
+A single course can be a step of multiple learning paths and have its own credential configurations. Each of them
+runs its processor separately, so without a cache, the grades and completions of the same course are retrieved
+multiple times during a single credential generation run.
+
+The cache only stores data that does not depend on the options of a credential configuration (e.g., the grades of
+each learner, but not their eligibility). It is only used within ``progress_cache_scope``, and each generation run
+gets a new cache, so the data retrieved during one run is never served in another one.
+
+The cache of a run has two layers. The entries are kept in the memory of the process until the last scope of the run in
+this process exits, so the workers do not keep the data between tasks. They are also stored in the Django cache under
+the ID of the run until the configured TTL passes, so the tasks of the same run share them even if they are executed by
+different worker processes. The scheduled tasks of separate credential configurations are not started together, so
+they share the run of the current TTL window (see ``get_scheduled_run_id``). The entries are also evicted from the
+memory when the cache is full (least recently used first) and when they are older than the TTL.
+
+The size of the cache is bounded by the number of entries and by the total number of items (e.g., the grades of one
+learner) stored in them. Streamed data (see ``iter_or_compute``) is only stored if it fits within the item limit, so
+large courses are still processed in chunks, at the cost of being retrieved again by each configuration. Runs that
+process all configurations of a learning context in one task can write the streamed data that does not fit to a
+temporary file instead (``spill``), so it is still retrieved once and read back from the disk by the other
+configurations. The files are deleted with the memory of the run.
+
+API views use a separate cache for each request (``request_progress_cache_scope``), so the credential configurations
+of a learning context evaluated for the same learner within a request share the retrieved grades and completions.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import hashlib
+import logging
+import pickle
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Sized
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, ClassVar, TypeVar
+
+from django.conf import settings
+from django.core.cache import cache as django_cache
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Iterable, Iterator
+
+log = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+_current_cache: contextvars.ContextVar[ProgressCache | None] = contextvars.ContextVar(
+    'learning_credentials_progress_cache', default=None
+)
+
+
+class ProgressCache:
+    """A thread-safe LRU cache with expiring entries, bound to a single credential generation run."""
+
+    # The cache of the most recent run in this process. Tasks of the same run that are executed by this process share
+    # it, and it is replaced as soon as a task of another run starts.
+    _run_cache: ClassVar[ProgressCache | None] = None
+    _run_cache_lock: ClassVar[threading.Lock] = threading.Lock()
+    # The number of active scopes using the run cache in this process.
+    _run_cache_scopes: ClassVar[int] = 0
+
+    def __init__(
+        self, run_id: str, max_entries: int, ttl: float, max_items: int | None = None, *, shared: bool = False
+    ):
+        """
+        Initialize an empty cache.
+
+        :param run_id: The ID of the credential generation run.
+        :param max_entries: The maximum number of entries. The least recently used entries are evicted first.
+        :param ttl: The number of seconds after which an entry expires.
+        :param max_items: Optional. The maximum total number of items in the entries (e.g., the grades of one learner).
+            Values with more items than this are not stored.
+        :param shared: Whether the entries are also stored in the Django cache, so other processes of the same run can
+            read them.
+        """
+        self.run_id = run_id
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_items = max_items
+        self.shared = shared
+        # Whether the streamed items that do not fit within `max_items` are written to temporary files.
+        self.spill = False
+        # The paths of the temporary files with the streamed items that did not fit within `max_items`.
+        self._spilled: dict[Hashable, Path] = {}
+        self._entries: OrderedDict[Hashable, tuple[float, object, int]] = OrderedDict()
+        self._items = 0
+        self._lock = threading.Lock()
+        # The locks of the keys that are being computed, so concurrent misses of a key compute it only once.
+        self._compute_locks: dict[Hashable, threading.Lock] = {}
+
+    @classmethod
+    def from_settings(cls, run_id: str, *, shared: bool = False) -> ProgressCache:
+        """
+        Create an empty cache with the size and TTL from the settings.
+
+        :param run_id: The ID of the credential generation run (or another scope) using the cache.
+        :param shared: Whether the entries are also stored in the Django cache.
+        :returns: The new cache.
+        """
+        return cls(
+            run_id,
+            max_entries=getattr(settings, 'LEARNING_CREDENTIALS_PROGRESS_CACHE_MAX_ENTRIES', 32),
+            ttl=_get_ttl(),
+            max_items=getattr(settings, 'LEARNING_CREDENTIALS_PROGRESS_CACHE_MAX_ITEMS', 10000),
+            shared=shared,
+        )
+
+    @classmethod
+    def for_run(cls, run_id: str) -> ProgressCache:
+        """
+        Get the cache of a run, and drop the cache of the previous run.
+
+        :param run_id: The ID of the credential generation run.
+        :returns: The cache of the run.
+        """
+        with cls._run_cache_lock:
+            return cls._replace_run_cache(run_id)
+
+    @classmethod
+    def _replace_run_cache(cls, run_id: str) -> ProgressCache:
+        """Get the cache of a run, replacing the cache of the previous run. The caller must hold the run cache lock."""
+        if cls._run_cache is None or cls._run_cache.run_id != run_id:
+            if cls._run_cache is not None:
+                cls._run_cache.clear()
+            cls._run_cache = cls.from_settings(run_id, shared=True)
+        return cls._run_cache
+
+    @classmethod
+    @contextmanager
+    def use_run_cache(cls, run_id: str, *, spill: bool = False) -> Iterator[ProgressCache]:
+        """
+        Use the cache of a run within the block, and drop it from memory once no other block of this process uses it.
+
+        The entries stored in the Django cache are kept until they expire, so the later tasks of the run can use them.
+
+        :param run_id: The ID of the credential generation run.
+        :param spill: Whether the streamed items that do not fit in the cache are written to temporary files.
+        :returns: A context manager yielding the cache of the run.
+        """
+        with cls._run_cache_lock:
+            cache = cls._replace_run_cache(run_id)
+            cache.spill = cache.spill or spill
+            cls._run_cache_scopes += 1
+        try:
+            yield cache
+        finally:
+            with cls._run_cache_lock:
+                cls._run_cache_scopes -= 1
+                if not cls._run_cache_scopes and cls._run_cache is cache:
+                    cache.clear()
+                    cls._run_cache = None
+
+    @classmethod
+    def invalidate(cls, key: Hashable):
+        """
+        Remove an entry from the cache of the current run in this process and from the cache of the scheduled run.
+
+        This is used when the source data changes during a run, e.g., when a course is published. The entries of other
+        runs started in other processes are not known here, so they are only removed once they expire.
+
+        :param key: The key of the entry.
+        """
+        with cls._run_cache_lock:
+            run_cache = cls._run_cache
+        if run_cache is not None:
+            run_cache.delete(key)
+        django_cache.delete(_get_shared_key(get_scheduled_run_id(), key))
+
+    def __len__(self) -> int:
+        """Get the number of entries in the cache, including the expired ones that have not been evicted yet."""
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: object = None) -> object:
+        """
+        Get the value of a key.
+
+        :param key: The key of the entry.
+        :param default: The value returned if the entry is missing or expired.
+        :returns: The value of the entry, or `default`.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[0] < self.ttl:
+                self._entries.move_to_end(key)
+                return entry[1]
+
+        if not self.shared:
+            return default
+        missing = object()
+        shared_entry = django_cache.get(_get_shared_key(self.run_id, key), missing)
+        if shared_entry is missing:
+            return default
+        stored_at, value = shared_entry
+        # The entry keeps its original age, so it does not outlive the TTL in the memory of this process.
+        self._store(key, value, now - (time.time() - stored_at))
+        return value
+
+    def _fits(self, items: int) -> bool:
+        """Check whether a value with the given number of items can be stored."""
+        return self.max_items is None or items <= self.max_items
+
+    def set(self, key: Hashable, value: object):
+        """
+        Store the value of a key, evicting the least recently used entries if the cache is full.
+
+        Values with more items than ``max_items`` are not stored.
+
+        :param key: The key of the entry.
+        :param value: The value of the entry.
+        """
+        if self._store(key, value, time.monotonic()) and self.shared:
+            django_cache.set(_get_shared_key(self.run_id, key), (time.time(), value), self.ttl)
+
+    def _store(self, key: Hashable, value: object, stored_at: float) -> bool:
+        """
+        Store the value of a key in the memory of this process.
+
+        :param key: The key of the entry.
+        :param value: The value of the entry.
+        :param stored_at: The monotonic time at which the value was stored.
+        :returns: Whether the value was stored.
+        """
+        items = len(value) if isinstance(value, Sized) and not isinstance(value, (str, bytes)) else 1
+        with self._lock:
+            self._pop(key)
+            if not self._fits(items):
+                return False
+            self._entries[key] = (stored_at, value, items)
+            self._items += items
+            while len(self._entries) > self.max_entries or not self._fits(self._items):
+                self._pop(next(iter(self._entries)))
+        return True
+
+    def _pop(self, key: Hashable):
+        """Remove an entry without acquiring the lock."""
+        if (entry := self._entries.pop(key, None)) is not None:
+            self._items -= entry[2]
+
+    def delete(self, key: Hashable):
+        """
+        Remove an entry from the cache, if it exists.
+
+        :param key: The key of the entry.
+        """
+        with self._lock:
+            self._pop(key)
+        if self.shared:
+            django_cache.delete(_get_shared_key(self.run_id, key))
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """
+        Get the value of a key, computing and storing it if it is missing or expired.
+
+        The value is computed outside the cache lock, so other keys can be read in the meantime. Concurrent misses of
+        the same key wait for the first one to compute the value instead of computing it again.
+
+        :param key: The key of the entry.
+        :param compute: The function computing the value.
+        :returns: The value of the entry.
+        """
+        missing = object()
+        if (value := self.get(key, missing)) is not missing:
+            log.debug('Progress cache hit for %s.', key)
+            return value  # type: ignore[return-value]
+
+        with self._lock:
+            compute_lock = self._compute_locks.setdefault(key, threading.Lock())
+        try:
+            with compute_lock:
+                # The value may have been computed by another thread while this one was waiting for the lock.
+                if (value := self.get(key, missing)) is not missing:
+                    log.debug('Progress cache hit for %s after waiting for its computation.', key)
+                    return value  # type: ignore[return-value]
+
+                log.debug('Progress cache miss for %s.', key)
+                value = compute()
+                self.set(key, value)
+                return value
+        finally:
+            with self._lock:
+                self._compute_locks.pop(key, None)
+
+    def iter_or_compute(self, key: Hashable, compute: Callable[[], Iterable[T]]) -> Iterator[T]:
+        """
+        Iterate over the cached items of a key, or over the computed items while storing them.
+
+        Unlike ``get_or_compute``, the computed items are yielded as they are retrieved. They are only stored once all
+        of them are retrieved and if they fit within ``max_items``. As soon as they do not fit, the retrieved items are
+        discarded, so the memory usage does not depend on the number of computed items. If ``spill`` is enabled, they
+        are written to a temporary file instead, and the next iterations read them from it. Concurrent misses of the
+        same key compute the items separately.
+
+        :param key: The key of the entry.
+        :param compute: The function computing the items.
+        :returns: An iterator over the items.
+        """
+        missing = object()
+        if (value := self.get(key, missing)) is not missing:
+            log.debug('Progress cache hit for %s.', key)
+            yield from value  # type: ignore[misc]
+            return
+
+        with self._lock:
+            spilled_path = self._spilled.get(key)
+        if spilled_path is not None:
+            log.debug('Progress cache hit for %s in %s.', key, spilled_path)
+            yield from _read_spilled_items(spilled_path)
+            return
+
+        log.debug('Progress cache miss for %s.', key)
+        yield from self._store_items(key, compute())
+
+    def _store_items(self, key: Hashable, items: Iterable[T]) -> Iterator[T]:
+        """
+        Yield the computed items of a key while storing them in the memory or, if they do not fit, in a temporary file.
+
+        :param key: The key of the entry.
+        :param items: The computed items.
+        :returns: An iterator over the items.
+        """
+        stored_items: list[T] | None = []
+        spill_file = None
+        try:
+            for item in items:
+                if stored_items is not None:
+                    stored_items.append(item)
+                    if not self._fits(len(stored_items)):
+                        log.debug('The items of %s do not fit in the progress cache.', key)
+                        spill_file = self._start_spill(stored_items)
+                        stored_items = None
+                elif spill_file is not None:
+                    pickle.dump(item, spill_file, pickle.HIGHEST_PROTOCOL)
+                yield item
+
+            if stored_items is not None:
+                self.set(key, stored_items)
+            elif spill_file is not None:
+                spill_file.close()
+                with self._lock:
+                    if (previous_path := self._spilled.get(key)) is not None:
+                        previous_path.unlink(missing_ok=True)
+                    self._spilled[key] = Path(spill_file.name)
+                spill_file = None
+        finally:
+            # The file of an incomplete retrieval is removed.
+            if spill_file is not None:
+                spill_file.close()
+                Path(spill_file.name).unlink(missing_ok=True)
+
+    def _start_spill(self, items: list[T]) -> IO[bytes] | None:
+        """
+        Write the items to a new temporary file, if spilling is enabled.
+
+        :param items: The items retrieved so far.
+        :returns: The open file, or None if spilling is disabled.
+        """
+        if not self.spill:
+            return None
+        spill_file = tempfile.NamedTemporaryFile(prefix='learning-credentials-', delete=False)  # noqa: SIM115
+        for item in items:
+            pickle.dump(item, spill_file, pickle.HIGHEST_PROTOCOL)
+        return spill_file
+
+    def clear(self):
+        """Remove all entries from the memory of this process. The entries in the Django cache expire on their own."""
+        with self._lock:
+            self._entries.clear()
+            self._items = 0
+            for spilled_path in self._spilled.values():
+                spilled_path.unlink(missing_ok=True)
+            self._spilled.clear()
+
+
+def _read_spilled_items(path: Path) -> Iterator[object]:
+    """
+    Read the items written to a temporary file by ``ProgressCache.iter_or_compute``.
+
+    :param path: The path of the file.
+    :returns: An iterator over the items.
+    """
+    with path.open('rb') as file:
+        while True:
+            try:
+                # The file was written by this process, so its contents are trusted.
+                yield pickle.load(file)  # noqa: S301
+            except EOFError:
+                return
+
+
+def _get_ttl() -> int:
+    """Get the number of seconds after which the entries of the progress cache expire."""
+    return max(getattr(settings, 'LEARNING_CREDENTIALS_PROGRESS_CACHE_TTL', 3600), 1)
+
+
+def _get_key_representation(key: Hashable) -> str:
+    """Get a representation of a key that is the same in all processes, regardless of the order of its sets."""
+    if isinstance(key, tuple):
+        return f'({",".join(_get_key_representation(part) for part in key)})'
+    if isinstance(key, frozenset):
+        return repr(sorted(key, key=repr))
+    return repr(key)
+
+
+def _get_shared_key(run_id: str, key: Hashable) -> str:
+    """
+    Get the key of a progress cache entry of a run in the Django cache.
+
+    :param run_id: The ID of the credential generation run.
+    :param key: The key of the entry.
+    :returns: A key that fits the key length limits of the cache backends.
+    """
+    digest = hashlib.sha256(_get_key_representation(key).encode()).hexdigest()
+    return f'learning_credentials.progress.{run_id}.{digest}'
+
+
+def get_scheduled_run_id() -> str:
+    """
+    Get the ID of the run of the scheduled credential generation tasks started within the current TTL window.
+
+    The periodic tasks of the credential configurations do not pass a run ID, so the tasks started within the same
+    window share the progress data retrieved by each other. The data is never older than the TTL.
+
+    :returns: The ID of the run.
+    """
+    return f'scheduled-{int(time.time() // _get_ttl())}'
+
+
+@contextmanager
+def progress_cache_scope(run_id: str | None, *, spill: bool = False) -> Iterator[ProgressCache | None]:
+    """
+    Use the progress cache of a credential generation run within the block.
+
+    The cache is also available in the threads started with ``run_concurrently`` within the block.
+
+    :param run_id: The ID of the credential generation run. If it is None, the cache is not used.
+    :param spill: Whether the streamed progress that does not fit in the cache is written to temporary files, so it is
+        only retrieved once within the run.
+    :returns: A context manager yielding the cache of the run, or None.
+    """
+    if run_id is None:
+        yield None
+        return
+
+    with ProgressCache.use_run_cache(run_id, spill=spill) as run_cache, _activate(run_cache) as cache:
+        yield cache
+
+
+@contextmanager
+def request_progress_cache_scope() -> Iterator[ProgressCache]:
+    """
+    Use a new progress cache within the block, e.g., for the duration of an API request.
+
+    Unlike the cache of a run, the cache is not shared with other requests, so each request sees the current progress
+    of the learners. If a cache is already active, it is used instead.
+
+    :returns: A context manager yielding the active cache.
+    """
+    if (cache := get_active_progress_cache()) is not None:
+        yield cache
+        return
+
+    with _activate(ProgressCache.from_settings('request')) as cache:
+        yield cache
+
+
+@contextmanager
+def _activate(cache: ProgressCache) -> Iterator[ProgressCache]:
+    """
+    Make the cache active in the current context within the block.
+
+    :param cache: The cache to activate.
+    :returns: A context manager yielding the cache.
+    """
+    token = _current_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _current_cache.reset(token)
+
+
+def get_active_progress_cache() -> ProgressCache | None:
+    """
+    Get the progress cache of the current run.
+
+    :returns: The cache, or None if it is not used in the current context.
+    """
+    return _current_cache.get()
+
+
+def get_cached_progress(key: Hashable, compute: Callable[[], T]) -> T:
+    """
+    Get the progress data with the given key from the cache of the current run.
+
+    :param key: The key of the data, e.g., ``(course_key, 'grades', user_id)``.
+    :param compute: The function computing the data.
+    :returns: The cached data, or the result of `compute` if there is no active cache.
+    """
+    cache = get_active_progress_cache()
+    if cache is None:
+        return compute()
+    return cache.get_or_compute(key, compute)
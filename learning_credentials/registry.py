@@ -0,0 +1,245 @@
+"""
+Registry of the functions used by credential types.
+
+Credential types refer to their retrieval and generation functions by dotted paths. The registry resolves each path once
+per process, so the functions are not imported again every time a credential is generated.
+
+Functions are discovered from two sources:
+
+1. The built-in ``learning_credentials.processors.retrieve_*`` and ``learning_credentials.generators.generate_*``
+   functions.
+2. The ``learning_credentials.processors`` and ``learning_credentials.generators`` entry point groups, which allow
+   other packages to provide their own functions. For example::
+
+     [project.entry-points."learning_credentials.processors"]
+     retrieve_fast_grades = "my_package.processors:retrieve_fast_grades"
+
+The metadata of the discovered functions is read from their source code, so listing them does not import their modules
+(and the heavy dependencies of these modules). A module is only imported when one of its functions is resolved to be
+executed. The "Options:" section of the docstring of a function documents its options, and the capabilities of the
+functions are declared in the ``CREDENTIAL_FUNCTIONS`` manifest of their module. The manifest must be a literal dict
+assigned at the top level of the module, so it can be read without importing it::
+
+    CREDENTIAL_FUNCTIONS = {
+        'retrieve_fast_grades': {'name': 'Fast grades', 'streaming': True, 'batch': True},
+    }
+"""
+
+from __future__ import annotations
+
+import ast
+import logging
+import threading
+from functools import cache
+from importlib import import_module
+from importlib.metadata import entry_points
+from importlib.util import find_spec
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+log = logging.getLogger(__name__)
+
+PROCESSORS_GROUP = 'learning_credentials.processors'
+GENERATORS_GROUP = 'learning_credentials.generators'
+
+# The name of the module-level manifest that declares the capabilities of the functions of a module.
+MANIFEST_NAME = 'CREDENTIAL_FUNCTIONS'
+
+# The built-in modules and the prefixes of the functions they provide for each group.
+_BUILT_IN_FUNCTIONS = {
+    PROCESSORS_GROUP: ('learning_credentials.processors', 'retrieve_'),
+    GENERATORS_GROUP: ('learning_credentials.generators', 'generate_'),
+}
+
+_functions: dict[str, Callable] = {}
+_functions_lock = threading.Lock()
+
+
+class FunctionMetadata(NamedTuple):
+    """
+    Metadata of a retrieval or generation function, read without importing its module.
+
+    - path: The path of the function, in the ``module.function_name`` format.
+    - name: The display name of the function, or the name of the function if the manifest does not declare it.
+    - options: The "Options:" section of the docstring of the function, or an empty string if it is not documented.
+    - supports_streaming: Whether a streaming variant is registered for the function with ``streaming_variant``.
+    - supports_batch: Whether the function only retrieves the progress of the users given to ``restrict_to_users``,
+      so the progress of a group of users is retrieved with a single call.
+    """
+
+    path: str
+    name: str
+    options: str
+    supports_streaming: bool
+    supports_batch: bool
+
+
+def resolve_function(func_path: str) -> Callable:
+    """
+    Get the function with the given dotted path.
+
+    :param func_path: The path of the function, in the ``module.function_name`` format.
+    :returns: The function.
+    :raises ValueError: If the path is not in the ``module.function_name`` format.
+    :raises ImportError: If the module cannot be imported.
+    :raises AttributeError: If the module does not contain an attribute with this name.
+    :raises TypeError: If the attribute is not callable.
+    """
+    if (func := _functions.get(func_path)) is not None:
+        return func
+
+    module_path, func_name = func_path.rsplit('.', 1)
+    func = getattr(import_module(module_path), func_name)
+    if not callable(func):
+        msg = f"{func_path} is not a function."
+        raise TypeError(msg)
+
+    with _functions_lock:
+        _functions[func_path] = func
+    return func
+
+
+def forget_functions(*func_paths: str):
+    """
+    Remove functions from the registry, so they are resolved again on the next use.
+
+    :param func_paths: The paths of the functions.
+    """
+    with _functions_lock:
+        for func_path in func_paths:
+            _functions.pop(func_path, None)
+
+
+@cache
+def _parse_module(module_path: str) -> ast.Module | None:
+    """
+    Parse the source code of a module without importing it.
+
+    :param module_path: The name of the module.
+    :returns: The syntax tree of the module, or None if its source code is not available.
+    """
+    try:
+        spec = find_spec(module_path)
+    except (ImportError, ValueError):
+        return None
+    if spec is None or not spec.origin or not spec.origin.endswith('.py'):
+        return None
+    return ast.parse(Path(spec.origin).read_text(encoding='utf-8'))
+
+
+def _get_function_node(module: ast.Module, func_name: str) -> ast.FunctionDef | None:
+    """Get the definition of a top-level function from the syntax tree of a module."""
+    for node in module.body:
+        if isinstance(node, ast.FunctionDef) and node.name == func_name:
+            return node
+    return None
+
+
+def _read_manifest(module: ast.Module, module_path: str) -> dict[str, Any]:
+    """
+    Read the ``CREDENTIAL_FUNCTIONS`` manifest from the syntax tree of a module.
+
+    :param module: The syntax tree of the module.
+    :param module_path: The name of the module.
+    :returns: The manifest, or an empty dict if the module does not declare it as a literal dict.
+    """
+    for node in module.body:
+        if isinstance(node, ast.Assign):
+            targets = node.targets
+        elif isinstance(node, ast.AnnAssign) and node.value is not None:
+            targets = [node.target]
+        else:
+            continue
+        if any(isinstance(target, ast.Name) and target.id == MANIFEST_NAME for target in targets):
+            try:
+                manifest = ast.literal_eval(node.value)
+            except ValueError:
+                manifest = None
+            if isinstance(manifest, dict):
+                return manifest
+            log.warning('The %s manifest of %s is not a literal dict.', MANIFEST_NAME, module_path)
+    return {}
+
+
+def _build_metadata(func_path: str, options: str, manifest: Mapping[str, Any]) -> FunctionMetadata:
+    """
+    Build the metadata of a function from its options documentation and the manifest of its module.
+
+    :param func_path: The path of the function, in the ``module.function_name`` format.
+    :param options: The "Options:" section of the docstring of the function.
+    :param manifest: The manifest of the module of the function.
+    :returns: The metadata of the function.
+    """
+    func_name = func_path.rpartition('.')[2]
+    declaration = manifest.get(func_name)
+    if not isinstance(declaration, dict):
+        declaration = {}
+    return FunctionMetadata(
+        path=func_path,
+        name=str(declaration.get('name') or func_name),
+        options=options,
+        supports_streaming=bool(declaration.get('streaming', False)),
+        supports_batch=bool(declaration.get('batch', False)),
+    )
+
+
+def _get_options_section(docstring: str | None) -> str:
+    """Get the "Options:" section of a docstring."""
+    _description, separator, options = (docstring or '').partition('Options:')
+    return options if separator else ''
+
+
+@cache
+def get_function_metadata(func_path: str) -> FunctionMetadata:
+    """
+    Get the metadata of a function.
+
+    The metadata is read from the source code of the function and the manifest of its module. If the source code is
+    not available, the module is imported instead.
+
+    :param func_path: The path of the function, in the ``module.function_name`` format.
+    :returns: The metadata of the function.
+    """
+    module_path, _separator, func_name = func_path.rpartition('.')
+    module = _parse_module(module_path) if module_path else None
+    if module is not None and (node := _get_function_node(module, func_name)) is not None:
+        return _build_metadata(
+            func_path, _get_options_section(ast.get_docstring(node)), _read_manifest(module, module_path)
+        )
+
+    try:
+        func = resolve_function(func_path)
+    except (ValueError, ImportError, AttributeError, TypeError):
+        return _build_metadata(func_path, '', {})
+    manifest = getattr(import_module(module_path), MANIFEST_NAME, None)
+    return _build_metadata(
+        func_path, _get_options_section(func.__doc__), manifest if isinstance(manifest, dict) else {}
+    )
+
+
+@cache
+def get_available_functions(group: str) -> tuple[FunctionMetadata, ...]:
+    """
+    Get the metadata of all functions available in a group.
+
+    The built-in functions are listed first, followed by the functions provided by the entry points of the group.
+    The result is cached, so the sources are only scanned once per process.
+
+    :param group: The group of the functions (``PROCESSORS_GROUP`` or ``GENERATORS_GROUP``).
+    :returns: The metadata of the functions.
+    """
+    func_paths = []
+    if group in _BUILT_IN_FUNCTIONS:
+        module_path, prefix = _BUILT_IN_FUNCTIONS[group]
+        if (module := _parse_module(module_path)) is not None:
+            func_paths += [
+                f'{module_path}.{node.name}'
+                for node in module.body
+                if isinstance(node, ast.FunctionDef) and node.name.startswith(prefix)
+            ]
+
+    func_paths += [entry_point.value.replace(':', '.') for entry_point in entry_points(group=group)]
+    return tuple(get_function_metadata(func_path) for func_path in dict.fromkeys(func_paths))
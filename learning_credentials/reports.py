@@ -0,0 +1,102 @@
+"""
+Progress reports of the learners of a learning context.
+
+The retrieval function of each credential configuration is called once for the whole learning context, and its
+streaming results are serialized and written as they are retrieved. The reports can be streamed to the client (see
+``CredentialProgressReportView``) or written to a file (see the ``credential_progress_report`` management command).
+
+The grades and completions of a course are streamed in chunks, so only one chunk of the progress is held in memory.
+This does not apply to learning paths and to ``retrieve_completions_and_grades``, whose results are collected for all
+learners before they are yielded, because the eligibility of each learner depends on all of them.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+from itertools import islice
+from typing import TYPE_CHECKING, Any
+
+from django.contrib.auth import get_user_model
+from django.core.serializers.json import DjangoJSONEncoder
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from learning_credentials.models import CredentialConfiguration
+
+# The content types of the supported report formats.
+REPORT_CONTENT_TYPES = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+}
+
+CSV_COLUMNS = ('credential_type_id', 'credential_type', 'user_id', 'username', 'is_eligible', 'progress')
+
+# The number of retrieved learners whose usernames are fetched with a single query.
+_USERNAME_BATCH_SIZE = 500
+
+
+class _EchoBuffer:
+    """A file-like object that returns the written value instead of storing it, so `csv.writer` rows can be streamed."""
+
+    def write(self, value: str) -> str:
+        """Return the written value."""
+        return value
+
+
+def iter_progress_report_rows(configurations: Iterable[CredentialConfiguration]) -> Iterator[dict[str, Any]]:
+    """
+    Yield the progress of each learner towards the credential of each configuration.
+
+    :param configurations: The credential configurations of the learning context.
+    :returns: An iterator over the rows of the report. The `progress` of each row contains the details returned by the
+        retrieval function (e.g., the current and required grades), except for `is_eligible`.
+    """
+    for config in configurations:
+        results = config.iter_retrieval_results()
+        while batch := list(islice(results, _USERNAME_BATCH_SIZE)):
+            usernames = dict(
+                get_user_model().objects.filter(id__in=[user_id for user_id, _ in batch]).values_list('id', 'username')
+            )
+            for user_id, progress in batch:
+                details = dict(progress)
+                yield {
+                    'credential_type_id': config.credential_type_id,
+                    'credential_type': config.credential_type.name,
+                    'user_id': user_id,
+                    'username': usernames.get(user_id),
+                    'is_eligible': details.pop('is_eligible', False),
+                    'progress': details,
+                }
+
+
+def _iter_ndjson_lines(rows: Iterable[dict[str, Any]]) -> Iterator[str]:
+    """Serialize each row as a line of JSON."""
+    for row in rows:
+        yield json.dumps(row, cls=DjangoJSONEncoder) + '\n'
+
+
+def _iter_csv_lines(rows: Iterable[dict[str, Any]]) -> Iterator[str]:
+    """Serialize the rows as CSV lines, with the progress details encoded as JSON."""
+    writer = csv.writer(_EchoBuffer())
+    yield writer.writerow(CSV_COLUMNS)
+    for row in rows:
+        row['progress'] = json.dumps(row['progress'], cls=DjangoJSONEncoder)
+        yield writer.writerow([row[column] for column in CSV_COLUMNS])
+
+
+def iter_progress_report(configurations: Iterable[CredentialConfiguration], report_format: str) -> Iterator[str]:
+    """
+    Generate the progress report of the configurations of a learning context.
+
+    :param configurations: The credential configurations of the learning context.
+    :param report_format: The format of the report (see `REPORT_CONTENT_TYPES`).
+    :returns: An iterator over the lines of the report.
+    :raises ValueError: If the format is not supported.
+    """
+    serializers = {'ndjson': _iter_ndjson_lines, 'csv': _iter_csv_lines}
+    if report_format not in serializers:
+        msg = f'Unsupported report format: {report_format}.'
+        raise ValueError(msg)
+    return serializers[report_format](iter_progress_report_rows(configurations))
@@ -0,0 +1,36 @@
+"""Signal receivers for learning_credentials."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.db import transaction
+
+from learning_credentials.compat import invalidate_learning_context_name
+from learning_credentials.models import LearnerProgressSnapshot
+
+if TYPE_CHECKING:
+    from django.contrib.auth.models import User
+    from learning_paths.models import LearningPath
+    from opaque_keys.edx.keys import CourseKey
+
+
+def invalidate_course_name(sender, instance, **_kwargs):  # noqa: ANN001, ARG001
+    """Invalidate the cached course name when its course overview is updated (e.g., after the course is published)."""
+    invalidate_learning_context_name(instance.id)
+
+
+def invalidate_learning_path_name(sender, instance: LearningPath, **_kwargs):  # noqa: ANN001, ARG001
+    """Invalidate the cached Learning Path name when the Learning Path is saved."""
+    invalidate_learning_context_name(instance.key)
+
+
+def update_progress_snapshots(sender, user: User, course_key: CourseKey, **_kwargs):  # noqa: ANN001, ARG001
+    """Update the progress snapshots of the learner when their course grade changes."""
+    if not LearnerProgressSnapshot.is_enabled():
+        return
+
+    # The tasks are only imported when they are used, as they are not needed to load the app.
+    from learning_credentials.tasks import update_progress_snapshots_task  # noqa: PLC0415
+
+    transaction.on_commit(lambda: update_progress_snapshots_task.delay(user.id, str(course_key)))
@@ -3,41 +3,135 @@
 from __future__ import annotations
 
 import logging
+import time
+import uuid
+from itertools import islice
+
+from celery.signals import worker_process_init
+from django.conf import settings
+from django.db.models import Q
+from learning_paths.models import LearningPathStep
 
 from learning_credentials.compat import get_celery_app
-from learning_credentials.models import CredentialConfiguration
+from learning_credentials.models import (
+    ArchivedCredential,
+    Credential,
+    CredentialAsset,
+    CredentialConfiguration,
+    CredentialConfigurationStats,
+)
+from learning_credentials.progress_cache import (
+    get_scheduled_run_id,
+    progress_cache_scope,
+    request_progress_cache_scope,
+)
 
 app = get_celery_app()
 log = logging.getLogger(__name__)
 
 
 @app.task
-def generate_credential_for_user_task(config_id: int, user_id: int):
+def generate_credential_for_user_task(config_id: int, user_id: int, run_id: str | None = None):
     """
     Celery task for processing a single user's credential.
 
     :param config_id: The ID of the CredentialConfiguration object to process.
     :param user_id: The ID of the user to process the credential for.
+    :param run_id: Optional. The ID of the credential generation run. The tasks of the same run share the data that
+        is the same for all users (e.g., the name of the learning context).
+    """
+    config = CredentialConfiguration.objects.get(id=config_id)
+    with progress_cache_scope(run_id):
+        config.generate_credential_for_user(user_id, generate_credential_for_user_task.request.id)
+
+
+@app.task
+def generate_credentials_for_users_task(config_id: int, user_ids: list[int], run_id: str | None = None):
+    """
+    Celery task for processing the credentials of multiple users at once.
+
+    :param config_id: The ID of the CredentialConfiguration object to process.
+    :param user_ids: The IDs of the users to process the credentials for.
+    :param run_id: Optional. The ID of the credential generation run.
     """
     config = CredentialConfiguration.objects.get(id=config_id)
-    config.generate_credential_for_user(user_id, generate_credential_for_user_task.request.id)
+    with progress_cache_scope(run_id):
+        config.generate_credentials_for_users(user_ids, generate_credentials_for_users_task.request.id)
+
+
+def _generate_credentials_for_config(config: CredentialConfiguration, run_id: str | None):
+    """
+    Start the generation of credentials for the eligible users of a configuration.
+
+    Eligible users are consumed from the streaming retrieval results in batches, so the generation of credentials
+    starts while the rest of the learning context is still being processed. If the
+    ``LEARNING_CREDENTIALS_GENERATION_TASK_SIZE`` setting is greater than 1, each generation task processes that many
+    users at once, using bulk database writes.
+
+    :param config: The CredentialConfiguration object to process.
+    :param run_id: The ID of the credential generation run, if any.
+    """
+    batch_size = getattr(settings, 'LEARNING_CREDENTIALS_GENERATION_BATCH_SIZE', 500)
+    task_size = getattr(settings, 'LEARNING_CREDENTIALS_GENERATION_TASK_SIZE', 1)
+
+    eligible_user_ids = config.iter_eligible_user_ids()
+    while user_ids := list(islice(eligible_user_ids, batch_size)):
+        log.info("The following users are eligible in %s: %s", config.learning_context_key, user_ids)
+        filtered_user_ids = config.filter_out_user_ids_with_credentials(user_ids)
+        log.info("The filtered users eligible in %s: %s", config.learning_context_key, filtered_user_ids)
+
+        if task_size > 1:
+            for i in range(0, len(filtered_user_ids), task_size):
+                generate_credentials_for_users_task.delay(config.id, filtered_user_ids[i : i + task_size], run_id)
+            continue
+
+        for user_id in filtered_user_ids:
+            generate_credential_for_user_task.delay(config.id, user_id, run_id)
 
 
 @app.task
-def generate_credentials_for_config_task(config_id: int):
+def generate_credentials_for_config_task(config_id: int, run_id: str | None = None):
     """
     Celery task for processing a single context's credentials.
 
+    If the ``LEARNING_CREDENTIALS_GROUP_BY_CONTEXT`` setting is enabled, the periodic tasks of the configurations do
+    nothing, as the configurations are processed by ``generate_all_credentials_task`` instead.
+
     :param config_id: The ID of the CredentialConfiguration object to process.
+    :param run_id: Optional. The ID of the credential generation run. The tasks of the same run share the learner
+        progress data of the courses they process. The periodic tasks of the configurations do not provide it, so they
+        use the scheduled run of the current progress cache TTL window.
     """
+    if run_id is None and getattr(settings, 'LEARNING_CREDENTIALS_GROUP_BY_CONTEXT', False):
+        log.info("Skipping the periodic task of configuration %s, as configurations are grouped by context.", config_id)
+        return
+
     config = CredentialConfiguration.objects.get(id=config_id)
-    user_ids = config.get_eligible_user_ids()
-    log.info("The following users are eligible in %s: %s", config.learning_context_key, user_ids)
-    filtered_user_ids = config.filter_out_user_ids_with_credentials(user_ids)
-    log.info("The filtered users eligible in %s: %s", config.learning_context_key, filtered_user_ids)
 
-    for user_id in filtered_user_ids:
-        generate_credential_for_user_task.delay(config_id, user_id)
+    run_id = run_id or get_scheduled_run_id()
+    with progress_cache_scope(run_id):
+        _generate_credentials_for_config(config, run_id)
+
+
+@app.task
+def generate_credentials_for_context_task(learning_context_key: str, run_id: str | None = None):
+    """
+    Celery task for processing the credentials of all enabled configurations of a single learning context.
+
+    The configurations are processed one after another within the same run, so the enrollments and the learner progress
+    of the learning context are retrieved once and shared by all of them. The progress of learning contexts with more
+    learners than the progress cache can hold is written to temporary files during the retrieval, and the next
+    configurations read it from them.
+
+    :param learning_context_key: The key of the learning context to process.
+    :param run_id: Optional. The ID of the credential generation run. A new run is started if it is not provided.
+    """
+    configs = CredentialConfiguration.get_enabled_configurations().filter(learning_context_key=learning_context_key)
+
+    run_id = run_id or uuid.uuid4().hex
+    with progress_cache_scope(run_id, spill=True):
+        for config in configs.select_related('credential_type'):
+            _generate_credentials_for_config(config, run_id)
 
 
 @app.task
@@ -46,8 +140,131 @@ def generate_all_credentials_task():
     Celery task for initiating the processing of credentials for all enabled contexts.
 
     This function fetches all enabled CredentialConfiguration objects,
-    and initiates a separate Celery task for each of them.
+    and initiates a separate Celery task for each of them. All tasks share the ID of this run.
+
+    If the ``LEARNING_CREDENTIALS_GROUP_BY_CONTEXT`` setting is enabled, a single task is initiated for each learning
+    context instead, and it processes all enabled configurations of that context. In this mode, this task is scheduled
+    by the ``Generate credentials grouped by learning context`` periodic task, which is disabled by default.
     """
-    config_ids = CredentialConfiguration.get_enabled_configurations().values_list('id', flat=True)
+    run_id = uuid.uuid4().hex
+    configs = CredentialConfiguration.get_enabled_configurations()
+
+    if getattr(settings, 'LEARNING_CREDENTIALS_GROUP_BY_CONTEXT', False):
+        learning_context_keys = configs.values_list('learning_context_key', flat=True).distinct()
+        for learning_context_key in learning_context_keys:
+            generate_credentials_for_context_task.delay(str(learning_context_key), run_id)
+        return
+
+    config_ids = configs.values_list('id', flat=True)
     for config_id in config_ids:
-        generate_credentials_for_config_task.delay(config_id)
+        generate_credentials_for_config_task.delay(config_id, run_id)
+
+
+@app.task
+def delete_old_asset_versions_task(asset_id: int | None = None):
+    """
+    Celery task for deleting the previous versions of the asset files once their grace period has passed.
+
+    It runs periodically (see the ``Delete old credential asset versions`` periodic task) and sweeps all assets.
+
+    :param asset_id: Optional. The ID of the CredentialAsset object whose previous versions are deleted. This is kept
+        for the tasks scheduled by the previous versions of this plugin.
+    """
+    if asset_id is None:
+        CredentialAsset.delete_expired_versions()
+    elif asset := CredentialAsset.objects.filter(id=asset_id).first():
+        asset.delete_old_versions()
+
+
+@app.task
+def archive_invalidated_credentials_task(config_id: int | None = None):
+    """
+    Celery task for moving the invalidated credentials to the archive.
+
+    It runs once a day as a periodic task, independently of the credential generation tasks. The credentials are moved
+    in batches of ``LEARNING_CREDENTIALS_ARCHIVE_BATCH_SIZE``. Setting it to 0 disables the archiving.
+
+    :param config_id: Optional. The ID of the CredentialConfiguration object whose credentials are archived. The
+        credentials of all configurations are archived if it is not provided.
+    """
+    if not (batch_size := getattr(settings, 'LEARNING_CREDENTIALS_ARCHIVE_BATCH_SIZE', 1000)):
+        return
+
+    credentials = Credential.objects.all()
+    if config_id is not None:
+        credentials = credentials.filter(configuration_id=config_id)
+
+    if archived_count := ArchivedCredential.archive(credentials, batch_size):
+        log.info("Archived %d invalidated credentials of configuration %s.", archived_count, config_id or "(all)")
+
+
+@app.task
+def reconcile_credential_stats_task(config_id: int | None = None):
+    """
+    Celery task for recalculating the credential counters of configurations.
+
+    It runs once a day as a periodic task, independently of the credential generation tasks, to fix any drift of the
+    counters.
+
+    :param config_id: Optional. The ID of the CredentialConfiguration object whose counters are recalculated. The
+        counters of all configurations are recalculated if it is not provided.
+    """
+    configs = CredentialConfiguration.objects.all()
+    if config_id is not None:
+        configs = configs.filter(id=config_id)
+
+    for reconciled_config_id in configs.values_list('id', flat=True):
+        CredentialConfigurationStats.reconcile(reconciled_config_id)
+
+
+@app.task
+def update_progress_snapshots_task(user_id: int, course_key: str):
+    """
+    Celery task for updating the progress snapshots of a learner after their progress in a course changed.
+
+    The progress is retrieved again for the configurations of the course and of the learning paths that include it.
+
+    :param user_id: The ID of the learner.
+    :param course_key: The key of the course.
+    """
+    learning_path_keys = LearningPathStep.objects.filter(course_key=course_key).values_list(
+        'learning_path__key', flat=True
+    )
+    configs = CredentialConfiguration.objects.filter(
+        Q(learning_context_key=course_key) | Q(learning_context_key__in=list(learning_path_keys))
+    )
+
+    # The configurations of the course and its learning paths share the progress of the learner in the course.
+    with request_progress_cache_scope():
+        for config in configs.select_related('credential_type'):
+            config.get_user_eligibility_details(user_id)
+
+
+@worker_process_init.connect
+def warm_up_worker(**_kwargs):
+    """
+    Preload the assets of the enabled credential configurations when a new worker process starts.
+
+    This way, the first credential rendered by the process does not need to download the PDF templates and register
+    the fonts. The warm-up is enabled with the ``LEARNING_CREDENTIALS_WORKER_WARMUP`` setting, and the total size of
+    the preloaded assets is limited by ``LEARNING_CREDENTIALS_WORKER_WARMUP_MAX_BYTES``.
+    """
+    if not getattr(settings, 'LEARNING_CREDENTIALS_WORKER_WARMUP', False):
+        return
+
+    from learning_credentials.generators import generate_pdf_credential, preload_assets  # noqa: PLC0415
+
+    start = time.monotonic()
+    configs = CredentialConfiguration.get_enabled_configurations().filter(
+        credential_type__generation_func=f'{generate_pdf_credential.__module__}.{generate_pdf_credential.__name__}',
+    )
+    try:
+        loaded_bytes = preload_assets(
+            (config.get_custom_options() for config in configs.select_related('credential_type')),
+            max_bytes=getattr(settings, 'LEARNING_CREDENTIALS_WORKER_WARMUP_MAX_BYTES', 64 * 1024 * 1024),
+        )
+    except Exception:
+        log.exception("Failed to warm up the worker process.")
+        return
+
+    log.info("Worker warm-up preloaded %d bytes of assets in %.3f seconds.", loaded_bytes, time.monotonic() - start)
@@ -0,0 +1,24 @@
+"""
+A stand-in for the student models of Open edX.
+
+The ``course_enrollment_model`` fixture installs this module as ``common.djangoapps.student.models``, so the functions
+of ``learning_credentials.compat`` run their queries against a real table.
+"""
+
+from django.contrib.auth.models import User
+from django.db import models
+
+
+class CourseEnrollment(models.Model):
+    """The fields of the Open edX course enrollment used by this plugin."""
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    course_id = models.CharField(max_length=255)
+    is_active = models.BooleanField(default=True)
+
+    class Meta:  # noqa: D106
+        app_label = 'student'
+
+    def __str__(self) -> str:
+        """Get the string representation of the enrollment."""
+        return f'{self.user_id} in {self.course_id}'
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import sys
+from types import ModuleType
 from typing import TYPE_CHECKING
 from unittest.mock import patch
 
 import pytest
+from django.core.cache import cache
+from django.db import connection
 from django.test import override_settings
 from learning_paths.keys import LearningPathKey
 from learning_paths.models import LearningPath, LearningPathEnrollment
@@ -15,12 +19,26 @@ from learning_credentials.models import Credential, CredentialConfiguration, Cre
 from test_utils.factories import UserFactory
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from pathlib import Path
 
     from django.contrib.auth.models import User
+    from django.db.models import Model
     from opaque_keys.edx.keys import LearningContextKey
 
 
+# =============================================================================
+# Cache fixtures
+# =============================================================================
+
+
+@pytest.fixture(autouse=True)
+def _clear_django_cache() -> Iterator[None]:
+    """Clear the Django cache after each test, so cached values (e.g., access decisions) do not leak between tests."""
+    yield
+    cache.clear()
+
+
 # =============================================================================
 # User fixtures
 # =============================================================================
@@ -44,6 +62,26 @@ def users() -> list[User]:
     return UserFactory.create_batch(6)
 
 
+@pytest.fixture
+def course_enrollment_model(monkeypatch: pytest.MonkeyPatch) -> type[Model]:
+    """
+    Provide a stand-in for the course enrollment model of Open edX, backed by a table of the test database.
+
+    The table is created within the transaction of the test, so it is removed when the test finishes.
+    """
+    from test_utils import student_models  # noqa: PLC0415
+
+    for name in ('common', 'common.djangoapps', 'common.djangoapps.student'):
+        monkeypatch.setitem(sys.modules, name, ModuleType(name))
+    monkeypatch.setitem(sys.modules, 'common.djangoapps.student.models', student_models)
+
+    model = student_models.CourseEnrollment
+    sql, params = connection.schema_editor().table_sql(model)
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+    return model
+
+
 # =============================================================================
 # Learning context fixtures
 # =============================================================================
@@ -12,6 +12,7 @@ from django.core.exceptions import ValidationError
 from django.test import RequestFactory
 
 from learning_credentials.admin import (
+    ArchivedCredentialAdmin,
     CredentialAdmin,
     CredentialAssetAdmin,
     CredentialConfigurationAdmin,
@@ -21,11 +22,14 @@ from learning_credentials.admin import (
     DocstringOptionsMixin,
 )
 from learning_credentials.models import (
+    ArchivedCredential,
     Credential,
     CredentialAsset,
     CredentialConfiguration,
+    CredentialConfigurationStats,
     CredentialType,
 )
+from learning_credentials.registry import PROCESSORS_GROUP, FunctionMetadata
 
 if TYPE_CHECKING:
     from django.contrib.auth.models import User
@@ -78,41 +82,28 @@ class TestDocstringOptionsMixin:
 
     def test_get_docstring_custom_options(self):
         """Test extraction of Options section from docstring."""
+        result = DocstringOptionsMixin._get_docstring_custom_options(
+            'learning_credentials.processors.retrieve_subsection_grades'
+        )
 
-        def mock_func():
-            """
-            Some description.
-
-            Options:
-                - option1: Description 1
-                - option2: Description 2
-            """
-
-        with patch('learning_credentials.admin.importlib.import_module') as mock_import:
-            mock_module = Mock()
-            mock_module.mock_func = mock_func
-            mock_import.return_value = mock_module
-
-            result = DocstringOptionsMixin._get_docstring_custom_options('some_module.mock_func')
-
-            assert 'Custom options:' in result
-            assert 'option1' in result
-            assert '<pre>' in result
+        assert 'Custom options:' in result
+        assert 'required_grades' in result
+        assert '<pre>' in result
 
     def test_get_docstring_custom_options_without_options(self):
         """Test fallback message when Options section is not found."""
-
-        def mock_func():
-            """Some description without options."""
-
-        with patch('learning_credentials.admin.importlib.import_module') as mock_import:
-            mock_module = Mock()
-            mock_module.mock_func = mock_func
-            mock_import.return_value = mock_module
-
+        metadata = FunctionMetadata(
+            path='some_module.mock_func',
+            name='mock_func',
+            options='',
+            supports_streaming=False,
+            supports_batch=False,
+        )
+        with patch('learning_credentials.admin.get_function_metadata', return_value=metadata) as mock_metadata:
             result = DocstringOptionsMixin._get_docstring_custom_options('some_module.mock_func')
 
-            assert 'Custom options are not documented' in result
+        mock_metadata.assert_called_once_with('some_module.mock_func')
+        assert 'Custom options are not documented' in result
 
 
 @pytest.mark.django_db
@@ -130,6 +121,10 @@ class TestCredentialTypeAdminForm:
         assert len(generation_choices) > 0
         assert any('retrieve_' in choice[0] for choice in retrieval_choices)
         assert any('generate_' in choice[0] for choice in generation_choices)
+        assert (
+            'learning_credentials.processors.retrieve_completions',
+            'Completions (learning_credentials.processors.retrieve_completions)',
+        ) in retrieval_choices
 
     def test_form_with_existing_instance_shows_help_text(self, grade_credential_type: CredentialType):
         """Test that form shows help text for existing instance functions."""
@@ -140,7 +135,7 @@ class TestCredentialTypeAdminForm:
 
     def test_available_functions_returns_prefixed_functions(self):
         """Test that _available_functions returns only functions with specified prefix."""
-        functions = list(CredentialTypeAdminForm._available_functions('learning_credentials.processors', 'retrieve_'))
+        functions = list(CredentialTypeAdminForm._available_functions(PROCESSORS_GROUP))
 
         assert len(functions) > 0
         for func_path, _ in functions:
@@ -303,6 +298,29 @@ class TestCredentialConfigurationAdmin:
 
         assert result == grade_config.periodic_task.interval
 
+    def test_credential_counts(
+        self, admin_credential_config: CredentialConfigurationAdmin, grade_config: CredentialConfiguration
+    ):
+        """Test that the credential counts are read from the stats of the configuration."""
+        issued, failed, invalidated = 3, 2, 1
+        CredentialConfigurationStats.objects.filter(configuration=grade_config).update(
+            available_count=issued, error_count=failed, invalidated_count=invalidated
+        )
+        grade_config.refresh_from_db()
+
+        assert admin_credential_config.issued_credentials(grade_config) == issued
+        assert admin_credential_config.failed_credentials(grade_config) == failed
+        assert admin_credential_config.invalidated_credentials(grade_config) == invalidated
+
+    def test_credential_counts_without_stats(
+        self, admin_credential_config: CredentialConfigurationAdmin, grade_config: CredentialConfiguration
+    ):
+        """Test that the credential counts are 0 if the stats of the configuration do not exist yet."""
+        CredentialConfigurationStats.objects.filter(configuration=grade_config).delete()
+        grade_config.refresh_from_db()
+
+        assert admin_credential_config.issued_credentials(grade_config) == 0
+
     def test_get_readonly_fields_for_new_object(
         self, admin_credential_config: CredentialConfigurationAdmin, request_factory: RequestFactory, staff_user: User
     ):
@@ -331,7 +349,7 @@ class TestCredentialConfigurationAdmin:
         assert 'learning_context_key' in readonly
         assert 'credential_type' in readonly
 
-    @patch('learning_credentials.admin.generate_credentials_for_config_task')
+    @patch('learning_credentials.tasks.generate_credentials_for_config_task')
     def test_generate_credentials_action(
         self,
         mock_task: Mock,
@@ -340,13 +358,18 @@ class TestCredentialConfigurationAdmin:
         staff_user: User,
         grade_config: CredentialConfiguration,
     ):
-        """Test that generate_credentials action triggers the task."""
+        """Test that generate_credentials action triggers the task in a new run."""
         request = request_factory.post('/admin/')
         request.user = staff_user
 
+        admin_credential_config.generate_credentials(request, grade_config)
         admin_credential_config.generate_credentials(request, grade_config)
 
-        mock_task.delay.assert_called_once_with(grade_config.id)
+        (first_config_id, first_run_id), (second_config_id, second_run_id) = (
+            call.args for call in mock_task.delay.call_args_list
+        )
+        assert first_config_id == second_config_id == grade_config.id
+        assert first_run_id != second_run_id
 
 
 @pytest.mark.django_db
@@ -441,3 +464,15 @@ class TestCredentialAssetAdmin:
     def test_prepopulated_fields(self, admin_credential_asset: CredentialAssetAdmin):
         """Test that asset_slug is prepopulated from description."""
         assert admin_credential_asset.prepopulated_fields == {"asset_slug": ("description",)}
+
+
+class TestArchivedCredentialAdmin:
+    """Tests for ArchivedCredentialAdmin."""
+
+    def test_read_only(self, admin_site: AdminSite):
+        """Test that archived credentials cannot be added, changed, or deleted."""
+        admin_archived_credential = ArchivedCredentialAdmin(ArchivedCredential, admin_site)
+
+        assert not admin_archived_credential.has_add_permission(Mock())
+        assert not admin_archived_credential.has_change_permission(Mock())
+        assert not admin_archived_credential.has_delete_permission(Mock())
@@ -0,0 +1,208 @@
+"""Tests for the local disk cache of credential assets."""
+
+from __future__ import annotations
+
+import io
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+from unittest.mock import Mock, patch
+
+import pytest
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.db.models.fields.files import FieldFile
+from django.test import override_settings
+
+from learning_credentials.asset_cache import (
+    AssetReader,
+    _evict,
+    _get_cache_path,
+    _write_atomically,
+    get_asset_path,
+    load_asset,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+TEMPLATE_DATA = b'%PDF-template'
+
+
+class CountingStorage(FileSystemStorage):
+    """A local stand-in for a remote storage, which counts the fetched files."""
+
+    def __init__(self, *args, **kwargs):  # noqa: D107
+        super().__init__(*args, **kwargs)
+        self.fetches = 0
+
+    def _open(self, name: str, mode: str = 'rb') -> object:
+        self.fetches += 1
+        return super()._open(name, mode)
+
+
+@pytest.fixture
+def storage(tmp_path: Path) -> CountingStorage:
+    """Create a storage with a template asset."""
+    storage = CountingStorage(location=tmp_path / 'storage')
+    storage.save('template.pdf', ContentFile(TEMPLATE_DATA))
+    storage.save('empty.ttf', ContentFile(b''))
+    return storage
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path) -> Iterator[Path]:
+    """Enable the asset cache in a temporary directory."""
+    cache_dir = tmp_path / 'cache'
+    with override_settings(LEARNING_CREDENTIALS_ASSET_CACHE_DIR=str(cache_dir)):
+        yield cache_dir
+
+
+def _get_asset_file(storage: CountingStorage, name: str = 'template.pdf') -> FieldFile:
+    """Get the file of an asset stored in the given storage."""
+    return FieldFile(None, Mock(storage=storage), name)
+
+
+def _clear_dir(directory: Path):
+    """Remove all files from a directory."""
+    for path in directory.iterdir():
+        path.unlink()
+
+
+def test_load_asset_without_cache(storage: CountingStorage):
+    """Test that the asset is fetched every time if the cache is disabled."""
+    assert load_asset(_get_asset_file(storage), 'v1') == TEMPLATE_DATA
+    assert load_asset(_get_asset_file(storage), 'v1') == TEMPLATE_DATA
+    assert storage.fetches == 2
+
+
+@pytest.mark.usefixtures('cache_dir')
+def test_load_asset_with_cache(storage: CountingStorage):
+    """Test that each version of an asset is fetched once, and then read from the local copy with mmap."""
+    content = load_asset(_get_asset_file(storage), 'v1')
+    assert isinstance(content, mmap.mmap)
+    assert content[:] == TEMPLATE_DATA
+
+    assert load_asset(_get_asset_file(storage), 'v1')[:] == TEMPLATE_DATA
+    assert storage.fetches == 1
+
+    assert load_asset(_get_asset_file(storage), 'v2')[:] == TEMPLATE_DATA
+    assert storage.fetches == 2
+
+
+@pytest.mark.usefixtures('cache_dir')
+def test_load_empty_asset(storage: CountingStorage):
+    """Test that empty files are cached, although they cannot be mapped into memory."""
+    assert not load_asset(_get_asset_file(storage, 'empty.ttf'), 'v1')
+    assert not load_asset(_get_asset_file(storage, 'empty.ttf'), 'v1')
+    assert storage.fetches == 1
+
+
+@override_settings(LEARNING_CREDENTIALS_ASSET_CACHE_MAX_BYTES=len(TEMPLATE_DATA) - 1)
+def test_load_asset_larger_than_cache(storage: CountingStorage, cache_dir: Path):
+    """Test that assets larger than the cache are not stored."""
+    assert load_asset(_get_asset_file(storage), 'v1') == TEMPLATE_DATA
+    assert not cache_dir.exists()
+
+
+def test_load_asset_evicted_by_another_process(storage: CountingStorage, cache_dir: Path):
+    """Test that the fetched content is returned if the cached file is removed right after it is written."""
+    with patch('learning_credentials.asset_cache._evict', side_effect=lambda *_args: _clear_dir(cache_dir)):
+        assert load_asset(_get_asset_file(storage), 'v1') == TEMPLATE_DATA
+
+
+def test_load_asset_concurrently(storage: CountingStorage, cache_dir: Path):
+    """Test that concurrent misses of the same asset do not leave partially written or temporary files."""
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        contents = list(executor.map(lambda _: load_asset(_get_asset_file(storage), 'v1'), range(8)))
+
+    assert all(content[:] == TEMPLATE_DATA for content in contents)
+    assert [path.read_bytes() for path in cache_dir.iterdir()] == [TEMPLATE_DATA]
+
+
+def test_get_asset_path_without_cache(storage: CountingStorage):
+    """Test that no path is returned if the cache is disabled."""
+    assert get_asset_path(_get_asset_file(storage), 'v1') is None
+    assert storage.fetches == 0
+
+
+def test_get_asset_path_with_cache(storage: CountingStorage, cache_dir: Path):
+    """Test that the asset is fetched once and then read from its cached file."""
+    path = get_asset_path(_get_asset_file(storage), 'v1')
+    assert path == _get_cache_path(cache_dir, 'v1')
+    assert path.read_bytes() == TEMPLATE_DATA
+
+    assert get_asset_path(_get_asset_file(storage), 'v1') == path
+    assert load_asset(_get_asset_file(storage), 'v1')[:] == TEMPLATE_DATA
+    assert storage.fetches == 1
+
+
+@override_settings(LEARNING_CREDENTIALS_ASSET_CACHE_MAX_BYTES=len(TEMPLATE_DATA) - 1)
+def test_get_asset_path_larger_than_cache(storage: CountingStorage, cache_dir: Path):
+    """Test that no path is returned for assets larger than the cache."""
+    assert get_asset_path(_get_asset_file(storage), 'v1') is None
+    assert not cache_dir.exists()
+
+
+def test_asset_reader(storage: CountingStorage, cache_dir: Path):  # noqa: ARG001
+    """Test that the reader is a seekable stream over the content that keeps its own position."""
+    content = load_asset(_get_asset_file(storage), 'v1')
+    assert isinstance(content, mmap.mmap)
+    reader = AssetReader(content)
+    other_reader = AssetReader(content)
+
+    assert reader.readable()
+    assert reader.seekable()
+    assert reader.read(4) == TEMPLATE_DATA[:4]
+    assert reader.tell() == 4
+    assert reader.seek(1, io.SEEK_CUR) == 5
+    assert reader.read() == TEMPLATE_DATA[5:]
+    assert not reader.read(1)
+    assert reader.seek(-8, io.SEEK_END) == len(TEMPLATE_DATA) - 8
+    assert reader.read(4) == TEMPLATE_DATA[-8:-4]
+    assert reader.seek(0) == 0
+    assert other_reader.read() == TEMPLATE_DATA
+    assert reader.read() == TEMPLATE_DATA
+
+    with pytest.raises(ValueError, match='Negative seek position'):
+        reader.seek(-1)
+
+
+def test_evict_least_recently_used(cache_dir: Path):
+    """Test that the least recently used files are removed until the cache fits within the limit."""
+    for index, name in enumerate(('oldest', 'old', 'recent')):
+        _write_atomically(cache_dir / name, b'x' * 10)
+        os.utime(cache_dir / name, (index, index))
+    (cache_dir / 'partial.tmp').write_bytes(b'x' * 100)
+
+    _evict(cache_dir, max_bytes=15)
+
+    assert sorted(path.name for path in cache_dir.iterdir()) == ['partial.tmp', 'recent']
+
+
+def test_evict_file_removed_by_another_process(cache_dir: Path):
+    """Test that files removed by another process during the eviction are skipped."""
+    _write_atomically(cache_dir / 'file', b'x' * 10)
+
+    entry = Mock(
+        is_file=Mock(return_value=True), stat=Mock(side_effect=FileNotFoundError), path=str(cache_dir / 'file')
+    )
+    entry.name = 'file'
+
+    with patch('learning_credentials.asset_cache.os.scandir', return_value=[entry]):
+        _evict(cache_dir, max_bytes=0)
+
+    assert (cache_dir / 'file').exists()
+
+
+def test_write_atomically_failure(cache_dir: Path):
+    """Test that the temporary file is removed if writing fails."""
+    with (
+        patch('learning_credentials.asset_cache.os.fdopen', side_effect=OSError('Disk is full.')),
+        pytest.raises(OSError, match=r'Disk is full\.'),
+    ):
+        _write_atomically(_get_cache_path(cache_dir, 'v1'), TEMPLATE_DATA)
+
+    assert list(cache_dir.iterdir()) == []
@@ -0,0 +1,53 @@
+"""Tests for the management commands."""
+
+from __future__ import annotations
+
+import json
+from io import StringIO
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+
+from learning_credentials.models import CredentialConfiguration
+from learning_credentials.reports import CSV_COLUMNS
+
+if TYPE_CHECKING:
+    from django.contrib.auth.models import User
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('retrieval_func', [None, 'nonexistent.module.func'])
+def test_credential_progress_report(user: User, grade_config: CredentialConfiguration, retrieval_func: str | None):
+    """Test that the progress report of a learning context is written to the standard output."""
+    stdout = StringIO()
+
+    with patch.object(
+        CredentialConfiguration, 'iter_retrieval_results', return_value=iter([(user.id, {'is_eligible': False})])
+    ):
+        call_command(
+            'credential_progress_report',
+            str(grade_config.learning_context_key),
+            retrieval_func=retrieval_func,
+            stdout=stdout,
+        )
+
+    lines = stdout.getvalue().splitlines()
+    if retrieval_func:
+        assert lines == []
+    else:
+        assert [json.loads(line)['username'] for line in lines] == [user.username]
+
+
+@pytest.mark.django_db
+def test_credential_progress_report_csv(grade_config: CredentialConfiguration):
+    """Test that the report can be written as CSV."""
+    stdout = StringIO()
+
+    with patch.object(CredentialConfiguration, 'iter_retrieval_results', return_value=iter([])):
+        call_command(
+            'credential_progress_report', str(grade_config.learning_context_key), output_format='csv', stdout=stdout
+        )
+
+    assert stdout.getvalue().splitlines() == [','.join(CSV_COLUMNS)]
@@ -0,0 +1,90 @@
+"""Tests for the compatibility layer."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import Mock, patch
+
+import pytest
+from django.core.cache import cache
+from django.test import override_settings
+from opaque_keys.edx.keys import CourseKey
+
+from learning_credentials.compat import (
+    get_learning_context_name,
+    get_learning_context_names,
+    invalidate_learning_context_name,
+)
+from learning_credentials.progress_cache import progress_cache_scope
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from learning_paths.models import LearningPath
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache() -> Iterator[None]:
+    """Clear the Django cache after each test."""
+    yield
+    cache.clear()
+
+
+def _get_course_names(course_ids: list[CourseKey]) -> dict[CourseKey, str]:
+    """Return the names of the courses, as they would be retrieved from Open edX."""
+    return {course_id: f'Course {course_id.run}' for course_id in course_ids}
+
+
+@pytest.mark.django_db
+@patch('learning_credentials.compat._get_course_names', side_effect=_get_course_names)
+def test_get_learning_context_names(mock_get_course_names: Mock, course_key: CourseKey, learning_path: LearningPath):
+    """Test that the names of courses and Learning Paths are retrieved in bulk."""
+    learning_path.display_name = 'Demo Path'
+    learning_path.save()
+    missing_learning_path_key = type(learning_path.key).from_string('path-v1:OpenedX+DemoX+Missing+Demo')
+
+    names = get_learning_context_names([course_key, learning_path.key, missing_learning_path_key, course_key])
+
+    assert names == {
+        course_key: 'Course DemoCourse',
+        learning_path.key: 'Demo Path',
+        missing_learning_path_key: str(missing_learning_path_key),
+    }
+    mock_get_course_names.assert_called_once_with([course_key])
+    assert get_learning_context_name(course_key) == 'Course DemoCourse'
+
+
+@pytest.mark.django_db
+@patch('learning_credentials.compat._get_course_names', side_effect=_get_course_names)
+def test_get_learning_context_names_within_run(mock_get_course_names: Mock, course_key: CourseKey):
+    """Test that the names are cached for the rest of the run."""
+    other_course_key = CourseKey.from_string('course-v1:OpenedX+DemoX+OtherCourse')
+
+    with progress_cache_scope('names-run'):
+        get_learning_context_name(course_key)
+        names = get_learning_context_names([course_key, other_course_key])
+
+    assert names == {course_key: 'Course DemoCourse', other_course_key: 'Course OtherCourse'}
+    assert mock_get_course_names.call_args_list[1].args == ([other_course_key],)
+
+    # The names are not cached outside the run, unless the Django cache is enabled.
+    get_learning_context_name(course_key)
+    assert mock_get_course_names.call_count == 3
+
+
+@pytest.mark.django_db
+@override_settings(LEARNING_CREDENTIALS_CONTEXT_NAME_CACHE_TIMEOUT=60)
+@patch('learning_credentials.compat._get_course_names', side_effect=_get_course_names)
+def test_get_learning_context_names_with_django_cache(mock_get_course_names: Mock, course_key: CourseKey):
+    """Test that the names are shared through the Django cache, and they can be invalidated."""
+    assert get_learning_context_name(course_key) == 'Course DemoCourse'
+    assert get_learning_context_name(course_key) == 'Course DemoCourse'
+    mock_get_course_names.assert_called_once()
+
+    with progress_cache_scope('invalidated-names-run'):
+        get_learning_context_name(course_key)
+        invalidate_learning_context_name(course_key)
+        mock_get_course_names.side_effect = lambda course_ids: dict.fromkeys(course_ids, 'Renamed Course')
+        assert get_learning_context_name(course_key) == 'Renamed Course'
+
+    assert mock_get_course_names.call_count == 2
@@ -0,0 +1,94 @@
+"""Tests for the concurrency helpers."""
+
+from __future__ import annotations
+
+import contextvars
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from learning_credentials.concurrency import run_concurrently
+
+request_id: contextvars.ContextVar[str] = contextvars.ContextVar('request_id', default='')
+
+
+def test_run_concurrently_sequential_fallback():
+    """Test that items are processed in order in the calling thread when concurrency is not needed."""
+    calling_thread = threading.get_ident()
+
+    def process(item: int) -> tuple[int, int]:
+        return item * 2, threading.get_ident()
+
+    assert list(run_concurrently(process, [1, 2, 3], max_workers=1)) == [
+        (1, (2, calling_thread)),
+        (2, (4, calling_thread)),
+        (3, (6, calling_thread)),
+    ]
+    assert list(run_concurrently(process, [1], max_workers=4)) == [(1, (2, calling_thread))]
+
+
+def test_run_concurrently_uses_threads_and_context():
+    """Test that items are processed in worker threads that see the caller's context variables."""
+    request_id.set('abc')
+    all_items_started = threading.Barrier(3, timeout=5)
+
+    def process(item: int) -> str:
+        all_items_started.wait()
+        return f'{request_id.get()}-{item}'
+
+    with patch('learning_credentials.concurrency.close_old_connections') as mock_close_old_connections:
+        results = dict(run_concurrently(process, [1, 2, 3], max_workers=3))
+
+    assert results == {1: 'abc-1', 2: 'abc-2', 3: 'abc-3'}
+    # The obsolete database connections of the worker threads are closed after each item.
+    assert mock_close_old_connections.call_count == 3
+
+
+def test_run_concurrently_reuses_threads():
+    """Test that the calls with the same number of workers share the threads, and process a bounded number of items."""
+    running = 0
+    max_running = 0
+    lock = threading.Lock()
+
+    def process(_item: int) -> str:
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+        return threading.current_thread().name
+
+    first_threads = set(dict(run_concurrently(process, range(10), max_workers=2)).values())
+    second_threads = set(dict(run_concurrently(process, range(10), max_workers=2)).values())
+
+    assert max_running <= 2
+    assert second_threads <= first_threads
+    assert all(name.startswith('learning-credentials') for name in first_threads)
+
+
+def test_run_concurrently_nested_calls_are_sequential():
+    """Test that the calls made from a worker thread process their items in that thread."""
+
+    def process_nested(_item: int) -> set[int]:
+        return {thread_id for _, thread_id in run_concurrently(lambda _: threading.get_ident(), [1, 2], max_workers=2)}
+
+    results = dict(run_concurrently(process_nested, [1, 2], max_workers=2))
+
+    assert all(len(thread_ids) == 1 for thread_ids in results.values())
+
+
+def test_run_concurrently_propagates_exceptions():
+    """Test that exceptions raised in worker threads are propagated to the caller."""
+
+    def process(item: int) -> int:
+        if item == 2:
+            msg = 'Failed to process the item.'
+            raise ValueError(msg)
+        return item
+
+    with pytest.raises(ValueError, match=r'Failed to process the item\.'):
+        list(run_concurrently(process, [1, 2, 3], max_workers=2))
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import io
-from unittest.mock import Mock, patch
+import json
+from pathlib import Path
+from unittest.mock import ANY, Mock, patch
 from uuid import uuid4
 
 import pytest
@@ -14,21 +16,49 @@ from django.test import override_settings
 from inmemorystorage import InMemoryStorage
 from pypdf import PdfWriter
 from pypdf.constants import UserAccessPermissions
+from reportlab.pdfbase.ttfonts import TTFError
 
+from learning_credentials import generators
 from learning_credentials.exceptions import AssetNotFoundError
 from learning_credentials.generators import (
     FontError,
     _build_text_elements,
+    _get_asset_slugs,
+    _get_asset_version,
     _get_credential_paths,
     _get_defaults,
+    _get_template_data,
     _hex_to_rgb,
     _invalidate_credential,
+    _load_font,
     _register_font,
     _save_credential,
+    _save_verification_sidecars,
     _substitute_placeholders,
     _write_text_on_template,
     generate_pdf_credential,
+    preload_assets,
 )
+from learning_credentials.models import Credential
+
+FONT_DATA = b'font_data'
+
+
+@pytest.fixture(autouse=True)
+def _clear_asset_caches():
+    """Clear the process-level asset caches, so each test loads the assets again."""
+    generators._template_cache.clear()
+    generators._template_cache_bytes = 0
+    generators._font_versions.clear()
+
+
+def _mock_asset_file(name: str = 'asset.ttf', content: bytes = b'') -> Mock:
+    """Create a mock CredentialAsset file."""
+    asset_file = Mock(size=len(content))
+    asset_file.name = name
+    asset_file.open.return_value.__enter__ = Mock(return_value=io.BytesIO(content))
+    asset_file.open.return_value.__exit__ = Mock(return_value=None)
+    return asset_file
 
 
 @patch("learning_credentials.generators.CredentialAsset.get_asset_by_slug")
@@ -45,6 +75,7 @@ def test_register_font_already_available(mock_get_asset_by_slug: Mock):
 def test_register_font_without_custom_font(mock_get_asset_by_slug: Mock):
     """Test the _register_font falls back to the default font when no custom font is specified."""
     mock_canvas = Mock(getAvailableFonts=Mock(return_value=['Helvetica', 'Times-Roman']))
+    mock_get_asset_by_slug.return_value = _mock_asset_file()
     assert _register_font(mock_canvas, '') == "Helvetica"
     mock_get_asset_by_slug.assert_called_once()
 
@@ -56,11 +87,12 @@ def test_register_font_with_custom_font(mock_register_font: Mock, mock_font_clas
     """Test that _register_font registers a custom font when not already available."""
     mock_canvas = Mock(getAvailableFonts=Mock(return_value=[]))
     custom_font = "MyFont"
-    mock_get_asset_by_slug.return_value = "font_path"
+    mock_get_asset_by_slug.return_value = _mock_asset_file(content=FONT_DATA)
 
     assert _register_font(mock_canvas, custom_font) == custom_font
     mock_get_asset_by_slug.assert_called_once_with(custom_font)
-    mock_font_class.assert_called_once_with(custom_font, mock_get_asset_by_slug.return_value)
+    mock_font_class.assert_called_once_with(custom_font, ANY)
+    assert mock_font_class.call_args.args[1].read() == FONT_DATA
     mock_register_font.assert_called_once_with(mock_font_class.return_value)
 
 
@@ -73,14 +105,50 @@ def test_register_font_with_registration_failure(
     """Test that _register_font returns False when font registration fails."""
     mock_canvas = Mock(getAvailableFonts=Mock(return_value=[]))
     custom_font = "MyFont"
-    mock_get_asset_by_slug.return_value = "font_path"
+    mock_get_asset_by_slug.return_value = _mock_asset_file()
 
     assert _register_font(mock_canvas, custom_font) == 'Helvetica'
     mock_get_asset_by_slug.assert_called_once_with(custom_font)
-    mock_font_class.assert_called_once_with(custom_font, mock_get_asset_by_slug.return_value)
+    mock_font_class.assert_called_once_with(custom_font, ANY)
     mock_register_font.assert_not_called()
 
 
+@patch('learning_credentials.generators.TTFont')
+def test_load_font_from_asset_cache(mock_font_class: Mock, tmp_path: Path):
+    """Test that reportlab reads a cached font by its path instead of a copy of its content."""
+    with override_settings(LEARNING_CREDENTIALS_ASSET_CACHE_DIR=str(tmp_path)):
+        assert _load_font('MyFont', _mock_asset_file(content=FONT_DATA), 'v1') == mock_font_class.return_value
+
+    path = mock_font_class.call_args.args[1]
+    mock_font_class.assert_called_once_with('MyFont', path)
+    assert Path(path).read_bytes() == FONT_DATA
+
+
+@patch('learning_credentials.generators.TTFont')
+@patch('learning_credentials.generators.get_asset_path')
+def test_load_font_evicted_from_asset_cache(mock_get_asset_path: Mock, mock_font_class: Mock, tmp_path: Path):
+    """Test that the font content is read if the cached file is removed before reportlab opens it."""
+    mock_get_asset_path.return_value = tmp_path / 'evicted'
+    font = Mock()
+    mock_font_class.side_effect = [TTFError("Can't open file"), font]
+
+    assert _load_font('MyFont', _mock_asset_file(content=FONT_DATA), 'v1') == font
+    assert mock_font_class.call_args_list[0].args == ('MyFont', str(tmp_path / 'evicted'))
+    assert mock_font_class.call_args.args[1].read() == FONT_DATA
+
+
+@patch('learning_credentials.generators.TTFont', side_effect=TTFError("Invalid font"))
+@patch('learning_credentials.generators.get_asset_path')
+def test_load_invalid_font_from_asset_cache(mock_get_asset_path: Mock, mock_font_class: Mock, tmp_path: Path):
+    """Test that errors of a cached font are raised instead of reading the same content again."""
+    mock_get_asset_path.return_value = tmp_path / 'font'
+    mock_get_asset_path.return_value.write_bytes(FONT_DATA)
+
+    with pytest.raises(TTFError, match="Invalid font"):
+        _load_font('MyFont', _mock_asset_file(content=FONT_DATA), 'v1')
+    mock_font_class.assert_called_once_with('MyFont', str(tmp_path / 'font'))
+
+
 @patch(
     "learning_credentials.generators.CredentialAsset.get_asset_by_slug",
     side_effect=AssetNotFoundError("Font not found"),
@@ -94,6 +162,124 @@ def test_register_font_with_asset_not_found(mock_get_asset_by_slug: Mock):
     mock_get_asset_by_slug.assert_called_once_with(custom_font)
 
 
+@patch("learning_credentials.generators.CredentialAsset.get_asset_by_slug")
+@patch('learning_credentials.generators.TTFont')
+@patch("learning_credentials.generators.registerFont")
+def test_register_font_once_per_version(
+    mock_register_font: Mock,
+    mock_font_class: Mock,
+    mock_get_asset_by_slug: Mock,
+):
+    """Test that a custom font is only registered again after it is re-uploaded."""
+    mock_canvas = Mock(getAvailableFonts=Mock(return_value=[]))
+    mock_get_asset_by_slug.return_value = _mock_asset_file()
+
+    assert _register_font(mock_canvas, 'MyFont') == 'MyFont'
+    assert _register_font(mock_canvas, 'MyFont') == 'MyFont'
+    mock_register_font.assert_called_once_with(mock_font_class.return_value)
+
+    mock_get_asset_by_slug.return_value = _mock_asset_file('learning_credentials_template_assets/1/new_hash/asset.ttf')
+    assert _register_font(mock_canvas, 'MyFont') == 'MyFont'
+    assert mock_register_font.call_count == 2
+
+
+def test_get_asset_version():
+    """Test that the version of an asset is identified by its content-hashed path."""
+    asset_file = _mock_asset_file('learning_credentials_template_assets/1/content_hash/template.pdf')
+
+    assert _get_asset_version(asset_file) == 'learning_credentials_template_assets/1/content_hash/template.pdf'
+
+
+@patch("learning_credentials.generators.CredentialAsset.get_asset_by_slug")
+def test_get_template_data(mock_get_asset_by_slug: Mock):
+    """Test that each version of a template is only downloaded once."""
+    content, new_content = b'pdf_data', b'new_pdf_data'
+    mock_get_asset_by_slug.return_value = asset_file = _mock_asset_file('template.pdf', content)
+
+    assert _get_template_data('template') == content
+    assert _get_template_data('template') == content
+    asset_file.open.assert_called_once_with('rb')
+
+    mock_get_asset_by_slug.return_value = new_asset_file = _mock_asset_file('template_v2.pdf', new_content)
+    assert _get_template_data('template') == new_content
+    new_asset_file.open.assert_called_once_with('rb')
+    # The previous version is replaced.
+    assert generators._template_cache == {'template': ('template_v2.pdf', new_content)}
+    assert generators._template_cache_bytes == len(new_content)
+
+
+@override_settings(LEARNING_CREDENTIALS_TEMPLATE_CACHE_MAX_BYTES=10, LEARNING_CREDENTIALS_WORKER_WARMUP_MAX_BYTES=0)
+@patch("learning_credentials.generators.CredentialAsset.get_asset_by_slug")
+def test_get_template_data_limits_cache_size(mock_get_asset_by_slug: Mock):
+    """Test that the least recently used templates are evicted, and templates larger than the limit are not cached."""
+    assets = {
+        'first': _mock_asset_file('first.pdf', b'1234'),
+        'second': _mock_asset_file('second.pdf', b'1234'),
+        'third': _mock_asset_file('third.pdf', b'1234'),
+        'large': _mock_asset_file('large.pdf', b'12345678901'),
+    }
+    mock_get_asset_by_slug.side_effect = assets.get
+
+    _get_template_data('first')
+    _get_template_data('second')
+    _get_template_data('first')  # `second` is now the least recently used template.
+    _get_template_data('third')
+    assert list(generators._template_cache) == ['first', 'third']
+    assert generators._template_cache_bytes == 8
+
+    assert len(_get_template_data('large')) == assets['large'].size
+    assert list(generators._template_cache) == ['first', 'third']
+
+
+def test_get_asset_slugs():
+    """Test that the templates and fonts referenced by the options are collected."""
+    options = {
+        'template': 'template',
+        'template_multiline': 'template-multiline',
+        'defaults': {'font': 'DefaultFont'},
+        'text_elements': {
+            'name': {'font': 'NameFont'},
+            'award_line': {'text': 'Awarded', 'y': 140, 'font': 'AwardFont'},
+        },
+    }
+
+    assert _get_asset_slugs(options) == (
+        {'template', 'template-multiline'},
+        {'DefaultFont', 'NameFont', 'AwardFont'},
+    )
+    assert _get_asset_slugs({}) == (set(), {'Helvetica'})
+
+
+@patch('learning_credentials.generators._register_font')
+@patch('learning_credentials.generators._get_template_data')
+@patch("learning_credentials.generators.CredentialAsset.get_asset_by_slug")
+def test_preload_assets(mock_get_asset_by_slug: Mock, mock_get_template_data: Mock, mock_register_font: Mock):
+    """Test that templates are preloaded before fonts, and assets exceeding the memory cap are skipped."""
+    assets = {
+        'template': _mock_asset_file(content=b'x' * 60),
+        'template-multiline': _mock_asset_file(content=b'x' * 50),
+        'Font': _mock_asset_file(content=b'x' * 30),
+    }
+
+    def get_asset_by_slug(slug: str) -> Mock:
+        if slug not in assets:
+            raise AssetNotFoundError(slug)
+        return assets[slug]
+
+    mock_get_asset_by_slug.side_effect = get_asset_by_slug
+    options_list = [
+        {'template': 'template', 'template_multiline': 'template-multiline'},
+        {'template': 'template', 'defaults': {'font': 'Font'}, 'text_elements': {'date': {'font': 'MissingFont'}}},
+    ]
+
+    assert preload_assets(options_list, max_bytes=100) == 90
+
+    mock_get_template_data.assert_called_once_with('template')
+    mock_register_font.assert_called_once_with(mock_register_font.call_args.args[0], 'Font')
+    mock_get_asset_by_slug.assert_any_call('MissingFont')
+    assert 'Helvetica' not in [call.args[0] for call in mock_get_asset_by_slug.call_args_list]
+
+
 @pytest.mark.parametrize(
     ("hex_color", "expected"),
     [
@@ -504,7 +690,9 @@ def test_save_credential(mock_contentfile: Mock, mock_token_hex: Mock, storage:
     return_value=Mock(getpdfdata=Mock(return_value=b'pdf_data')),
 )
 @patch('learning_credentials.generators._save_credential', return_value='credential_url')
+@patch('learning_credentials.generators._save_verification_sidecars')
 def test_generate_pdf_credential(
+    mock_save_sidecars: Mock,
     mock_save_credential: Mock,
     mock_write_text_on_template: Mock,
     mock_pdf_writer: Mock,
@@ -540,6 +728,7 @@ def test_generate_pdf_credential(
     assert args[5] == options
 
     mock_save_credential.assert_called_once()
+    mock_save_sidecars.assert_called_once_with(credential, Credential.Status.AVAILABLE)
 
 
 def test_generate_pdf_credential_no_template():
@@ -552,7 +741,8 @@ def test_generate_pdf_credential_no_template():
 
 
 @patch('learning_credentials.generators._invalidate_credential')
-def test_generate_pdf_credential_invalidate(mock_invalidate: Mock):
+@patch('learning_credentials.generators._save_verification_sidecars')
+def test_generate_pdf_credential_invalidate(mock_save_sidecars: Mock, mock_invalidate: Mock):
     """Test that generate_pdf_credential calls _invalidate_credential when invalidate=True."""
     credential_uuid = uuid4()
     credential = Mock(uuid=credential_uuid, user=Mock(id=1))
@@ -561,6 +751,61 @@ def test_generate_pdf_credential_invalidate(mock_invalidate: Mock):
 
     assert result == ''
     mock_invalidate.assert_called_once_with(credential_uuid)
+    mock_save_sidecars.assert_called_once_with(credential, Credential.Status.INVALIDATED)
+
+
+@pytest.mark.django_db
+def test_save_verification_sidecars_disabled(credential: Credential):
+    """Test that no verification documents are saved by default."""
+    storage = Mock(spec=FileSystemStorage)
+
+    with patch('learning_credentials.generators.default_storage', storage):
+        assert _save_verification_sidecars(credential, Credential.Status.AVAILABLE) == []
+
+    storage.save.assert_not_called()
+
+
+@override_settings(LEARNING_CREDENTIALS_VERIFICATION_SIDECARS=('json', 'html'))
+@patch('learning_credentials.generators.get_localized_credential_date', return_value='April 1, 2021')
+@pytest.mark.usefixtures('temp_media')
+@pytest.mark.django_db
+def test_save_verification_sidecars(mock_get_date: Mock, credential: Credential):
+    """Test that the verification documents are saved next to the PDF, and rewritten when the credential changes."""
+    storage = InMemoryStorage()
+    json_path = f'learning_credentials/{credential.verify_uuid}.json'
+    html_path = f'learning_credentials/{credential.verify_uuid}.html'
+
+    with patch('learning_credentials.generators.default_storage', storage):
+        urls = _save_verification_sidecars(credential, Credential.Status.AVAILABLE)
+
+        assert urls == [storage.url(json_path), storage.url(html_path)]
+        assert json.loads(storage.open(json_path).read()) == {
+            'user_full_name': 'Test User',
+            'created': ANY,
+            'learning_context_name': 'Test Course',
+            'status': Credential.Status.AVAILABLE,
+            'invalidation_reason': '',
+        }
+        html = storage.open(html_path).read().decode()
+        assert 'Valid credential' in html
+        assert 'Test User' in html
+        assert mock_get_date.return_value in html
+
+        credential.invalidation_reason = 'Reissued'
+        _save_verification_sidecars(credential, Credential.Status.INVALIDATED)
+
+        assert json.loads(storage.open(json_path).read())['status'] == Credential.Status.INVALIDATED
+        html = storage.open(html_path).read().decode()
+        assert 'This credential is no longer valid' in html
+        assert 'Reissued' in html
+
+        # The verification documents use the custom domain of the credentials.
+        with override_settings(LEARNING_CREDENTIALS_CUSTOM_DOMAIN='https://example2.com'):
+            urls = _save_verification_sidecars(credential, Credential.Status.INVALIDATED)
+        assert urls == [
+            f'https://example2.com/{credential.verify_uuid}.json',
+            f'https://example2.com/{credential.verify_uuid}.html',
+        ]
 
 
 def test_get_credential_paths():
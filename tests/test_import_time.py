@@ -0,0 +1,68 @@
+"""Import cost of the modules loaded by every LMS process."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Load the app as the LMS does, and list the imported modules.
+IMPORT_SCRIPT = """
+import sys
+
+import django
+
+django.setup()
+
+print(','.join(sorted(sys.modules)))
+"""
+
+# Heavy modules that are only needed when credentials are generated or sent.
+DEFERRED_MODULES = (
+    'completion_aggregator.api.v1.views',
+    'edx_ace',
+    'learning_credentials.generators',
+    'learning_credentials.processors',
+    'learning_credentials.tasks',
+    'numpy',
+    'pypdf',
+    'reportlab',
+    'rest_framework.test',
+)
+
+
+@pytest.fixture(scope='module')
+def imported_modules() -> set[str]:
+    """Load the app in a new interpreter, and return the imported modules."""
+    # Do not start the coverage measurement in the subprocess.
+    env = {key: value for key, value in os.environ.items() if not key.startswith('COV_CORE_')}
+    env['DJANGO_SETTINGS_MODULE'] = 'test_settings'
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, '-c', IMPORT_SCRIPT],
+        capture_output=True,
+        check=True,
+        cwd=Path(__file__).parents[1],
+        env=env,
+        text=True,
+    )
+    return set(result.stdout.strip().split(','))
+
+
+def test_app_is_loaded(imported_modules: set[str]):
+    """Test that the subprocess loaded the app and its models, so the check below is meaningful."""
+    assert {'learning_credentials.apps', 'learning_credentials.models'} <= imported_modules
+
+
+def test_heavy_modules_are_deferred(imported_modules: set[str]):
+    """
+    Test that the heavy dependencies are not imported when the app is loaded.
+
+    Whether a module is imported does not depend on the speed of the machine, unlike its import time.
+    """
+    imported = {
+        module
+        for module in imported_modules
+        if any(module == name or module.startswith(f'{name}.') for name in DEFERRED_MODULES)
+    }
+    assert not imported, f'Heavy modules were imported when the app was loaded: {sorted(imported)}'
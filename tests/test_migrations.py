@@ -7,12 +7,26 @@ import importlib
 from typing import Any
 
 import pytest
+from django.apps import apps
+from django_celery_beat.models import PeriodicTask
+
+from learning_credentials.models import (
+    ArchivedCredential,
+    Credential,
+    CredentialConfiguration,
+    CredentialConfigurationStats,
+)
 
 # Import the migration module using importlib since it starts with a number.
 migration_0007 = importlib.import_module('learning_credentials.migrations.0007_migrate_to_text_elements_format')
 _convert_to_text_elements = migration_0007._convert_to_text_elements
 _convert_to_flat_format = migration_0007._convert_to_flat_format
 
+migration_0014 = importlib.import_module('learning_credentials.migrations.0014_credential_configuration_stats')
+migration_0016 = importlib.import_module('learning_credentials.migrations.0016_delete_old_asset_versions_periodic_task')
+migration_0017 = importlib.import_module('learning_credentials.migrations.0017_archive_and_reconcile_periodic_tasks')
+migration_0018 = importlib.import_module('learning_credentials.migrations.0018_grouped_generation_periodic_task')
+
 # Type alias for options dictionary.
 OptionsDict = dict[str, Any] | None
 
@@ -248,3 +262,60 @@ class TestMigration0007:
         _convert_to_flat_format(original)
 
         assert original == expected
+
+
+@pytest.mark.django_db
+def test_migration_0014_backfill_stats(credential: Credential, grade_config: CredentialConfiguration):
+    """Test that the stats of the existing configurations are calculated from their credentials."""
+    ArchivedCredential.objects.create(
+        user=credential.user, configuration=credential.configuration, status=Credential.Status.INVALIDATED
+    )
+    CredentialConfigurationStats.objects.all().delete()
+
+    migration_0014.backfill_stats(apps, None)
+
+    stats = CredentialConfigurationStats.objects.get(configuration=credential.configuration)
+    assert (stats.available_count, stats.invalidated_count, stats.error_count) == (1, 1, 0)
+    assert stats.reconciled_at is not None
+    assert CredentialConfigurationStats.objects.get(configuration=grade_config).available_count == 0
+
+
+@pytest.mark.django_db
+def test_migration_0016_periodic_task():
+    """Test that the periodic task sweeping the old asset versions is created once, and removed on reversal."""
+    periodic_tasks = PeriodicTask.objects.filter(name=migration_0016.PERIODIC_TASK_NAME)
+    assert periodic_tasks.get().task == 'learning_credentials.tasks.delete_old_asset_versions_task'
+
+    migration_0016.create_periodic_task(apps, None)
+    assert periodic_tasks.count() == 1
+
+    migration_0016.delete_periodic_task(apps, None)
+    assert not periodic_tasks.exists()
+
+
+@pytest.mark.django_db
+def test_migration_0017_periodic_tasks():
+    """Test that the periodic tasks archiving the credentials and recalculating the counters are created once."""
+    periodic_tasks = PeriodicTask.objects.filter(name__in=migration_0017.PERIODIC_TASKS)
+    assert dict(periodic_tasks.values_list('name', 'task')) == migration_0017.PERIODIC_TASKS
+
+    migration_0017.create_periodic_tasks(apps, None)
+    assert periodic_tasks.count() == len(migration_0017.PERIODIC_TASKS)
+
+    migration_0017.delete_periodic_tasks(apps, None)
+    assert not periodic_tasks.exists()
+
+
+@pytest.mark.django_db
+def test_migration_0018_periodic_task():
+    """Test that the disabled periodic task of the generation grouped by learning context is created once."""
+    periodic_tasks = PeriodicTask.objects.filter(name=migration_0018.PERIODIC_TASK_NAME)
+    periodic_task = periodic_tasks.get()
+    assert periodic_task.task == 'learning_credentials.tasks.generate_all_credentials_task'
+    assert periodic_task.enabled is False
+
+    migration_0018.create_periodic_task(apps, None)
+    assert periodic_tasks.count() == 1
+
+    migration_0018.delete_periodic_task(apps, None)
+    assert not periodic_tasks.exists()
@@ -2,35 +2,62 @@
 
 from __future__ import annotations
 
+import hashlib
+import shutil
+from datetime import timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING
 from unittest.mock import Mock, patch
 from uuid import uuid4
 
 import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.core.files.base import ContentFile
+from django.db import connection
+from django.db.models import QuerySet
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 from django_celery_beat.models import PeriodicTask
 
 from learning_credentials.exceptions import AssetNotFoundError, CredentialGenerationError
 from learning_credentials.models import (
+    ArchivedCredential,
+    BaseCredential,
     Credential,
     CredentialAsset,
     CredentialConfiguration,
+    CredentialConfigurationStats,
     CredentialType,
+    LearnerProgressSnapshot,
+    _deep_merge,
     post_delete_periodic_task,
 )
+from learning_credentials.processors import _restricted_user_ids
 from test_utils.factories import UserFactory
+from tests.conftest import _mock_retrieval_func
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from django.contrib.auth.models import User
-    from django.db.models import Model
 
 
 @pytest.fixture(autouse=True)
 def patch_compat_functions(monkeypatch: pytest.MonkeyPatch):
     """Patch Open edX compatibility functions used in learning_credentials.compat."""
     monkeypatch.setattr('learning_credentials.models.get_learning_context_name', lambda _: "Test Course")
+    monkeypatch.setattr(
+        'learning_credentials.models.get_users_with_profiles',
+        lambda user_ids: get_user_model().objects.filter(id__in=user_ids),
+    )
+
+
+def _get_generation_periodic_tasks() -> QuerySet[PeriodicTask]:
+    """Get the periodic tasks of the credential configurations, excluding the maintenance tasks."""
+    return PeriodicTask.objects.filter(task='learning_credentials.tasks.generate_credentials_for_config_task')
 
 
 class TestCredentialType:
@@ -62,6 +89,16 @@ class TestCredentialType:
             credential_type.clean()
         assert "Function path must be in format 'module.function_name'" in str(exc.value)
 
+    def test_clean_with_non_callable_function(self):
+        """Test the clean method with a path to an attribute that is not a function."""
+        credential_type = CredentialType(
+            name="Test Type",
+            retrieval_func="tests.conftest._mock_retrieval_func",
+            generation_func="learning_credentials.models.log",
+        )
+        with pytest.raises(ValidationError, match="could not be found"):
+            credential_type.clean()
+
     def test_clean_with_invalid_function(self):
         """Test the clean method with invalid function paths."""
         credential_type = CredentialType(
@@ -93,15 +130,15 @@ class TestCredentialConfiguration:
     @pytest.mark.django_db
     def test_periodic_task_is_deleted_on_deletion(self, mock_credential_config: CredentialConfiguration):
         """Test that the periodic task is deleted when the configuration is deleted."""
-        assert PeriodicTask.objects.count() == 1
+        assert _get_generation_periodic_tasks().count() == 1
 
         mock_credential_config.delete()
-        assert not PeriodicTask.objects.exists()
+        assert not _get_generation_periodic_tasks().exists()
 
     @pytest.mark.django_db
     def test_periodic_task_deletion_removes_the_configuration(self, mock_credential_config: CredentialConfiguration):
         """Test that the configuration is deleted when the periodic task is deleted."""
-        assert PeriodicTask.objects.count() == 1
+        assert _get_generation_periodic_tasks().count() == 1
 
         mock_credential_config.periodic_task.delete()
         assert not CredentialConfiguration.objects.exists()
@@ -109,18 +146,18 @@ class TestCredentialConfiguration:
     @pytest.mark.django_db
     @pytest.mark.usefixtures("mock_credential_config", "grade_config")
     @pytest.mark.parametrize(
-        ("deleted_model", "verified_model"),
+        ("deleted_queryset", "verified_queryset"),
         [
-            (CredentialConfiguration, PeriodicTask),  # `post_delete` signal.
-            (PeriodicTask, CredentialConfiguration),  # Cascade deletion of the `OneToOneField`.
+            (CredentialConfiguration.objects.all, _get_generation_periodic_tasks),  # `post_delete` signal.
+            (_get_generation_periodic_tasks, CredentialConfiguration.objects.all),  # Cascade deletion.
         ],
     )
-    def test_bulk_delete(self, deleted_model: type[Model], verified_model: type[Model]):
+    def test_bulk_delete(self, deleted_queryset: Callable[[], QuerySet], verified_queryset: Callable[[], QuerySet]):
         """Test that the bulk deletion of configurations removes the periodic tasks (and vice versa)."""
-        assert PeriodicTask.objects.count() == 2
+        assert _get_generation_periodic_tasks().count() == 2
 
-        deleted_model.objects.all().delete()
-        assert not verified_model.objects.exists()
+        deleted_queryset().delete()
+        assert not verified_queryset().exists()
 
     @pytest.mark.django_db
     def test_str_representation(self, mock_credential_config: CredentialConfiguration):
@@ -134,6 +171,24 @@ class TestCredentialConfiguration:
         eligible_user_ids = mock_credential_config.get_eligible_user_ids()
         assert eligible_user_ids == [1, 2, 3]
 
+    @pytest.mark.django_db
+    def test_iter_retrieval_results_uses_streaming_variant(self, mock_credential_config: CredentialConfiguration):
+        """Test that the streaming variant of the retrieval function is used when it is registered."""
+        stream_func = Mock(side_effect=lambda *_args, **_kwargs: iter([(1, {'is_eligible': True}), (2, {})]))
+
+        with patch.dict('learning_credentials.processors._streaming_variants', {_mock_retrieval_func: stream_func}):
+            results = mock_credential_config.iter_retrieval_results()
+            stream_func.assert_not_called()
+
+            assert list(results) == [(1, {'is_eligible': True}), (2, {})]
+            stream_func.assert_called_once_with(mock_credential_config.learning_context_key, {}, user_id=None)
+            assert list(mock_credential_config.iter_eligible_user_ids()) == [1]
+
+    @pytest.mark.django_db
+    def test_iter_eligible_user_ids_adapts_dict_results(self, mock_credential_config: CredentialConfiguration):
+        """Test that the results of retrieval functions without a streaming variant are adapted."""
+        assert list(mock_credential_config.iter_eligible_user_ids()) == [1, 2, 3]
+
     @pytest.mark.django_db
     def test_get_user_eligibility_details(self, mock_credential_config: CredentialConfiguration):
         """Test that get_user_eligibility_details returns details for a known user."""
@@ -146,6 +201,22 @@ class TestCredentialConfiguration:
         details = mock_credential_config.get_user_eligibility_details(user_id=999)
         assert details == {'is_eligible': False}
 
+    @pytest.mark.django_db
+    def test_get_users_eligibility_details(self, mock_credential_config: CredentialConfiguration):
+        """Test that the retrieval function is called once for multiple users, and only their results are returned."""
+        restrictions = []
+
+        def retrieval_func(*_args, **_kwargs) -> dict[int, dict]:
+            restrictions.append(_restricted_user_ids.get())
+            return {1: {'is_eligible': True}, 2: {'is_eligible': True}}
+
+        with patch('tests.conftest._mock_retrieval_func', side_effect=retrieval_func):
+            details = mock_credential_config.get_users_eligibility_details([1, 999])
+
+        assert details == {1: {'is_eligible': True}, 999: {'is_eligible': False}}
+        assert restrictions == [frozenset({1, 999})]
+        assert _restricted_user_ids.get() is None
+
     @pytest.mark.django_db
     @patch('tests.conftest._mock_retrieval_func')
     def test_custom_options_deep_merge(
@@ -209,6 +280,46 @@ class TestCredentialConfiguration:
             'new_top': 'new_value',  # Added from override.
         }
 
+    @pytest.mark.django_db
+    def test_get_custom_options_is_cached_until_save(
+        self, mock_credential_type: CredentialType, mock_credential_config: CredentialConfiguration
+    ):
+        """Test that the merged options are reused until the configuration or its credential type is saved."""
+        mock_credential_type.custom_options = {'type_option': 1}
+        mock_credential_type.save()
+        mock_credential_config.custom_options = {'config_option': 1}
+        mock_credential_config.save()
+
+        with patch('learning_credentials.models._deep_merge', wraps=_deep_merge) as mock_deep_merge:
+            options = mock_credential_config.get_custom_options()
+            assert mock_credential_config.get_custom_options() is options
+            assert options == {'type_option': 1, 'config_option': 1}
+            assert mock_deep_merge.call_count == 1
+
+            mock_credential_config.custom_options = {'config_option': 2}
+            mock_credential_config.save()
+            assert mock_credential_config.get_custom_options() == {'type_option': 1, 'config_option': 2}
+
+            mock_credential_type.custom_options = {'type_option': 2}
+            mock_credential_type.save()
+            assert mock_credential_config.get_custom_options() == {'type_option': 2, 'config_option': 2}
+            assert mock_deep_merge.call_count == 3
+
+            # Saving another credential type does not drop the options of this configuration.
+            CredentialType.objects.create(name='Other Type', retrieval_func='', generation_func='')
+            mock_credential_config.get_custom_options()
+            assert mock_deep_merge.call_count == 3
+
+    @pytest.mark.django_db
+    def test_get_custom_options_of_unsaved_configuration(self, mock_credential_type: CredentialType):
+        """Test that the merged options of unsaved configurations are not cached."""
+        config = CredentialConfiguration(credential_type=mock_credential_type, custom_options={'option': 1})
+
+        with patch('learning_credentials.models._deep_merge', wraps=_deep_merge) as mock_deep_merge:
+            assert config.get_custom_options() == {'option': 1}
+            assert config.get_custom_options() == {'option': 1}
+            assert mock_deep_merge.call_count == 2
+
     @pytest.mark.django_db
     def test_filter_out_user_ids_with_credentials(self, mock_credential_config: CredentialConfiguration):
         """Test the filter_out_user_ids_with_credentials method."""
@@ -313,7 +424,7 @@ class TestCredentialConfiguration:
         patch_send_email.assert_called_once()
 
     @pytest.mark.django_db
-    @patch('learning_credentials.models.import_module')
+    @patch('learning_credentials.models.resolve_function')
     def test_generate_credential_for_user_with_exception(
         self, mock_module: Mock, mock_credential_config: CredentialConfiguration, user: User
     ):
@@ -359,6 +470,105 @@ class TestCredentialConfiguration:
         assert not Credential.objects.filter(user_id=user4.id).exists()
         assert patch_send_email.call_count == 3
 
+    @pytest.mark.django_db
+    def test_generate_credentials_for_users(
+        self, patch_send_email: Mock, mock_credential_config: CredentialConfiguration, user: User
+    ):
+        """Test that the credentials of multiple users are created or updated like with generate_credential_for_user."""
+        task_id = 123
+        invalidated_credential = Credential.objects.create(
+            user=user,
+            configuration=mock_credential_config,
+            learning_context_key=mock_credential_config.learning_context_key,
+            credential_type=mock_credential_config.credential_type.name,
+            status=Credential.Status.INVALIDATED,
+        )
+        existing_credential = Credential.objects.create(
+            user=user,
+            configuration=mock_credential_config,
+            learning_context_key=mock_credential_config.learning_context_key,
+            credential_type=mock_credential_config.credential_type.name,
+            user_full_name="Random Name",
+            status=Credential.Status.ERROR,
+            generation_task_id=1,
+        )
+        inactive_user = UserFactory.create(is_active=False)
+
+        credentials = mock_credential_config.generate_credentials_for_users([user.id, inactive_user.id], task_id)
+
+        assert len(credentials) == 2
+        assert Credential.objects.filter(configuration=mock_credential_config).count() == 3
+        for credential_user in (user, inactive_user):
+            assert Credential.objects.filter(
+                user_id=credential_user.id,
+                learning_context_name="Test Course",
+                configuration=mock_credential_config,
+                user_full_name=f"{credential_user.first_name} {credential_user.last_name}",
+                status=Credential.Status.AVAILABLE,
+                generation_task_id=task_id,
+                download_url="http://example.com/mock_credential.pdf",
+            ).exists()
+        existing_credential.refresh_from_db()
+        assert existing_credential.status == Credential.Status.AVAILABLE
+        invalidated_credential.refresh_from_db()
+        assert invalidated_credential.status == Credential.Status.INVALIDATED
+        # Emails are only sent to active users.
+        patch_send_email.assert_called_once()
+        stats = CredentialConfigurationStats.objects.get(configuration=mock_credential_config)
+        assert (stats.generating_count, stats.available_count, stats.error_count, stats.invalidated_count) == (
+            0,
+            2,
+            0,
+            1,
+        )
+
+    @pytest.mark.django_db
+    @pytest.mark.usefixtures('patch_send_email')
+    def test_generate_credentials_for_users_query_count(self, mock_credential_config: CredentialConfiguration):
+        """Test that the number of queries does not depend on the number of users."""
+
+        def count_queries(user_count: int) -> int:
+            users = UserFactory.create_batch(user_count)
+            # Half of the users already have a credential that is updated.
+            for user in users[::2]:
+                Credential.objects.create(
+                    user=user,
+                    configuration=mock_credential_config,
+                    learning_context_key=mock_credential_config.learning_context_key,
+                    credential_type=mock_credential_config.credential_type.name,
+                    status=Credential.Status.ERROR,
+                )
+            with CaptureQueriesContext(connection) as queries:
+                mock_credential_config.generate_credentials_for_users([user.id for user in users])
+            return len(queries)
+
+        assert count_queries(2) == count_queries(20)
+
+    @pytest.mark.django_db
+    @pytest.mark.usefixtures('patch_send_email')
+    def test_generate_credentials_for_users_with_exception(self, mock_credential_config: CredentialConfiguration):
+        """Test that a failed credential does not prevent the generation of the other ones."""
+        users = UserFactory.create_batch(3)
+
+        def generate(credential: Credential, _options: dict) -> str:
+            if credential.user == users[1]:
+                msg = "Test Exception"
+                raise RuntimeError(msg)
+            return "http://example.com/mock_credential.pdf"
+
+        with (
+            patch.object(CredentialConfiguration, '_get_generation_func', return_value=generate),
+            pytest.raises(CredentialGenerationError, match='Failed to generate 1 credentials'),
+        ):
+            mock_credential_config.generate_credentials_for_users([user.id for user in users], 123)
+
+        statuses = dict(Credential.objects.values_list('user_id', 'status'))
+        assert statuses == {
+            users[0].id: Credential.Status.AVAILABLE,
+            users[1].id: Credential.Status.ERROR,
+            users[2].id: Credential.Status.AVAILABLE,
+        }
+
     @pytest.mark.django_db
     def test_get_enabled_configurations(self, mock_credential_config: CredentialConfiguration):
         """Test the get_enabled_configurations classmethod."""
@@ -414,7 +624,7 @@ class TestCredential:
 
     @pytest.mark.django_db
     @patch('learning_credentials.models.settings')
-    @patch('learning_credentials.models.ace')
+    @patch('edx_ace.ace')
     def test_send_email(self, mock_ace: Mock, mock_settings: Mock, credential: Credential):
         """Test the send_email method sends an email to the user."""
         mock_settings.PLATFORM_NAME = "Test Platform"
@@ -456,6 +666,19 @@ class TestCredential:
             assert credential.invalidated_at == original_invalidated_at
             mock_invalidate.assert_not_called()
 
+    @pytest.mark.django_db
+    def test_invalidate_cached_metadata(self, credential: Credential, django_capture_on_commit_callbacks: Callable):
+        """Test that the cached verification metadata is removed when the transaction is committed."""
+        cache_key = Credential.get_metadata_cache_key(credential.verify_uuid)
+        cache.set(cache_key, {'data': {}})
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            Credential.invalidate_cached_metadata([credential])
+        assert cache.get(cache_key) is not None
+
+        callbacks[0]()
+        assert cache.get(cache_key) is None
+
     @pytest.mark.django_db
     @pytest.mark.usefixtures("patch_send_email")
     def test_reissue_creates_new_credential(self, credential: Credential):
@@ -484,6 +707,249 @@ class TestCredential:
         assert credential.invalidation_reason == "Name change\nReissued"
 
 
+class TestArchivedCredential:
+    """Tests for the ArchivedCredential model."""
+
+    @pytest.mark.django_db
+    @pytest.mark.usefixtures("patch_send_email")
+    def test_archive(self, credential: Credential):
+        """Test that only the invalidated credentials are moved to the archive, in batches."""
+        reissued_credentials = [credential]
+        for _ in range(2):
+            reissued_credentials.append(reissued_credentials[-1].reissue())
+        for reissued_credential in reissued_credentials:
+            reissued_credential.refresh_from_db()
+
+        with CaptureQueriesContext(connection) as batch_queries:
+            assert ArchivedCredential.archive(Credential.objects.all(), batch_size=1) == 2
+
+        assert list(Credential.objects.all()) == [reissued_credentials[-1]]
+        archived_credential = ArchivedCredential.objects.get(pk=credential.pk)
+        for field in BaseCredential._meta.concrete_fields:
+            if field.name != 'modified':
+                assert getattr(archived_credential, field.attname) == getattr(credential, field.attname)
+        assert archived_credential.archived_at is not None
+        # Each batch is selected, copied, and deleted in a transaction. The last selection returns no credentials.
+        assert sum('SELECT' in query['sql'] for query in batch_queries.captured_queries) == 3
+
+    @pytest.mark.django_db
+    def test_archive_nothing(self, credential: Credential):
+        """Test that valid credentials are not archived."""
+        assert ArchivedCredential.archive(Credential.objects.all()) == 0
+        assert Credential.objects.filter(pk=credential.pk).exists()
+        assert not ArchivedCredential.objects.exists()
+
+
+@pytest.mark.django_db
+class TestCredentialConfigurationStats:
+    """Tests for the CredentialConfigurationStats model."""
+
+    @staticmethod
+    def _get_counts(configuration: CredentialConfiguration) -> dict[str, int]:
+        """Get the non-zero counters of a configuration."""
+        stats = CredentialConfigurationStats.objects.get(configuration=configuration)
+        counts = {status: getattr(stats, stats.get_counter_field(status)) for status in Credential.Status}
+        return {status: count for status, count in counts.items() if count}
+
+    def test_str_representation(self, grade_config: CredentialConfiguration):
+        """Test the string representation of the stats."""
+        assert str(grade_config.stats) == f'Stats of {grade_config.id}'
+
+    def test_created_with_configuration(self, grade_config: CredentialConfiguration):
+        """Test that the stats of a new configuration start at zero."""
+        assert self._get_counts(grade_config) == {}
+
+    def test_status_transitions(self, credential: Credential):
+        """Test that the counters are updated when credentials are created and their statuses change."""
+        assert self._get_counts(credential.configuration) == {Credential.Status.AVAILABLE: 1}
+
+        credential.download_url = 'http://example.com/updated.pdf'
+        credential.save()
+        assert self._get_counts(credential.configuration) == {Credential.Status.AVAILABLE: 1}
+
+        credential = Credential.objects.get(pk=credential.pk)
+        credential.invalidation_reason = 'Name change'
+        credential.save()
+        assert self._get_counts(credential.configuration) == {Credential.Status.INVALIDATED: 1}
+
+        ArchivedCredential.archive(Credential.objects.all())
+        assert self._get_counts(credential.configuration) == {Credential.Status.INVALIDATED: 1}
+
+    def test_status_change_without_stats(self, credential: Credential):
+        """Test that the counters are recalculated if the stats of the configuration do not exist."""
+        CredentialConfigurationStats.objects.all().delete()
+
+        credential.status = Credential.Status.ERROR
+        credential.save()
+
+        assert self._get_counts(credential.configuration) == {Credential.Status.ERROR: 1}
+
+    def test_reconcile(self, credential: Credential, user: User):
+        """Test that the counters are recalculated from the current and the archived credentials."""
+        configuration = credential.configuration
+        archived_credential = ArchivedCredential.objects.create(
+            user=user, configuration=configuration, status=Credential.Status.INVALIDATED
+        )
+        CredentialConfigurationStats.objects.filter(configuration=configuration).update(error_count=5)
+
+        stats = CredentialConfigurationStats.reconcile(configuration.id)
+
+        assert stats.reconciled_at is not None
+        assert self._get_counts(configuration) == {
+            Credential.Status.AVAILABLE: 1,
+            archived_credential.status: 1,
+        }
+
+
+@pytest.mark.django_db
+class TestLearnerProgressSnapshot:
+    """Tests for the LearnerProgressSnapshot model."""
+
+    @staticmethod
+    def _get_snapshots(configuration: CredentialConfiguration) -> dict[int, tuple[dict, bool]]:
+        """Get the stored progress and eligibility of each user."""
+        return {
+            snapshot.user_id: (snapshot.progress, snapshot.is_eligible)
+            for snapshot in LearnerProgressSnapshot.objects.filter(configuration=configuration)
+        }
+
+    def test_str_representation(self, mock_credential_config: CredentialConfiguration, user: User):
+        """Test the string representation of a snapshot."""
+        (snapshot,) = LearnerProgressSnapshot.save_results(mock_credential_config, [(user.id, {})])
+        assert str(snapshot) == f'Progress of {user.id} in {mock_credential_config.id}'
+
+    def test_save_results_updates_existing_snapshots(
+        self, mock_credential_config: CredentialConfiguration, users: list[User]
+    ):
+        """Test that the existing snapshot of a user is updated instead of creating another one."""
+        LearnerProgressSnapshot.save_results(mock_credential_config, [(users[0].id, {'is_eligible': False})])
+        computed_at = LearnerProgressSnapshot.objects.get(user=users[0]).computed_at
+
+        LearnerProgressSnapshot.save_results(
+            mock_credential_config,
+            [(users[0].id, {'is_eligible': True, 'current_completion': 1.0}), (users[1].id, {})],
+        )
+
+        assert self._get_snapshots(mock_credential_config) == {
+            users[0].id: ({'is_eligible': True, 'current_completion': 1.0}, True),
+            users[1].id: ({}, False),
+        }
+        assert LearnerProgressSnapshot.objects.get(user=users[0]).computed_at > computed_at
+
+    def test_save_results_without_conflict_target(self, mock_credential_config: CredentialConfiguration, user: User):
+        """Test that the conflict target is omitted on databases that do not support it (e.g., MySQL)."""
+        with (
+            patch.object(connection.features, 'supports_update_conflicts_with_target', new=False),
+            patch.object(QuerySet, 'bulk_create', autospec=True) as mock_bulk_create,
+        ):
+            LearnerProgressSnapshot.save_results(mock_credential_config, [(user.id, {})])
+
+        assert 'unique_fields' not in mock_bulk_create.call_args.kwargs
+        assert mock_bulk_create.call_args.kwargs['update_conflicts'] is True
+
+    def test_get_current_snapshots(self, mock_credential_config: CredentialConfiguration, users: list[User]):
+        """Test that the snapshots older than the maximum age are not current, unless the age is not limited."""
+        LearnerProgressSnapshot.save_results(mock_credential_config, [(users[0].id, {}), (users[1].id, {})])
+        LearnerProgressSnapshot.objects.filter(user=users[1]).update(computed_at=timezone.now() - timedelta(seconds=61))
+
+        with override_settings(LEARNING_CREDENTIALS_PROGRESS_SNAPSHOT_MAX_AGE=60):
+            assert [snapshot.user_id for snapshot in LearnerProgressSnapshot.get_current_snapshots()] == [users[0].id]
+        with override_settings(LEARNING_CREDENTIALS_PROGRESS_SNAPSHOT_MAX_AGE=None):
+            assert LearnerProgressSnapshot.get_current_snapshots().count() == 2
+
+    def test_configuration_options_change_deletes_snapshots(
+        self, grade_config: CredentialConfiguration, completion_config: CredentialConfiguration, user: User
+    ):
+        """Test that the snapshots of a configuration are deleted when its options change."""
+        LearnerProgressSnapshot.save_results(grade_config, [(user.id, {})])
+        LearnerProgressSnapshot.save_results(completion_config, [(user.id, {})])
+
+        grade_config.save()
+        assert self._get_snapshots(grade_config)
+
+        grade_config.custom_options = {'required_grades': {'Final Exam': 70}}
+        grade_config.save()
+        assert not self._get_snapshots(grade_config)
+        assert self._get_snapshots(completion_config)
+
+    def test_credential_type_change_deletes_snapshots(
+        self, grade_config: CredentialConfiguration, completion_config: CredentialConfiguration, user: User
+    ):
+        """Test that the snapshots of the configurations of a credential type are deleted when its options change."""
+        LearnerProgressSnapshot.save_results(grade_config, [(user.id, {})])
+        LearnerProgressSnapshot.save_results(completion_config, [(user.id, {})])
+        credential_type = grade_config.credential_type
+
+        credential_type.name = 'Renamed'
+        credential_type.save()
+        assert self._get_snapshots(grade_config)
+
+        credential_type.custom_options = {**credential_type.custom_options, 'required_grades': {'total': 0.5}}
+        credential_type.save()
+        assert not self._get_snapshots(grade_config)
+        assert self._get_snapshots(completion_config)
+
+    @override_settings(LEARNING_CREDENTIALS_BULK_WRITE_BATCH_SIZE=2)
+    def test_iter_and_save_results(self, mock_credential_config: CredentialConfiguration, users: list[User]):
+        """Test that the results are saved in batches while they are consumed."""
+        results = [(user.id, {'is_eligible': True}) for user in users[:3]]
+        iterator = LearnerProgressSnapshot.iter_and_save_results(mock_credential_config, iter(results))
+
+        assert [next(iterator), next(iterator)] == results[:2]
+        assert not LearnerProgressSnapshot.objects.exists()
+
+        assert next(iterator) == results[2]
+        assert LearnerProgressSnapshot.objects.count() == 2
+
+        assert list(iterator) == []
+        assert set(self._get_snapshots(mock_credential_config)) == {user.id for user in users[:3]}
+
+        assert list(LearnerProgressSnapshot.iter_and_save_results(mock_credential_config, [])) == []
+
+    @override_settings(LEARNING_CREDENTIALS_PROGRESS_SNAPSHOTS=True)
+    def test_iter_eligible_user_ids_saves_snapshots(
+        self, mock_credential_config: CredentialConfiguration, users: list[User]
+    ):
+        """Test that the progress of all retrieved users is saved during the generation."""
+        results = [(users[0].id, {'is_eligible': True}), (users[1].id, {'is_eligible': False})]
+        with patch.object(CredentialConfiguration, 'iter_retrieval_results', return_value=iter(results)):
+            assert list(mock_credential_config.iter_eligible_user_ids()) == [users[0].id]
+
+        assert self._get_snapshots(mock_credential_config) == {
+            users[0].id: ({'is_eligible': True}, True),
+            users[1].id: ({'is_eligible': False}, False),
+        }
+
+    @pytest.mark.parametrize('enabled', [True, False])
+    def test_get_user_eligibility_details_saves_snapshot(
+        self, mock_credential_config: CredentialConfiguration, user: User, enabled: bool
+    ):
+        """Test that the progress retrieved for a single user is saved if the snapshots are enabled."""
+        with (
+            override_settings(LEARNING_CREDENTIALS_PROGRESS_SNAPSHOTS=enabled),
+            patch.object(CredentialConfiguration, '_call_retrieval_func', return_value={}),
+        ):
+            assert mock_credential_config.get_user_eligibility_details(user.id) == {'is_eligible': False}
+
+        expected_snapshots = {user.id: ({'is_eligible': False}, False)} if enabled else {}
+        assert self._get_snapshots(mock_credential_config) == expected_snapshots
+
+    @override_settings(LEARNING_CREDENTIALS_PROGRESS_SNAPSHOTS=True)
+    def test_get_users_eligibility_details_saves_snapshots(
+        self, mock_credential_config: CredentialConfiguration, users: list[User]
+    ):
+        """Test that the progress retrieved for multiple users is saved if the snapshots are enabled."""
+        with patch.object(
+            CredentialConfiguration, '_call_retrieval_func', return_value={users[0].id: {'is_eligible': True}}
+        ):
+            mock_credential_config.get_users_eligibility_details([users[0].id, users[1].id])
+
+        assert self._get_snapshots(mock_credential_config) == {
+            users[0].id: ({'is_eligible': True}, True),
+            users[1].id: ({'is_eligible': False}, False),
+        }
+
+
 class TestCredentialAsset:
     """Tests for the CredentialAsset model."""
 
@@ -536,37 +1002,164 @@ class TestCredentialAsset:
         assert "Asset with slug non-existent-slug does not exist" in str(exc.value)
 
     @pytest.mark.django_db
-    def test_template_assets_path_deletes_existing_file(self, temp_media: str):
-        """Test that template_assets_path deletes an existing file before returning the path."""
-        asset = CredentialAsset(description="Test Asset", asset_slug="test-asset-delete")
-        asset.asset = ContentFile(b"original content", name="original.pdf")
+    def test_template_assets_path_contains_content_hash(self, temp_media: str):
+        """Test that the asset file is stored in an immutable path containing the hash of its content."""
+        asset = CredentialAsset(description="Test Asset", asset_slug="test-asset-hash")
+        content = b"content"
+        asset.asset = ContentFile(content, name="initial.pdf")
+        asset.save()
+        asset.refresh_from_db()
+
+        content_hash = hashlib.sha256(content).hexdigest()
+        assert asset.content_hash == content_hash
+        assert asset.content_uploaded is not None
+        assert asset.asset.name == f'learning_credentials_template_assets/{asset.id}/{content_hash}/initial.pdf'
+        assert (Path(temp_media) / asset.asset.name).read_bytes() == content
+
+    @pytest.mark.django_db
+    def test_save_new_version_keeps_previous_version(self, temp_media: str):
+        """Test that uploading a new version keeps the previous one."""
+        original_content, new_content = b"original content", b"new content"
+        asset = CredentialAsset(description="Test Asset", asset_slug="test-asset-version")
+        asset.asset = ContentFile(original_content, name="template.pdf")
+        asset.save()
+        original_name = asset.asset.name
+
+        asset.asset = ContentFile(new_content, name="template.pdf")
+        asset.save()
+
+        assert asset.asset.name != original_name
+        assert asset.content_hash == hashlib.sha256(new_content).hexdigest()
+        assert (Path(temp_media) / original_name).read_bytes() == original_content
+
+    @pytest.mark.django_db
+    def test_save_same_content_keeps_current_file(self, temp_media: str):
+        """Test that uploading the same content again keeps the current file and its upload time."""
+        asset = CredentialAsset(description="Test Asset", asset_slug="test-asset-same-content")
+        asset.asset = ContentFile(b"content", name="template.pdf")
+        asset.save()
+        original_name = asset.asset.name
+        content_uploaded = asset.content_uploaded
+
+        asset.asset = ContentFile(b"content", name="template.pdf")
+        asset.save()
+        asset.refresh_from_db()
+
+        assert asset.asset.name == original_name
+        assert asset.content_uploaded == content_uploaded
+        assert [path.name for path in (Path(temp_media) / original_name).parent.iterdir()] == ['template.pdf']
+
+    @pytest.mark.django_db
+    def test_save_same_content_with_missing_file(self, temp_media: str):
+        """Test that the same content is stored again if the current file is missing."""
+        asset = CredentialAsset(description="Test Asset", asset_slug="test-asset-same-content-missing")
+        content = b"content"
+        asset.asset = ContentFile(content, name="template.pdf")
+        asset.save()
+        original_name = asset.asset.name
+        (Path(temp_media) / original_name).unlink()
+
+        asset.asset = ContentFile(content, name="template.pdf")
         asset.save()
 
-        target_filename = "test_file.pdf"
-        target_path = Path(temp_media) / 'learning_credentials_template_assets' / str(asset.id) / target_filename
+        assert asset.asset.name == original_name
+        assert (Path(temp_media) / original_name).read_bytes() == content
 
-        target_path.parent.mkdir(parents=True, exist_ok=True)
-        target_path.write_bytes(b"existing content")
+    @pytest.mark.django_db
+    def test_save_without_new_version(self, temp_media: str):
+        """Test that saving an asset without uploading a new file keeps its version."""
+        asset = CredentialAsset(description="Test Asset", asset_slug="test-asset-same-version")
+        asset.asset = ContentFile(b"content", name="template.pdf")
+        asset.save()
+        content_uploaded = asset.content_uploaded
+
+        asset.description = "Updated Description"
+        asset.save()
+
+        assert asset.content_uploaded == content_uploaded
+
+    @pytest.mark.django_db
+    def test_delete_old_versions(self, temp_media: str):
+        """Test that the previous versions are only deleted after the grace period."""
+        asset = CredentialAsset(description="Test Asset", asset_slug="test-asset-old-versions")
+        asset.asset = ContentFile(b"original content", name="template.pdf")
+        asset.save()
+        original_name = asset.asset.name
+        # A file uploaded before the asset paths contained the content hash.
+        legacy_path = Path(temp_media) / 'learning_credentials_template_assets' / str(asset.id) / 'legacy.pdf'
+        legacy_path.write_bytes(b"legacy content")
+
+        new_content = b"new content"
+        asset.asset = ContentFile(new_content, name="template.pdf")
+        asset.save()
+
+        assert asset.delete_old_versions() == []
+
+        with override_settings(LEARNING_CREDENTIALS_ASSET_GRACE_PERIOD=0):
+            assert sorted(asset.delete_old_versions()) == sorted(
+                [original_name, f'learning_credentials_template_assets/{asset.id}/legacy.pdf']
+            )
 
-        assert target_path.exists()
+        assert not (Path(temp_media) / original_name).exists()
+        assert not legacy_path.exists()
+        assert (Path(temp_media) / asset.asset.name).read_bytes() == new_content
 
-        # This should delete the existing file.
-        new_path = asset.template_assets_path(target_filename)
+    @pytest.mark.django_db
+    @override_settings(LEARNING_CREDENTIALS_ASSET_GRACE_PERIOD=3600)
+    def test_delete_expired_versions(self, temp_media: str):
+        """Test that only the assets whose current version is older than the grace period are swept."""
+        old_names = []
+        for slug in ('test-asset-expired', 'test-asset-recent'):
+            asset = CredentialAsset(description="Test Asset", asset_slug=slug)
+            asset.asset = ContentFile(b"original content", name="template.pdf")
+            asset.save()
+            old_names.append(asset.asset.name)
+            asset.asset = ContentFile(b"new content", name="template.pdf")
+            asset.save()
+        CredentialAsset.objects.filter(asset_slug='test-asset-expired').update(
+            content_uploaded=timezone.now() - timedelta(hours=2)
+        )
 
-        assert not target_path.exists()
-        assert target_filename in new_path
+        assert CredentialAsset.delete_expired_versions() == [old_names[0]]
+        assert not (Path(temp_media) / old_names[0]).exists()
+        assert (Path(temp_media) / old_names[1]).exists()
 
     @pytest.mark.django_db
-    def test_template_assets_path_when_file_does_not_exist(self, temp_media: str):
-        """Test that template_assets_path works when no file exists at the target path."""
-        asset = CredentialAsset(description="Test Asset", asset_slug="test-asset-no-file")
-        asset.asset = ContentFile(b"content", name="initial.pdf")
+    @override_settings(LEARNING_CREDENTIALS_ASSET_GRACE_PERIOD=3600)
+    def test_delete_expired_versions_of_legacy_asset(self, temp_media: str):
+        """Test that legacy assets without an upload time are swept based on their last modification."""
+        asset = CredentialAsset(description="Test Asset", asset_slug="test-asset-legacy")
+        asset.asset = ContentFile(b"content", name="template.pdf")
         asset.save()
+        directory = Path(temp_media) / 'learning_credentials_template_assets' / str(asset.id)
+        (directory / 'current.pdf').write_bytes(b"current content")
+        (directory / 'previous.pdf').write_bytes(b"previous content")
+        shutil.rmtree(directory / asset.content_hash)
+        CredentialAsset.objects.filter(pk=asset.pk).update(
+            asset=f'learning_credentials_template_assets/{asset.id}/current.pdf',
+            content_hash='',
+            content_uploaded=None,
+            modified=timezone.now() - timedelta(minutes=30),
+        )
+
+        assert CredentialAsset.delete_expired_versions() == []
+
+        CredentialAsset.objects.filter(pk=asset.pk).update(modified=timezone.now() - timedelta(hours=2))
+        assert CredentialAsset.delete_expired_versions() == [
+            f'learning_credentials_template_assets/{asset.id}/previous.pdf'
+        ]
+        assert [path.name for path in directory.iterdir()] == ['current.pdf']
 
-        new_path = asset.template_assets_path("nonexistent.pdf")
+    @pytest.mark.django_db
+    @override_settings(LEARNING_CREDENTIALS_ASSET_GRACE_PERIOD=0)
+    def test_delete_old_versions_without_files(self, temp_media: str):
+        """Test that nothing is deleted for assets whose files are missing."""
+        asset = CredentialAsset(description="Test Asset", asset_slug="test-asset-missing-files")
+        asset.asset = ContentFile(b"content", name="template.pdf")
+        asset.save()
+        shutil.rmtree(Path(temp_media) / 'learning_credentials_template_assets')
 
-        assert "nonexistent.pdf" in new_path
-        assert str(asset.id) in new_path
+        assert asset.delete_old_versions() == []
 
     @pytest.mark.django_db
     def test_save_updates_existing_asset(self, temp_media: str):
@@ -2,28 +2,40 @@
 
 from __future__ import annotations
 
+import threading
 from typing import TYPE_CHECKING
 from unittest.mock import Mock, call, patch
 
 import pytest
 from django.http import QueryDict
+from django.test import override_settings
 from opaque_keys.edx.keys import CourseKey
 
 # noinspection PyProtectedMember
 from learning_credentials.processors import (
-    _are_grades_passing_criteria,
     _get_category_weights,
     _get_grades_by_format,
+    _iter_grade_matrix_progress,
+    _iter_grades_by_format,
     _prepare_request_to_completion_aggregator,
+    collect_progress,
+    get_streaming_variant,
+    iter_progress,
+    restrict_to_users,
     retrieve_completions,
     retrieve_completions_and_grades,
     retrieve_subsection_grades,
+    stream_completions,
+    stream_completions_and_grades,
+    stream_subsection_grades,
 )
+from learning_credentials.progress_cache import progress_cache_scope
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator
 
     from django.contrib.auth.models import User
+    from learning_paths.keys import LearningPathKey
     from learning_paths.models import LearningPath
 
 
@@ -65,7 +77,34 @@ def test_get_grades_by_format(mock_get_course_grade: Mock, mock_prefetch_course_
     )
 
 
-_are_grades_passing_criteria_test_data = [
+@patch('learning_credentials.processors.prefetch_course_grades')
+@patch('learning_credentials.processors.get_course_grade')
+def test_iter_grades_by_format_prefetches_in_chunks(mock_get_course_grade: Mock, mock_prefetch_course_grades: Mock):
+    """Test that grades are prefetched and cleared one chunk of users at a time."""
+    course_id = Mock(spec=CourseKey)
+    users = [Mock(id=user_id) for user_id in range(1, 6)]
+    mock_get_course_grade.return_value.graded_subsections_by_format.return_value = {
+        'Homework': {'subsection1': Mock(graded_total=Mock(earned=1.0, possible=2.0))},
+    }
+
+    stream = _iter_grades_by_format(course_id, iter(users), chunk_size=2)
+
+    # Nothing is prefetched until the stream is consumed.
+    mock_prefetch_course_grades.assert_not_called()
+    assert next(stream) == (1, {'homework': 50.0})
+    mock_prefetch_course_grades.assert_called_once_with(course_id, users[:2])
+
+    assert dict(stream) == {user_id: {'homework': 50.0} for user_id in range(2, 6)}
+    assert mock_prefetch_course_grades.call_args_list == [
+        call(course_id, users[:2]),
+        call(course_id, users[2:4]),
+        call(course_id, users[4:]),
+    ]
+    # Each prefetched chunk is cleared before the next one is prefetched.
+    assert mock_prefetch_course_grades.return_value.__exit__.call_count == 3
+
+
+_grade_criteria_test_data = [
     (
         "All grades are passing",
         {"homework": 90, "lab": 90, "exam": 90},
@@ -128,10 +167,10 @@ _are_grades_passing_criteria_test_data = [
 
 @pytest.mark.parametrize(
     ('desc', 'user_grades', 'required_grades', 'category_weights', 'expected'),
-    _are_grades_passing_criteria_test_data,
-    ids=[i[0] for i in _are_grades_passing_criteria_test_data],
+    _grade_criteria_test_data,
+    ids=[i[0] for i in _grade_criteria_test_data],
 )
-def test_are_grades_passing_criteria(
+def test_grade_matrix_progress(
     desc: str,  # noqa: ARG001
     user_grades: dict[str, float],
     required_grades: dict[str, float],
@@ -139,26 +178,91 @@ def test_are_grades_passing_criteria(
     expected: bool,
 ):
     """Test that the user grades are compared to the required grades correctly."""
-    assert _are_grades_passing_criteria(user_grades, required_grades, category_weights) == expected
+    total = sum(grade * category_weights[category] for category, grade in user_grades.items())
+
+    result = dict(_iter_grade_matrix_progress([(1, user_grades)], required_grades, category_weights))
+
+    assert result[1] == {
+        'is_eligible': expected,
+        'current_grades': {**user_grades, 'total': pytest.approx(total)},
+        'required_grades': required_grades,
+    }
 
 
-def test_are_grades_passing_criteria_invalid_grade_category():
-    """Test that an exception is raised if user grades contain a category that is not defined in the grading policy."""
+@pytest.mark.parametrize(
+    ('desc', 'user_grades', 'required_grades', 'category_weights', 'expected'),
+    _grade_criteria_test_data,
+    ids=[i[0] for i in _grade_criteria_test_data],
+)
+def test_grade_matrix_progress_does_not_depend_on_other_users(
+    desc: str,  # noqa: ARG001
+    user_grades: dict[str, float],
+    required_grades: dict[str, float],
+    category_weights: dict[str, float],
+    expected: bool,  # noqa: ARG001
+):
+    """Test that the progress of a user is the same regardless of the other users evaluated in the same chunk."""
+    alone = dict(_iter_grade_matrix_progress([(1, user_grades)], required_grades, category_weights))
+    grades = [(2, dict.fromkeys(reversed(category_weights), 100.0)), (1, user_grades), (3, {})]
+    result = dict(_iter_grade_matrix_progress(grades, required_grades, category_weights))
+
+    assert result[1] == alone[1]
+
+
+@pytest.mark.parametrize(
+    'grades',
+    [
+        [(1, {"homework": 90, "unknown_category": 90})],
+        [(1, {"unknown_category": 90, "homework": 10})],
+        [(2, {"homework": 80, "lab": 90}), (1, {"homework": 10, "unknown_category": 90})],
+    ],
+    ids=['passing', 'failing', 'after another user'],
+)
+def test_grade_matrix_invalid_grade_category(grades: list[tuple[int, dict[str, float]]]):
+    """Test that an exception is raised if a user has a grade in a category missing in the grading policy."""
     with pytest.raises(ValueError, match='unknown_category'):
-        _are_grades_passing_criteria(
-            {"homework": 90, "unknown_category": 90},
-            {"total": 175},
-            {"homework": 0.5, "lab": 0.5},
-        )
+        list(_iter_grade_matrix_progress(grades, {"homework": 50}, {"homework": 0.5, "lab": 0.5}))
 
 
-@patch('learning_credentials.processors.get_course_enrollments')
-@patch('learning_credentials.processors._get_grades_by_format')
+def test_grade_matrix_unknown_category_without_required_categories():
+    """Test that an unknown category does not raise an error for users who did not attempt the required categories."""
+    grades = [(1, {"unknown_category": 90}), (2, {"homework": 60})]
+
+    result = dict(_iter_grade_matrix_progress(grades, {"homework": 50}, {"homework": 1.0}))
+
+    assert [progress['is_eligible'] for progress in result.values()] == [False, True]
+
+
+def test_grade_matrix_progress_in_chunks():
+    """Test that the users are evaluated one chunk at a time, and the categories of each chunk are independent."""
+    grades = iter([(1, {"homework": 60}), (2, {"lab": 40}), (3, {"lab": 90})])
+
+    progress = _iter_grade_matrix_progress(grades, {"lab": 50}, {"homework": 0.5, "lab": 0.5}, chunk_size=2)
+
+    assert next(progress)[1]['current_grades'] == {'homework': 60, 'total': 30}
+    assert next(grades) == (3, {"lab": 90})  # Only the first chunk is read.
+    assert list(progress) == [
+        (2, {'is_eligible': False, 'current_grades': {'lab': 40, 'total': 20}, 'required_grades': {"lab": 50}}),
+    ]
+
+
+def test_grade_matrix_required_category_not_graded_for_anyone():
+    """Test that no user is eligible if nobody has a grade in a required category."""
+    grades = [(1, {"homework": 100}), (2, {})]
+
+    result = dict(_iter_grade_matrix_progress(grades, {"exam": 50}, {"homework": 0.5, "exam": 0.5}))
+
+    assert [progress['is_eligible'] for progress in result.values()] == [False, False]
+    assert result[2]['current_grades'] == {'total': 0}
+
+
+@patch('learning_credentials.processors.iter_course_enrollments')
+@patch('learning_credentials.processors._iter_grades_by_format')
 @patch('learning_credentials.processors._get_category_weights')
 def test_retrieve_subsection_grades(
     mock_get_category_weights: Mock,
-    mock_get_grades_by_format: Mock,
-    mock_get_course_enrollments: Mock,
+    mock_iter_grades_by_format: Mock,
+    mock_iter_course_enrollments: Mock,
 ):
     """Test that the function returns detailed eligibility results for users."""
     course_id = Mock(spec=CourseKey)
@@ -176,8 +280,8 @@ def test_retrieve_subsection_grades(
     }
     weights = {'homework': 0.2, 'exam': 0.7, 'lab': 0.1}
 
-    mock_get_course_enrollments.return_value = users
-    mock_get_grades_by_format.return_value = grades
+    mock_iter_course_enrollments.return_value = iter(users)
+    mock_iter_grades_by_format.return_value = iter(grades.items())
     mock_get_category_weights.return_value = weights
 
     result = retrieve_subsection_grades(course_id, options)
@@ -188,18 +292,18 @@ def test_retrieve_subsection_grades(
     assert result[102]['is_eligible'] is False
     assert 'current_grades' in result[101]
     assert 'required_grades' in result[101]
-    mock_get_course_enrollments.assert_called_once_with(course_id, None)
-    mock_get_grades_by_format.assert_called_once_with(course_id, users)
+    mock_iter_course_enrollments.assert_called_once_with(course_id, None, user_ids=None)
+    mock_iter_grades_by_format.assert_called_once_with(course_id, mock_iter_course_enrollments.return_value, 1000)
     mock_get_category_weights.assert_called_once_with(course_id)
 
 
-@patch('learning_credentials.processors.get_course_enrollments')
-@patch('learning_credentials.processors._get_grades_by_format')
+@patch('learning_credentials.processors.iter_course_enrollments')
+@patch('learning_credentials.processors._iter_grades_by_format')
 @patch('learning_credentials.processors._get_category_weights')
 def test_retrieve_subsection_grades_unknown_grade_category(
     mock_get_category_weights: Mock,
-    mock_get_grades_by_format: Mock,
-    mock_get_course_enrollments: Mock,
+    mock_iter_grades_by_format: Mock,
+    mock_iter_course_enrollments: Mock,
 ):
     """Test that grade categories not in the grading policy are skipped in total calculation."""
     course_id = Mock(spec=CourseKey)
@@ -209,8 +313,8 @@ def test_retrieve_subsection_grades_unknown_grade_category(
     grades = {101: {'homework': 80.0, 'lab': 100.0}}
     weights = {'homework': 0.5, 'exam': 0.5}
 
-    mock_get_course_enrollments.return_value = users
-    mock_get_grades_by_format.return_value = grades
+    mock_iter_course_enrollments.return_value = iter(users)
+    mock_iter_grades_by_format.return_value = iter(grades.items())
     mock_get_category_weights.return_value = weights
 
     result = retrieve_subsection_grades(course_id, options)
@@ -228,7 +332,7 @@ def test_prepare_request_to_completion_aggregator():
     with (
         patch('learning_credentials.processors.get_user_model') as mock_get_user_model,
         patch(
-            'learning_credentials.processors.CompletionDetailView',
+            'completion_aggregator.api.v1.views.CompletionDetailView',
         ) as mock_view_class,
     ):
         staff_user = Mock(is_staff=True)
@@ -277,10 +381,9 @@ def test_retrieve_course_completions(
     mock_prepare_request_to_completion_aggregator.side_effect = [mock_view_page1, mock_view_page2]
 
     # Mock enrolled users to map usernames to IDs.
-    mock_get_course_enrollments.return_value = [
-        Mock(username='user1', id=1),
-        Mock(username='user2', id=2),
-        Mock(username='user3', id=3),
+    mock_get_course_enrollments.side_effect = [
+        [Mock(username='user1', id=1)],
+        [Mock(username='user2', id=2), Mock(username='user3', id=3)],
     ]
 
     result = retrieve_completions(course_id, options)
@@ -296,6 +399,22 @@ def test_retrieve_course_completions(
     )
     mock_view_page1.get.assert_called_once_with(mock_view_page1.request, str(course_id))
     mock_view_page2.get.assert_called_once_with(mock_view_page2.request, str(course_id))
+    # The usernames of each page are mapped to user IDs with a separate query.
+    assert mock_get_course_enrollments.call_args_list == [
+        call(course_id, user_ids=None, usernames=['user1']),
+        call(course_id, user_ids=None, usernames=['user2', 'user3', 'unenrolled_user']),
+    ]
+
+
+@patch('learning_credentials.processors._prepare_request_to_completion_aggregator')
+@patch('learning_credentials.processors.get_course_enrollments', return_value=[])
+def test_retrieve_course_completions_single_unenrolled_user(mock_enrollments: Mock, mock_aggregator_request: Mock):
+    """Test that the Completion Aggregator API is not queried for a user who is not enrolled in the course."""
+    course_id = Mock(spec=CourseKey)
+
+    assert retrieve_completions(course_id, {}, user_id=1) == {}
+    mock_enrollments.assert_called_once_with(course_id, 1, user_ids=None)
+    mock_aggregator_request.assert_not_called()
 
 
 @patch('learning_credentials.processors._prepare_request_to_completion_aggregator')
@@ -324,6 +443,144 @@ def test_retrieve_course_completions_single_user(
     )
 
 
+@patch('learning_credentials.processors.iter_course_enrollments', Mock())
+@patch('learning_credentials.processors._iter_grades_by_format')
+@patch('learning_credentials.processors._get_category_weights', return_value={'homework': 1.0})
+def test_retrieve_subsection_grades_shares_grades_within_run(
+    mock_get_category_weights: Mock, mock_iter_grades_by_format: Mock
+):
+    """Test that configurations with different options reuse the grades of a course within a run."""
+    course_id = Mock(spec=CourseKey)
+    mock_iter_grades_by_format.side_effect = lambda *_args: iter([(101, {'homework': 70.0})])
+
+    with progress_cache_scope('shared-grades-run'):
+        lenient = retrieve_subsection_grades(course_id, {'required_grades': {'homework': 0.5}})
+        strict = retrieve_subsection_grades(course_id, {'required_grades': {'homework': 0.8}})
+
+    assert lenient[101]['is_eligible'] is True
+    assert strict[101]['is_eligible'] is False
+    mock_iter_grades_by_format.assert_called_once()
+    mock_get_category_weights.assert_called_once_with(course_id)
+
+    # Without a run, the grades are retrieved again.
+    retrieve_subsection_grades(course_id, {'required_grades': {'homework': 0.5}})
+    assert mock_iter_grades_by_format.call_count == 2
+
+
+@patch('learning_credentials.processors._iter_completion_percents')
+def test_retrieve_completions_shares_completions_within_run(mock_iter_completion_percents: Mock):
+    """Test that configurations with different options reuse the completions of a course within a run."""
+    course_id = Mock(spec=CourseKey)
+    mock_iter_completion_percents.side_effect = lambda *_args: iter([(101, 0.85)])
+
+    with progress_cache_scope('shared-completions-run'):
+        lenient = retrieve_completions(course_id, {'required_completion': 0.8})
+        strict = retrieve_completions(course_id, {'required_completion': 0.9})
+
+    assert lenient[101]['is_eligible'] is True
+    assert strict[101]['is_eligible'] is False
+    mock_iter_completion_percents.assert_called_once_with(course_id, None)
+
+
+@override_settings(LEARNING_CREDENTIALS_PROGRESS_CACHE_MAX_ITEMS=1)
+@patch('learning_credentials.processors.iter_course_enrollments', Mock())
+@patch('learning_credentials.processors._iter_grades_by_format')
+@patch('learning_credentials.processors._get_category_weights', Mock(return_value={'homework': 1.0}))
+def test_grades_exceeding_progress_cache_are_not_shared(mock_iter_grades_by_format: Mock):
+    """Test that the grades are streamed again by each configuration when they do not fit in the progress cache."""
+    course_id = Mock(spec=CourseKey)
+    grades = [(101, {'homework': 70.0}), (102, {'homework': 90.0})]
+    mock_iter_grades_by_format.side_effect = lambda *_args: iter(grades)
+
+    with progress_cache_scope('large-course-run') as cache:
+        lenient = retrieve_subsection_grades(course_id, {'required_grades': {'homework': 0.5}})
+        strict = retrieve_subsection_grades(course_id, {'required_grades': {'homework': 0.8}})
+        assert len(cache) == 1  # Only the category weights are cached.
+
+    assert lenient[101]['is_eligible'] is True
+    assert lenient[102]['current_grades'] == {'homework': 90.0, 'total': 90.0}
+    assert strict[101]['is_eligible'] is False
+    assert strict[102]['is_eligible'] is True
+    assert mock_iter_grades_by_format.call_count == 2
+
+
+@override_settings(LEARNING_CREDENTIALS_PROGRESS_CACHE_MAX_ITEMS=1)
+@patch('learning_credentials.processors.iter_course_enrollments', Mock())
+@patch('learning_credentials.processors._iter_grades_by_format')
+@patch('learning_credentials.processors._get_category_weights', Mock(return_value={'homework': 1.0}))
+def test_grades_exceeding_progress_cache_are_spilled(mock_iter_grades_by_format: Mock):
+    """Test that the grades that do not fit in the progress cache are retrieved once if the run spills them."""
+    course_id = Mock(spec=CourseKey)
+    grades = [(101, {'homework': 70.0}), (102, {'homework': 90.0})]
+    mock_iter_grades_by_format.side_effect = lambda *_args: iter(grades)
+
+    with progress_cache_scope('spilled-course-run', spill=True):
+        lenient = retrieve_subsection_grades(course_id, {'required_grades': {'homework': 0.5}})
+        strict = retrieve_subsection_grades(course_id, {'required_grades': {'homework': 0.8}})
+
+    assert (lenient[101]['is_eligible'], lenient[102]['is_eligible']) == (True, True)
+    assert (strict[101]['is_eligible'], strict[102]['is_eligible']) == (False, True)
+    mock_iter_grades_by_format.assert_called_once()
+
+
+@pytest.mark.django_db
+@patch('learning_credentials.processors._iter_completion_percents')
+def test_learning_path_shares_course_completions_within_run(
+    mock_iter_completion_percents: Mock, learning_path_with_courses: LearningPath, users: list[User]
+):
+    """Test that learning paths reuse the completions retrieved for their courses within a run."""
+    course_keys = [step.course_key for step in learning_path_with_courses.steps.all()]
+    mock_iter_completion_percents.side_effect = lambda *_args: iter([(users[0].id, 1.0)])
+
+    with progress_cache_scope('shared-learning-path-run'):
+        for course_key in course_keys:
+            retrieve_completions(course_key, {})
+        result = retrieve_completions(learning_path_with_courses.key, {})
+        # The enrollments of the learning path are also shared, so changes are only visible in the next run.
+        learning_path_with_courses.enrolled_users.remove(users[0])
+        assert retrieve_completions(learning_path_with_courses.key, {}) == result
+
+    assert result[users[0].id]['is_eligible'] is True
+    assert mock_iter_completion_percents.call_count == len(course_keys)
+
+
+@patch('learning_credentials.processors.iter_course_enrollments', return_value=iter([]))
+@patch('learning_credentials.processors._get_category_weights', Mock(return_value={}))
+def test_restrict_to_users_restricts_enrollments(mock_iter_course_enrollments: Mock):
+    """Test that the enrollments of the restricted users are retrieved and cached separately."""
+    course_id = Mock(spec=CourseKey)
+    options = {'required_grades': {}}
+
+    with restrict_to_users([101, 102]):
+        list(stream_subsection_grades(course_id, options))
+        with progress_cache_scope('restricted-run'):
+            retrieve_subsection_grades(course_id, options)
+            with restrict_to_users([101]):
+                retrieve_subsection_grades(course_id, options)
+            retrieve_subsection_grades(course_id, options)
+
+    assert mock_iter_course_enrollments.call_args_list == [
+        call(course_id, None, user_ids=frozenset({101, 102})),
+        call(course_id, None, user_ids=frozenset({101, 102})),
+        call(course_id, None, user_ids=frozenset({101})),
+    ]
+
+
+@pytest.mark.django_db
+@patch('learning_credentials.processors._retrieve_course_completions')
+def test_restrict_to_users_in_learning_path(
+    mock_retrieve: Mock, learning_path_with_courses: LearningPath, users: list[User]
+):
+    """Test that only the restricted users of a learning path are processed."""
+    mock_retrieve.return_value = {user.id: {'is_eligible': True} for user in users}
+
+    with restrict_to_users([users[0].id, users[5].id]):
+        result = retrieve_completions(learning_path_with_courses.key, {})
+
+    # users[5] is not enrolled in the learning path.
+    assert list(result) == [users[0].id]
+
+
 @pytest.mark.parametrize(
     ('completion_results', 'grade_results', 'expected_eligible_ids'),
     [
@@ -402,11 +659,13 @@ def test_retrieve_data_for_learning_path(
         def make_results(user_indices: tuple) -> dict[int, dict]:
             return {users[i].id: {'is_eligible': True} for i in user_indices}
 
-        mock_retrieve.side_effect = [
-            make_results((0, 1, 2, 4, 5)),  # Users passing/completing course0
-            make_results((0, 1, 2, 3, 4, 5)),  # Users passing/completing course1
-            make_results((0, 2, 3, 4, 5)),  # Users passing/completing course2
-        ]
+        course_keys = [step.course_key for step in learning_path_with_courses.steps.all()]
+        results_by_course = {
+            course_keys[0]: make_results((0, 1, 2, 4, 5)),  # Users passing/completing course0
+            course_keys[1]: make_results((0, 1, 2, 3, 4, 5)),  # Users passing/completing course1
+            course_keys[2]: make_results((0, 2, 3, 4, 5)),  # Users passing/completing course2
+        }
+        mock_retrieve.side_effect = lambda course_key, _options, _user_id: results_by_course[course_key]
 
         result = function_to_test(learning_path_with_courses.key, options)
 
@@ -414,12 +673,13 @@ def test_retrieve_data_for_learning_path(
         # users[4] passes all 3 but enrollment is inactive. users[5] is not enrolled at all.
         eligible_ids = sorted(uid for uid, details in result.items() if details['is_eligible'])
         assert eligible_ids == [users[0].id, users[2].id]
+        # Step results are listed in the order of the steps, regardless of the order in which they finished.
+        assert list(result[users[0].id]['steps']) == [str(course_key) for course_key in course_keys]
 
         assert mock_retrieve.call_count == 3
-        course_keys = [step.course_key for step in learning_path_with_courses.steps.all()]
-        for i, course_key in enumerate(course_keys):
-            call_args = mock_retrieve.call_args_list[i]
-            assert call_args[0] == (course_key, options, None)
+        assert sorted(call_args[0] for call_args in mock_retrieve.call_args_list) == [
+            (course_key, options, None) for course_key in course_keys
+        ]
 
 
 @patch("learning_credentials.processors._retrieve_course_completions")
@@ -444,6 +704,134 @@ def test_retrieve_data_for_learning_path_with_step_options(
     retrieve_completions(learning_path_with_courses.key, options)
 
     assert mock_retrieve.call_count == 3
-    assert mock_retrieve.call_args_list[0][0] == (course_keys[0], options["steps"][str(course_keys[0])], None)
-    assert mock_retrieve.call_args_list[1][0] == (course_keys[1], options["steps"][str(course_keys[1])], None)
-    assert mock_retrieve.call_args_list[2][0] == (course_keys[2], options, None)
+    mock_retrieve.assert_any_call(course_keys[0], options["steps"][str(course_keys[0])], None)
+    mock_retrieve.assert_any_call(course_keys[1], options["steps"][str(course_keys[1])], None)
+    mock_retrieve.assert_any_call(course_keys[2], options, None)
+
+
+@pytest.mark.django_db
+def test_learning_path_steps_are_processed_concurrently(learning_path_with_courses: LearningPath):
+    """Test that the steps of a learning path are processed at the same time."""
+    all_steps_started = threading.Barrier(3, timeout=5)
+
+    def process_course(_course_key: CourseKey, _options: dict, _user_id: int | None) -> dict:
+        # This raises `BrokenBarrierError` if the steps are processed sequentially.
+        all_steps_started.wait()
+        return {}
+
+    with patch('learning_credentials.processors._retrieve_course_completions', side_effect=process_course):
+        assert retrieve_completions(learning_path_with_courses.key, {}) == {}
+
+
+@pytest.mark.django_db
+@override_settings(LEARNING_CREDENTIALS_LEARNING_PATH_MAX_WORKERS=1)
+@patch("learning_credentials.processors._retrieve_course_completions", return_value={})
+def test_learning_path_steps_are_processed_sequentially(mock_retrieve: Mock, learning_path_with_courses: LearningPath):
+    """Test that the steps of a learning path are processed in order when concurrency is disabled."""
+    retrieve_completions(learning_path_with_courses.key, {})
+
+    assert [call_args[0][0] for call_args in mock_retrieve.call_args_list] == [
+        step.course_key for step in learning_path_with_courses.steps.all()
+    ]
+
+
+@pytest.mark.parametrize(
+    'results',
+    [
+        {1: {'is_eligible': True}, 2: {'is_eligible': False}},
+        [(1, {'is_eligible': True}), (2, {'is_eligible': False})],
+        iter([(1, {'is_eligible': True}), (2, {'is_eligible': False})]),
+    ],
+    ids=['dict', 'list', 'iterator'],
+)
+def test_progress_adapters(results: dict | list | Iterator):
+    """Test that the adapters accept the results of both variants of the processor contract."""
+    expected = [(1, {'is_eligible': True}), (2, {'is_eligible': False})]
+    if isinstance(results, dict):
+        assert list(iter_progress(results)) == expected
+        assert collect_progress(results) is results
+    else:
+        assert collect_progress(results) == dict(expected)
+
+
+@pytest.mark.parametrize(
+    ('processor', 'stream'),
+    [
+        (retrieve_subsection_grades, stream_subsection_grades),
+        (retrieve_completions, stream_completions),
+        (retrieve_completions_and_grades, stream_completions_and_grades),
+    ],
+    ids=['subsection_grades', 'completions', 'completions_and_grades'],
+)
+def test_get_streaming_variant(processor: Callable, stream: Callable):
+    """Test that the built-in processors have registered streaming variants."""
+    assert get_streaming_variant(processor) is stream
+    assert get_streaming_variant(stream) is stream
+
+
+@override_settings(LEARNING_CREDENTIALS_GRADES_CHUNK_SIZE=1)
+@patch('learning_credentials.processors.iter_course_enrollments')
+@patch('learning_credentials.processors._iter_grades_by_format')
+@patch('learning_credentials.processors._get_category_weights', return_value={'total': 1})
+def test_stream_subsection_grades_for_course(
+    mock_get_category_weights: Mock, mock_iter_grades_by_format: Mock, mock_iter_course_enrollments: Mock
+):
+    """Test that grade progress is yielded while the grades are being retrieved."""
+    course_id = CourseKey.from_string('course-v1:OpenedX+DemoX+DemoCourse')
+
+    def grades():
+        yield 101, {'total': 90.0}
+        pytest.fail('The stream should be consumed lazily.')
+
+    mock_iter_grades_by_format.return_value = grades()
+
+    stream = stream_subsection_grades(course_id, {'required_grades': {'total': 0.8}})
+    uid, progress = next(stream)
+
+    assert uid == 101
+    assert progress['is_eligible'] is True
+    mock_iter_course_enrollments.assert_called_once_with(course_id, None, user_ids=None)
+    mock_get_category_weights.assert_called_once_with(course_id)
+
+
+@pytest.mark.parametrize(
+    ('patch_target', 'function_to_test'),
+    [
+        ("learning_credentials.processors.retrieve_subsection_grades", stream_subsection_grades),
+        ("learning_credentials.processors.retrieve_completions", stream_completions),
+    ],
+    ids=['subsection_grades', 'completions'],
+)
+def test_stream_learning_path_is_adapted(
+    patch_target: str, function_to_test: Callable, learning_path_key: LearningPathKey
+):
+    """Test that learning paths are processed by the dict-returning processors and adapted to a stream."""
+    with patch(patch_target, return_value={1: {'is_eligible': True}}) as mock_retrieve:
+        assert list(function_to_test(learning_path_key, {}, 1)) == [(1, {'is_eligible': True})]
+
+    mock_retrieve.assert_called_once_with(learning_path_key, {}, 1)
+
+
+@patch('learning_credentials.processors.stream_subsection_grades')
+@patch('learning_credentials.processors.stream_completions')
+def test_stream_completions_and_grades(mock_stream_completions: Mock, mock_stream_subsection_grades: Mock):
+    """Test that the combined progress is yielded for users present in both results."""
+    course_id = Mock(spec=CourseKey)
+    options = Mock()
+    mock_stream_completions.return_value = iter([(101, {'is_eligible': True}), (102, {'is_eligible': True})])
+    mock_stream_subsection_grades.return_value = iter([(102, {'is_eligible': False}), (103, {'is_eligible': True})])
+
+    result = list(stream_completions_and_grades(course_id, options))
+
+    assert result == [(102, {'is_eligible': False})]
+    mock_stream_completions.assert_called_once_with(course_id, options, None)
+    mock_stream_subsection_grades.assert_called_once_with(course_id, options, None)
+
+
+@patch('learning_credentials.processors._stream_course_completions')
+def test_stream_completions_for_course(mock_stream_course_completions: Mock, course_key: CourseKey):
+    """Test that course completions are streamed one API page at a time."""
+    options = {'required_completion': 0.8}
+
+    assert stream_completions(course_key, options, 1) is mock_stream_course_completions.return_value
+    mock_stream_course_completions.assert_called_once_with(course_key, options, 1)
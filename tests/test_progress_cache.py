@@ -0,0 +1,369 @@
+"""Tests for the run-scoped progress cache."""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+from unittest.mock import Mock, patch
+
+import pytest
+from django.test import override_settings
+
+from learning_credentials.concurrency import run_concurrently
+from learning_credentials.progress_cache import (
+    ProgressCache,
+    _get_shared_key,
+    get_active_progress_cache,
+    get_cached_progress,
+    get_scheduled_run_id,
+    progress_cache_scope,
+    request_progress_cache_scope,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_get_or_compute_stores_values():
+    """Test that values are computed once per key."""
+    cache = ProgressCache('run', max_entries=10, ttl=60)
+    compute = Mock(return_value='value')
+
+    assert cache.get_or_compute('key', compute) == 'value'
+    assert cache.get_or_compute('key', compute) == 'value'
+    compute.assert_called_once()
+
+    cache.delete('key')
+    assert cache.get('key') is None
+
+
+def test_get_or_compute_evicts_least_recently_used_entries():
+    """Test that the least recently used entries are evicted when the cache is full."""
+    cache = ProgressCache('run', max_entries=2, ttl=60)
+    cache.get_or_compute('a', lambda: 1)
+    cache.get_or_compute('b', lambda: 2)
+    cache.get_or_compute('a', lambda: 1)  # `b` is now the least recently used entry.
+    cache.get_or_compute('c', lambda: 3)
+
+    assert len(cache) == 2
+    assert cache.get_or_compute('a', lambda: 'recomputed') == 1
+    assert cache.get_or_compute('b', lambda: 'recomputed') == 'recomputed'
+
+
+def test_get_or_compute_concurrent_misses():
+    """Test that concurrent misses of a key wait for a single computation of the value."""
+    cache = ProgressCache('run', max_entries=10, ttl=60)
+    started, release = threading.Event(), threading.Event()
+
+    def compute() -> str:
+        started.set()
+        release.wait(timeout=5)
+        return 'value'
+
+    compute_mock = Mock(side_effect=compute)
+
+    def get_value(item: int) -> str:
+        if item:
+            # The second thread misses the key while the first one is computing it, and the computation finishes
+            # once the second thread is waiting for it.
+            started.wait(timeout=5)
+            threading.Timer(0.1, release.set).start()
+        return cache.get_or_compute('key', compute_mock)
+
+    results = dict(run_concurrently(get_value, [0, 1], max_workers=2))
+
+    assert results == {0: 'value', 1: 'value'}
+    compute_mock.assert_called_once_with()
+    assert cache._compute_locks == {}
+
+
+def test_get_or_compute_failure_releases_key():
+    """Test that a failed computation is not cached, and the key can be computed again."""
+    cache = ProgressCache('run', max_entries=10, ttl=60)
+
+    with pytest.raises(ValueError, match=r'Retrieval failed\.'):
+        cache.get_or_compute('key', Mock(side_effect=ValueError('Retrieval failed.')))
+
+    assert cache.get_or_compute('key', lambda: 'value') == 'value'
+    assert cache._compute_locks == {}
+
+
+def test_set_limits_total_items():
+    """Test that the entries are evicted when their items exceed the limit, and larger values are not stored."""
+    cache = ProgressCache('run', max_entries=10, ttl=60, max_items=3)
+    cache.set('a', [1, 2])
+    cache.set('b', 'value')
+    cache.set('c', [1, 2])  # `a` is evicted to keep the total number of items within the limit.
+
+    assert cache.get('a') is None
+    assert (cache.get('b'), cache.get('c')) == ('value', [1, 2])
+
+    cache.set('c', [1, 2, 3, 4])  # The value is too large, so the previous one is also removed.
+    assert cache.get('c') is None
+    assert cache._items == 1
+
+
+def test_iter_or_compute_stores_items():
+    """Test that the items are streamed while they are computed, and they are reused afterward."""
+    cache = ProgressCache('run', max_entries=10, ttl=60, max_items=3)
+    compute = Mock(side_effect=lambda: iter([1, 2, 3]))
+
+    stream = cache.iter_or_compute('key', compute)
+    assert next(stream) == 1
+    assert cache.get('key') is None  # The items are only stored once all of them are retrieved.
+    assert list(stream) == [2, 3]
+
+    assert list(cache.iter_or_compute('key', compute)) == [1, 2, 3]
+    compute.assert_called_once()
+
+
+def test_iter_or_compute_does_not_store_too_many_items():
+    """Test that the items are not stored if there are more of them than the cache can hold."""
+    cache = ProgressCache('run', max_entries=10, ttl=60, max_items=2)
+    compute = Mock(side_effect=lambda: iter([1, 2, 3, 4]))
+
+    assert list(cache.iter_or_compute('key', compute)) == [1, 2, 3, 4]
+    assert list(cache.iter_or_compute('key', compute)) == [1, 2, 3, 4]
+    assert compute.call_count == 2
+    assert len(cache) == 0
+
+
+def test_iter_or_compute_spills_too_many_items():
+    """Test that the items that do not fit in the cache are written to a temporary file and read back from it."""
+    cache = ProgressCache('run', max_entries=10, ttl=60, max_items=2)
+    cache.spill = True
+    items = [(1, {'a': 1.0}), (2, {}), (3, {'b': 0.5}), (4, {'a': 0.0})]
+    compute = Mock(side_effect=lambda: iter(items))
+
+    assert list(cache.iter_or_compute('key', compute)) == items
+    assert list(cache.iter_or_compute('key', compute)) == items
+    compute.assert_called_once()
+    assert len(cache) == 0
+
+    spilled_path = cache._spilled['key']
+    cache.clear()
+    assert not spilled_path.exists()
+    assert cache._spilled == {}
+
+
+def test_iter_or_compute_replaces_spilled_items():
+    """Test that concurrent misses of a key keep the file of the last finished retrieval."""
+    cache = ProgressCache('run', max_entries=10, ttl=60, max_items=1)
+    cache.spill = True
+
+    first_stream = cache.iter_or_compute('key', lambda: iter([1, 2]))
+    second_stream = cache.iter_or_compute('key', lambda: iter([3, 4]))
+    assert next(first_stream) == 1
+    assert list(second_stream) == [3, 4]
+    first_spilled_path = cache._spilled['key']
+    assert list(first_stream) == [2]
+
+    assert not first_spilled_path.exists()
+    assert list(cache.iter_or_compute('key', Mock(side_effect=AssertionError))) == [1, 2]
+    cache.clear()
+
+
+@patch('learning_credentials.progress_cache.tempfile.NamedTemporaryFile')
+def test_iter_or_compute_removes_incomplete_spill(mock_temporary_file: Mock, tmp_path: Path):
+    """Test that the file of an abandoned retrieval is removed, and the items are retrieved again."""
+    spilled_path = tmp_path / 'spilled'
+    mock_temporary_file.side_effect = lambda **_kwargs: spilled_path.open('wb')
+    cache = ProgressCache('run', max_entries=10, ttl=60, max_items=1)
+    cache.spill = True
+
+    stream = cache.iter_or_compute('key', lambda: iter([1, 2, 3]))
+    assert next(stream) == 1
+    assert next(stream) == 2
+    assert spilled_path.exists()
+    stream.close()
+
+    assert not spilled_path.exists()
+    assert cache._spilled == {}
+
+
+@patch('learning_credentials.progress_cache.time.monotonic')
+def test_get_or_compute_expires_entries(mock_monotonic: Mock):
+    """Test that the entries are recomputed once they are older than the TTL."""
+    cache = ProgressCache('run', max_entries=10, ttl=60)
+    mock_monotonic.return_value = 100
+    cache.get_or_compute('key', lambda: 'old')
+
+    mock_monotonic.return_value = 159
+    assert cache.get_or_compute('key', lambda: 'new') == 'old'
+
+    mock_monotonic.return_value = 160
+    assert cache.get_or_compute('key', lambda: 'new') == 'new'
+
+
+@override_settings(
+    LEARNING_CREDENTIALS_PROGRESS_CACHE_MAX_ENTRIES=5,
+    LEARNING_CREDENTIALS_PROGRESS_CACHE_MAX_ITEMS=100,
+    LEARNING_CREDENTIALS_PROGRESS_CACHE_TTL=10,
+)
+def test_for_run_replaces_cache_of_previous_run():
+    """Test that the tasks of a run share the cache, and a new run starts with an empty one."""
+    cache = ProgressCache.for_run('first-run')
+    cache.get_or_compute('key', lambda: 'value')
+
+    assert ProgressCache.for_run('first-run') is cache
+    assert (cache.max_entries, cache.max_items, cache.ttl) == (5, 100, 10)
+
+    new_cache = ProgressCache.for_run('second-run')
+    assert new_cache is not cache
+    assert len(new_cache) == 0
+    assert len(cache) == 0
+
+
+def test_progress_cache_scope():
+    """Test that the cache is only active within the scope, and it is shared with worker threads."""
+    assert get_active_progress_cache() is None
+
+    with progress_cache_scope('scope-run') as cache:
+        assert get_active_progress_cache() is cache
+        results = dict(run_concurrently(lambda _item: get_active_progress_cache(), [1, 2], max_workers=2))
+        assert results == {1: cache, 2: cache}
+
+    assert get_active_progress_cache() is None
+
+
+def test_progress_cache_scope_enables_spill():
+    """Test that the spilling is enabled for the run once any scope of the run requests it."""
+    with progress_cache_scope('spilled-run') as cache:
+        assert cache.spill is False
+        with progress_cache_scope('spilled-run', spill=True):
+            assert cache.spill is True
+        with progress_cache_scope('spilled-run'):
+            assert cache.spill is True
+
+
+def test_progress_cache_scope_drops_run_cache():
+    """Test that the cache of a run is dropped once the last scope using it exits."""
+    with progress_cache_scope('dropped-run') as cache:
+        cache.set('key', 'value')
+        with progress_cache_scope('dropped-run') as nested_cache:
+            assert nested_cache is cache
+        assert cache.get('key') == 'value'
+        assert ProgressCache._run_cache is cache
+
+    assert ProgressCache._run_cache is None
+    assert len(cache) == 0
+
+
+def test_progress_cache_scope_shares_entries_between_processes():
+    """Test that the entries of a run outlive its scopes in the Django cache, and other runs do not see them."""
+    with progress_cache_scope('shared-run') as cache:
+        cache.set('key', 'value')
+        cache.set('deleted-key', 'value')
+        cache.delete('deleted-key')
+
+    # A scope of the same run in another process (or in a later task) starts with an empty memory.
+    with progress_cache_scope('shared-run') as cache:
+        assert len(cache) == 0
+        assert cache.get_or_compute('key', Mock(side_effect=AssertionError)) == 'value'
+        assert len(cache) == 1
+        assert cache.get('deleted-key') is None
+
+    with progress_cache_scope('other-run') as cache:
+        assert cache.get('key') is None
+
+
+@patch('learning_credentials.progress_cache.time.time')
+@patch('learning_credentials.progress_cache.time.monotonic')
+def test_shared_entries_keep_their_age(mock_monotonic: Mock, mock_time: Mock):
+    """Test that the entries read from the Django cache expire at the same time as in the process that stored them."""
+    mock_monotonic.return_value, mock_time.return_value = 100, 1000
+    ProgressCache('aged-run', max_entries=10, ttl=60, shared=True).set('key', 'value')
+
+    mock_monotonic.return_value, mock_time.return_value = 500, 1050
+    cache = ProgressCache('aged-run', max_entries=10, ttl=60, shared=True)
+    assert cache.get('key') == 'value'
+    assert cache._entries['key'][0] == 450
+
+
+def test_shared_key_does_not_depend_on_set_order():
+    """Test that the keys containing sets of user IDs are the same in all processes."""
+    assert _get_shared_key('run', ('course', 'grades', frozenset([3, 1, 2]))) == _get_shared_key(
+        'run', ('course', 'grades', frozenset([2, 3, 1]))
+    )
+    assert _get_shared_key('run', 'key') != _get_shared_key('other-run', 'key')
+
+
+@override_settings(LEARNING_CREDENTIALS_PROGRESS_CACHE_TTL=60)
+@patch('learning_credentials.progress_cache.time.time')
+def test_get_scheduled_run_id(mock_time: Mock):
+    """Test that the scheduled tasks started within the same TTL window share a run."""
+    mock_time.return_value = 120
+    first_run_id = get_scheduled_run_id()
+    mock_time.return_value = 179
+    assert get_scheduled_run_id() == first_run_id
+    mock_time.return_value = 180
+    assert get_scheduled_run_id() != first_run_id
+
+
+def test_progress_cache_scope_without_run():
+    """Test that the cache is not used when there is no run ID."""
+    compute = Mock(return_value='value')
+
+    with progress_cache_scope(None) as cache:
+        assert cache is None
+        get_cached_progress('key', compute)
+        get_cached_progress('key', compute)
+
+    assert compute.call_count == 2
+
+
+def test_get_cached_progress():
+    """Test that the progress data is cached within the scope of a run."""
+    compute = Mock(return_value='value')
+
+    with progress_cache_scope('cached-progress-run'):
+        assert get_cached_progress('key', compute) == 'value'
+        assert get_cached_progress('key', compute) == 'value'
+
+    compute.assert_called_once()
+
+
+def test_invalidate_removes_entry_from_run_cache():
+    """Test that an entry can be removed from the cache of the current run."""
+    cache = ProgressCache.for_run('invalidated-run')
+    cache.set('key', 'value')
+    cache.set('other-key', 'other-value')
+
+    ProgressCache.invalidate('key')
+
+    assert cache.get('key') is None
+    assert cache.get('other-key') == 'other-value'
+
+
+def test_invalidate_without_run_cache():
+    """Test that the entry of the scheduled run is removed even if no run has started in this process."""
+    ProgressCache.from_settings(get_scheduled_run_id(), shared=True).set('key', 'value')
+
+    with patch.object(ProgressCache, '_run_cache', None):
+        ProgressCache.invalidate('key')
+        assert ProgressCache._run_cache is None
+
+    assert ProgressCache.from_settings(get_scheduled_run_id(), shared=True).get('key') is None
+
+
+def test_request_progress_cache_scope():
+    """Test that each request uses a new cache, which does not replace the cache of the current run."""
+    run_cache = ProgressCache.for_run('request-run')
+
+    with request_progress_cache_scope() as cache:
+        assert get_active_progress_cache() is cache
+        assert cache is not run_cache
+        cache.set('key', 'value')
+
+    with request_progress_cache_scope() as new_cache:
+        assert new_cache is not cache
+        assert new_cache.get('key') is None
+
+    assert ProgressCache.for_run('request-run') is run_cache
+    assert get_active_progress_cache() is None
+
+
+def test_request_progress_cache_scope_reuses_active_cache():
+    """Test that the active cache is used if the request scope is entered within another scope."""
+    with progress_cache_scope('outer-run') as run_cache, request_progress_cache_scope() as cache:
+        assert cache is run_cache
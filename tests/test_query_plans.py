@@ -0,0 +1,131 @@
+"""
+Query-plan regression tests for the hot queries on the Credential table.
+
+Each test runs ``EXPLAIN`` on a query executed in a hot path and fails if the database would read the whole credential
+table instead of using an index.
+"""
+
+from __future__ import annotations
+
+import re
+import uuid
+from typing import TYPE_CHECKING
+
+import pytest
+from django.db import connection
+
+from learning_credentials.models import Credential, CredentialConfiguration
+from test_utils.factories import UserFactory
+
+if TYPE_CHECKING:
+    from django.contrib.auth.models import User
+    from django.db.models import QuerySet
+
+CREDENTIAL_TABLE = Credential._meta.db_table
+
+# Patterns of full table scans in the output of `EXPLAIN`, for each database vendor.
+FULL_SCAN_PATTERNS = {
+    'sqlite': re.compile(rf'\bSCAN {CREDENTIAL_TABLE}\b(?! USING (COVERING )?INDEX)'),
+    'postgresql': re.compile(rf'Seq Scan on {CREDENTIAL_TABLE}\b'),
+    # The columns of each row are `id select_type table partitions type ...`, and the `ALL` access type reads all rows.
+    'mysql': re.compile(rf'\b{CREDENTIAL_TABLE} \S+ ALL\b'),
+}
+
+STATUSES = list(Credential.Status)
+
+
+def assert_uses_index(queryset: QuerySet):
+    """Assert that the query does not read the whole credential table."""
+    if connection.vendor not in FULL_SCAN_PATTERNS:
+        pytest.skip(f'The query plans of {connection.vendor} are not checked.')
+
+    if connection.vendor == 'postgresql':
+        # Seeded tables are small, so the planner would prefer sequential scans without this.
+        with connection.cursor() as cursor:
+            cursor.execute('SET enable_seqscan = off')
+
+    plan = queryset.explain()
+    assert CREDENTIAL_TABLE in str(queryset.query)
+    assert not FULL_SCAN_PATTERNS[connection.vendor].search(plan), f'The query reads the whole table:\n{plan}'
+
+
+@pytest.fixture
+def seeded_credentials(grade_config: CredentialConfiguration, mock_credential_config: CredentialConfiguration) -> User:
+    """Seed the database with credentials of multiple users, configurations, and statuses."""
+    users = UserFactory.create_batch(20)
+    Credential.objects.bulk_create(
+        Credential(
+            user=user,
+            user_full_name=user.get_full_name(),
+            learning_context_key=config.learning_context_key,
+            learning_context_name='Test Course',
+            credential_type=config.credential_type.name,
+            configuration=config,
+            status=STATUSES[index % len(STATUSES)],
+            generation_task_id='0',
+        )
+        for index, user in enumerate(users)
+        for config in (grade_config, mock_credential_config)
+    )
+    with connection.cursor() as cursor:
+        cursor.execute('ANALYZE')
+    return users[0]
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures('seeded_credentials')
+def test_filter_out_user_ids_with_credentials_uses_index(grade_config: CredentialConfiguration):
+    """Test the query filtering out the users who already have a credential of a configuration."""
+    assert_uses_index(
+        Credential.objects.filter(configuration=grade_config, user_id__in=[1, 2, 3])
+        .exclude(status=Credential.Status.ERROR)
+        .values_list('user_id', flat=True)
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures('seeded_credentials')
+def test_metadata_lookup_uses_index():
+    """Test the lookup of a credential by its verification UUID."""
+    assert_uses_index(Credential.objects.filter(verify_uuid=uuid.uuid4()))
+
+
+@pytest.mark.django_db
+def test_eligibility_lookup_uses_index(seeded_credentials: User, grade_config: CredentialConfiguration):
+    """Test the lookup of the credentials of a user in a learning context."""
+    configurations = CredentialConfiguration.objects.filter(learning_context_key=grade_config.learning_context_key)
+
+    assert_uses_index(
+        Credential.objects.filter(user_id=seeded_credentials.id, configuration__in=configurations).exclude(
+            status__in=[Credential.Status.ERROR, Credential.Status.INVALIDATED]
+        )
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures('seeded_credentials')
+def test_admin_learning_context_filter_uses_index(grade_config: CredentialConfiguration):
+    """Test the admin filter of credentials by learning context."""
+    assert_uses_index(Credential.objects.filter(configuration__learning_context_key=grade_config.learning_context_key))
+
+
+def test_full_scan_pattern():
+    """Test that the full scan pattern detects full table scans, but not index scans."""
+    pattern = FULL_SCAN_PATTERNS['sqlite']
+
+    assert pattern.search(f'2 0 0 SCAN {CREDENTIAL_TABLE}')
+    assert not pattern.search(f'2 0 0 SEARCH {CREDENTIAL_TABLE} USING INDEX lc_credential_user_config (user_id=?)')
+    assert not pattern.search(f'2 0 0 SCAN {CREDENTIAL_TABLE} USING COVERING INDEX lc_credential_config_status')
+
+
+def test_mysql_full_scan_pattern():
+    """Test that the MySQL full scan pattern detects the `ALL` access type, but not index lookups."""
+    pattern = FULL_SCAN_PATTERNS['mysql']
+
+    assert pattern.search(f'1 SIMPLE {CREDENTIAL_TABLE} None ALL None None None None 40 10.0 Using where')
+    assert not pattern.search(
+        f'1 SIMPLE {CREDENTIAL_TABLE} None ref lc_credential_user_config lc_credential_user_config 4 const 2 100.0 None'
+    )
+    assert not pattern.search(
+        f'1 SIMPLE {CREDENTIAL_TABLE} None index None lc_credential_config_status 8 None 40 100.0'
+    )
@@ -0,0 +1,235 @@
+"""Tests for the registry of credential type functions."""
+
+from __future__ import annotations
+
+import sys
+from importlib.metadata import EntryPoint
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from learning_credentials import processors
+from learning_credentials.registry import (
+    GENERATORS_GROUP,
+    PROCESSORS_GROUP,
+    FunctionMetadata,
+    _parse_module,
+    forget_functions,
+    get_available_functions,
+    get_function_metadata,
+    resolve_function,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture(autouse=True)
+def _clear_metadata_caches():
+    """Clear the cached metadata, so each test scans the sources again."""
+    get_available_functions.cache_clear()
+    get_function_metadata.cache_clear()
+    _parse_module.cache_clear()
+
+
+def test_resolve_function():
+    """Test that functions are imported once, until they are forgotten."""
+    func_path = 'learning_credentials.processors.retrieve_completions'
+    forget_functions(func_path)
+
+    with patch('learning_credentials.registry.import_module', return_value=processors) as mock_import_module:
+        assert resolve_function(func_path) is processors.retrieve_completions
+        assert resolve_function(func_path) is processors.retrieve_completions
+        mock_import_module.assert_called_once_with('learning_credentials.processors')
+
+        forget_functions(func_path)
+        assert resolve_function(func_path) is processors.retrieve_completions
+        assert mock_import_module.call_count == 2
+
+
+@pytest.mark.parametrize(
+    ('func_path', 'exception'),
+    [
+        ('invalid_format_func', ValueError),
+        ('invalid.module.path', ImportError),
+        ('learning_credentials.processors.missing_function', AttributeError),
+        ('learning_credentials.processors.log', TypeError),
+    ],
+)
+def test_resolve_function_with_invalid_path(func_path: str, exception: type[Exception]):
+    """Test that invalid paths are not resolved."""
+    with pytest.raises(exception):
+        resolve_function(func_path)
+
+
+def test_get_function_metadata():
+    """Test that the metadata is read from the source code, without importing the module."""
+    with patch('learning_credentials.registry.import_module') as mock_import_module:
+        completions = get_function_metadata('learning_credentials.processors.retrieve_completions')
+        grades = get_function_metadata('learning_credentials.processors.retrieve_subsection_grades')
+        pdf = get_function_metadata('learning_credentials.generators.generate_pdf_credential')
+
+    mock_import_module.assert_not_called()
+    assert completions.name == 'Completions'
+    assert completions.supports_streaming is True
+    assert completions.supports_batch is True
+    assert 'required_completion' in completions.options
+    assert grades.supports_streaming is True
+    assert 'required_grades' in grades.options
+    assert pdf.name == 'PDF credential'
+    assert pdf.supports_streaming is False
+    assert pdf.supports_batch is False
+    assert 'template' in pdf.options
+
+
+def test_get_function_metadata_without_source():
+    """Test that the function is imported if its definition is not found in the source code."""
+    with (
+        patch('learning_credentials.registry._parse_module', return_value=None),
+        patch('learning_credentials.registry.entry_points', return_value=()),
+    ):
+        metadata = get_function_metadata('learning_credentials.processors.retrieve_completions')
+        assert get_available_functions(PROCESSORS_GROUP) == ()
+
+    assert metadata.name == 'Completions'
+    assert metadata.supports_streaming is True
+    assert 'required_completion' in metadata.options
+
+
+def test_get_function_metadata_of_compiled_module():
+    """Test that modules without Python source code are imported instead of parsed."""
+    assert _parse_module('math') is None
+    assert _parse_module('invalid.module.path') is None
+    assert get_function_metadata('math.floor') == FunctionMetadata(
+        path='math.floor',
+        name='floor',
+        options='',
+        supports_streaming=False,
+        supports_batch=False,
+    )
+
+
+@pytest.mark.parametrize(
+    ('source', 'expected'),
+    [
+        (
+            (
+                "CREDENTIAL_FUNCTIONS = {'retrieve': {'name': 'Retrieve', 'streaming': True, 'batch': True}}\n"
+                'def retrieve(course_id, options): ...\n'
+            ),
+            ('Retrieve', True, True),
+        ),
+        (
+            ("CREDENTIAL_FUNCTIONS: dict = {'retrieve': {'streaming': True}}\ndef retrieve(course_id, options): ...\n"),
+            ('retrieve', True, False),
+        ),
+        (
+            (
+                "CREDENTIAL_FUNCTIONS = {'retrieve_other': {'name': 'Other', 'streaming': True}}\n"
+                'def retrieve(course_id, options): ...\n'
+            ),
+            ('retrieve', False, False),
+        ),
+        (
+            ("CREDENTIAL_FUNCTIONS = {'retrieve': 'Retrieve'}\ndef retrieve(course_id, options): ...\n"),
+            ('retrieve', False, False),
+        ),
+        (
+            (
+                'from learning_credentials.processors import streaming_variant\n'
+                '@streaming_variant(stream)\n'
+                'def retrieve(course_id, options): ...\n'
+            ),
+            ('retrieve', False, False),
+        ),
+    ],
+)
+def test_get_function_metadata_from_manifest(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, source: str, expected: tuple[str, bool, bool]
+):
+    """Test that the capabilities are read from the manifest of the module, without importing it."""
+    (tmp_path / 'external_processors.py').write_text(source, encoding='utf-8')
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    metadata = get_function_metadata('external_processors.retrieve')
+
+    assert (metadata.name, metadata.supports_streaming, metadata.supports_batch) == expected
+    assert 'external_processors' not in sys.modules
+
+
+@pytest.mark.parametrize(
+    'manifest',
+    ['CREDENTIAL_FUNCTIONS = get_manifest()', "CREDENTIAL_FUNCTIONS = ['retrieve']", 'CREDENTIAL_FUNCTIONS += {}'],
+)
+def test_get_function_metadata_with_invalid_manifest(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, manifest: str):
+    """Test that manifests that are not literal dicts are ignored."""
+    (tmp_path / 'external_processors.py').write_text(
+        f'{manifest}\ndef retrieve(course_id, options): ...\n', encoding='utf-8'
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    metadata = get_function_metadata('external_processors.retrieve')
+
+    assert (metadata.name, metadata.supports_streaming, metadata.supports_batch) == ('retrieve', False, False)
+    assert 'external_processors' not in sys.modules
+
+
+def test_built_in_manifest_matches_streaming_variants():
+    """Test that the manifest of the built-in processors declares exactly the registered streaming variants."""
+    for metadata in get_available_functions(PROCESSORS_GROUP):
+        if metadata.path.startswith('learning_credentials.'):
+            func = resolve_function(metadata.path)
+            assert metadata.supports_streaming is (processors.get_streaming_variant(func) is not func)
+            assert metadata.name != metadata.path.rpartition('.')[2]
+
+
+@pytest.mark.parametrize(
+    'func_path',
+    ['invalid_format_func', 'invalid.module.path', 'learning_credentials.processors.log'],
+)
+def test_get_function_metadata_with_invalid_path(func_path: str):
+    """Test that invalid paths have empty metadata."""
+    assert get_function_metadata(func_path) == FunctionMetadata(
+        path=func_path,
+        name=func_path.rpartition('.')[2],
+        options='',
+        supports_streaming=False,
+        supports_batch=False,
+    )
+
+
+def test_get_available_functions(monkeypatch: pytest.MonkeyPatch):
+    """Test that the built-in functions are listed without importing their modules, and only scanned once."""
+    monkeypatch.delitem(sys.modules, 'learning_credentials.generators', raising=False)
+
+    with patch('learning_credentials.registry.entry_points', return_value=()) as mock_entry_points:
+        processors_metadata = get_available_functions(PROCESSORS_GROUP)
+        generators_metadata = get_available_functions(GENERATORS_GROUP)
+        assert get_available_functions(PROCESSORS_GROUP) is processors_metadata
+        assert mock_entry_points.call_count == 2
+
+    assert 'learning_credentials.generators' not in sys.modules
+    assert 'learning_credentials.processors.retrieve_completions' in [m.path for m in processors_metadata]
+    assert all('.retrieve_' in m.path for m in processors_metadata)
+    assert [m.path for m in generators_metadata] == ['learning_credentials.generators.generate_pdf_credential']
+
+
+def test_get_available_functions_from_entry_points():
+    """Test that the functions of the entry points are listed after the built-in ones, without duplicates."""
+    plugins = [
+        EntryPoint('retrieve_completions', 'learning_credentials.processors:retrieve_completions', PROCESSORS_GROUP),
+        EntryPoint('retrieve_plugin', 'tests.conftest:_mock_retrieval_func', PROCESSORS_GROUP),
+    ]
+
+    with patch('learning_credentials.registry.entry_points', return_value=plugins) as mock_entry_points:
+        functions = [metadata.path for metadata in get_available_functions(PROCESSORS_GROUP)]
+        plugin_functions = [metadata.path for metadata in get_available_functions('unknown.group')]
+
+    mock_entry_points.assert_any_call(group=PROCESSORS_GROUP)
+    assert functions[-1] == 'tests.conftest._mock_retrieval_func'
+    assert functions.count('learning_credentials.processors.retrieve_completions') == 1
+    assert plugin_functions == [
+        'learning_credentials.processors.retrieve_completions',
+        'tests.conftest._mock_retrieval_func',
+    ]
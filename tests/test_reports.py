@@ -0,0 +1,110 @@
+"""Tests for the progress reports of learning contexts."""
+
+from __future__ import annotations
+
+import csv
+import json
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from learning_credentials.models import CredentialConfiguration
+from learning_credentials.reports import CSV_COLUMNS, iter_progress_report, iter_progress_report_rows
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from django.contrib.auth.models import User
+
+
+@pytest.fixture
+def retrieval_results(users: list[User]) -> Iterator[list[tuple[int, dict]]]:
+    """Patch the retrieval results of all configurations."""
+    results = [
+        (users[0].id, {'is_eligible': True, 'current_grades': {'total': 0.9}}),
+        (users[1].id, {'is_eligible': False, 'current_grades': {'total': 0.4}}),
+    ]
+    with patch.object(CredentialConfiguration, 'iter_retrieval_results', side_effect=lambda: iter(results)):
+        yield results
+
+
+@pytest.mark.django_db
+def test_iter_progress_report_rows(
+    retrieval_results: list[tuple[int, dict]], users: list[User], grade_config: CredentialConfiguration
+):
+    """Test that each retrieved learner is reported with their username and progress details."""
+    rows = list(iter_progress_report_rows([grade_config]))
+
+    assert rows == [
+        {
+            'credential_type_id': grade_config.credential_type_id,
+            'credential_type': grade_config.credential_type.name,
+            'user_id': users[0].id,
+            'username': users[0].username,
+            'is_eligible': True,
+            'progress': {'current_grades': {'total': 0.9}},
+        },
+        {
+            'credential_type_id': grade_config.credential_type_id,
+            'credential_type': grade_config.credential_type.name,
+            'user_id': users[1].id,
+            'username': users[1].username,
+            'is_eligible': False,
+            'progress': {'current_grades': {'total': 0.4}},
+        },
+    ]
+    # The retrieval results are not modified.
+    assert retrieval_results[0][1]['is_eligible'] is True
+
+
+@pytest.mark.django_db
+@patch('learning_credentials.reports._USERNAME_BATCH_SIZE', 1)
+def test_iter_progress_report_rows_is_lazy(grade_config: CredentialConfiguration, users: list[User]):
+    """Test that the rows are yielded while the rest of the learning context is still being retrieved."""
+    retrieved = []
+
+    def iter_retrieval_results() -> Iterator[tuple[int, dict]]:
+        for user in users:
+            retrieved.append(user.id)
+            yield user.id, {'is_eligible': False}
+
+    with patch.object(CredentialConfiguration, 'iter_retrieval_results', side_effect=iter_retrieval_results):
+        rows = iter_progress_report_rows([grade_config])
+        assert next(rows)['user_id'] == users[0].id
+        assert retrieved == [users[0].id]
+        assert len(list(rows)) == len(users) - 1
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures('retrieval_results')
+def test_iter_progress_report_ndjson(grade_config: CredentialConfiguration, users: list[User]):
+    """Test that each row is serialized as a separate line of JSON."""
+    lines = list(iter_progress_report([grade_config], 'ndjson'))
+
+    assert all(line.endswith('\n') for line in lines)
+    assert [json.loads(line)['username'] for line in lines] == [users[0].username, users[1].username]
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures('retrieval_results')
+def test_iter_progress_report_csv(grade_config: CredentialConfiguration, users: list[User]):
+    """Test that the rows are serialized as CSV, with the progress details encoded as JSON."""
+    rows = list(csv.reader(''.join(iter_progress_report([grade_config], 'csv')).splitlines()))
+
+    assert rows[0] == list(CSV_COLUMNS)
+    assert rows[1] == [
+        str(grade_config.credential_type_id),
+        grade_config.credential_type.name,
+        str(users[0].id),
+        users[0].username,
+        'True',
+        '{"current_grades": {"total": 0.9}}',
+    ]
+    assert len(rows) == 3
+
+
+def test_iter_progress_report_unsupported_format():
+    """Test that unsupported formats are rejected before the retrieval starts."""
+    with pytest.raises(ValueError, match=r'Unsupported report format: xml\.'):
+        iter_progress_report([], 'xml')
@@ -0,0 +1,57 @@
+"""Tests for the signal receivers."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import Mock, patch
+
+import pytest
+from django.test import override_settings
+
+from learning_credentials.signals import (
+    invalidate_course_name,
+    invalidate_learning_path_name,
+    update_progress_snapshots,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+@patch('learning_credentials.signals.invalidate_learning_context_name')
+def test_invalidate_course_name(mock_invalidate: Mock):
+    """Test that the course name is invalidated when the course overview is saved."""
+    course_overview = Mock()
+
+    invalidate_course_name(sender=Mock(), instance=course_overview, created=False)
+
+    mock_invalidate.assert_called_once_with(course_overview.id)
+
+
+@patch('learning_credentials.signals.invalidate_learning_context_name')
+def test_invalidate_learning_path_name(mock_invalidate: Mock):
+    """Test that the Learning Path name is invalidated when the Learning Path is saved."""
+    learning_path = Mock()
+
+    invalidate_learning_path_name(sender=Mock(), instance=learning_path, created=False)
+
+    mock_invalidate.assert_called_once_with(learning_path.key)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('enabled', [True, False])
+@patch('learning_credentials.tasks.update_progress_snapshots_task')
+def test_update_progress_snapshots(mock_task: Mock, enabled: bool, django_capture_on_commit_callbacks: Callable):
+    """Test that the progress snapshots of the learner are updated after their course grade changes."""
+    user = Mock(id=7)
+
+    with (
+        override_settings(LEARNING_CREDENTIALS_PROGRESS_SNAPSHOTS=enabled),
+        django_capture_on_commit_callbacks(execute=True),
+    ):
+        update_progress_snapshots(sender=None, user=user, course_grade=Mock(), course_key='course-v1:TestX+T1+2026')
+
+    if enabled:
+        mock_task.delay.assert_called_once_with(7, 'course-v1:TestX+T1+2026')
+    else:
+        mock_task.delay.assert_not_called()
@@ -1,15 +1,32 @@
 """Tests for the learning-credentials Celery tasks."""
 
-from unittest.mock import MagicMock, Mock, PropertyMock, patch
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock, Mock, PropertyMock, call, patch
 
 import pytest
+from django.core.files.base import ContentFile
+from django.test import override_settings
 
+from learning_credentials.models import Credential, CredentialAsset, CredentialConfiguration, CredentialType
+from learning_credentials.progress_cache import get_active_progress_cache
 from learning_credentials.tasks import (
+    archive_invalidated_credentials_task,
+    delete_old_asset_versions_task,
     generate_all_credentials_task,
     generate_credential_for_user_task,
     generate_credentials_for_config_task,
+    generate_credentials_for_context_task,
+    generate_credentials_for_users_task,
+    reconcile_credential_stats_task,
+    update_progress_snapshots_task,
+    warm_up_worker,
 )
 
+if TYPE_CHECKING:
+    from learning_paths.models import LearningPath
+
 
 @pytest.mark.django_db
 def test_generate_credential_for_user():
@@ -22,7 +39,7 @@ def test_generate_credential_for_user():
         patch('learning_credentials.models.CredentialConfiguration.objects.get') as mock_get,
         patch('learning_credentials.tasks.generate_credential_for_user_task') as mock_task,
     ):
-        mock_config = Mock()
+        mock_config = Mock(id=config_id)
         mock_get.return_value = mock_config
 
         mock_request = Mock()
@@ -36,7 +53,8 @@ def test_generate_credential_for_user():
 
 
 @pytest.mark.django_db
-def test_generate_credentials_for_course_with_filtering():
+@patch('learning_credentials.tasks.get_scheduled_run_id', return_value='scheduled-run')
+def test_generate_credentials_for_course_with_filtering(mock_get_scheduled_run_id: Mock):
     """Test if `generate_credential_for_user_task.delay` is called for each filtered eligible user."""
     config_id = 123
     all_eligible_user_ids = [1, 2, 3, 4]  # Initial set of eligible user IDs
@@ -46,11 +64,11 @@ def test_generate_credentials_for_course_with_filtering():
         patch('learning_credentials.models.CredentialConfiguration.objects.get') as mock_get,
         patch('learning_credentials.tasks.generate_credential_for_user_task.delay') as mock_delay,
     ):
-        mock_config = Mock()
+        mock_config = Mock(id=config_id)
         mock_get.return_value = mock_config
 
         # Mocking the methods to return predefined lists
-        mock_config.get_eligible_user_ids.return_value = all_eligible_user_ids
+        mock_config.iter_eligible_user_ids.return_value = iter(all_eligible_user_ids)
         mock_config.filter_out_user_ids_with_credentials.return_value = filtered_user_ids
 
         generate_credentials_for_config_task(config_id)
@@ -58,7 +76,47 @@ def test_generate_credentials_for_course_with_filtering():
         # Ensure that the delay method is called only for filtered user IDs
         assert mock_delay.call_count == len(filtered_user_ids)
         for user_id in filtered_user_ids:
-            mock_delay.assert_any_call(config_id, user_id)
+            mock_delay.assert_any_call(config_id, user_id, 'scheduled-run')
+        mock_get_scheduled_run_id.assert_called_once_with()
+
+
+@pytest.mark.django_db
+@override_settings(LEARNING_CREDENTIALS_GENERATION_BATCH_SIZE=2)
+@patch('learning_credentials.tasks.get_scheduled_run_id', return_value='scheduled-run')
+def test_generate_credentials_for_config_dispatches_batches_while_streaming(mock_get_scheduled_run_id: Mock):
+    """Test that generation tasks are dispatched for each batch before the retrieval finishes."""
+    config_id = 123
+    dispatched_before_retrieval_finished = []
+
+    with (
+        patch('learning_credentials.models.CredentialConfiguration.objects.get') as mock_get,
+        patch('learning_credentials.tasks.generate_credential_for_user_task.delay') as mock_delay,
+    ):
+        mock_config = Mock(id=config_id)
+        mock_get.return_value = mock_config
+
+        def stream_eligible_user_ids():
+            yield from (1, 2, 3)
+            dispatched_before_retrieval_finished.extend(mock_delay.call_args_list)
+            yield 4
+            yield 5
+
+        mock_config.iter_eligible_user_ids.return_value = stream_eligible_user_ids()
+        mock_config.filter_out_user_ids_with_credentials.side_effect = lambda user_ids: user_ids
+
+        generate_credentials_for_config_task(config_id)
+
+        assert mock_config.filter_out_user_ids_with_credentials.call_args_list == [
+            call([1, 2]),
+            call([3, 4]),
+            call([5]),
+        ]
+        assert mock_delay.call_args_list == [call(config_id, user_id, 'scheduled-run') for user_id in range(1, 6)]
+        assert dispatched_before_retrieval_finished == [
+            call(config_id, 1, 'scheduled-run'),
+            call(config_id, 2, 'scheduled-run'),
+        ]
+        mock_get_scheduled_run_id.assert_called_once_with()
 
 
 @pytest.mark.django_db
@@ -76,9 +134,318 @@ def test_generate_all_credentials():
             return_value=mock_queryset,
         ),
         patch('learning_credentials.tasks.generate_credentials_for_config_task.delay') as mock_delay,
+        patch('learning_credentials.tasks.uuid.uuid4', return_value=Mock(hex='run-id')),
     ):
         generate_all_credentials_task()
 
         assert mock_delay.call_count == len(config_ids)
         for config_id in config_ids:
-            mock_delay.assert_any_call(config_id)
+            mock_delay.assert_any_call(config_id, 'run-id')
+
+
+@pytest.mark.django_db
+def test_generate_credentials_for_config_uses_progress_cache_of_run():
+    """Test that the retrieval results are consumed within the progress cache scope of the run."""
+    with (
+        patch('learning_credentials.models.CredentialConfiguration.objects.get') as mock_get,
+        patch('learning_credentials.tasks.progress_cache_scope') as mock_scope,
+        patch('learning_credentials.tasks.generate_credential_for_user_task.delay'),
+    ):
+        mock_config = mock_get.return_value
+        mock_config.id = 123
+
+        def iter_eligible_user_ids():
+            mock_scope.return_value.__enter__.assert_called_once()
+            yield 1
+
+        mock_config.iter_eligible_user_ids.side_effect = iter_eligible_user_ids
+        mock_config.filter_out_user_ids_with_credentials.return_value = [1]
+
+        generate_credentials_for_config_task(123, 'run-id')
+
+        mock_scope.assert_called_once_with('run-id')
+        mock_scope.return_value.__exit__.assert_called_once()
+
+
+@pytest.mark.django_db
+@override_settings(LEARNING_CREDENTIALS_GROUP_BY_CONTEXT=True)
+def test_generate_all_credentials_grouped_by_context(
+    grade_config: CredentialConfiguration, completion_config: CredentialConfiguration, learning_path_key: str
+):
+    """Test that a single task is initiated for each learning context with enabled configurations."""
+    learning_path_config = CredentialConfiguration.objects.create(
+        learning_context_key=learning_path_key, credential_type=grade_config.credential_type
+    )
+    for config in (grade_config, completion_config, learning_path_config):
+        config.periodic_task.enabled = True
+        config.periodic_task.save()
+
+    with (
+        patch('learning_credentials.tasks.generate_credentials_for_context_task.delay') as mock_delay,
+        patch('learning_credentials.tasks.generate_credentials_for_config_task.delay') as mock_config_delay,
+        patch('learning_credentials.tasks.uuid.uuid4', return_value=Mock(hex='run-id')),
+    ):
+        generate_all_credentials_task()
+
+    assert sorted(mock_delay.call_args_list) == sorted(
+        [call(str(grade_config.learning_context_key), 'run-id'), call(str(learning_path_key), 'run-id')]
+    )
+    mock_config_delay.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_generate_credentials_for_context(
+    grade_config: CredentialConfiguration, completion_config: CredentialConfiguration
+):
+    """Test that all enabled configurations of a learning context are processed within the same run."""
+    grade_config.periodic_task.enabled = True
+    grade_config.periodic_task.save()
+    completion_config.periodic_task.enabled = True
+    completion_config.periodic_task.save()
+    disabled_config = CredentialConfiguration.objects.create(
+        learning_context_key=grade_config.learning_context_key,
+        credential_type=CredentialType.objects.create(name='Disabled', retrieval_func='', generation_func=''),
+    )
+
+    caches = {}
+
+    def generate_credentials_for_config(config: CredentialConfiguration, run_id: str):
+        caches[config.id] = get_active_progress_cache()
+        assert caches[config.id].run_id == run_id
+        assert caches[config.id].spill is True
+
+    with patch(
+        'learning_credentials.tasks._generate_credentials_for_config', side_effect=generate_credentials_for_config
+    ):
+        generate_credentials_for_context_task(str(grade_config.learning_context_key))
+
+    assert set(caches) == {grade_config.id, completion_config.id}
+    assert disabled_config.id not in caches
+    assert caches[grade_config.id] is caches[completion_config.id] is not None
+
+
+@pytest.mark.django_db
+@override_settings(LEARNING_CREDENTIALS_GROUP_BY_CONTEXT=True)
+@patch('learning_credentials.tasks._generate_credentials_for_config')
+def test_generate_credentials_for_config_grouped_by_context(mock_generate: Mock, grade_config: CredentialConfiguration):
+    """Test that the periodic tasks of the configurations are skipped, but the runs grouped by context are processed."""
+    generate_credentials_for_config_task(grade_config.id)
+    mock_generate.assert_not_called()
+
+    generate_credentials_for_config_task(grade_config.id, 'run-id')
+    mock_generate.assert_called_once_with(grade_config, 'run-id')
+
+
+@pytest.mark.django_db
+def test_generate_credential_for_user_uses_progress_cache_of_run():
+    """Test that the credential of a user is generated within the progress cache scope of the run."""
+    with (
+        patch('learning_credentials.models.CredentialConfiguration.objects.get') as mock_get,
+        patch('learning_credentials.tasks.progress_cache_scope') as mock_scope,
+    ):
+        mock_get.return_value.generate_credential_for_user.side_effect = lambda *_args: (
+            mock_scope.return_value.__enter__.assert_called_once()
+        )
+
+        generate_credential_for_user_task(123, 456, 'run-id')
+
+        mock_scope.assert_called_once_with('run-id')
+        mock_get.return_value.generate_credential_for_user.assert_called_once()
+
+
+@pytest.mark.django_db
+def test_generate_credentials_for_users():
+    """Test that the credentials of multiple users are generated within the progress cache scope of the run."""
+    with (
+        patch('learning_credentials.models.CredentialConfiguration.objects.get') as mock_get,
+        patch('learning_credentials.tasks.progress_cache_scope') as mock_scope,
+    ):
+        generate_credentials_for_users_task(123, [1, 2], 'run-id')
+
+        mock_get.assert_called_once_with(id=123)
+        mock_scope.assert_called_once_with('run-id')
+        mock_get.return_value.generate_credentials_for_users.assert_called_once()
+        assert mock_get.return_value.generate_credentials_for_users.call_args.args[0] == [1, 2]
+
+
+@pytest.mark.django_db
+@override_settings(LEARNING_CREDENTIALS_GENERATION_TASK_SIZE=2)
+def test_generate_credentials_for_config_dispatches_multi_user_tasks():
+    """Test that users are grouped into multi-user generation tasks."""
+    with (
+        patch('learning_credentials.models.CredentialConfiguration.objects.get') as mock_get,
+        patch('learning_credentials.tasks.generate_credentials_for_users_task.delay') as mock_delay,
+        patch('learning_credentials.tasks.generate_credential_for_user_task.delay') as mock_user_delay,
+    ):
+        mock_config = Mock(id=123)
+        mock_get.return_value = mock_config
+        mock_config.iter_eligible_user_ids.return_value = iter([1, 2, 3])
+        mock_config.filter_out_user_ids_with_credentials.side_effect = lambda user_ids: user_ids
+
+        generate_credentials_for_config_task(123, 'run-id')
+
+    assert mock_delay.call_args_list == [call(123, [1, 2], 'run-id'), call(123, [3], 'run-id')]
+    mock_user_delay.assert_not_called()
+
+
+@pytest.mark.django_db
+@override_settings(LEARNING_CREDENTIALS_ARCHIVE_BATCH_SIZE=10)
+@patch('learning_credentials.tasks.ArchivedCredential.archive', return_value=1)
+def test_archive_invalidated_credentials(mock_archive: Mock, grade_config: CredentialConfiguration):
+    """Test that the invalidated credentials of a configuration are archived in batches."""
+    archive_invalidated_credentials_task(grade_config.id)
+
+    credentials, batch_size = mock_archive.call_args.args
+    assert str(credentials.query) == str(Credential.objects.filter(configuration_id=grade_config.id).query)
+    assert batch_size == 10
+
+
+@pytest.mark.django_db
+@patch('learning_credentials.tasks.ArchivedCredential.archive', return_value=0)
+def test_archive_invalidated_credentials_of_all_configurations(mock_archive: Mock):
+    """Test that the invalidated credentials of all configurations are archived if no configuration is specified."""
+    archive_invalidated_credentials_task()
+
+    credentials, _batch_size = mock_archive.call_args.args
+    assert str(credentials.query) == str(Credential.objects.all().query)
+
+
+@override_settings(LEARNING_CREDENTIALS_ARCHIVE_BATCH_SIZE=0)
+@patch('learning_credentials.tasks.ArchivedCredential.archive')
+def test_archive_invalidated_credentials_disabled(mock_archive: Mock):
+    """Test that the credentials are not archived if the batch size is 0."""
+    archive_invalidated_credentials_task()
+
+    mock_archive.assert_not_called()
+
+
+@pytest.mark.django_db
+@patch('learning_credentials.tasks.reconcile_credential_stats_task.delay')
+@patch('learning_credentials.tasks.archive_invalidated_credentials_task.delay')
+def test_generate_credentials_for_config_does_not_archive_invalidated_credentials(
+    mock_archive_delay: Mock, mock_reconcile_delay: Mock
+):
+    """Test that the archiving and the recalculation of the counters are left to their periodic tasks."""
+    with patch('learning_credentials.models.CredentialConfiguration.objects.get') as mock_get:
+        mock_config = Mock(id=123)
+        mock_get.return_value = mock_config
+        mock_config.iter_eligible_user_ids.return_value = iter([])
+
+        generate_credentials_for_config_task(123)
+
+    mock_archive_delay.assert_not_called()
+    mock_reconcile_delay.assert_not_called()
+
+
+@pytest.mark.django_db
+@patch('learning_credentials.tasks.CredentialConfigurationStats.reconcile')
+def test_reconcile_credential_stats(
+    mock_reconcile: Mock, grade_config: CredentialConfiguration, completion_config: CredentialConfiguration
+):
+    """Test that the counters of the given configuration, or all configurations, are recalculated."""
+    reconcile_credential_stats_task(grade_config.id)
+    mock_reconcile.assert_called_once_with(grade_config.id)
+
+    mock_reconcile.reset_mock()
+    reconcile_credential_stats_task()
+    assert sorted(mock_reconcile.call_args_list) == [call(grade_config.id), call(completion_config.id)]
+
+    mock_reconcile.reset_mock()
+    reconcile_credential_stats_task(completion_config.id + 1)
+    mock_reconcile.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_update_progress_snapshots_task(
+    grade_config: CredentialConfiguration,
+    mock_credential_type: CredentialType,
+    learning_path_with_courses: LearningPath,
+):
+    """Test that the progress is retrieved again for the configurations of the course and its learning paths."""
+    course_key = learning_path_with_courses.steps.first().course_key
+    course_config = CredentialConfiguration.objects.create(
+        learning_context_key=course_key, credential_type=mock_credential_type
+    )
+    path_config = CredentialConfiguration.objects.create(
+        learning_context_key=learning_path_with_courses.key, credential_type=mock_credential_type
+    )
+    evaluated_configs = []
+
+    def get_user_eligibility_details(config: CredentialConfiguration, user_id: int) -> dict:
+        assert get_active_progress_cache() is not None
+        evaluated_configs.append((config.id, user_id))
+        return {}
+
+    with patch.object(
+        CredentialConfiguration, 'get_user_eligibility_details', autospec=True, side_effect=get_user_eligibility_details
+    ):
+        update_progress_snapshots_task(7, str(course_key))
+
+    assert sorted(evaluated_configs) == [(course_config.id, 7), (path_config.id, 7)]
+    assert grade_config.id not in dict(evaluated_configs)
+
+
+@patch('learning_credentials.generators.preload_assets')
+def test_warm_up_worker_disabled(mock_preload_assets: Mock):
+    """Test that the worker is not warmed up unless it is enabled."""
+    warm_up_worker()
+
+    mock_preload_assets.assert_not_called()
+
+
+@pytest.mark.django_db
+@override_settings(LEARNING_CREDENTIALS_WORKER_WARMUP=True, LEARNING_CREDENTIALS_WORKER_WARMUP_MAX_BYTES=1024)
+@patch('learning_credentials.generators.preload_assets', return_value=512)
+def test_warm_up_worker(
+    mock_preload_assets: Mock,
+    grade_config: CredentialConfiguration,
+    mock_credential_config: CredentialConfiguration,
+    caplog: pytest.LogCaptureFixture,
+):
+    """Test that the assets of the enabled configurations using the PDF generator are preloaded."""
+    grade_config.credential_type.custom_options = {'template': 'template'}
+    grade_config.credential_type.save()
+    for config in (grade_config, mock_credential_config):
+        config.periodic_task.enabled = True
+        config.periodic_task.save()
+
+    with caplog.at_level('INFO', logger='learning_credentials.tasks'):
+        warm_up_worker(sender=None)
+
+    (options_list,) = mock_preload_assets.call_args.args
+    assert list(options_list) == [grade_config.get_custom_options()]
+    assert mock_preload_assets.call_args.kwargs == {'max_bytes': 1024}
+    assert 'Worker warm-up preloaded 512 bytes of assets' in caplog.text
+
+
+@pytest.mark.django_db
+@override_settings(LEARNING_CREDENTIALS_WORKER_WARMUP=True)
+@patch('learning_credentials.generators.preload_assets', side_effect=OSError('Storage is not available.'))
+def test_warm_up_worker_failure(mock_preload_assets: Mock, caplog: pytest.LogCaptureFixture):
+    """Test that a failed warm-up does not prevent the worker process from starting."""
+    warm_up_worker()
+
+    mock_preload_assets.assert_called_once()
+    assert 'Failed to warm up the worker process.' in caplog.text
+
+
+@pytest.mark.django_db
+@patch.object(CredentialAsset, 'delete_old_versions')
+def test_delete_old_asset_versions_task(mock_delete_old_versions: Mock, temp_media: str):  # noqa: ARG001
+    """Test that the previous versions of an existing asset are deleted."""
+    asset = CredentialAsset(description="Test Asset", asset_slug="test-asset")
+    asset.asset = ContentFile(b"content", name="template.pdf")
+    asset.save()
+
+    delete_old_asset_versions_task(asset.id)
+    delete_old_asset_versions_task(asset.id + 1)
+
+    mock_delete_old_versions.assert_called_once_with()
+
+
+@patch.object(CredentialAsset, 'delete_expired_versions')
+def test_delete_old_asset_versions_task_sweep(mock_delete_expired_versions: Mock):
+    """Test that the periodic task sweeps the expired versions of all assets."""
+    delete_old_asset_versions_task()
+
+    mock_delete_expired_versions.assert_called_once_with()
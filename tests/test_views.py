@@ -2,20 +2,40 @@
 
 from __future__ import annotations
 
+import threading
+from datetime import datetime, timedelta
 from typing import TYPE_CHECKING
 from unittest.mock import Mock, patch
+from urllib.parse import urlencode
 
 import pytest
+from django.core.cache import cache
+from django.test import override_settings
 from django.urls import reverse
+from django.utils import timezone
+from django.utils.http import http_date
 from learning_paths.models import LearningPathStep
 from rest_framework import status
-from rest_framework.test import APIClient
-
-from learning_credentials.models import Credential, CredentialConfiguration
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from learning_credentials.api.v1.permissions import CanAccessLearningContext
+from learning_credentials.models import (
+    ArchivedCredential,
+    Credential,
+    CredentialConfiguration,
+    LearnerProgressSnapshot,
+)
+from learning_credentials.progress_cache import get_active_progress_cache, get_cached_progress
+from learning_credentials.reports import REPORT_CONTENT_TYPES
 from test_utils.factories import UserFactory
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
     from django.contrib.auth.models import User
+    from django.db.models import Model
     from learning_paths.models import LearningPath, LearningPathEnrollment
     from opaque_keys.edx.keys import CourseKey, LearningContextKey
     from requests import Response
@@ -49,19 +69,19 @@ class TestCredentialConfigurationCheckViewPermissions:
         response = self._make_request(None, course_key)
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
-    @patch('learning_credentials.api.v1.permissions.get_course_enrollments')
+    @patch('learning_credentials.api.v1.permissions.is_enrolled_in_course')
     def test_enrolled_user_can_access_course_check(
         self, mock_course_enrollments: Mock, user: User, course_key: CourseKey
     ):
         """Test that enrolled user can access course configuration check."""
-        mock_course_enrollments.return_value = [user]
+        mock_course_enrollments.return_value = True
         response = self._make_request(user, course_key)
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data == {'has_credentials': False, 'credential_count': 0}
         mock_course_enrollments.assert_called_once_with(course_key, user.id)
 
-    @patch('learning_credentials.api.v1.permissions.get_course_enrollments', return_value=[])
+    @patch('learning_credentials.api.v1.permissions.is_enrolled_in_course', return_value=False)
     def test_non_enrolled_user_denied_course_access(
         self, mock_course_enrollments: Mock, user: User, course_key: CourseKey
     ):
@@ -94,7 +114,7 @@ class TestCredentialConfigurationCheckViewPermissions:
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert 'Invalid learning context key' in str(response.data)
 
-    @patch('learning_credentials.api.v1.permissions.get_course_enrollments')
+    @patch('learning_credentials.api.v1.permissions.is_enrolled_in_course')
     def test_staff_can_view_any_context_check(
         self, mock_course_enrollments: Mock, staff_user: User, course_key: CourseKey
     ):
@@ -129,7 +149,7 @@ class TestCredentialConfigurationCheckViewPermissions:
         assert response.status_code == status.HTTP_200_OK
         assert response.data == {'has_credentials': False, 'credential_count': 0}
 
-    @patch('learning_credentials.api.v1.permissions.get_course_enrollments', return_value=[])
+    @patch('learning_credentials.api.v1.permissions.is_enrolled_in_course', return_value=False)
     def test_user_can_access_course_via_public_learning_path(
         self, mock_course_enrollments: Mock, user: User, course_key: CourseKey, public_learning_path: LearningPath
     ):
@@ -140,7 +160,7 @@ class TestCredentialConfigurationCheckViewPermissions:
         assert response.status_code == status.HTTP_200_OK
         assert response.data == {'has_credentials': False, 'credential_count': 0}
 
-    @patch('learning_credentials.api.v1.permissions.get_course_enrollments', return_value=[])
+    @patch('learning_credentials.api.v1.permissions.is_enrolled_in_course', return_value=False)
     def test_user_can_access_course_via_enrolled_learning_path(
         self, mock_course_enrollments: Mock, course_key: CourseKey, learning_path_enrollment: LearningPathEnrollment
     ):
@@ -152,6 +172,70 @@ class TestCredentialConfigurationCheckViewPermissions:
         assert response.data == {'has_credentials': False, 'credential_count': 0}
 
 
+@pytest.mark.django_db
+class TestCanAccessLearningContext:
+    """Tests for the cached access decisions of the CanAccessLearningContext permission."""
+
+    @staticmethod
+    def _get_request(user: User) -> Request:
+        """Create a request of the given user."""
+        request = Request(APIRequestFactory().get('/'))
+        request.user = user
+        return request
+
+    @staticmethod
+    def _has_permission(request: Request, learning_context_key: LearningContextKey) -> bool:
+        """Check the permission of the request to access the learning context."""
+        view = Mock(kwargs={'learning_context_key': str(learning_context_key)})
+        return CanAccessLearningContext().has_permission(request, view)
+
+    def test_learning_path_access_costs_single_query(
+        self, learning_path_enrollment: LearningPathEnrollment, django_assert_num_queries: Callable
+    ):
+        """Test that the access to a learning path is checked with a single query, and then read from the cache."""
+        learning_path_key = learning_path_enrollment.learning_path.key
+        with django_assert_num_queries(1):
+            assert self._has_permission(self._get_request(learning_path_enrollment.user), learning_path_key)
+        with django_assert_num_queries(0):
+            assert self._has_permission(self._get_request(learning_path_enrollment.user), learning_path_key)
+
+    def test_enrolled_course_access_costs_single_query(
+        self,
+        course_enrollment_model: type[Model],
+        user: User,
+        course_key: CourseKey,
+        django_assert_num_queries: Callable,
+    ):
+        """Test that enrolled users skip the learning path query, and the access is then read from the cache."""
+        course_enrollment_model.objects.create(user=user, course_id=str(course_key))
+
+        with django_assert_num_queries(1):
+            assert self._has_permission(self._get_request(user), course_key)
+        with django_assert_num_queries(0):
+            assert self._has_permission(self._get_request(user), course_key)
+
+    @override_settings(LEARNING_CREDENTIALS_ACCESS_CACHE_TIMEOUT=0)
+    @patch('learning_credentials.api.v1.permissions.is_enrolled_in_course', return_value=True)
+    def test_access_is_checked_once_per_request(self, mock_is_enrolled: Mock, user: User, course_key: CourseKey):
+        """Test that the access decision is reused within a request even if the Django cache is disabled."""
+        request = self._get_request(user)
+        assert self._has_permission(request, course_key)
+        assert self._has_permission(request, course_key)
+        assert mock_is_enrolled.call_count == 1
+
+        assert self._has_permission(self._get_request(user), course_key)
+        assert mock_is_enrolled.call_count == 2
+
+    @patch('learning_credentials.api.v1.permissions.is_enrolled_in_course', side_effect=[False, True])
+    def test_denied_access_is_not_cached(self, mock_is_enrolled: Mock, user: User, course_key: CourseKey):
+        """Test that learners can access a learning context right after they enroll."""
+        with pytest.raises(NotFound):
+            self._has_permission(self._get_request(user), course_key)
+
+        assert self._has_permission(self._get_request(user), course_key)
+        assert mock_is_enrolled.call_count == 2
+
+
 @pytest.mark.django_db
 class TestCredentialConfigurationCheckView:
     """Test the CredentialConfigurationCheckView functionality."""
@@ -165,27 +249,27 @@ class TestCredentialConfigurationCheckView:
         )
         return client.get(url)
 
-    @patch('learning_credentials.api.v1.permissions.get_course_enrollments')
+    @patch('learning_credentials.api.v1.permissions.is_enrolled_in_course')
     def test_no_credentials_configured(self, mock_course_enrollments: Mock, user: User, course_key: CourseKey):
         """Test response when no credentials are configured for a learning context."""
-        mock_course_enrollments.return_value = [user]
+        mock_course_enrollments.return_value = True
         response = self._make_request(user, course_key)
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data == {'has_credentials': False, 'credential_count': 0}
 
-    @patch('learning_credentials.api.v1.permissions.get_course_enrollments')
+    @patch('learning_credentials.api.v1.permissions.is_enrolled_in_course')
     def test_single_credential_configured(
         self, mock_course_enrollments: Mock, user: User, course_key: CourseKey, grade_config: CredentialConfiguration
     ):
         """Test response when one credential is configured for a learning context."""
-        mock_course_enrollments.return_value = [user]
+        mock_course_enrollments.return_value = True
         response = self._make_request(user, course_key)
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data == {'has_credentials': True, 'credential_count': 1}
 
-    @patch('learning_credentials.api.v1.permissions.get_course_enrollments')
+    @patch('learning_credentials.api.v1.permissions.is_enrolled_in_course')
     def test_multiple_credentials_configured(
         self,
         mock_course_enrollments: Mock,
@@ -195,7 +279,7 @@ class TestCredentialConfigurationCheckView:
         completion_config: CredentialConfiguration,
     ):
         """Test response when multiple credentials are configured for a learning context."""
-        mock_course_enrollments.return_value = [user]
+        mock_course_enrollments.return_value = True
         response = self._make_request(user, course_key)
 
         assert response.status_code == status.HTTP_200_OK
@@ -227,11 +311,17 @@ class TestCredentialConfigurationCheckView:
 class TestCredentialMetadataView:
     """Test the CredentialMetadataView functionality."""
 
-    def _make_request(self, uuid: str) -> Response:
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self) -> Iterator[None]:
+        """Clear the cached metadata after each test."""
+        yield
+        cache.clear()
+
+    def _make_request(self, uuid: str, **headers) -> Response:
         """Helper to make GET request to the metadata endpoint."""
         client = APIClient()
         url = reverse('learning_credentials_api_v1:credential-metadata', kwargs={'uuid': uuid})
-        return client.get(url)
+        return client.get(url, headers=headers)
 
     def test_credential_metadata(self, credential: Credential):
         """Test that valid credential metadata is returned."""
@@ -263,6 +353,153 @@ class TestCredentialMetadataView:
         assert response.data['status'] == Credential.Status.INVALIDATED
         assert response.data['invalidation_reason'] == "Reissued due to name change."
 
+    def test_credential_metadata_headers(self, credential: Credential):
+        """Test that the response can be cached by CDNs and revalidated with conditional requests."""
+        response = self._make_request(str(credential.verify_uuid))
+
+        assert response['ETag']
+        assert response['Last-Modified'] == http_date(int(credential.modified.timestamp()))
+        assert response['Cache-Control'] == 'public, max-age=300'
+
+        not_modified_response = self._make_request(str(credential.verify_uuid), if_none_match=response['ETag'])
+        assert not_modified_response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert not_modified_response['ETag'] == response['ETag']
+
+        not_modified_response = self._make_request(
+            str(credential.verify_uuid), if_modified_since=response['Last-Modified']
+        )
+        assert not_modified_response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_credential_metadata_cached(
+        self, credential: Credential, django_assert_num_queries: Callable, django_capture_on_commit_callbacks: Callable
+    ):
+        """Test that the metadata is cached until the credential is saved."""
+        response = self._make_request(str(credential.verify_uuid))
+
+        with django_assert_num_queries(0):
+            assert self._make_request(str(credential.verify_uuid)).data == response.data
+
+        with django_capture_on_commit_callbacks(execute=True):
+            credential.invalidation_reason = "Reissued due to name change."
+            credential.save()
+
+        invalidated_response = self._make_request(str(credential.verify_uuid))
+        assert invalidated_response.data['status'] == Credential.Status.INVALIDATED
+        assert invalidated_response['ETag'] != response['ETag']
+
+    @override_settings(LEARNING_CREDENTIALS_METADATA_NEGATIVE_CACHE_TIMEOUT=30)
+    def test_credential_metadata_not_found_cached(self, django_assert_num_queries: Callable):
+        """Test that unknown UUIDs are cached, so repeated requests do not reach the database."""
+        uuid = "00000000-0000-0000-0000-000000000000"
+        assert self._make_request(uuid).status_code == status.HTTP_404_NOT_FOUND
+
+        with django_assert_num_queries(0):
+            response = self._make_request(uuid)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response['Cache-Control'] == 'public, max-age=30'
+
+    def test_archived_credential_metadata(self, credential: Credential):
+        """Test that archived credentials can still be verified."""
+        credential.invalidation_reason = "Reissued due to name change."
+        credential.save()
+        ArchivedCredential.archive(Credential.objects.all())
+
+        response = self._make_request(str(credential.verify_uuid))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['user_full_name'] == "Test User"
+        assert response.data['status'] == Credential.Status.INVALIDATED
+        assert response.data['invalidation_reason'] == "Reissued due to name change."
+
+
+@pytest.mark.django_db
+class TestCredentialBulkMetadataView:
+    """Test the CredentialBulkMetadataView functionality."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self) -> Iterator[None]:
+        """Clear the cached metadata and throttling history after each test."""
+        yield
+        cache.clear()
+
+    def _make_request(self, verify_uuids: list[str]) -> Response:
+        """Helper to make POST request to the bulk metadata endpoint."""
+        client = APIClient()
+        url = reverse('learning_credentials_api_v1:credential-metadata-bulk')
+        return client.post(url, {'verify_uuids': verify_uuids}, format='json')
+
+    def test_bulk_credential_metadata(self, credential: Credential, user: User, django_assert_num_queries: Callable):
+        """Test that current, archived, and unknown credentials are resolved with one query per credential table."""
+        archived_credential = ArchivedCredential.objects.create(
+            user=user,
+            configuration=credential.configuration,
+            user_full_name="Test User",
+            learning_context_name="Test Course",
+            status=Credential.Status.INVALIDATED,
+            invalidation_reason="Reissued",
+        )
+        unknown_uuid = "00000000-0000-0000-0000-000000000000"
+        verify_uuids = [str(credential.verify_uuid), str(archived_credential.verify_uuid), unknown_uuid]
+
+        with django_assert_num_queries(2):
+            response = self._make_request(verify_uuids)
+
+        assert response.status_code == status.HTTP_200_OK
+        credentials = response.data['credentials']
+        assert list(credentials) == verify_uuids
+        assert credentials[str(credential.verify_uuid)] == self._get_single_metadata(credential)
+        assert credentials[str(archived_credential.verify_uuid)]['invalidation_reason'] == "Reissued"
+        assert credentials[unknown_uuid] is None
+
+        # The metadata of all credentials (including the unknown one) is cached.
+        with django_assert_num_queries(0):
+            assert self._make_request(verify_uuids).data == response.data
+
+    @staticmethod
+    def _get_single_metadata(credential: Credential) -> dict:
+        """Get the metadata of a credential from the single-credential endpoint."""
+        url = reverse('learning_credentials_api_v1:credential-metadata', kwargs={'uuid': credential.verify_uuid})
+        return APIClient().get(url).data
+
+    @override_settings(LEARNING_CREDENTIALS_BULK_VERIFICATION_MAX_UUIDS=2)
+    @pytest.mark.parametrize(
+        'verify_uuids',
+        [
+            [],
+            ['not-a-uuid'],
+            [
+                '00000000-0000-0000-0000-000000000001',
+                '00000000-0000-0000-0000-000000000002',
+                '00000000-0000-0000-0000-000000000003',
+            ],
+        ],
+    )
+    def test_invalid_uuids(self, verify_uuids: list[str]):
+        """Test that empty lists, invalid UUIDs, and too many UUIDs are rejected."""
+        response = self._make_request(verify_uuids)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'verify_uuids' in response.data
+
+    @override_settings(LEARNING_CREDENTIALS_BULK_VERIFICATION_THROTTLE_RATE='1/min')
+    def test_throttling(self):
+        """Test that the bulk verification requests are throttled."""
+        verify_uuids = ['00000000-0000-0000-0000-000000000000']
+
+        assert self._make_request(verify_uuids).status_code == status.HTTP_200_OK
+        assert self._make_request(verify_uuids).status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+    @override_settings(LEARNING_CREDENTIALS_BULK_VERIFICATION_THROTTLE_RATE='1/min')
+    def test_throttling_authenticated_user(self, user: User):
+        """Test that the requests of authenticated users are throttled separately from anonymous requests."""
+        verify_uuids = ['00000000-0000-0000-0000-000000000000']
+        url = reverse('learning_credentials_api_v1:credential-metadata-bulk')
+
+        assert self._make_request(verify_uuids).status_code == status.HTTP_200_OK
+        response = _get_api_client(user).post(url, {'verify_uuids': verify_uuids}, format='json')
+        assert response.status_code == status.HTTP_200_OK
+
 
 @pytest.mark.django_db
 class TestCredentialEligibilityView:
@@ -284,21 +521,21 @@ class TestCredentialEligibilityView:
         response = self._make_get_request(None, course_key)
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
-    @patch('learning_credentials.api.v1.permissions.get_course_enrollments')
+    @patch('learning_credentials.api.v1.permissions.is_enrolled_in_course')
     def test_get_no_configurations(self, mock_enrollments: Mock, user: User, course_key: CourseKey):
         """Test that an empty credentials list is returned when no configurations exist."""
-        mock_enrollments.return_value = [user]
+        mock_enrollments.return_value = True
         response = self._make_get_request(user, course_key)
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data == {'context_key': str(course_key), 'credentials': []}
 
-    @patch('learning_credentials.api.v1.permissions.get_course_enrollments')
+    @patch('learning_credentials.api.v1.permissions.is_enrolled_in_course')
     def test_get_eligible_user(
         self, mock_enrollments: Mock, user: User, course_key: CourseKey, mock_credential_config: CredentialConfiguration
     ):
         """Test eligibility response for an eligible user with no existing credential."""
-        mock_enrollments.return_value = [user]
+        mock_enrollments.return_value = True
         with patch.object(CredentialConfiguration, 'get_user_eligibility_details', return_value={'is_eligible': True}):
             response = self._make_get_request(user, course_key)
 
@@ -313,7 +550,7 @@ class TestCredentialEligibilityView:
         assert 'existing_credential' not in cred
         assert 'existing_credential_url' not in cred
 
-    @patch('learning_credentials.api.v1.permissions.get_course_enrollments')
+    @patch('learning_credentials.api.v1.permissions.is_enrolled_in_course')
     def test_get_filters_by_retrieval_func(
         self,
         mock_enrollments: Mock,
@@ -323,7 +560,7 @@ class TestCredentialEligibilityView:
         completion_config: CredentialConfiguration,
     ):
         """Test that the retrieval_func query parameter filters configurations."""
-        mock_enrollments.return_value = [user]
+        mock_enrollments.return_value = True
         with patch.object(CredentialConfiguration, 'get_user_eligibility_details', return_value={'is_eligible': False}):
             response = self._make_get_request(
                 user, course_key, retrieval_func=mock_credential_config.credential_type.retrieval_func
@@ -334,22 +571,22 @@ class TestCredentialEligibilityView:
         assert len(credentials) == 1
         assert credentials[0]['credential_type_id'] == mock_credential_config.credential_type.pk
 
-    @patch('learning_credentials.api.v1.permissions.get_course_enrollments')
+    @patch('learning_credentials.api.v1.permissions.is_enrolled_in_course')
     def test_get_filter_by_retrieval_func_no_match(
         self, mock_enrollments: Mock, user: User, course_key: CourseKey, mock_credential_config: CredentialConfiguration
     ):
         """Test that filtering by a non-matching retrieval_func returns no credentials."""
-        mock_enrollments.return_value = [user]
+        mock_enrollments.return_value = True
         response = self._make_get_request(user, course_key, retrieval_func='nonexistent.module.func')
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data == {'context_key': str(course_key), 'credentials': []}
 
     @pytest.mark.usefixtures('mock_credential_config')
-    @patch('learning_credentials.api.v1.permissions.get_course_enrollments')
+    @patch('learning_credentials.api.v1.permissions.is_enrolled_in_course')
     def test_get_strips_empty_dicts(self, mock_enrollments: Mock, user: User, course_key: CourseKey):
         """Test that the serializer strips empty dict values from the response."""
-        mock_enrollments.return_value = [user]
+        mock_enrollments.return_value = True
         with patch.object(
             CredentialConfiguration,
             'get_user_eligibility_details',
@@ -363,12 +600,12 @@ class TestCredentialEligibilityView:
         assert 'current_grades' not in cred
         assert 'steps' not in cred
 
-    @patch('learning_credentials.api.v1.permissions.get_course_enrollments')
+    @patch('learning_credentials.api.v1.permissions.is_enrolled_in_course')
     def test_get_with_existing_credential(
         self, mock_enrollments: Mock, user: User, course_key: CourseKey, credential: Credential
     ):
         """Test that existing credential info is included in the response."""
-        mock_enrollments.return_value = [user]
+        mock_enrollments.return_value = True
         with patch.object(CredentialConfiguration, 'get_user_eligibility_details', return_value={'is_eligible': True}):
             response = self._make_get_request(user, course_key)
 
@@ -377,12 +614,12 @@ class TestCredentialEligibilityView:
         assert str(cred['existing_credential']) == str(credential.uuid)
         assert cred['existing_credential_url'] == credential.download_url
 
-    @patch('learning_credentials.api.v1.permissions.get_course_enrollments')
+    @patch('learning_credentials.api.v1.permissions.is_enrolled_in_course')
     def test_get_excludes_error_and_invalidated_credentials(
         self, mock_enrollments: Mock, user: User, course_key: CourseKey, mock_credential_config: CredentialConfiguration
     ):
         """Test that credentials with ERROR or INVALIDATED status are not returned as existing."""
-        mock_enrollments.return_value = [user]
+        mock_enrollments.return_value = True
         mock_credential_config.credential_set.create(user=user, status=Credential.Status.ERROR)
         mock_credential_config.credential_set.create(user=user, status=Credential.Status.INVALIDATED)
         with patch.object(CredentialConfiguration, 'get_user_eligibility_details', return_value={'is_eligible': True}):
@@ -392,6 +629,119 @@ class TestCredentialEligibilityView:
         cred = response.data['credentials'][0]
         assert 'existing_credential' not in cred
 
+    @patch('learning_credentials.api.v1.permissions.is_enrolled_in_course')
+    def test_get_evaluates_configurations_concurrently_with_shared_progress(
+        self,
+        mock_enrollments: Mock,
+        user: User,
+        course_key: CourseKey,
+        grade_config: CredentialConfiguration,
+        completion_config: CredentialConfiguration,
+    ):
+        """Test that configurations are evaluated concurrently by default, and the progress is retrieved once."""
+        mock_enrollments.return_value = True
+        barrier = threading.Barrier(2, timeout=5)
+        retrieve_grades = Mock(return_value={'total': 0.9})
+
+        def get_user_eligibility_details(config: CredentialConfiguration, user_id: int) -> dict:
+            barrier.wait()  # Both configurations are evaluated at the same time.
+            grades = get_cached_progress((str(config.learning_context_key), 'grades', user_id), retrieve_grades)
+            return {'is_eligible': config == grade_config, 'current_grades': grades}
+
+        with patch.object(
+            CredentialConfiguration,
+            'get_user_eligibility_details',
+            autospec=True,
+            side_effect=get_user_eligibility_details,
+        ):
+            response = self._make_get_request(user, course_key)
+
+        assert response.status_code == status.HTTP_200_OK
+        retrieve_grades.assert_called_once_with()
+        assert [(cred['credential_type_id'], cred['is_eligible']) for cred in response.data['credentials']] == [
+            (grade_config.credential_type_id, True),
+            (completion_config.credential_type_id, False),
+        ]
+        assert get_active_progress_cache() is None
+
+    @override_settings(LEARNING_CREDENTIALS_PROGRESS_SNAPSHOTS=True)
+    @patch('learning_credentials.api.v1.permissions.is_enrolled_in_course')
+    def test_get_from_progress_snapshots(
+        self,
+        mock_enrollments: Mock,
+        user: User,
+        course_key: CourseKey,
+        grade_config: CredentialConfiguration,
+        completion_config: CredentialConfiguration,
+    ):
+        """Test that the stored progress is returned, and it is only retrieved for configurations without snapshots."""
+        mock_enrollments.return_value = True
+        (snapshot,) = LearnerProgressSnapshot.save_results(
+            grade_config, [(user.id, {'is_eligible': True, 'current_grades': {'total': 0.9}})]
+        )
+        live_progress = {'is_eligible': False, 'current_completion': 0.5}
+
+        with patch.object(
+            CredentialConfiguration, 'get_user_eligibility_details', return_value=live_progress
+        ) as mock_details:
+            response = self._make_get_request(user, course_key)
+
+        assert response.status_code == status.HTTP_200_OK
+        mock_details.assert_called_once_with(user_id=user.id)
+        grade_data, completion_data = response.data['credentials']
+        assert grade_data['is_eligible'] is True
+        assert grade_data['current_grades'] == {'total': 0.9}
+        assert datetime.fromisoformat(grade_data['progress_computed_at']) == snapshot.computed_at
+        assert completion_data['current_completion'] == live_progress['current_completion']
+        assert datetime.fromisoformat(completion_data['progress_computed_at']) >= snapshot.computed_at
+
+    @override_settings(LEARNING_CREDENTIALS_PROGRESS_SNAPSHOTS=True, LEARNING_CREDENTIALS_PROGRESS_SNAPSHOT_MAX_AGE=60)
+    @patch('learning_credentials.api.v1.permissions.is_enrolled_in_course')
+    def test_get_with_outdated_progress_snapshot(
+        self, mock_enrollments: Mock, user: User, course_key: CourseKey, mock_credential_config: CredentialConfiguration
+    ):
+        """Test that the progress is retrieved again if its snapshot is older than the maximum age."""
+        mock_enrollments.return_value = True
+        LearnerProgressSnapshot.save_results(mock_credential_config, [(user.id, {'is_eligible': False})])
+        LearnerProgressSnapshot.objects.update(computed_at=timezone.now() - timedelta(seconds=61))
+
+        with patch.object(
+            CredentialConfiguration, 'get_user_eligibility_details', return_value={'is_eligible': True}
+        ) as mock_details:
+            response = self._make_get_request(user, course_key)
+
+        assert response.status_code == status.HTTP_200_OK
+        mock_details.assert_called_once_with(user_id=user.id)
+        assert response.data['credentials'][0]['is_eligible'] is True
+
+    @override_settings(
+        LEARNING_CREDENTIALS_PROGRESS_SNAPSHOTS=True, LEARNING_CREDENTIALS_FRESH_ELIGIBILITY_THROTTLE_RATE='1/minute'
+    )
+    @patch('learning_credentials.api.v1.permissions.is_enrolled_in_course')
+    def test_get_fresh(
+        self, mock_enrollments: Mock, user: User, course_key: CourseKey, mock_credential_config: CredentialConfiguration
+    ):
+        """Test that fresh=true retrieves the progress even if it is stored, and that these requests are throttled."""
+        mock_enrollments.return_value = True
+        LearnerProgressSnapshot.save_results(mock_credential_config, [(user.id, {'is_eligible': False})])
+
+        try:
+            with patch.object(
+                CredentialConfiguration, 'get_user_eligibility_details', return_value={'is_eligible': True}
+            ) as mock_details:
+                response = self._make_get_request(user, course_key, fresh='true')
+                throttled_response = self._make_get_request(user, course_key, fresh='true')
+                cached_response = self._make_get_request(user, course_key)
+        finally:
+            cache.clear()
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['credentials'][0]['is_eligible'] is True
+        assert throttled_response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert cached_response.status_code == status.HTTP_200_OK
+        assert cached_response.data['credentials'][0]['is_eligible'] is False
+        mock_details.assert_called_once_with(user_id=user.id)
+
     @pytest.mark.usefixtures('mock_credential_config')
     def test_staff_get_for_other_user(self, staff_user: User, user: User, course_key: CourseKey):
         """Test that staff can view eligibility for another user via username param."""
@@ -412,3 +762,265 @@ class TestCredentialEligibilityView:
         """Test that 404 is returned when the specified username doesn't exist."""
         response = self._make_get_request(staff_user, course_key, username='nonexistent_user')
         assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+class TestCredentialBulkEligibilityView:
+    """Tests for the CredentialBulkEligibilityView."""
+
+    def _make_request(
+        self, user: User | None, learning_context_key: LearningContextKey, data: dict, **query_params
+    ) -> Response:
+        """Helper to make POST request to the bulk eligibility endpoint."""
+        client = _get_api_client(user)
+        url = reverse(
+            'learning_credentials_api_v1:credential-eligibility-bulk',
+            kwargs={'learning_context_key': str(learning_context_key)},
+        )
+        if query_params:
+            url = f'{url}?{urlencode(query_params)}'
+        return client.post(url, data, format='json')
+
+    def test_non_staff_gets_403(self, user: User, course_key: CourseKey):
+        """Test that only staff users can check the eligibility of multiple learners."""
+        response = self._make_request(user, course_key, {'usernames': [user.username]})
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    @pytest.mark.parametrize(
+        'data',
+        [{}, {'usernames': [], 'user_ids': []}, {'user_ids': ['invalid']}, {'usernames': ['a', 'b'], 'user_ids': [1]}],
+        ids=['missing', 'empty', 'invalid_id', 'too_many'],
+    )
+    @override_settings(LEARNING_CREDENTIALS_BULK_ELIGIBILITY_MAX_USERS=2)
+    def test_invalid_learners(self, staff_user: User, course_key: CourseKey, data: dict):
+        """Test that a missing, invalid, or too long list of learners is rejected."""
+        response = self._make_request(staff_user, course_key, data)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_bulk_eligibility(
+        self,
+        staff_user: User,
+        user: User,
+        course_key: CourseKey,
+        credential: Credential,
+        grade_config: CredentialConfiguration,
+    ):
+        """Test that the progress of all learners is retrieved with a single call for each configuration."""
+        learner, other_learner = user, UserFactory()
+
+        def get_users_eligibility_details(config: CredentialConfiguration, user_ids: list[int]) -> dict:
+            return {user_id: {'is_eligible': config == grade_config and user_id == learner.id} for user_id in user_ids}
+
+        with patch.object(
+            CredentialConfiguration,
+            'get_users_eligibility_details',
+            autospec=True,
+            side_effect=get_users_eligibility_details,
+        ) as mock_details:
+            response = self._make_request(
+                staff_user,
+                course_key,
+                {'usernames': [learner.username, 'nonexistent_user'], 'user_ids': [other_learner.id, 0]},
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['context_key'] == str(course_key)
+        assert mock_details.call_count == 2
+        assert {frozenset(call_args.args[1]) for call_args in mock_details.call_args_list} == {
+            frozenset({learner.id, other_learner.id})
+        }
+
+        results_by_username = response.data['users_by_username']
+        results_by_id = response.data['users_by_id']
+        assert list(results_by_username) == [learner.username, 'nonexistent_user']
+        assert list(results_by_id) == [str(other_learner.id), '0']
+        assert results_by_username['nonexistent_user'] is None
+        assert results_by_id['0'] is None
+        assert results_by_username[learner.username]['user_id'] == learner.id
+        assert results_by_id[str(other_learner.id)]['username'] == other_learner.username
+
+        mock_data, grade_data = results_by_username[learner.username]['credentials']
+        assert grade_data['credential_type_id'] == grade_config.credential_type_id
+        assert grade_data['is_eligible'] is True
+        assert str(mock_data['existing_credential']) == str(credential.uuid)
+        assert mock_data['is_eligible'] is False
+        assert all(not data['is_eligible'] for data in results_by_id[str(other_learner.id)]['credentials'])
+
+    @pytest.mark.usefixtures('mock_credential_config')
+    def test_bulk_eligibility_numeric_username(self, staff_user: User, users: list[User], course_key: CourseKey):
+        """Test that a numeric username does not collide with the user ID of another learner."""
+        numeric_user, other_learner = users[:2]
+        numeric_user.username = str(other_learner.id)
+        numeric_user.save()
+
+        with patch.object(
+            CredentialConfiguration,
+            'get_users_eligibility_details',
+            side_effect=lambda user_ids: {user_id: {'is_eligible': False} for user_id in user_ids},
+        ):
+            response = self._make_request(
+                staff_user,
+                course_key,
+                {'usernames': [numeric_user.username], 'user_ids': [other_learner.id]},
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['users_by_username'][numeric_user.username]['user_id'] == numeric_user.id
+        assert response.data['users_by_id'][str(other_learner.id)]['user_id'] == other_learner.id
+
+    @override_settings(
+        LEARNING_CREDENTIALS_BULK_ELIGIBILITY_THROTTLE_RATE='1/hour',
+        LEARNING_CREDENTIALS_FRESH_ELIGIBILITY_THROTTLE_RATE=None,
+    )
+    def test_throttling(self, staff_user: User, course_key: CourseKey):
+        """Test that the bulk eligibility requests are throttled by their own rate."""
+        data = {'usernames': ['nonexistent_user']}
+
+        assert self._make_request(staff_user, course_key, data).status_code == status.HTTP_200_OK
+        assert self._make_request(staff_user, course_key, data).status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+    def test_bulk_eligibility_filters_by_retrieval_func(
+        self,
+        staff_user: User,
+        user: User,
+        course_key: CourseKey,
+        mock_credential_config: CredentialConfiguration,
+        completion_config: CredentialConfiguration,
+    ):
+        """Test that the retrieval_func query parameter filters configurations."""
+        with patch.object(
+            CredentialConfiguration, 'get_users_eligibility_details', return_value={user.id: {'is_eligible': False}}
+        ) as mock_details:
+            response = self._make_request(
+                staff_user,
+                course_key,
+                {'user_ids': [user.id]},
+                retrieval_func=completion_config.credential_type.retrieval_func,
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        mock_details.assert_called_once_with([user.id])
+        credentials = response.data['users_by_id'][str(user.id)]['credentials']
+        assert [data['credential_type_id'] for data in credentials] == [completion_config.credential_type_id]
+        assert mock_credential_config.credential_type_id != completion_config.credential_type_id
+
+    @pytest.mark.usefixtures('mock_credential_config')
+    def test_bulk_eligibility_of_unknown_learners(self, staff_user: User, course_key: CourseKey):
+        """Test that the progress is not retrieved if none of the learners exist."""
+        with patch.object(CredentialConfiguration, 'get_users_eligibility_details') as mock_details:
+            response = self._make_request(staff_user, course_key, {'usernames': ['nonexistent_user']})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['users_by_username'] == {'nonexistent_user': None}
+        assert response.data['users_by_id'] == {}
+        mock_details.assert_not_called()
+
+
+@pytest.mark.django_db
+class TestCredentialStatsView:
+    """Tests for the CredentialStatsView."""
+
+    def _make_request(self, user: User | None, learning_context_key: LearningContextKey) -> Response:
+        """Helper to make GET request to the stats endpoint."""
+        client = _get_api_client(user)
+        url = reverse(
+            'learning_credentials_api_v1:credential-stats',
+            kwargs={'learning_context_key': str(learning_context_key)},
+        )
+        return client.get(url)
+
+    def test_non_staff_gets_403(self, user: User, course_key: CourseKey):
+        """Test that only staff users can see the stats."""
+        response = self._make_request(user, course_key)
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_get_stats(
+        self, staff_user: User, course_key: CourseKey, credential: Credential, grade_config: CredentialConfiguration
+    ):
+        """Test that the counters of each configuration in the learning context are returned."""
+        credential.configuration.credential_set.create(user=staff_user, status=Credential.Status.INVALIDATED)
+
+        response = self._make_request(staff_user, course_key)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['context_key'] == str(course_key)
+        stats_by_type = {stats['credential_type_id']: stats for stats in response.data['credentials']}
+        assert stats_by_type[credential.configuration.credential_type_id] == {
+            'credential_type_id': credential.configuration.credential_type_id,
+            'name': credential.configuration.credential_type.name,
+            'generating_count': 0,
+            'available_count': 1,
+            'error_count': 0,
+            'invalidated_count': 1,
+            'reconciled_at': None,
+        }
+        assert stats_by_type[grade_config.credential_type_id]['available_count'] == 0
+
+
+@pytest.mark.django_db
+class TestCredentialProgressReportView:
+    """Tests for the CredentialProgressReportView."""
+
+    def _make_request(self, user: User | None, learning_context_key: LearningContextKey, **query_params) -> Response:
+        """Helper to make GET request to the progress report endpoint."""
+        client = _get_api_client(user)
+        url = reverse(
+            'learning_credentials_api_v1:credential-progress-report',
+            kwargs={'learning_context_key': str(learning_context_key)},
+        )
+        return client.get(url, query_params)
+
+    def test_non_staff_gets_403(self, user: User, course_key: CourseKey):
+        """Test that only staff users can see the report."""
+        response = self._make_request(user, course_key)
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_unsupported_format(self, staff_user: User, course_key: CourseKey):
+        """Test that unsupported report formats are rejected."""
+        response = self._make_request(staff_user, course_key, output_format='xml')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data == {'error': 'Unsupported report format: xml.'}
+
+    @pytest.mark.usefixtures('completion_config')
+    @pytest.mark.parametrize('output_format', ['ndjson', 'csv'])
+    def test_stream_report(
+        self,
+        staff_user: User,
+        user: User,
+        course_key: CourseKey,
+        grade_config: CredentialConfiguration,
+        output_format: str,
+    ):
+        """Test that the progress of the learners is streamed for the filtered configurations."""
+        with patch.object(
+            CredentialConfiguration, 'iter_retrieval_results', return_value=iter([(user.id, {'is_eligible': True})])
+        ) as mock_retrieval:
+            response = self._make_request(
+                staff_user,
+                course_key,
+                output_format=output_format,
+                retrieval_func=grade_config.credential_type.retrieval_func,
+            )
+            content = b''.join(response.streaming_content).decode()
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response['Content-Type'] == REPORT_CONTENT_TYPES[output_format]
+        assert response['Content-Disposition'] == (
+            f'attachment; filename="course-v1_OpenedX+DemoX+DemoCourse.{output_format}"'
+        )
+        # The retrieval function is only called for the configuration matching the filter.
+        mock_retrieval.assert_called_once_with()
+        assert user.username in content
+        assert grade_config.credential_type.name in content
+
+    @pytest.mark.usefixtures('grade_config', 'completion_config')
+    def test_stream_report_of_all_configurations(self, staff_user: User, course_key: CourseKey):
+        """Test that all configurations of the learning context are reported by default."""
+        with patch.object(
+            CredentialConfiguration, 'iter_retrieval_results', side_effect=lambda: iter([(staff_user.id, {})])
+        ) as mock_retrieval:
+            response = self._make_request(staff_user, course_key)
+            lines = b''.join(response.streaming_content).decode().splitlines()
+
+        assert mock_retrieval.call_count == len(lines) == 2